@@ -1,4 +1,3 @@
-from db_facts.db_facts_types import DBFacts
 from .database import db_facts_from_env
 from typing import TYPE_CHECKING, Iterable, Union, Optional, Dict, Any
 from records_mover.mover_types import PleaseInfer
@@ -6,6 +5,7 @@ from config_resolver import get_config
 import os
 import logging
 if TYPE_CHECKING:
+    from db_facts.db_facts_types import DBFacts  # noqa
     import google.auth.credentials  # noqa
     import boto3  # noqa
 
@@ -38,7 +38,7 @@ class BaseCreds():
                  default_db_creds_name: Optional[str] = None,
                  default_aws_creds_name: Optional[str] = None,
                  default_gcp_creds_name: Optional[str] = None,
-                 default_db_facts: Union[PleaseInfer, DBFacts] = PleaseInfer.token,
+                 default_db_facts: Union[PleaseInfer, 'DBFacts'] = PleaseInfer.token,
                  default_boto3_session: Union[PleaseInfer,
                                               'boto3.session.Session',
                                               None] = PleaseInfer.token,
@@ -83,7 +83,7 @@ class BaseCreds():
                    scopes: Iterable[str]) -> 'google.auth.credentials.Credentials':
         raise NotImplementedError
 
-    def db_facts(self, db_creds_name: str) -> DBFacts:
+    def db_facts(self, db_creds_name: str) -> 'DBFacts':
         raise NotImplementedError
 
     def boto3_session(self, aws_creds_name: str) -> 'boto3.session.Session':
@@ -183,7 +183,7 @@ class BaseCreds():
 
         return None
 
-    def default_db_facts(self) -> DBFacts:
+    def default_db_facts(self) -> 'DBFacts':
         if self.__default_db_facts is not PleaseInfer.token:
             return self.__default_db_facts
 
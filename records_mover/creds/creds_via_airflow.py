@@ -1,9 +1,9 @@
 from .base_creds import BaseCreds
 import logging
-from db_facts.db_facts_types import DBFacts
 from records_mover.logging import register_secret
 from typing import Iterable, Optional, Union, TYPE_CHECKING
 if TYPE_CHECKING:
+    from db_facts.db_facts_types import DBFacts  # noqa
     # see the 'gsheets' extras_require option in setup.py - needed for this!
     import google.auth.credentials  # noqa
     import boto3  # noqa
@@ -18,10 +18,10 @@ class CredsViaAirflow(BaseCreds):
         aws_hook = AwsBaseHook(aws_creds_name)
         return aws_hook.get_session()
 
-    def db_facts(self, db_creds_name: str) -> DBFacts:
+    def db_facts(self, db_creds_name: str) -> 'DBFacts':
         from airflow.hooks.base import BaseHook
         conn = BaseHook.get_connection(db_creds_name)
-        out: DBFacts = {}
+        out: 'DBFacts' = {}
 
         def add(key: str, value: Optional[Union[str, int]]) -> None:
             if value is not None:
@@ -1,12 +1,11 @@
-from db_facts import db
 import os
 import base64
 import json
 from typing import Iterable, Optional, Any, Dict
 from .base_creds import BaseCreds
 from typing import TYPE_CHECKING
-from db_facts.db_facts_types import DBFacts
 if TYPE_CHECKING:
+    from db_facts.db_facts_types import DBFacts  # noqa
     # see the 'gsheets' extras_require option in setup.py - needed for this!
     import google.auth.credentials  # noqa
     import boto3  # noqa
@@ -46,7 +45,9 @@ class CredsViaEnv(BaseCreds):
                            'Cloud Platform credentials')
         return creds_from_env
 
-    def db_facts(self, db_creds_name: str) -> DBFacts:
+    def db_facts(self, db_creds_name: str) -> 'DBFacts':
+        from db_facts import db
+
         return db(db_creds_name.split('-'))
 
     def _gcp_creds_of_last_resort(self,
@@ -1,9 +1,10 @@
 import os
-from db_facts.db_facts_types import DBFacts
-from typing import Dict, Optional
+from typing import Dict, Optional, TYPE_CHECKING
+if TYPE_CHECKING:
+    from db_facts.db_facts_types import DBFacts  # noqa
 
 
-def db_facts_from_env() -> DBFacts:
+def db_facts_from_env() -> 'DBFacts':
     db_facts: Dict[str, Optional[str]]
     if os.environ.get('DB_TYPE') == 'bigquery':
         db_facts = {
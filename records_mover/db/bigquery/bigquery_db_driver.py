@@ -1,21 +1,45 @@
 from ..driver import DBDriver
+from sqlalchemy import text
 import logging
 from ...records import RecordsSchema
 from ...records.records_format import BaseRecordsFormat, ParquetRecordsFormat, AvroRecordsFormat
 from ...utils.limits import INT64_MAX, INT64_MIN, FLOAT64_SIGNIFICAND_BITS, num_digits
 import re
-from typing import Union, Optional, Tuple
+from typing import Any, Dict, List, Union, Optional, Sequence, Tuple, Type
 from ...url.resolver import UrlResolver
 import sqlalchemy
+from sqlalchemy.schema import Column
 from .loader import BigQueryLoader
 from .unloader import BigQueryUnloader
-from ..loader import LoaderFromFileobj, LoaderFromRecordsDirectory
+from ..loader import LoaderFromFileobj, LoaderFromRecordsDirectory, LoaderFromDataframes
 from ..unloader import Unloader
 from ...url.base import BaseDirectoryUrl
 
 
 logger = logging.getLogger(__name__)
 
+# BigQuery's DB-API reports standard SQL type names as type codes;
+# these are mapped the same way the SQLAlchemy dialect maps the types
+# of table columns.
+#
+# https://cloud.google.com/bigquery/docs/reference/standard-sql/data-types
+BIGQUERY_TYPE_CODES: Dict[str, Type[sqlalchemy.types.TypeEngine]] = {
+    'INTEGER': sqlalchemy.types.Integer,
+    'INT64': sqlalchemy.types.Integer,
+    'FLOAT': sqlalchemy.types.Float,
+    'FLOAT64': sqlalchemy.types.Float,
+    'NUMERIC': sqlalchemy.types.Numeric,
+    'BIGNUMERIC': sqlalchemy.types.Numeric,
+    'BOOLEAN': sqlalchemy.types.Boolean,
+    'BOOL': sqlalchemy.types.Boolean,
+    'STRING': sqlalchemy.types.String,
+    'BYTES': sqlalchemy.types.LargeBinary,
+    'DATE': sqlalchemy.types.DATE,
+    'DATETIME': sqlalchemy.types.DATETIME,
+    'TIMESTAMP': sqlalchemy.types.TIMESTAMP,
+    'TIME': sqlalchemy.types.TIME,
+}
+
 
 class BigQueryDBDriver(DBDriver):
     def __init__(self,
@@ -45,9 +69,40 @@ class BigQueryDBDriver(DBDriver):
     def loader_from_fileobj(self) -> LoaderFromFileobj:
         return self._bigquery_loader
 
+    def loader_from_dataframes(self) -> Optional[LoaderFromDataframes]:
+        try:
+            import pyarrow  # noqa
+        except ModuleNotFoundError:
+            logger.debug("pyarrow not installed; will serialize dataframes "
+                         "before loading them", exc_info=True)
+            return None
+        return self._bigquery_loader
+
     def unloader(self) -> Unloader:
         return self._bigquery_unloader
 
+    def create_table_like(self, schema: str, table: str, like_table: str) -> None:
+        self.db_conn.execute(text(f"CREATE TABLE {self._quote_schema_and_table(schema, table)} "
+                                  f"LIKE {self._quote_schema_and_table(schema, like_table)}"))
+
+    def replace_table(self, schema: str, table: str, replacement_table: str) -> None:
+        # BigQuery DDL isn't transactional, but replacing a table with
+        # a copy of another is a single atomic (and metadata-only)
+        # job.
+        replacement = self._quote_schema_and_table(schema, replacement_table)
+        self.db_conn.execute(text("CREATE OR REPLACE TABLE "
+                                  f"{self._quote_schema_and_table(schema, table)} "
+                                  f"COPY {replacement}"))
+        self.db_conn.execute(text(f"DROP TABLE {replacement}"))
+
+    def merge_table(self,
+                    schema: str,
+                    table: str,
+                    source_table: str,
+                    key_columns: List[str]) -> None:
+        self.db_conn.execute(text(self._merge_statement(schema, table,
+                                                        source_table, key_columns)))
+
     def type_for_date_plus_time(self, has_tz: bool = False) -> sqlalchemy.sql.sqltypes.DateTime:
         # https://cloud.google.com/bigquery/docs/reference/standard-sql/data-types
         if has_tz:
@@ -56,6 +111,14 @@ class BigQueryDBDriver(DBDriver):
         else:
             return sqlalchemy.sql.sqltypes.DATETIME()
 
+    def columns_from_cursor_description(self,
+                                        description: Sequence[Sequence[Any]]) -> List[Column]:
+        columns = []
+        for name, type_code, *_ in description:
+            coltype = BIGQUERY_TYPE_CODES.get(type_code, sqlalchemy.types.String)
+            columns.append(Column(name, coltype()))
+        return columns
+
     def make_column_name_valid(self, colname: str) -> str:
         # https://cloud.google.com/bigquery/docs/schemas#column_names
 
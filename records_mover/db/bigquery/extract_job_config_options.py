@@ -0,0 +1,115 @@
+from ...utils import quiet_remove
+from ...records.delimited import cant_handle_hint
+from typing import Set
+from ...records.unload_plan import RecordsUnloadPlan
+from ...records.records_format import (
+    DelimitedRecordsFormat, ParquetRecordsFormat, AvroRecordsFormat
+)
+from records_mover.records.delimited import ValidatedRecordsHints
+from google.cloud.bigquery.job import ExtractJobConfig
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def extract_job_config(unhandled_hints: Set[str],
+                       unload_plan: RecordsUnloadPlan) -> ExtractJobConfig:
+    # https://cloud.google.com/bigquery/docs/exporting-data#export_formats_and_compression_types
+    # https://googleapis.dev/python/bigquery/latest/generated/google.cloud.bigquery.job.ExtractJobConfig.html
+    config = ExtractJobConfig()
+    if isinstance(unload_plan.records_format, AvroRecordsFormat):
+        config.destination_format = 'AVRO'
+        # https://cloud.google.com/bigquery/docs/loading-data-cloud-storage-avro#logical_types
+        config.use_avro_logical_types = True
+        return config
+
+    if isinstance(unload_plan.records_format, ParquetRecordsFormat):
+        config.destination_format = 'PARQUET'
+        return config
+
+    if isinstance(unload_plan.records_format, DelimitedRecordsFormat):
+        fail_if_cant_handle_hint = unload_plan.processing_instructions.fail_if_cant_handle_hint
+        hints = unload_plan.records_format.\
+            validate(fail_if_cant_handle_hint=fail_if_cant_handle_hint)
+        add_extract_job_csv_config(unhandled_hints,
+                                   hints,
+                                   fail_if_cant_handle_hint,
+                                   config)
+        return config
+
+    raise NotImplementedError("Not currently able to export "
+                              f"{unload_plan.records_format.format_type}")
+
+
+def add_extract_job_csv_config(unhandled_hints: Set[str],
+                               hints: ValidatedRecordsHints,
+                               fail_if_cant_handle_hint: bool,
+                               config: ExtractJobConfig) -> None:
+    config.destination_format = 'CSV'
+
+    # field_delimiter: Delimiter to use between fields in the
+    # exported data.
+    config.field_delimiter = hints.field_delimiter
+    quiet_remove(unhandled_hints, 'field-delimiter')
+
+    # print_header: Print a header row in the exported data.
+    config.print_header = hints.header_row
+    quiet_remove(unhandled_hints, 'header-row')
+
+    # compression: Compression type to use for exported files.
+    #
+    # GZIP is the only compression offered for CSV exports.
+    if hints.compression == 'GZIP':
+        config.compression = 'GZIP'
+    elif hints.compression is None:
+        config.compression = 'NONE'
+    else:
+        cant_handle_hint(fail_if_cant_handle_hint, 'compression', hints)
+    quiet_remove(unhandled_hints, 'compression')
+
+    # The remaining hints describe the only flavor of CSV which
+    # BigQuery knows how to write - there are no options to change
+    # any of them.
+
+    if hints.encoding != 'UTF8':
+        cant_handle_hint(fail_if_cant_handle_hint, 'encoding', hints)
+    quiet_remove(unhandled_hints, 'encoding')
+
+    if hints.record_terminator != '\n':
+        cant_handle_hint(fail_if_cant_handle_hint, 'record-terminator', hints)
+    quiet_remove(unhandled_hints, 'record-terminator')
+
+    # Fields containing the delimiter, a quote or a newline are
+    # surrounded by double quotes, with quotes inside doubled up.
+    if hints.quoting != 'minimal':
+        cant_handle_hint(fail_if_cant_handle_hint, 'quoting', hints)
+    quiet_remove(unhandled_hints, 'quoting')
+    if hints.quotechar != '"':
+        cant_handle_hint(fail_if_cant_handle_hint, 'quotechar', hints)
+    quiet_remove(unhandled_hints, 'quotechar')
+    if not hints.doublequote:
+        cant_handle_hint(fail_if_cant_handle_hint, 'doublequote', hints)
+    quiet_remove(unhandled_hints, 'doublequote')
+
+    # Backslashes are written out as-is.
+    if hints.escape is not None:
+        cant_handle_hint(fail_if_cant_handle_hint, 'escape', hints)
+    quiet_remove(unhandled_hints, 'escape')
+
+    if hints.dateformat != 'YYYY-MM-DD':
+        cant_handle_hint(fail_if_cant_handle_hint, 'dateformat', hints)
+    quiet_remove(unhandled_hints, 'dateformat')
+
+    if hints.timeonlyformat not in ['HH24:MI:SS', 'HH:MI:SS']:
+        cant_handle_hint(fail_if_cant_handle_hint, 'timeonlyformat', hints)
+    quiet_remove(unhandled_hints, 'timeonlyformat')
+
+    # BigQuery writes DATETIME and TIMESTAMP values with fractional
+    # seconds where they have them, and TIMESTAMP values with a
+    # trailing ' UTC' (e.g., '2000-01-02 12:34:56.789 UTC').  No
+    # datetimeformat or datetimeformattz hint describes that, so
+    # loaders can't be relied on to parse these values as written.
+    cant_handle_hint(fail_if_cant_handle_hint, 'datetimeformat', hints)
+    quiet_remove(unhandled_hints, 'datetimeformat')
+    cant_handle_hint(fail_if_cant_handle_hint, 'datetimeformattz', hints)
+    quiet_remove(unhandled_hints, 'datetimeformattz')
@@ -1,8 +1,11 @@
 from contextlib import contextmanager
-from typing import Union, List, IO, Tuple, Optional, Iterator
-from ...url import BaseDirectoryUrl
+from typing import Union, List, IO, Tuple, Optional, Iterator, Iterable, TYPE_CHECKING
+from ...url import BaseDirectoryUrl, BaseFileUrl
 from ...records.delimited import complain_on_unhandled_hints
+import datetime
+import io
 import pprint
+import secrets
 import sqlalchemy
 from ...records.load_plan import RecordsLoadPlan
 from ...records.records_format import (
@@ -13,19 +16,31 @@ from ...records.processing_instructions import ProcessingInstructions
 from ...url.resolver import UrlResolver
 from google.cloud.bigquery.dbapi.connection import Connection
 from google.cloud.bigquery.client import Client
-from google.cloud.bigquery.job import LoadJobConfig
+from google.cloud.bigquery.job import (
+    LoadJobConfig, CopyJobConfig, CreateDisposition, WriteDisposition
+)
+from google.cloud.bigquery.table import Table
 from google.cloud.exceptions import NotFound
 from .load_job_config_options import load_job_config
 import logging
-from ..loader import LoaderFromFileobj
+from ..loader import LoaderFromFileobj, LoaderFromDataframes
 from ..errors import NoTemporaryBucketConfiguration
 from ...check_db_conn_engine import check_db_conn_engine
 from ..db_conn_mixin import DBConnMixin
+from ...records.metrics import record_bytes_written
+from ...utils.concurrency import imap_concurrently, map_concurrently
+if TYPE_CHECKING:
+    from pandas import DataFrame  # noqa
+    from ...records.schema import RecordsSchema  # noqa
 
 logger = logging.getLogger(__name__)
 
+# Staging tables are deleted once a load finishes; this is a backstop
+# in case the process dies before it gets the chance.
+STAGING_TABLE_LIFETIME = datetime.timedelta(days=1)
+
 
-class BigQueryLoader(DBConnMixin, LoaderFromFileobj):
+class BigQueryLoader(DBConnMixin, LoaderFromFileobj, LoaderFromDataframes):
     def __init__(self,
                  db: Optional[Union[sqlalchemy.engine.Connection, sqlalchemy.engine.Engine]],
                  url_resolver: UrlResolver,
@@ -79,6 +94,11 @@ class BigQueryLoader(DBConnMixin, LoaderFromFileobj):
                                         unhandled_hints, target_records_format.hints)
         return job_config
 
+    def max_concurrent_fileobj_loads(self) -> int:
+        # Each file is sent as its own load job, and BigQuery runs
+        # jobs appending to the same table in parallel.
+        return 4
+
     def load_from_fileobj(self, schema: str, table: str,
                           load_plan: RecordsLoadPlan, fileobj: IO[bytes]) -> int:
         logger.info("Loading from fileobj into BigQuery")
@@ -107,6 +127,148 @@ class BigQueryLoader(DBConnMixin, LoaderFromFileobj):
         assert job.output_rows is not None  # should be populated after job result is obtained
         return job.output_rows
 
+    @contextmanager
+    def _staging_table(self,
+                       client: Client,
+                       schema: str,
+                       table: str) -> Iterator[Tuple[str, Table]]:
+        """Create an empty table with the same columns as the target
+        table to load into.  If the block exits without error, its
+        contents are appended to the target table in one copy job, so
+        the target sees either all of the rows or none of them.  The
+        staging table is dropped either way.
+
+        Yields the staging table name and the target table.
+        """
+        project_id, dataset_id = self._parse_bigquery_schema_name(schema)
+        try:
+            table_obj = client.get_table(f"{schema}.{table}")
+        except NotFound:
+            logger.error("BigQuery table %s.%s not found", schema, table)
+            raise
+
+        staging_table_name = (f"{project_id or client.project}.{dataset_id}."
+                              f"{table}_staging_{secrets.token_hex(8)}")
+        staging_table = Table(staging_table_name, schema=table_obj.schema)
+        staging_table.expires = (datetime.datetime.now(datetime.timezone.utc) +
+                                 STAGING_TABLE_LIFETIME)
+        client.create_table(staging_table)
+        try:
+            yield staging_table_name, table_obj
+
+            copy_config = CopyJobConfig()
+            copy_config.create_disposition = CreateDisposition.CREATE_NEVER
+            copy_config.write_disposition = WriteDisposition.WRITE_APPEND
+            copy_job = client.copy_table(staging_table_name,
+                                         f"{schema}.{table}",
+                                         location=table_obj.location,
+                                         job_config=copy_config)
+            try:
+                copy_job.result()  # Waits for copy to complete.
+            except Exception:
+                logger.error(f"BigQuery copy errors:\n\n{pprint.pformat(copy_job.errors)}\n")
+                raise
+        finally:
+            client.delete_table(staging_table_name, not_found_ok=True)
+
+    def _load_fileobj_into(self,
+                           client: Client,
+                           fileobj: IO[bytes],
+                           destination: str,
+                           location: Optional[str],
+                           job_config: LoadJobConfig) -> int:
+        # load_table_from_file() uses a resumable upload for anything
+        # larger than a few megabytes, so a dropped connection
+        # doesn't mean starting the file over.
+        job = client.load_table_from_file(fileobj,
+                                          destination,
+                                          location=location,
+                                          job_config=job_config)
+        try:
+            job.result()  # Waits for table load to complete.
+        except Exception:
+            logger.error(f"BigQuery load errors:\n\n{pprint.pformat(job.errors)}\n")
+            raise
+        assert job.output_rows is not None  # should be populated after job result is obtained
+        return job.output_rows
+
+    def load_from_records_directory_via_fileobj(self,
+                                                schema: str,
+                                                table: str,
+                                                load_plan: RecordsLoadPlan,
+                                                directory: RecordsDirectory) -> Optional[int]:
+        all_urls = directory.manifest_entry_urls()
+        if len(all_urls) <= 1:
+            # A single load job is already all-or-nothing
+            return super().load_from_records_directory_via_fileobj(schema=schema,
+                                                                   table=table,
+                                                                   load_plan=load_plan,
+                                                                   directory=directory)
+
+        logger.info(f"Loading {len(all_urls)} files into BigQuery via a staging table")
+        connection: Connection = self.db_engine.raw_connection().connection
+        client: Client = connection._client
+        project_id, dataset_id = self._parse_bigquery_schema_name(schema)
+        job_config = self._load_job_config(load_plan)
+        logger.info(f"Using BigQuery load options: {job_config.to_api_repr()}")
+
+        # Resolve URLs here rather than in the threads below, as
+        # doing so can create clients from a shared session (e.g.,
+        # boto3's), which isn't thread-safe.
+        locs = [self.url_resolver.file_url(url) for url in all_urls]
+        with self._staging_table(client, schema, table) as (staging_table_name, table_obj):
+            def load_loc(loc: BaseFileUrl) -> int:
+                with loc.open() as f:
+                    logger.info(f"Loading {loc.url} into {staging_table_name}...")
+                    return self._load_fileobj_into(client, f, staging_table_name,
+                                                   table_obj.location, job_config)
+
+            rows = sum(map_concurrently(load_loc, locs,
+                                        max_workers=self.max_concurrent_fileobj_loads()))
+
+        logger.info(f"Loaded {rows} rows into {dataset_id}:{table}")
+        return rows
+
+    def dataframes_records_format(self) -> BaseRecordsFormat:
+        return ParquetRecordsFormat()
+
+    def load_from_dataframes(self,
+                             schema: str,
+                             table: str,
+                             load_plan: RecordsLoadPlan,
+                             records_schema: 'RecordsSchema',
+                             dfs: Iterable['DataFrame'],
+                             include_index: bool) -> int:
+        import pyarrow.parquet
+
+        logger.info("Loading from dataframes into BigQuery")
+        connection: Connection = self.db_engine.raw_connection().connection
+        client: Client = connection._client
+        project_id, dataset_id = self._parse_bigquery_schema_name(schema)
+        parquet_load_plan = RecordsLoadPlan(records_format=ParquetRecordsFormat(),
+                                            processing_instructions=load_plan.
+                                            processing_instructions)
+        job_config = self._load_job_config(parquet_load_plan)
+
+        # Each dataframe is sent as its own load job, and those jobs
+        # run concurrently.
+        with self._staging_table(client, schema, table) as (staging_table_name, table_obj):
+            def load_df(df: 'DataFrame') -> int:
+                arrow_table = records_schema.dataframe_to_arrow_table(df,
+                                                                      include_index=include_index)
+                buf = io.BytesIO()
+                pyarrow.parquet.write_table(arrow_table, buf)
+                record_bytes_written(buf.tell())
+                buf.seek(0)
+                return self._load_fileobj_into(client, buf, staging_table_name,
+                                               table_obj.location, job_config)
+
+            rows = sum(imap_concurrently(load_df, dfs,
+                                         max_workers=self.max_concurrent_fileobj_loads()))
+
+        logger.info(f"Loaded {rows} rows into {dataset_id}:{table}")
+        return rows
+
     def load(self,
              schema: str,
              table: str,
@@ -1,21 +1,41 @@
 import sqlalchemy
 from contextlib import contextmanager
-from typing import List, Iterator, Optional, Union, Tuple
+from typing import List, Iterator, Optional, Union, Tuple, Set
 import logging
+from google.api_core.exceptions import BadRequest
 from google.cloud.bigquery.dbapi.connection import Connection
 from google.cloud.bigquery.client import Client
 from google.cloud.bigquery.job import ExtractJobConfig
+from google.cloud.bigquery.table import TableReference
 from records_mover.db.unloader import Unloader
-from records_mover.records.records_format import BaseRecordsFormat, AvroRecordsFormat
+from records_mover.db.quoting import quote_schema_and_table
+from records_mover.records.records_format import (
+    BaseRecordsFormat, AvroRecordsFormat, DelimitedRecordsFormat, ParquetRecordsFormat
+)
+from records_mover.records.delimited import complain_on_unhandled_hints
 from records_mover.url.base import BaseDirectoryUrl
 from records_mover.url.resolver import UrlResolver
 from records_mover.records.unload_plan import RecordsUnloadPlan
 from records_mover.records.records_directory import RecordsDirectory
+from records_mover.records.records_types import UrlDetails
 from records_mover.db.errors import NoTemporaryBucketConfiguration
 from ...check_db_conn_engine import check_db_conn_engine
+from .extract_job_config_options import extract_job_config
 
 logger = logging.getLogger(__name__)
 
+# Basename of the file BigQuery exports a table into, where it fits
+# into one file
+SINGLE_FILE_BASENAME = 'output'
+
+# Filename prefix for the files BigQuery exports a table into when
+# it's too large for one
+SHARD_PREFIX = 'part-'
+
+# Part of the error BigQuery gives when asked to export more than
+# 1GB into a single file
+TOO_LARGE_FOR_SINGLE_FILE = 'too large to be exported to a single file'
+
 
 class BigQueryUnloader(Unloader):
     def __init__(self,
@@ -30,9 +50,12 @@ class BigQueryUnloader(Unloader):
         super().__init__(db=db, db_conn=db_conn, db_engine=db_engine)
 
     def can_unload_format(self, target_records_format: BaseRecordsFormat) -> bool:
-        if isinstance(target_records_format, AvroRecordsFormat):
+        try:
+            unload_plan = RecordsUnloadPlan(records_format=target_records_format)
+            self._extract_job_config(unload_plan)
             return True
-        return False
+        except NotImplementedError:
+            return False
 
     def can_unload_to_scheme(self, scheme: str) -> bool:
         if scheme == 'gs':
@@ -42,7 +65,16 @@ class BigQueryUnloader(Unloader):
         return self.gcs_temp_base_loc is not None
 
     def known_supported_records_formats_for_unload(self) -> List[BaseRecordsFormat]:
-        return [AvroRecordsFormat()]
+        return [
+            AvroRecordsFormat(),
+            # Offered so that databases which can't load Avro can
+            # still bulk load what BigQuery exports, rather than
+            # having to go through a dataframe.
+            #
+            # CSV isn't offered, as there are no hints to describe
+            # how BigQuery writes out date/time values in CSV.
+            ParquetRecordsFormat(),
+        ]
 
     @contextmanager
     def temporary_unloadable_directory_loc(self) -> Iterator[BaseDirectoryUrl]:
@@ -69,46 +101,113 @@ class BigQueryUnloader(Unloader):
         return (project, dataset)
 
     def _extract_job_config(self, unload_plan: RecordsUnloadPlan) -> ExtractJobConfig:
-        config = ExtractJobConfig()
-        if isinstance(unload_plan.records_format, AvroRecordsFormat):
-            config.destination_format = 'AVRO'
-            # https://cloud.google.com/bigquery/docs/loading-data-cloud-storage-avro#logical_types
-            config.use_avro_logical_types = True
-        else:
-            raise NotImplementedError(f'Please add support for {unload_plan.records_format}')
+        unhandled_hints: Set[str] = set()
+        if isinstance(unload_plan.records_format, DelimitedRecordsFormat):
+            unhandled_hints = set(unload_plan.records_format.hints.keys())
+        config = extract_job_config(unhandled_hints, unload_plan)
+        if isinstance(unload_plan.records_format, DelimitedRecordsFormat):
+            processing_instructions = unload_plan.processing_instructions
+            complain_on_unhandled_hints(processing_instructions.fail_if_dont_understand,
+                                        unhandled_hints, unload_plan.records_format.hints)
         return config
 
+    def _client(self) -> Client:
+        # https://googleapis.github.io/google-cloud-python/latest/bigquery/usage/tables.html#creating-a-table
+        connection: Connection =\
+            self.db_engine.raw_connection().connection
+        # https://google-cloud.readthedocs.io/en/latest/bigquery/generated/google.cloud.bigquery.client.Client.html
+        client: Client = connection._client
+        return client
+
     def unload(self,
                schema: str,
                table: str,
                unload_plan: RecordsUnloadPlan,
                directory: RecordsDirectory) -> Optional[int]:
+        if unload_plan.where is not None:
+            schema_and_table = quote_schema_and_table(None, schema, table,
+                                                      db_engine=self.db_engine)
+            return self.unload_query(f"SELECT * FROM {schema_and_table} "
+                                     f"WHERE {unload_plan.where}",
+                                     unload_plan=unload_plan,
+                                     directory=directory)
+        # Validate the schema name before starting any jobs
+        self._parse_bigquery_schema_name(schema)
+        return self._extract_table(f"{schema}.{table}", unload_plan, directory)
+
+    def unload_query(self,
+                     query: str,
+                     unload_plan: RecordsUnloadPlan,
+                     directory: RecordsDirectory) -> Optional[int]:
+        # Extract jobs can only export whole tables, so run the query
+        # first and export its (temporary) result table.
+        logger.info("Running query to unload from BigQuery")
+        query_job = self._client().query(query)
+        query_job.result()
+        return self._extract_table(query_job.destination, unload_plan, directory)
+
+    def _run_extract_job(self,
+                         client: Client,
+                         source: Union[str, TableReference],
+                         destination_uri: str,
+                         job_config: ExtractJobConfig) -> None:
+        job = client.extract_table(source,
+                                   destination_uri,
+                                   # Must match the destination dataset location.
+                                   job_config=job_config)
+        job.result()  # Waits for table load to complete.
+
+    def _extract_table(self,
+                       source: Union[str, TableReference],
+                       unload_plan: RecordsUnloadPlan,
+                       directory: RecordsDirectory) -> Optional[int]:
         if directory.scheme != 'gs':
             with self.temporary_unloadable_directory_loc() as temp_gcs_loc:
                 temp_directory = RecordsDirectory(temp_gcs_loc)
-                out = self.unload(schema=schema,
-                                  table=table,
-                                  unload_plan=unload_plan,
-                                  directory=temp_directory)
+                out = self._extract_table(source,
+                                          unload_plan=unload_plan,
+                                          directory=temp_directory)
                 temp_directory.copy_to(directory.loc)
                 return out
         logger.info("Loading from records directory into BigQuery")
-        # https://googleapis.github.io/google-cloud-python/latest/bigquery/usage/tables.html#creating-a-table
-        connection: Connection =\
-            self.db_engine.raw_connection().connection
-        # https://google-cloud.readthedocs.io/en/latest/bigquery/generated/google.cloud.bigquery.client.Client.html
-        client: Client = connection._client
-        project_id, dataset_id = self._parse_bigquery_schema_name(schema)
+        client = self._client()
         job_config = self._extract_job_config(unload_plan)
 
         records_format = unload_plan.records_format
-        filename = records_format.generate_filename('output')
-        destination_uri = directory.loc.file_in_this_directory(filename)
-        job = client.extract_table(f"{schema}.{table}",
-                                   destination_uri.url,
-                                   # Must match the destination dataset location.
-                                   job_config=job_config)
-        job.result()  # Waits for table load to complete.
-        logger.info(f"Unloaded from {dataset_id}:{table} into {filename}")
-        directory.save_preliminary_manifest()
+        # Export into a single file where BigQuery allows it, as
+        # that's what's needed to save the records to a single URL
+        # later (e.g., Avro files, or delimited files with header
+        # rows, can't simply be concatenated).
+        filename = records_format.generate_filename(SINGLE_FILE_BASENAME)
+        loc = directory.loc.file_in_this_directory(filename)
+        try:
+            self._run_extract_job(client, source, loc.url, job_config)
+            url_details: UrlDetails = {
+                loc.url: {
+                    'content_length': loc.size()
+                }
+            }
+        except BadRequest as e:
+            if (TOO_LARGE_FOR_SINGLE_FILE not in str(e) or
+               not unload_plan.processing_instructions.parallel_export):
+                raise
+            # BigQuery refuses to export more than 1GB into a single
+            # file; with a wildcard it splits the export into as many
+            # shards as it needs, which can then be read in parallel.
+            logger.info(f"{source} is too large to export into a single file; "
+                        "exporting into shards instead")
+            filename = records_format.generate_filename(f'{SHARD_PREFIX}*')
+            self._run_extract_job(client, source,
+                                  directory.loc.file_in_this_directory(filename).url,
+                                  job_config)
+            url_details = {
+                shard_loc.url: {
+                    'content_length': shard_loc.size()
+                }
+                for shard_loc in sorted(directory.loc.files_matching_prefix(SHARD_PREFIX),
+                                        key=lambda shard_loc: shard_loc.url)
+            }
+        logger.info(f"Unloaded from {source} into {len(url_details)} "
+                    f"files matching {filename}")
+        directory.save_preliminary_manifest(url_details)
         return None
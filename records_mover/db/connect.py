@@ -7,7 +7,7 @@ from db_facts.lpass import db_info_from_lpass
 
 from records_mover.db.db_type import canonicalize_db_type
 from db_facts.db_facts_types import DBFacts
-from typing import Union
+from typing import Union, Any
 
 
 logger = logging.getLogger(__name__)
@@ -85,7 +85,7 @@ def create_bigquery_sqlalchemy_url(db_facts: DBFacts) -> str:
     return url
 
 
-def create_bigquery_db_engine(db_facts: DBFacts) -> sa.engine.Engine:
+def create_bigquery_db_engine(db_facts: DBFacts, **engine_kwargs: Any) -> sa.engine.Engine:
     service_account_json = db_facts.get('bq_service_account_json')
     credentials_info = None
     if service_account_json is not None:
@@ -94,7 +94,7 @@ def create_bigquery_db_engine(db_facts: DBFacts) -> sa.engine.Engine:
     else:
         logger.info("Found no service account info for BigQuery, using local creds")
     url = create_bigquery_sqlalchemy_url(db_facts)
-    return sa.engine.create_engine(url, credentials_info=credentials_info)
+    return sa.engine.create_engine(url, credentials_info=credentials_info, **engine_kwargs)
 
 
 def create_sqlalchemy_url(db_facts: DBFacts,
@@ -130,14 +130,19 @@ def engine_from_lpass_entry(lpass_entry_name: str) -> sa.engine.Engine:
     return engine_from_db_facts(db_facts)
 
 
-def engine_from_db_facts(db_facts: DBFacts) -> sa.engine.Engine:
+def engine_from_db_facts(db_facts: DBFacts, **engine_kwargs: Any) -> sa.engine.Engine:
+    """Create a new SQLAlchemy Engine for the database described by db_facts.
+
+    Any engine_kwargs (e.g., pool_size, pool_pre_ping, pool_recycle)
+    are passed through to sqlalchemy.create_engine().
+    """
     db_type = canonicalize_db_type(db_facts['type'])
     driver = db_driver_for_type.get(db_type, db_type)
     if driver == 'bigquery':
         # without writing creds to a temp file, pybigquery doesn't
         # support specifying service account creds in a URL - so let's
         # use create_engine() instead of creating a URL just in case.
-        return create_bigquery_db_engine(db_facts)
+        return create_bigquery_db_engine(db_facts, **engine_kwargs)
     else:
         db_url = create_sqlalchemy_url(db_facts)
-        return sa.create_engine(db_url)
+        return sa.create_engine(db_url, **engine_kwargs)
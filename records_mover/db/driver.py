@@ -2,21 +2,36 @@ from ..check_db_conn_engine import check_db_conn_engine
 from sqlalchemy.schema import CreateTable
 from sqlalchemy_privileges import GrantPrivileges  # type: ignore[import-untyped]
 from ..records.records_format import BaseRecordsFormat
-from .loader import LoaderFromFileobj, LoaderFromRecordsDirectory
+from .loader import LoaderFromFileobj, LoaderFromRecordsDirectory, LoaderFromDataframes
 from .unloader import Unloader
 import logging
 import sqlalchemy
 from sqlalchemy import MetaData, text
-from sqlalchemy.schema import Table
+from sqlalchemy.schema import Column, Table
 from abc import ABCMeta, abstractmethod
 from records_mover.records import RecordsSchema
-from typing import Union, Dict, List, Tuple, Optional, TYPE_CHECKING
+from typing import Any, Union, Dict, List, Sequence, Tuple, Optional, TYPE_CHECKING
 from .db_conn_mixin import DBConnMixin
+from .reflection_cache import reflection_cache_for_engine
+from .quoting import (quote_schema_and_table, quote_table_only, quote_column_name,
+                      literal_text)
+import secrets
 if TYPE_CHECKING:
     from typing_extensions import Literal  # noqa
 
 logger = logging.getLogger(__name__)
 
+# Postgres truncates identifiers longer than this; the other
+# databases supported allow at least as many characters.
+MAX_TABLE_NAME_LENGTH = 63
+
+
+def scratch_table_name(table: str, purpose: str) -> str:
+    """Return a new, unique name for a short-lived table based on the
+    given table's name."""
+    suffix = f"_{purpose}_{secrets.token_hex(4)}"
+    return table[:MAX_TABLE_NAME_LENGTH - len(suffix)] + suffix
+
 
 class DBDriver(DBConnMixin, metaclass=ABCMeta):
     def __init__(self,
@@ -24,6 +39,7 @@ class DBDriver(DBConnMixin, metaclass=ABCMeta):
                               sqlalchemy.engine.Connection]],
                  db_conn: Optional[sqlalchemy.engine.Connection] = None,
                  db_engine: Optional[sqlalchemy.engine.Engine] = None,
+                 fast_reflection: bool = False,
                  **kwargs) -> None:
         db, db_conn, db_engine = check_db_conn_engine(db=db, db_conn=db_conn, db_engine=db_engine)
         self.db = db
@@ -31,14 +47,66 @@ class DBDriver(DBConnMixin, metaclass=ABCMeta):
         self._db_conn = db_conn
         self.conn_opened_here = False
         self.meta = MetaData()
+        self.fast_reflection = fast_reflection
+
+    def _reflection_db(self) -> Union[sqlalchemy.engine.Engine, sqlalchemy.engine.Connection]:
+        # Reuse our connection if we already have one rather than
+        # checking out another from the pool.
+        if self._db_conn is not None:
+            return self._db_conn
+        return self.db_engine
 
     def has_table(self, schema: str, table: str) -> bool:
-        return sqlalchemy.inspect(self.db_engine).has_table(table, schema=schema)
+        return sqlalchemy.inspect(self._reflection_db()).has_table(table, schema=schema)
 
     def table(self,
               schema: str,
               table: str) -> Table:
-        return Table(table, self.meta, schema=schema, autoload_with=self.db_engine)
+        """Return a SQLAlchemy Table describing an existing table.
+
+        Results are cached per engine for a limited time (see
+        :class:`records_mover.db.reflection_cache.TableReflectionCache`);
+        call invalidate_table() after changing a table's structure.
+        """
+        cache = reflection_cache_for_engine(self.db_engine)
+        return cache.get_or_reflect(schema, table,
+                                    lambda: self.reflect_table(schema, table),
+                                    fast=self.fast_reflection)
+
+    def reflect_table(self,
+                      schema: str,
+                      table: str) -> Table:
+        """Pull table metadata from the database, bypassing the cache.
+        Override this (or autoload_table()) rather than table() to change
+        how reflection is done for a particular database type."""
+        if self.fast_reflection:
+            table_obj = self.fast_reflect_table(schema, table)
+            if table_obj is not None:
+                return table_obj
+        return self.autoload_table(schema, table)
+
+    def autoload_table(self,
+                       schema: str,
+                       table: str) -> Table:
+        """Reflect full table metadata.  Each table is reflected into its
+        own MetaData so that cached tables can be freed independently."""
+        return Table(table, MetaData(), schema=schema, autoload_with=self._reflection_db())
+
+    def fast_reflect_table(self,
+                           schema: str,
+                           table: str) -> Optional[Table]:
+        """Reflect column names, types and nullability (but not defaults or
+        constraints) in a single query, if this database type supports
+        it.  Returns None if not possible, in which case full
+        reflection is used."""
+        return None
+
+    def invalidate_table(self,
+                         schema: str,
+                         table: str) -> None:
+        """Discard any cached reflection of the given table.  Call after
+        running DDL which creates, drops or alters it."""
+        reflection_cache_for_engine(self.db_engine).invalidate(schema, table)
 
     def schema_sql(self,
                    schema: str,
@@ -52,6 +120,138 @@ class DBDriver(DBConnMixin, metaclass=ABCMeta):
         table_obj = self.table(schema, table)
         return str(CreateTable(table_obj))
 
+    def query_columns(self, sql: str) -> List[Column]:
+        """Describe the columns a SELECT statement returns (without
+        fetching any of its rows) as SQLAlchemy Column objects."""
+        query = literal_text(f"SELECT * FROM ({sql}) AS records_mover_query WHERE 1 = 0")
+        result = self.db_conn.execute(query)
+        try:
+            description = result.cursor.description
+        finally:
+            result.close()
+        return self.columns_from_cursor_description(description)
+
+    def columns_from_cursor_description(self,
+                                        description: Sequence[Sequence[Any]]) -> List[Column]:
+        """Build SQLAlchemy columns from a DB-API cursor description.
+
+        By default this relies on the DB-API type objects, which only
+        tell numbers, dates and times and binary data apart from
+        strings; override this where the driver reports more precise
+        type codes."""
+        dbapi = self.db_engine.dialect.dbapi
+        columns = []
+        for name, type_code, _display_size, _internal_size, precision, scale, *_ in description:
+            type_: sqlalchemy.types.TypeEngine
+            if type_code is not None and type_code == getattr(dbapi, 'NUMBER', None):
+                type_ = sqlalchemy.types.Numeric(precision, scale)
+            elif type_code is not None and type_code == getattr(dbapi, 'DATETIME', None):
+                type_ = sqlalchemy.types.DateTime()
+            elif type_code is not None and type_code == getattr(dbapi, 'BINARY', None):
+                type_ = sqlalchemy.types.LargeBinary()
+            else:
+                type_ = sqlalchemy.types.String()
+            columns.append(Column(name, type_))
+        return columns
+
+    def _quote_schema_and_table(self, schema: str, table: str) -> str:
+        return quote_schema_and_table(None, schema, table, db_engine=self.db_engine)
+
+    def truncate_table(self,
+                       schema: str,
+                       table: str) -> None:
+        """Remove all rows from an existing table, typically with a SQL
+        TRUNCATE statement.  This is much faster than a DELETE, but
+        depending on the database may commit any transaction in
+        progress and ignore triggers and constraints."""
+        self.db_conn.execute(text(f"TRUNCATE TABLE {self._quote_schema_and_table(schema, table)}"))
+
+    def create_table_like(self,
+                          schema: str,
+                          table: str,
+                          like_table: str) -> None:
+        """Create a new, empty table with the same columns as an existing
+        table in the same schema."""
+        existing = self.table(schema, like_table)
+        new_table = existing.to_metadata(MetaData(), name=table)  # type: ignore[attr-defined]
+        self.db_conn.execute(CreateTable(new_table))
+
+    def replace_table(self,
+                      schema: str,
+                      table: str,
+                      replacement_table: str) -> None:
+        """Put replacement_table in place of table (in the same schema),
+        dropping the original.
+
+        By default this renames both tables and drops the old one,
+        which other sessions see as a single change if run in a
+        transaction on a database with transactional DDL (e.g.,
+        Postgres or Redshift).  Override this for databases which
+        offer a better way.
+
+        The old table is dropped without CASCADE, so objects which
+        depend on it (e.g., views) are never silently dropped; where
+        the database tracks them, the DROP fails instead.
+        """
+        old_table = scratch_table_name(table, 'old')
+        self.db_conn.execute(text(f"ALTER TABLE {self._quote_schema_and_table(schema, table)} "
+                                  f"RENAME TO {quote_table_only(None, old_table, self.db_engine)}"))
+        self.db_conn.execute(text("ALTER TABLE "
+                                  f"{self._quote_schema_and_table(schema, replacement_table)} "
+                                  f"RENAME TO {quote_table_only(None, table, self.db_engine)}"))
+        self.db_conn.execute(text(f"DROP TABLE {self._quote_schema_and_table(schema, old_table)}"))
+
+    def _quote_column_names(self, schema: str, table: str) -> List[str]:
+        return [quote_column_name(None, column.name, db_engine=self.db_engine)
+                for column in self.table(schema, table).columns]
+
+    def merge_table(self,
+                    schema: str,
+                    table: str,
+                    source_table: str,
+                    key_columns: List[str]) -> None:
+        """Upsert all rows of source_table into table (both in the same
+        schema and with the same columns): rows of table whose
+        key_columns match a source row are replaced by it, and other
+        source rows are inserted.
+
+        By default this deletes the matching rows and then inserts
+        the new ones, which is the usual approach for databases
+        without an upsert statement (e.g., Redshift).
+        """
+        target = self._quote_schema_and_table(schema, table)
+        source = self._quote_schema_and_table(schema, source_table)
+        columns = ', '.join(self._quote_column_names(schema, table))
+        quoted_keys = [quote_column_name(None, key, db_engine=self.db_engine)
+                       for key in key_columns]
+        matches = ' AND '.join(f"{source}.{key} = {target}.{key}" for key in quoted_keys)
+        self.db_conn.execute(text(f"DELETE FROM {target} "
+                                  f"WHERE EXISTS (SELECT 1 FROM {source} WHERE {matches})"))
+        self.db_conn.execute(text(f"INSERT INTO {target} ({columns}) "
+                                  f"SELECT {columns} FROM {source}"))
+
+    def _merge_statement(self,
+                         schema: str,
+                         table: str,
+                         source_table: str,
+                         key_columns: List[str]) -> str:
+        """A SQL MERGE statement implementing merge_table(), for
+        databases which support one."""
+        quoted_keys = [quote_column_name(None, key, db_engine=self.db_engine)
+                       for key in key_columns]
+        columns = self._quote_column_names(schema, table)
+        matches = ' AND '.join(f"tgt.{key} = src.{key}" for key in quoted_keys)
+        updates = ', '.join(f"{column} = src.{column}"
+                            for column in columns if column not in quoted_keys)
+        sql = (f"MERGE INTO {self._quote_schema_and_table(schema, table)} AS tgt "
+               f"USING {self._quote_schema_and_table(schema, source_table)} AS src "
+               f"ON {matches} ")
+        if updates:
+            sql += f"WHEN MATCHED THEN UPDATE SET {updates} "
+        sql += (f"WHEN NOT MATCHED THEN INSERT ({', '.join(columns)}) "
+                f"VALUES ({', '.join('src.' + column for column in columns)})")
+        return sql
+
     def varchar_length_is_in_chars(self) -> bool:
         """True if the 'n' in VARCHAR(n) is represented in natural language
         characters, rather than in post-encoding bytes.  This varies by database -
@@ -139,6 +339,11 @@ class DBDriver(DBConnMixin, metaclass=ABCMeta):
     def unloader(self) -> Optional[Unloader]:
         ...
 
+    def loader_from_dataframes(self) -> Optional[LoaderFromDataframes]:
+        """Loader able to load dataframes without first serializing
+        them into a records format, if this database supports that."""
+        return None
+
     def type_for_floating_point(self,
                                 fp_total_bits: int,
                                 fp_significand_bits: int) -> sqlalchemy.sql.sqltypes.Numeric:
@@ -222,6 +427,13 @@ class DBDriver(DBConnMixin, metaclass=ABCMeta):
 
 
 class GenericDBDriver(DBDriver):
+    def truncate_table(self,
+                       schema: str,
+                       table: str) -> None:
+        # TRUNCATE isn't universal (e.g., SQLite), but DELETE is.
+        table_obj = Table(table, MetaData(), schema=schema)
+        self.db_conn.execute(table_obj.delete())
+
     def loader_from_fileobj(self) -> None:
         return None
 
@@ -0,0 +1,80 @@
+import json
+import logging
+import threading
+from typing import Any, Dict, Optional, TYPE_CHECKING
+from db_facts.db_facts_types import DBFacts
+from records_mover.db.db_type import canonicalize_db_type
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine  # noqa
+
+
+logger = logging.getLogger(__name__)
+
+
+def normalized_db_facts_key(db_facts: DBFacts) -> str:
+    """Produce a stable string key for a set of DB facts, so that
+    equivalent ways of describing the same database (e.g., 'psql
+    (redshift)' vs 'redshift', or the legacy 'username' key vs
+    'user') map to the same cached engine."""
+    normalized: Dict[str, Any] = {
+        k: v for k, v in db_facts.items() if v is not None
+    }
+    if 'type' in normalized:
+        normalized['type'] = canonicalize_db_type(normalized['type'])
+    if 'username' in normalized and 'user' not in normalized:
+        normalized['user'] = normalized.pop('username')
+    return json.dumps(normalized, sort_keys=True, default=str)
+
+
+class EngineCache:
+    def __init__(self,
+                 pool_size: Optional[int] = None,
+                 pool_pre_ping: bool = True,
+                 pool_recycle: Optional[int] = None) -> None:
+        """Hands out one SQLAlchemy Engine (and thus one connection pool)
+        per distinct database, so that repeated lookups of the same
+        credentials reuse pooled connections rather than building a
+        new engine each time.
+
+        :param pool_size: Number of connections to keep open in each
+           engine's pool.  If not specified, SQLAlchemy's default for
+           the dialect is used.
+        :param pool_pre_ping: Whether to test connections for liveness
+           when they are checked out of the pool.  Recommended, as
+           cached engines can outlive server-side idle timeouts.
+        :param pool_recycle: Number of seconds after which a pooled
+           connection is replaced.  If not specified, SQLAlchemy's
+           default (no recycling) is used.
+        """
+        self.pool_size = pool_size
+        self.pool_pre_ping = pool_pre_ping
+        self.pool_recycle = pool_recycle
+        self._engines: Dict[str, 'Engine'] = {}
+        self._lock = threading.Lock()
+
+    def engine_kwargs(self) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {'pool_pre_ping': self.pool_pre_ping}
+        if self.pool_size is not None:
+            kwargs['pool_size'] = self.pool_size
+        if self.pool_recycle is not None:
+            kwargs['pool_recycle'] = self.pool_recycle
+        return kwargs
+
+    def engine_from_db_facts(self, db_facts: DBFacts) -> 'Engine':
+        from records_mover.db.connect import engine_from_db_facts
+
+        key = normalized_db_facts_key(db_facts)
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is None:
+                logger.debug("Creating new database engine")
+                engine = engine_from_db_facts(db_facts, **self.engine_kwargs())
+                self._engines[key] = engine
+            return engine
+
+    def dispose(self) -> None:
+        """Close all pooled connections and forget all cached engines."""
+        with self._lock:
+            for engine in self._engines.values():
+                engine.dispose()
+            self._engines.clear()
@@ -28,3 +28,7 @@ class CredsDoNotSupportS3Export(S3ExportNotSupported):
 
 class CredsDoNotSupportS3Import(LoadError):
     pass
+
+
+class RedshiftDataApiError(LoadUnloadError):
+    pass
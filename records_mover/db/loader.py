@@ -4,12 +4,16 @@ from ..records.load_plan import RecordsLoadPlan
 from ..records.records_directory import RecordsDirectory
 from ..url.filesystem import FilesystemDirectoryUrl
 from contextlib import contextmanager
-from ..url.base import BaseDirectoryUrl
+from ..url.base import BaseDirectoryUrl, BaseFileUrl
+from ..utils.concurrency import map_concurrently
 from tempfile import TemporaryDirectory
 from abc import ABCMeta, abstractmethod
-from typing import Optional, Type, Iterator, IO, List
+from typing import Optional, Type, Iterator, Iterable, IO, List, TYPE_CHECKING
 import sqlalchemy
 import logging
+if TYPE_CHECKING:
+    from pandas import DataFrame  # noqa
+    from ..records.schema import RecordsSchema  # noqa
 
 
 logger = logging.getLogger(__name__)
@@ -81,23 +85,35 @@ class LoaderFromFileobj(LoaderFromRecordsDirectory, metaclass=ABCMeta):
         """Loads the data from the file stream provided and append to the existing table."""
         ...
 
+    def max_concurrent_fileobj_loads(self) -> int:
+        """Number of files in a records directory which can be passed to
+        load_from_fileobj() at the same time.  Override this if
+        concurrent calls are safe and the database handles them in
+        parallel."""
+        return 1
+
     def load_from_records_directory_via_fileobj(self,
                                                 schema: str,
                                                 table: str,
                                                 load_plan: RecordsLoadPlan,
                                                 directory: RecordsDirectory) -> Optional[int]:
-        all_urls = directory.manifest_entry_urls()
+        # Resolve URLs here rather than in the threads below, as
+        # doing so can create clients from a shared session (e.g.,
+        # boto3's), which isn't thread-safe.
+        locs = [self.url_resolver.file_url(url) for url in directory.manifest_entry_urls()]
 
-        total_rows = None
-        for url in all_urls:
-            loc = self.url_resolver.file_url(url)
+        def load_loc(loc: BaseFileUrl) -> Optional[int]:
             with loc.open() as f:
-                logger.info(f"Loading {url} into {schema}.{table}...")
-                out = self.load_from_fileobj(schema, table, load_plan, f)
-                if out is not None:
-                    if total_rows is None:
-                        total_rows = 0
-                    total_rows += out
+                logger.info(f"Loading {loc.url} into {schema}.{table}...")
+                return self.load_from_fileobj(schema, table, load_plan, f)
+
+        total_rows = None
+        for out in map_concurrently(load_loc, locs,
+                                    max_workers=self.max_concurrent_fileobj_loads()):
+            if out is not None:
+                if total_rows is None:
+                    total_rows = 0
+                total_rows += out
         return total_rows
 
     def load(self,
@@ -110,3 +126,28 @@ class LoaderFromFileobj(LoaderFromRecordsDirectory, metaclass=ABCMeta):
                                                             table=table,
                                                             load_plan=load_plan,
                                                             directory=directory)
+
+
+class LoaderFromDataframes(LoaderFromRecordsDirectory, metaclass=ABCMeta):
+    @abstractmethod
+    def dataframes_records_format(self) -> BaseRecordsFormat:
+        """The records format dataframes are converted into by
+        load_from_dataframes(), so the target table can be created
+        with types that format can load into."""
+        ...
+
+    @abstractmethod
+    def load_from_dataframes(self,
+                             schema: str,
+                             table: str,
+                             load_plan: RecordsLoadPlan,
+                             records_schema: 'RecordsSchema',
+                             dfs: Iterable['DataFrame'],
+                             include_index: bool) -> Optional[int]:
+        """Load the dataframes provided, whose series (and index, if
+        include_index is True) are named after the fields in
+        records_schema, and append them to the existing table.
+
+        Returns number of rows loaded (if database provides that
+        info)."""
+        ...
@@ -0,0 +1,76 @@
+from contextlib import contextmanager
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from typing import IO, Iterator, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class _FifoWriter(threading.Thread):
+    def __init__(self, path: str, fileobj: IO[bytes]) -> None:
+        super().__init__(name=f'fifo_writer({path})', daemon=True)
+        self.path = path
+        self.fileobj = fileobj
+        self.tried_open = threading.Event()
+        self.error: Optional[BaseException] = None
+
+    def run(self) -> None:
+        try:
+            try:
+                # Blocks until something opens the pipe to read from it
+                fifo = open(self.path, 'wb')
+            finally:
+                self.tried_open.set()
+            with fifo:
+                shutil.copyfileobj(self.fileobj, fifo)
+        except BaseException as e:
+            self.error = e
+
+    def finish(self) -> None:
+        if not self.tried_open.is_set():
+            # Nothing ever read from the pipe (e.g., the statement
+            # failed before asking for the file), so open it ourselves
+            # until the writer is past opening it, to let the writer
+            # give up rather than waiting forever.
+            fd = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+            try:
+                self.tried_open.wait()
+            finally:
+                os.close(fd)
+        self.join()
+
+
+@contextmanager
+def fileobj_as_local_file(fileobj: IO[bytes]) -> Iterator[str]:
+    """Yield the path of a local file whose contents are those of
+    fileobj, e.g. for LOAD DATA LOCAL INFILE.
+
+    Where supported, this is a named pipe which fileobj is copied
+    into as it's read from, so data is streamed through without a
+    local copy being made.  Raises any error encountered copying
+    fileobj once the file has been read, as the reader will have
+    seen a truncated file.
+    """
+    with tempfile.TemporaryDirectory(prefix='mysql_loader_fifo') as tempdir:
+        path = os.path.join(tempdir, 'data')
+        if not hasattr(os, 'mkfifo'):
+            logger.info("Named pipes aren't supported here; making a local copy to load from")
+            with open(path, 'wb') as f:
+                shutil.copyfileobj(fileobj, f)
+            yield path
+            return
+        os.mkfifo(path)
+        writer = _FifoWriter(path, fileobj)
+        writer.start()
+        try:
+            yield path
+        except BaseException:
+            writer.finish()
+            raise
+        writer.finish()
+        if writer.error is not None:
+            raise writer.error
@@ -1,24 +1,32 @@
 import sqlalchemy
-from pathlib import Path
+from contextlib import ExitStack
 from records_mover.records import ProcessingInstructions
-from records_mover.db.loader import LoaderFromRecordsDirectory
-from records_mover.url.filesystem import FilesystemDirectoryUrl, FilesystemFileUrl
+from records_mover.db.loader import LoaderFromFileobj
+from records_mover.url.base import BaseFileUrl
+from records_mover.url.filesystem import FilesystemFileUrl
 from records_mover.records.load_plan import RecordsLoadPlan
 from records_mover.records.records_directory import RecordsDirectory
 from records_mover.records.records_format import BaseRecordsFormat, DelimitedRecordsFormat
-from .load_options import mysql_load_options
+from .fifo import fileobj_as_local_file
+from .load_options import mysql_load_options, MySqlLoadOptions
 from ...records.delimited import complain_on_unhandled_hints
 from ...url.resolver import UrlResolver
-from typing import Union, List, Optional
+from ...utils.concurrency import map_concurrently
+from typing import IO, Union, List, Optional
 import logging
-import tempfile
 from ...check_db_conn_engine import check_db_conn_engine
 from ..db_conn_mixin import DBConnMixin
 
 logger = logging.getLogger(__name__)
 
+# load() loads files over up to this many connections at once, as
+# LOAD DATA spends much of its time parsing and inserting rows on the
+# server.  (load_from_fileobj() uses the one shared connection, so
+# can't be called concurrently.)
+MAX_LOAD_CONNECTIONS = 4
 
-class MySQLLoader(DBConnMixin, LoaderFromRecordsDirectory):
+
+class MySQLLoader(DBConnMixin, LoaderFromFileobj):
     def __init__(self,
                  db: Optional[Union[sqlalchemy.engine.Engine, sqlalchemy.engine.Connection]],
                  url_resolver: UrlResolver,
@@ -31,11 +39,7 @@ class MySQLLoader(DBConnMixin, LoaderFromRecordsDirectory):
         self.db_engine = db_engine
         self.url_resolver = url_resolver
 
-    def load(self,
-             schema: str,
-             table: str,
-             load_plan: RecordsLoadPlan,
-             directory: RecordsDirectory) -> None:
+    def _load_options(self, load_plan: RecordsLoadPlan) -> MySqlLoadOptions:
         if not isinstance(load_plan.records_format, DelimitedRecordsFormat):
             raise NotImplementedError('Teach me how to load '
                                       f'{load_plan.records_format.format_type} format')
@@ -47,30 +51,89 @@ class MySQLLoader(DBConnMixin, LoaderFromRecordsDirectory):
                                           processing_instructions.fail_if_cant_handle_hint)
         complain_on_unhandled_hints(processing_instructions.fail_if_dont_understand,
                                     unhandled_hints, load_plan.records_format.hints)
-        if not isinstance(directory.loc, FilesystemDirectoryUrl):
-            with tempfile.TemporaryDirectory(prefix='mysql_loader_load') as tempdir:
-                filesystem_url = Path(tempdir).as_uri()
-                temp_filesystem_loc = FilesystemDirectoryUrl(filesystem_url)
-                filesystem_directory = directory.copy_to(temp_filesystem_loc)
-                return self.load(schema=schema,
-                                 table=table,
-                                 load_plan=load_plan,
-                                 directory=filesystem_directory)
-
-        all_urls = directory.manifest_entry_urls()
-
-        locs = [self.url_resolver.file_url(url) for url in all_urls]
-        for loc in locs:
-            # This came from a FilesystemDirectoryUrl, so it had better be...
-            assert isinstance(loc, FilesystemFileUrl)
-            filename = loc.local_file_path
-            sql = load_options.generate_load_data_sql(filename=filename,
-                                                      table_name=table,
-                                                      schema_name=schema)
-            logger.info(f"Loading to MySQL with options: {load_options}")
-            logger.info(str(sql))
-            self.db_conn.execute(sql)
-            logger.info("MySQL LOAD DATA complete.")
+        return load_options
+
+    def _load_local_file(self,
+                         db_conn: sqlalchemy.engine.Connection,
+                         schema: str,
+                         table: str,
+                         load_options: MySqlLoadOptions,
+                         filename: str) -> None:
+        sql = load_options.generate_load_data_sql(filename=filename,
+                                                  table_name=table,
+                                                  schema_name=schema)
+        logger.info(f"Loading to MySQL with options: {load_options}")
+        logger.info(str(sql))
+        db_conn.execute(sql)
+        logger.info("MySQL LOAD DATA complete.")
+
+    def _load_fileobj(self,
+                      db_conn: sqlalchemy.engine.Connection,
+                      schema: str,
+                      table: str,
+                      load_options: MySqlLoadOptions,
+                      fileobj: IO[bytes]) -> None:
+        with fileobj_as_local_file(fileobj) as filename:
+            self._load_local_file(db_conn, schema, table, load_options, filename)
+
+    def _load_loc(self,
+                  db_conn: sqlalchemy.engine.Connection,
+                  schema: str,
+                  table: str,
+                  load_options: MySqlLoadOptions,
+                  loc: BaseFileUrl) -> None:
+        if isinstance(loc, FilesystemFileUrl):
+            self._load_local_file(db_conn, schema, table, load_options, loc.local_file_path)
+        else:
+            # Stream other files straight into the server rather than
+            # copying them somewhere local first.
+            with loc.open() as f:
+                self._load_fileobj(db_conn, schema, table, load_options, f)
+
+    def load_from_fileobj(self, schema: str, table: str,
+                          load_plan: RecordsLoadPlan, fileobj: IO[bytes]) -> None:
+        load_options = self._load_options(load_plan)
+        self._load_fileobj(self.db_conn, schema, table, load_options, fileobj)
+        return None
+
+    def load(self,
+             schema: str,
+             table: str,
+             load_plan: RecordsLoadPlan,
+             directory: RecordsDirectory) -> None:
+        load_options = self._load_options(load_plan)
+        locs = [self.url_resolver.file_url(url) for url in directory.manifest_entry_urls()]
+        num_connections = min(MAX_LOAD_CONNECTIONS, len(locs))
+        if num_connections <= 1:
+            for loc in locs:
+                self._load_loc(self.db_conn, schema, table, load_options, loc)
+            return None
+
+        # Files are loaded on separate connections, each in a
+        # transaction which is only committed once every file has
+        # loaded, so a failed load is rolled back.  The commits
+        # themselves happen one connection at a time, though, so a
+        # failure while committing can still leave the table partly
+        # loaded.
+        logger.info(f"Loading {len(locs)} files into MySQL over {num_connections} connections")
+        locs_per_connection = [locs[i::num_connections] for i in range(num_connections)]
+        with ExitStack() as stack:
+            db_conns = [stack.enter_context(self.db_engine.connect())
+                        for _ in range(num_connections)]
+            transactions = [db_conn.begin() for db_conn in db_conns]
+
+            def load_locs(i: int) -> None:
+                for loc in locs_per_connection[i]:
+                    self._load_loc(db_conns[i], schema, table, load_options, loc)
+
+            try:
+                map_concurrently(load_locs, range(num_connections), max_workers=num_connections)
+            except BaseException:
+                for transaction in transactions:
+                    transaction.rollback()
+                raise
+            for transaction in transactions:
+                transaction.commit()
         return None
 
     def can_load_this_format(self, source_records_format: BaseRecordsFormat) -> bool:
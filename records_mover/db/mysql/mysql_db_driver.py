@@ -5,9 +5,11 @@ from ...utils.limits import (IntegerType,
                              FLOAT32_SIGNIFICAND_BITS,
                              FLOAT64_SIGNIFICAND_BITS,
                              num_digits)
-from ..driver import DBDriver
+from sqlalchemy import text
+from ..driver import DBDriver, scratch_table_name
 from .loader import MySQLLoader
-from typing import Optional, Tuple, Union
+from ..quoting import quote_column_name
+from typing import List, Optional, Tuple, Union
 from ..loader import LoaderFromFileobj, LoaderFromRecordsDirectory
 from ...url.resolver import UrlResolver
 
@@ -22,7 +24,7 @@ class MySQLDBDriver(DBDriver):
                  db_conn: Optional[sqlalchemy.engine.Connection] = None,
                  db_engine: Optional[sqlalchemy.engine.Engine] = None,
                  **kwargs) -> None:
-        super().__init__(db=db, db_conn=db_conn, db_engine=db_engine)
+        super().__init__(db=db, db_conn=db_conn, db_engine=db_engine, **kwargs)
         self._mysql_loader = MySQLLoader(db=db,
                                          db_conn=db_conn,
                                          db_engine=db_engine,
@@ -32,11 +34,45 @@ class MySQLDBDriver(DBDriver):
         return self._mysql_loader
 
     def loader_from_fileobj(self) -> Optional[LoaderFromFileobj]:
-        return None
+        return self._mysql_loader
 
     def unloader(self) -> None:
         return None
 
+    def create_table_like(self, schema: str, table: str, like_table: str) -> None:
+        self.db_conn.execute(text(f"CREATE TABLE {self._quote_schema_and_table(schema, table)} "
+                                  f"LIKE {self._quote_schema_and_table(schema, like_table)}"))
+
+    def replace_table(self, schema: str, table: str, replacement_table: str) -> None:
+        # DDL commits implicitly in MySQL, but a single RENAME TABLE
+        # statement is atomic.
+        old_table = scratch_table_name(table, 'old')
+        self.db_conn.execute(text(f"RENAME TABLE {self._quote_schema_and_table(schema, table)} "
+                                  f"TO {self._quote_schema_and_table(schema, old_table)}, "
+                                  f"{self._quote_schema_and_table(schema, replacement_table)} "
+                                  f"TO {self._quote_schema_and_table(schema, table)}"))
+        self.db_conn.execute(text(f"DROP TABLE {self._quote_schema_and_table(schema, old_table)}"))
+
+    def merge_table(self,
+                    schema: str,
+                    table: str,
+                    source_table: str,
+                    key_columns: List[str]) -> None:
+        # MySQL decides which rows conflict using the table's primary
+        # and unique keys; key_columns should correspond to one.
+        quoted_keys = [quote_column_name(None, key, db_engine=self.db_engine)
+                       for key in key_columns]
+        columns = self._quote_column_names(schema, table)
+        updates = ', '.join(f"{column} = VALUES({column})"
+                            for column in columns if column not in quoted_keys)
+        if not updates:
+            updates = f"{quoted_keys[0]} = {quoted_keys[0]}"
+        self.db_conn.execute(text(f"INSERT INTO {self._quote_schema_and_table(schema, table)} "
+                                  f"({', '.join(columns)}) "
+                                  f"SELECT {', '.join(columns)} "
+                                  f"FROM {self._quote_schema_and_table(schema, source_table)} "
+                                  f"ON DUPLICATE KEY UPDATE {updates}"))
+
     # https://dev.mysql.com/doc/refman/8.0/en/integer-types.html
     def integer_limits(self,
                        type_: sqlalchemy.types.Integer) ->\
@@ -7,16 +7,49 @@ from records_mover.utils.limits import (INT16_MIN, INT16_MAX,
                                         FLOAT32_SIGNIFICAND_BITS,
                                         FLOAT64_SIGNIFICAND_BITS,
                                         num_digits)
+from sqlalchemy import text
+from sqlalchemy.schema import Column, Table
 from ..driver import DBDriver
 from .loader import PostgresLoader
 from ..loader import LoaderFromFileobj, LoaderFromRecordsDirectory
 from .unloader import PostgresUnloader
+from .reflection import fast_reflect_table, columns_from_cursor_description
 from ..unloader import Unloader
-from typing import Optional, Tuple, Union
+from ..quoting import quote_column_name
+from typing import Any, List, Optional, Sequence, Tuple, Union
 
 
 logger = logging.getLogger(__name__)
 
+# Sequences created for serial/bigserial columns are OWNED BY their
+# column (an 'auto' dependency), and are dropped along with its table.
+# This finds those of a table's columns which have a column of the
+# same name in another table to hand them over to.
+OWNED_SEQUENCES_SQL = """\
+SELECT sn.nspname AS sequence_schema,
+       s.relname AS sequence_name,
+       a.attname AS column_name
+FROM pg_catalog.pg_depend d
+JOIN pg_catalog.pg_class s ON d.objid = s.oid AND s.relkind = 'S'
+JOIN pg_catalog.pg_namespace sn ON s.relnamespace = sn.oid
+JOIN pg_catalog.pg_class c ON d.refobjid = c.oid
+JOIN pg_catalog.pg_namespace n ON c.relnamespace = n.oid
+JOIN pg_catalog.pg_attribute a ON a.attrelid = c.oid AND a.attnum = d.refobjsubid
+WHERE d.classid = 'pg_catalog.pg_class'::regclass
+  AND d.refclassid = 'pg_catalog.pg_class'::regclass
+  AND d.deptype = 'a'
+  AND n.nspname = :schema
+  AND c.relname = :table
+  AND EXISTS (SELECT 1
+              FROM pg_catalog.pg_attribute na
+              JOIN pg_catalog.pg_class nc ON na.attrelid = nc.oid
+              WHERE nc.relnamespace = n.oid
+                AND nc.relname = :new_table
+                AND na.attname = a.attname
+                AND NOT na.attisdropped)
+ORDER BY a.attnum
+"""
+
 
 class PostgresDBDriver(DBDriver):
     def __init__(self,
@@ -25,7 +58,7 @@ class PostgresDBDriver(DBDriver):
                  db_conn: Optional[sqlalchemy.engine.Connection] = None,
                  db_engine: Optional[sqlalchemy.engine.Engine] = None,
                  **kwargs) -> None:
-        super().__init__(db=db, db_conn=db_conn, db_engine=db_engine)
+        super().__init__(db=db, db_conn=db_conn, db_engine=db_engine, **kwargs)
         self._postgres_loader = PostgresLoader(url_resolver=url_resolver,
                                                meta=self.meta,
                                                db=db,
@@ -44,6 +77,65 @@ class PostgresDBDriver(DBDriver):
     def unloader(self) -> Optional[Unloader]:
         return self._postgres_unloader
 
+    def fast_reflect_table(self, schema: str, table: str) -> Optional[Table]:
+        return fast_reflect_table(self._reflection_db(), schema, table)
+
+    def columns_from_cursor_description(self,
+                                        description: Sequence[Sequence[Any]]) -> List[Column]:
+        return columns_from_cursor_description(self._reflection_db(), description)
+
+    def create_table_like(self, schema: str, table: str, like_table: str) -> None:
+        # INCLUDING ALL copies serial columns' nextval() defaults, so
+        # the new table shares like_table's sequences; replace_table()
+        # hands those over before like_table is dropped.
+        self.db_conn.execute(text(f"CREATE TABLE {self._quote_schema_and_table(schema, table)} "
+                                  f"(LIKE {self._quote_schema_and_table(schema, like_table)} "
+                                  "INCLUDING ALL)"))
+
+    def replace_table(self,
+                      schema: str,
+                      table: str,
+                      replacement_table: str) -> None:
+        """Put replacement_table in place of table, as DBDriver does.
+
+        Sequences owned by columns of table (e.g., those of serial
+        columns) would be dropped with it--or rather, the DROP would
+        fail, as the defaults copied by create_table_like() still use
+        them--so ownership of each is first moved to the column of the
+        same name in replacement_table.  Sequences owned by columns
+        replacement_table lacks are dropped along with table as usual.
+        """
+        rows = self.db_conn.execute(text(OWNED_SEQUENCES_SQL),
+                                    {'schema': schema,
+                                     'table': table,
+                                     'new_table': replacement_table}).fetchall()
+        for sequence_schema, sequence_name, column_name in rows:
+            sequence = self._quote_schema_and_table(sequence_schema, sequence_name)
+            column = quote_column_name(None, column_name, db_engine=self.db_engine)
+            self.db_conn.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY "
+                                      f"{self._quote_schema_and_table(schema, replacement_table)}"
+                                      f".{column}"))
+        super().replace_table(schema, table, replacement_table)
+
+    def merge_table(self,
+                    schema: str,
+                    table: str,
+                    source_table: str,
+                    key_columns: List[str]) -> None:
+        # ON CONFLICT requires a unique index or constraint on exactly
+        # the key columns.
+        quoted_keys = [quote_column_name(None, key, db_engine=self.db_engine)
+                       for key in key_columns]
+        columns = self._quote_column_names(schema, table)
+        updates = ', '.join(f"{column} = EXCLUDED.{column}"
+                            for column in columns if column not in quoted_keys)
+        action = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+        self.db_conn.execute(text(f"INSERT INTO {self._quote_schema_and_table(schema, table)} "
+                                  f"({', '.join(columns)}) "
+                                  f"SELECT {', '.join(columns)} "
+                                  f"FROM {self._quote_schema_and_table(schema, source_table)} "
+                                  f"ON CONFLICT ({', '.join(quoted_keys)}) {action}"))
+
     # https://www.postgresql.org/docs/10/datatype-numeric.html
     def integer_limits(self,
                        type_: sqlalchemy.types.Integer) ->\
@@ -0,0 +1,131 @@
+import logging
+import re
+import sqlalchemy
+from sqlalchemy import bindparam, text
+from sqlalchemy.schema import Column, MetaData, Table
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+
+logger = logging.getLogger(__name__)
+
+# A single catalog query for every column in the table - SQLAlchemy's
+# inspector instead issues a series of queries per table (columns,
+# domains, enums, constraints, ...), which adds up quickly on large
+# catalogs.
+#
+# pg_catalog.format_type() gives us the same type strings (e.g.,
+# 'character varying(256)', 'numeric(18,2)') that SQLAlchemy's
+# PostgreSQL dialect parses.
+COLUMNS_SQL = """\
+SELECT a.attname AS name,
+       pg_catalog.format_type(a.atttypid, a.atttypmod) AS format_type,
+       a.attnotnull AS notnull
+FROM pg_catalog.pg_attribute a
+JOIN pg_catalog.pg_class c ON a.attrelid = c.oid
+JOIN pg_catalog.pg_namespace n ON c.relnamespace = n.oid
+WHERE n.nspname = :schema
+  AND c.relname = :table
+  AND a.attnum > 0
+  AND NOT a.attisdropped
+ORDER BY a.attnum
+"""
+
+
+def column_type_from_format_type(format_type: str,
+                                 ischema_names: Dict[str, Any]) ->\
+        Optional[sqlalchemy.types.TypeEngine]:
+    """Translate a pg_catalog.format_type() string into a SQLAlchemy type
+    using the same conventions as SQLAlchemy's PostgreSQL dialect.
+    Returns None for types which need more catalog information than
+    we pull (arrays, enums, domains, etc)."""
+    if format_type.endswith('[]'):
+        return None
+    attype = re.sub(r"\(.*\)", "", format_type)
+    charlen_match = re.search(r"\(([\d,]+)\)", format_type)
+    charlen = charlen_match.group(1) if charlen_match else None
+    args: Tuple[int, ...] = ()
+    kwargs: Dict[str, Any] = {}
+    if attype == 'numeric':
+        if charlen:
+            prec, scale = charlen.split(',')
+            args = (int(prec), int(scale))
+    elif attype == 'double precision':
+        args = (53,)
+    elif attype in ('timestamp with time zone', 'time with time zone'):
+        kwargs['timezone'] = True
+        if charlen:
+            kwargs['precision'] = int(charlen)
+    elif attype in ('timestamp without time zone', 'time without time zone', 'time'):
+        kwargs['timezone'] = False
+        if charlen:
+            kwargs['precision'] = int(charlen)
+    elif attype == 'integer':
+        pass
+    elif charlen:
+        if ',' in charlen:
+            return None
+        args = (int(charlen),)
+
+    coltype = ischema_names.get(attype)
+    if coltype is None:
+        return None
+    return coltype(*args, **kwargs)
+
+
+def fast_reflect_table(db: Union[sqlalchemy.engine.Engine, sqlalchemy.engine.Connection],
+                       schema: str,
+                       table: str) -> Optional[Table]:
+    """Build a Table with column names, types and nullability using a
+    single catalog query.  Defaults, constraints and indexes are not
+    reflected.
+
+    Returns None if the table can't be found this way or uses a type
+    this path doesn't understand, in which case callers should fall
+    back to full reflection.
+    """
+    ischema_names = db.dialect.ischema_names
+    rows = db.execute(text(COLUMNS_SQL), {'schema': schema, 'table': table}).fetchall()
+    if len(rows) == 0:
+        logger.debug(f"Found no columns for {schema}.{table} in pg_catalog")
+        return None
+    columns: List[Column] = []
+    for row in rows:
+        coltype = column_type_from_format_type(row.format_type, ischema_names)
+        if coltype is None:
+            logger.debug(f"Can't quickly reflect {schema}.{table}.{row.name} "
+                         f"of type {row.format_type}")
+            return None
+        columns.append(Column(row.name, coltype, nullable=not row.notnull))
+    return Table(table, MetaData(), *columns, schema=schema)
+
+
+TYPE_NAMES_SQL = """\
+SELECT oid, pg_catalog.format_type(oid, NULL) AS format_type
+FROM pg_catalog.pg_type
+WHERE oid IN :oids
+"""
+
+
+def columns_from_cursor_description(db: Union[sqlalchemy.engine.Engine,
+                                              sqlalchemy.engine.Connection],
+                                    description: Sequence[Sequence[Any]]) -> List[Column]:
+    """Build columns from a psycopg2 cursor description, whose type
+    codes are pg_type OIDs, looking up all of the type names in a
+    single catalog query.  Columns of types this path doesn't
+    understand come back as strings."""
+    ischema_names = db.dialect.ischema_names
+    oids = sorted({column[1] for column in description})
+    query = text(TYPE_NAMES_SQL).bindparams(bindparam('oids', expanding=True))
+    format_types = {row.oid: row.format_type
+                    for row in db.execute(query, {'oids': oids}).fetchall()}
+    columns: List[Column] = []
+    for name, type_code, _display_size, _internal_size, precision, scale, *_ in description:
+        format_type = format_types.get(type_code, '')
+        if format_type == 'numeric' and precision is not None and scale is not None:
+            format_type = f"numeric({precision},{scale})"
+        coltype = column_type_from_format_type(format_type, ischema_names)
+        if coltype is None:
+            logger.debug(f"Treating query column {name} of type {format_type} as a string")
+            coltype = sqlalchemy.types.String()
+        columns.append(Column(name, coltype))
+    return columns
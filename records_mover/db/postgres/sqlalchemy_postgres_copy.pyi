@@ -10,6 +10,7 @@ def copy_from(source: IO[bytes],
 
 
 def copy_to(source: Union[sqlalchemy.sql.expression.Select,
+                          sqlalchemy.sql.expression.TextClause,
                           sqlalchemy.orm.query.Query],
             dest: IO[bytes],
             engine_or_conn: Union[sqlalchemy.engine.Engine, sqlalchemy.engine.Connection],
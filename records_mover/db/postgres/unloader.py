@@ -1,8 +1,9 @@
 from contextlib import contextmanager
 from sqlalchemy import text
 from sqlalchemy.schema import Table
+from sqlalchemy.sql.expression import Select, TextClause
 from .sqlalchemy_postgres_copy import copy_to
-from ..quoting import quote_value
+from ..quoting import quote_value, literal_text
 from ...records.unload_plan import RecordsUnloadPlan
 from ...records.records_format import BaseRecordsFormat
 from ...records.records_directory import RecordsDirectory
@@ -10,7 +11,7 @@ from ...records.records_format import DelimitedRecordsFormat
 from ...records.delimited import complain_on_unhandled_hints
 from records_mover.url.base import BaseDirectoryUrl
 from records_mover.url.filesystem import FilesystemDirectoryUrl
-from typing import List, Iterator
+from typing import List, Iterator, Union
 from tempfile import TemporaryDirectory
 from ..unloader import Unloader
 from .copy_options import postgres_copy_to_options
@@ -25,6 +26,25 @@ class PostgresUnloader(Unloader):
                table: str,
                unload_plan: RecordsUnloadPlan,
                directory: RecordsDirectory) -> None:
+        table_obj = Table(table,
+                          self.meta,
+                          schema=schema,
+                          autoload_with=self.db_engine)
+        query = table_obj.select()
+        if unload_plan.where is not None:
+            query = query.where(text(unload_plan.where))
+        self._copy_to(query, unload_plan, directory)
+
+    def unload_query(self,
+                     query: str,
+                     unload_plan: RecordsUnloadPlan,
+                     directory: RecordsDirectory) -> None:
+        self._copy_to(literal_text(query), unload_plan, directory)
+
+    def _copy_to(self,
+                 query: Union[Select, TextClause],
+                 unload_plan: RecordsUnloadPlan,
+                 directory: RecordsDirectory) -> None:
         if not isinstance(unload_plan.records_format, DelimitedRecordsFormat):
             raise NotImplementedError("This only supports delimited mode for now")
 
@@ -41,11 +61,6 @@ class PostgresUnloader(Unloader):
                                     unhandled_hints,
                                     unload_plan.records_format.hints)
 
-        table_obj = Table(table,
-                          self.meta,
-                          schema=schema,
-                          autoload_with=self.db_engine)
-
         # https://www.postgresql.org/docs/8.3/sql-set.html
         #
         # The effects of SET LOCAL last only till the end of the
@@ -62,7 +77,7 @@ class PostgresUnloader(Unloader):
         filename = unload_plan.records_format.generate_filename('data')
         loc = directory.loc.file_in_this_directory(filename)
         with loc.open(mode='wb') as fileobj:
-            copy_to(table_obj.select(),
+            copy_to(query,
                     fileobj,
                     self.db_conn,
                     **postgres_options)
@@ -1,4 +1,6 @@
+from sqlalchemy import text
 from sqlalchemy.engine import Engine, Connection
+from sqlalchemy.sql.elements import TextClause
 from typing import Union, Optional
 from ..check_db_conn_engine import check_db_conn_engine
 
@@ -79,3 +81,15 @@ def quote_group_name(db: Optional[Union[Connection, Engine]],
     db, _, db_engine = check_db_conn_engine(db=db, db_conn=None, db_engine=db_engine)
     dialect = db_engine.dialect
     return dialect.preparer(dialect).quote_identifier(group_name)
+
+
+def literal_text(sql: str) -> TextClause:
+    """
+    Wrap SQL which we didn't write (e.g., a user's query) so that it
+    can be executed or embedded in other SQLAlchemy statements as-is.
+
+    sqlalchemy.text() would otherwise treat anything which looks like
+    :name as a bind parameter--e.g., Postgres casts like x::date, or
+    string literals like '{"k":1}' or '12:30:00'.
+    """
+    return text(sql.replace(':', '\\:'))
@@ -0,0 +1,64 @@
+"""Redshift COPY and UNLOAD commands, extended with options which
+sqlalchemy-redshift doesn't know how to generate yet."""
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy_redshift import commands
+from typing import Any, List, Optional
+
+
+class CopyCommand(commands.CopyCommand):
+    """sqlalchemy_redshift.commands.CopyCommand, plus:
+
+    :param zstd: Files being loaded are compressed with Zstandard.
+    """
+
+    def __init__(self, *args: Any, zstd: bool = False, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.zstd = zstd
+
+
+class UnloadFromSelect(commands.UnloadFromSelect):
+    """sqlalchemy_redshift.commands.UnloadFromSelect, plus:
+
+    :param zstd: Compress unloaded files with Zstandard.
+    :param partition_by: Write files into 'column=value/' prefixes by
+       the values of these columns, still including the columns in
+       the files.
+    :param row_group_size: Target size in bytes of Parquet row groups.
+    """
+
+    def __init__(self,
+                 *args: Any,
+                 zstd: bool = False,
+                 partition_by: Optional[List[str]] = None,
+                 row_group_size: Optional[int] = None,
+                 **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.zstd = zstd
+        self.partition_by = partition_by
+        self.row_group_size = row_group_size
+
+
+# Both commands end with a list of space-separated options, so
+# further ones can be added on the end.
+
+@compiles(CopyCommand)
+def visit_copy_command(element: CopyCommand, compiler: Any, **kw: Any) -> str:
+    sql: str = commands.visit_copy_command(element, compiler, **kw)
+    if element.zstd:
+        sql = sql.rstrip() + ' ZSTD'
+    return sql
+
+
+@compiles(UnloadFromSelect)
+def visit_unload_from_select(element: UnloadFromSelect, compiler: Any, **kw: Any) -> str:
+    sql: str = commands.visit_unload_from_select(element, compiler, **kw)
+    if element.zstd:
+        sql = sql.rstrip() + ' ZSTD'
+    if element.partition_by:
+        columns = ', '.join(compiler.preparer.quote(column) for column in element.partition_by)
+        sql = sql.rstrip() + f' PARTITION BY ({columns}) INCLUDE'
+    if element.row_group_size is not None:
+        # Redshift takes this in whole megabytes
+        row_group_size_mb = element.row_group_size // (1024 * 1024)
+        sql = sql.rstrip() + f' ROWGROUPSIZE {row_group_size_mb} MB'
+    return sql
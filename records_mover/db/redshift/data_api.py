@@ -0,0 +1,117 @@
+from ..errors import RedshiftDataApiError
+import logging
+import re
+import time
+from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine  # noqa
+    from boto3.session import (  # noqa
+        Session,
+        RedshiftDataClientTypeStub,
+        RedshiftDataDescribeStatementOutput
+    )
+
+
+logger = logging.getLogger(__name__)
+
+# e.g., mycluster.abc123xyz789.us-east-1.redshift.amazonaws.com
+PROVISIONED_HOST = re.compile(r'^([^.]+)\.[^.]+\.([^.]+)\.redshift\.amazonaws\.com$')
+# e.g., myworkgroup.123456789012.us-east-1.redshift-serverless.amazonaws.com
+SERVERLESS_HOST = re.compile(r'^([^.]+)\.[^.]+\.([^.]+)\.redshift-serverless\.amazonaws\.com$')
+
+
+class RedshiftDataApi:
+    """Runs statements through the Redshift Data API.
+
+    Statements are queued and run by the cluster itself rather than on
+    a client connection which has to stay open until they finish, so
+    long-running statements (e.g., large UNLOADs) carry on regardless
+    of what happens to connections in the meantime.
+    """
+
+    def __init__(self,
+                 client: 'RedshiftDataClientTypeStub',
+                 database: str,
+                 cluster_identifier: Optional[str] = None,
+                 workgroup_name: Optional[str] = None,
+                 db_user: Optional[str] = None,
+                 secret_arn: Optional[str] = None,
+                 seconds_between_polls: float = 5.0) -> None:
+        if (cluster_identifier is None) == (workgroup_name is None):
+            raise ValueError('Please provide exactly one of cluster_identifier '
+                             'and workgroup_name')
+        self.client = client
+        self.database = database
+        self.cluster_identifier = cluster_identifier
+        self.workgroup_name = workgroup_name
+        self.db_user = db_user
+        self.secret_arn = secret_arn
+        self.seconds_between_polls = seconds_between_polls
+
+    @staticmethod
+    def from_db_engine(db_engine: 'Engine',
+                       boto3_session: 'Session') -> 'RedshiftDataApi':
+        """Point at the same cluster or workgroup and database as a
+        SQLAlchemy engine, based on its endpoint hostname.  Provisioned
+        clusters are accessed as the engine's user via temporary
+        credentials, so the AWS identity in use needs
+        redshift:GetClusterCredentials as well as access to the Data
+        API.
+        """
+        url = db_engine.url
+        host = url.host or ''
+        database = url.database or ''
+        provisioned = PROVISIONED_HOST.match(host)
+        if provisioned is not None:
+            cluster_identifier, region = provisioned.groups()
+            return RedshiftDataApi(boto3_session.client('redshift-data', region_name=region),
+                                   database=database,
+                                   cluster_identifier=cluster_identifier,
+                                   db_user=url.username)
+        serverless = SERVERLESS_HOST.match(host)
+        if serverless is not None:
+            workgroup_name, region = serverless.groups()
+            return RedshiftDataApi(boto3_session.client('redshift-data', region_name=region),
+                                   database=database,
+                                   workgroup_name=workgroup_name)
+        raise ValueError(f"Could not determine the Redshift cluster or workgroup behind {host}; "
+                         "please connect via its Redshift endpoint to use the Data API")
+
+    def submit(self, sql: str) -> str:
+        "Queue a statement to run and return its id, without waiting for it to run."
+        kwargs: Dict[str, Any] = {
+            'Sql': sql,
+            'Database': self.database,
+            'StatementName': 'records_mover',
+        }
+        if self.cluster_identifier is not None:
+            kwargs['ClusterIdentifier'] = self.cluster_identifier
+        if self.workgroup_name is not None:
+            kwargs['WorkgroupName'] = self.workgroup_name
+        if self.secret_arn is not None:
+            kwargs['SecretArn'] = self.secret_arn
+        elif self.db_user is not None:
+            kwargs['DbUser'] = self.db_user
+        statement_id = self.client.execute_statement(**kwargs)['Id']
+        logger.info(f"Submitted Redshift Data API statement {statement_id}")
+        return statement_id
+
+    def wait(self,
+             statement_id: str,
+             on_poll: Optional[Callable[['RedshiftDataDescribeStatementOutput'],
+                                        None]] = None) ->\
+            'RedshiftDataDescribeStatementOutput':
+        """Poll until a submitted statement is finished and return its
+        final description, calling on_poll with each description
+        received while it is still running."""
+        while True:
+            description = self.client.describe_statement(Id=statement_id)
+            status = description['Status']
+            if status == 'FINISHED':
+                return description
+            if status in ('FAILED', 'ABORTED'):
+                raise RedshiftDataApiError(f"Redshift Data API statement {statement_id} "
+                                           f"{status.lower()}: {description.get('Error')}")
+            if on_poll is not None:
+                on_poll(description)
+            time.sleep(self.seconds_between_polls)
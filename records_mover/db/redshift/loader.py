@@ -1,5 +1,5 @@
 from contextlib import contextmanager
-from sqlalchemy_redshift.commands import CopyCommand
+from .commands import CopyCommand
 from records_mover.logging import register_secret
 from ..loader import LoaderFromRecordsDirectory
 from ...records.records_directory import RecordsDirectory
@@ -10,9 +10,10 @@ from sqlalchemy import text
 from sqlalchemy.schema import Table
 import logging
 from .records_copy import redshift_copy_options
+from .slice_staging import can_stage_in_slices, num_slices, stage_in_slices
 from ...records.load_plan import RecordsLoadPlan
 from ..errors import CredsDoNotSupportS3Import, NoTemporaryBucketConfiguration
-from typing import Optional, Union, List, Iterator
+from typing import Optional, Union, List, Iterator, Tuple
 from ...url import BaseDirectoryUrl
 from botocore.credentials import Credentials
 from ...records.delimited import complain_on_unhandled_hints
@@ -46,6 +47,36 @@ class RedshiftLoader(DBConnMixin, LoaderFromRecordsDirectory):
             with self.s3_temp_base_loc.temporary_directory() as temp_loc:
                 yield temp_loc
 
+    def stage_to_s3(self,
+                    load_plan: RecordsLoadPlan,
+                    directory: RecordsDirectory,
+                    temp_s3_loc: BaseDirectoryUrl) -> Tuple[RecordsDirectory, RecordsLoadPlan]:
+        """Copy records from outside of S3 to temp_s3_loc for COPY to read.
+
+        COPY loads one file per slice at a time, so where the records
+        can be split up, they're staged as one file per slice rather
+        than however many files they were written into.  Returns the
+        new directory and the plan to load it with.
+        """
+        records_format = load_plan.records_format
+        processing_instructions = load_plan.processing_instructions
+        fail_if_cant_handle_hint = processing_instructions.fail_if_cant_handle_hint
+        if (isinstance(records_format, DelimitedRecordsFormat) and
+           can_stage_in_slices(records_format, fail_if_cant_handle_hint)):
+            slices = num_slices(self.db_engine)
+            if slices is not None:
+                staged = stage_in_slices(directory,
+                                         records_format,
+                                         fail_if_cant_handle_hint,
+                                         num_parts=slices,
+                                         new_loc=temp_s3_loc)
+                if staged is not None:
+                    s3_directory, staged_records_format = staged
+                    return s3_directory, RecordsLoadPlan(
+                        records_format=staged_records_format,
+                        processing_instructions=processing_instructions)
+        return directory.copy_to(temp_s3_loc), load_plan
+
     def load(self,
              schema: str,
              table: str,
@@ -54,7 +85,7 @@ class RedshiftLoader(DBConnMixin, LoaderFromRecordsDirectory):
 
         if directory.scheme != 's3':
             with self.temporary_s3_directory_loc() as temp_s3_loc:
-                s3_directory = directory.copy_to(temp_s3_loc)
+                s3_directory, load_plan = self.stage_to_s3(load_plan, directory, temp_s3_loc)
                 return self.load(schema=schema,
                                  table=table,
                                  load_plan=load_plan,
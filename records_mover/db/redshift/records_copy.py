@@ -58,6 +58,13 @@ class RedshiftDelimitedRecordsHandler:
             'BZIP': Compression.bzip2,
             None: None
         }
+        if self.hints.compression == 'ZSTD':
+            # Not in sqlalchemy-redshift's Compression enum; see
+            # .commands.CopyCommand
+            self.redshift_options['compression'] = None
+            self.redshift_options['zstd'] = True
+            quiet_remove(self.unhandled_hints, 'compression')
+            return
         compression = compression_map.get(self.hints.compression)
         if compression is None and self.hints.compression is not None:
             _assert_never(self.hints.compression)
@@ -7,9 +7,17 @@ from ...records.records_format import (
     DelimitedRecordsFormat, ParquetRecordsFormat, BaseRecordsFormat
 )
 from ...records.delimited.validated_records_hints import ValidatedRecordsHints
+from ...records.processing_instructions import ProcessingInstructions
+import logging
+
+logger = logging.getLogger(__name__)
 
 RedshiftUnloadOptions = Dict[str, Any]
 
+# https://docs.aws.amazon.com/redshift/latest/dg/r_UNLOAD.html#unload-rowgroupsize
+MIN_ROW_GROUP_SIZE_MB = 32
+MAX_ROW_GROUP_SIZE_MB = 128
+
 
 def process_escape_chars(hints: ValidatedRecordsHints,
                          redshift_options: RedshiftUnloadOptions,
@@ -65,6 +73,9 @@ def process_compression(hints: ValidatedRecordsHints,
                         ) -> None:
     if hints.compression == 'GZIP':
         redshift_options['gzip'] = True
+    elif hints.compression == 'ZSTD':
+        # see .commands.UnloadFromSelect
+        redshift_options['zstd'] = True
     elif hints.compression is None:
         # good to go
         pass
@@ -115,13 +126,42 @@ def process_header_row(hints: ValidatedRecordsHints,
         quiet_remove(unhandled_hints, 'header-row')
 
 
+def process_file_layout(records_format: BaseRecordsFormat,
+                        processing_instructions: ProcessingInstructions,
+                        redshift_options: RedshiftUnloadOptions) -> None:
+    if processing_instructions.max_file_size is not None:
+        redshift_options['max_file_size'] = processing_instructions.max_file_size
+    if not processing_instructions.parallel_export:
+        redshift_options['parallel'] = False
+    if processing_instructions.partition_by:
+        redshift_options['partition_by'] = processing_instructions.partition_by
+    if processing_instructions.parquet_row_group_size is not None:
+        if isinstance(records_format, ParquetRecordsFormat):
+            row_group_size = processing_instructions.parquet_row_group_size
+            # Redshift takes this in whole megabytes, within this range
+            if not (MIN_ROW_GROUP_SIZE_MB <=
+                    row_group_size // (1024 * 1024) <=
+                    MAX_ROW_GROUP_SIZE_MB):
+                raise ValueError("Redshift only supports Parquet row group sizes from "
+                                 f"{MIN_ROW_GROUP_SIZE_MB} to {MAX_ROW_GROUP_SIZE_MB} MB, "
+                                 f"not {row_group_size} bytes")
+            redshift_options['row_group_size'] = row_group_size
+        else:
+            logger.warning("Ignoring parquet_row_group_size when exporting "
+                           f"{records_format.format_type} files")
+
+
 # https://docs.aws.amazon.com/redshift/latest/dg/r_UNLOAD.html
 #
 def redshift_unload_options(unhandled_hints: Set[str],
                             records_format: BaseRecordsFormat,
-                            fail_if_cant_handle_hint: bool) -> RedshiftUnloadOptions:
+                            fail_if_cant_handle_hint: bool,
+                            processing_instructions: ProcessingInstructions =
+                            ProcessingInstructions()) -> RedshiftUnloadOptions:
     redshift_options: RedshiftUnloadOptions = {}
 
+    process_file_layout(records_format, processing_instructions, redshift_options)
+
     if isinstance(records_format, ParquetRecordsFormat):
         redshift_options['format'] = Format.parquet
         return redshift_options
@@ -1,7 +1,8 @@
 from ..driver import DBDriver
 import sqlalchemy
 from sqlalchemy_privileges import GrantPrivileges  # type: ignore[import-untyped]
-from sqlalchemy.schema import Table, MetaData
+from sqlalchemy import text
+from sqlalchemy.schema import Column, Table, MetaData
 from records_mover.records import RecordsSchema
 from records_mover.records.records_format import BaseRecordsFormat, AvroRecordsFormat
 import logging
@@ -12,14 +13,18 @@ from ...utils.limits import (INT16_MIN, INT16_MAX,
                              FLOAT64_SIGNIFICAND_BITS,
                              num_digits)
 from .sql import schema_sql_from_admin_views
+from ..postgres.reflection import fast_reflect_table, columns_from_cursor_description
 import timeout_decorator
-from typing import Optional, Union, Dict, List, Tuple
+from typing import Any, Optional, Union, Dict, List, Sequence, Tuple, TYPE_CHECKING
 from ...url.base import BaseDirectoryUrl
 from .unloader import RedshiftUnloader
+from .data_api import RedshiftDataApi
 from ..unloader import Unloader
 from .loader import RedshiftLoader
 from ..loader import LoaderFromRecordsDirectory
 from ...check_db_conn_engine import check_db_conn_engine
+if TYPE_CHECKING:
+    import boto3  # noqa
 
 
 logger = logging.getLogger(__name__)
@@ -31,9 +36,13 @@ class RedshiftDBDriver(DBDriver):
                  db_conn: Optional[sqlalchemy.engine.Connection] = None,
                  db_engine: Optional[sqlalchemy.engine.Engine] = None,
                  s3_temp_base_loc: Optional[BaseDirectoryUrl] = None,
+                 data_api_boto3_session: Optional['boto3.session.Session'] = None,
                  **kwargs) -> None:
-        super().__init__(db=db, db_conn=db_conn, db_engine=db_engine)
+        super().__init__(db=db, db_conn=db_conn, db_engine=db_engine, **kwargs)
         self.s3_temp_base_loc = s3_temp_base_loc
+        data_api = None
+        if data_api_boto3_session is not None:
+            data_api = RedshiftDataApi.from_db_engine(self.db_engine, data_api_boto3_session)
         self._redshift_loader =\
             RedshiftLoader(db=db,
                            db_conn=db_conn,
@@ -45,7 +54,8 @@ class RedshiftDBDriver(DBDriver):
                              db_conn=db_conn,
                              db_engine=db_engine,
                              table=self.table,
-                             s3_temp_base_loc=s3_temp_base_loc)
+                             s3_temp_base_loc=s3_temp_base_loc,
+                             data_api=data_api)
 
     def schema_sql(self, schema: str, table: str) -> str:
         out = schema_sql_from_admin_views(schema, table, None, db_conn=self.db_conn)
@@ -54,11 +64,25 @@ class RedshiftDBDriver(DBDriver):
         else:
             return out
 
+    def fast_reflect_table(self, schema: str, table: str) -> Optional[Table]:
+        return fast_reflect_table(self._reflection_db(), schema, table)
+
+    def columns_from_cursor_description(self,
+                                        description: Sequence[Sequence[Any]]) -> List[Column]:
+        return columns_from_cursor_description(self._reflection_db(), description)
+
+    def create_table_like(self, schema: str, table: str, like_table: str) -> None:
+        # LIKE carries over the distribution style, sort keys and
+        # column encodings too.
+        self.db_conn.execute(text(f"CREATE TABLE {self._quote_schema_and_table(schema, table)} "
+                                  f"(LIKE {self._quote_schema_and_table(schema, like_table)} "
+                                  "INCLUDING DEFAULTS)"))
+
     # if this timeout goes off (at least for Redshift), it's probably
     # because memory is filling because sqlalchemy's cache of all
     # tables and columns filled up memory in the job.
     @timeout_decorator.timeout(80)
-    def table(self, schema: str, table: str) -> Table:
+    def autoload_table(self, schema: str, table: str) -> Table:
         with self.db_engine.connect() as conn:
             with conn.begin():
                 # The code in the Redshift SQLAlchemy driver relies on 'SET
@@ -73,7 +97,7 @@ class RedshiftDBDriver(DBDriver):
                 # There was some hang-wringing when they added it originally:
                 #  https://github.com/sqlalchemy-redshift/sqlalchemy-redshift/commit/
                 #      94723ec6437c5e5197fcf785845499e81640b167
-                return Table(table, self.meta, schema=schema, autoload_with=conn)
+                return Table(table, MetaData(), schema=schema, autoload_with=conn)
 
     def set_grant_permissions_for_groups(self,
                                          schema_name: str,
@@ -0,0 +1,282 @@
+from contextlib import ExitStack
+from ...records.records_directory import RecordsDirectory
+from ...records.records_format import BaseRecordsFormat, DelimitedRecordsFormat
+from ...records.delimited import ValidatedRecordsHints
+from ...records.metrics import stage, record_bytes_written, record_files_moved, TRANSFER
+from ...records.records_types import UrlDetails
+from ...url.base import BaseDirectoryUrl, BaseFileUrl
+from ...utils.concurrency import map_concurrently
+from sqlalchemy import text
+import sqlalchemy
+import bz2
+import gzip
+import logging
+import tempfile
+from typing import IO, Iterator, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Data is dealt out to parts in chunks of about this many
+# (uncompressed) bytes, cut at record boundaries, so parts come out
+# about the same size without knowing the size of the input up front.
+CHUNK_SIZE = 4 * 1024 * 1024
+
+# Redshift spends far longer loading than we spend compressing at
+# this level, and it saves a good deal of upload time over level 9.
+COMPRESSLEVEL = 6
+
+
+def num_slices(db_engine: sqlalchemy.engine.Engine) -> Optional[int]:
+    """Number of slices in the cluster, or None if that can't be
+    determined.  Runs on a connection of its own, as a failure would
+    otherwise abort any transaction the load is part of."""
+    try:
+        with db_engine.connect() as db_conn:
+            return db_conn.execute(text("SELECT COUNT(*) FROM stv_slices")).scalar()
+    except sqlalchemy.exc.DatabaseError:
+        logger.warning("Could not determine the number of slices in this cluster",
+                       exc_info=True)
+        return None
+
+
+class RecordBoundaryFinder:
+    """Finds where records end in delimited data, so it can be split
+    into files without splitting a record across two of them.
+
+    Data passed in must start at the start of a record.
+    """
+
+    def __init__(self, hints: ValidatedRecordsHints) -> None:
+        self.record_terminator = hints.record_terminator.encode('utf-8')
+        self.quotechar: Optional[bytes] = None
+        self.escape: Optional[int] = None
+        if hints.quoting is not None:
+            self.quotechar = hints.quotechar.encode('utf-8')
+        if hints.escape is not None:
+            self.escape = ord(hints.escape)
+
+    @staticmethod
+    def can_split(hints: ValidatedRecordsHints) -> bool:
+        """Whether record boundaries can be found in data described by
+        these hints just by looking for unquoted and unescaped record
+        terminators."""
+        if hints.encoding != 'UTF8':
+            # quote, escape and terminator characters may show up
+            # inside of other characters in other encodings
+            return False
+        if hints.quoting is not None:
+            # With both quoting and escaping, escaped quotes inside
+            # of quoted fields would throw off tracking of which
+            # terminators are quoted.
+            return hints.escape is None and hints.doublequote
+        return True
+
+    def _is_escaped(self, data: bytes, index: int) -> bool:
+        num_escapes = 0
+        while index - num_escapes > 0 and data[index - num_escapes - 1] == self.escape:
+            num_escapes += 1
+        return num_escapes % 2 == 1
+
+    def record_ends(self, data: bytes) -> Iterator[int]:
+        "Yield the offset just past each complete record in data."
+        pos = 0
+        in_quotes = False
+        while True:
+            index = data.find(self.record_terminator, pos)
+            if index == -1:
+                return
+            if self.quotechar is not None:
+                # Doubled quotes inside of quoted fields cancel out,
+                # so counting them is enough to tell if we're inside
+                # of one.
+                if data.count(self.quotechar, pos, index) % 2 == 1:
+                    in_quotes = not in_quotes
+                is_boundary = not in_quotes
+            elif self.escape is not None:
+                is_boundary = not self._is_escaped(data, index)
+            else:
+                is_boundary = True
+            pos = index + len(self.record_terminator)
+            if is_boundary:
+                yield pos
+
+    def first_record_end(self, data: bytes) -> Optional[int]:
+        return next(self.record_ends(data), None)
+
+    def last_record_end(self, data: bytes) -> Optional[int]:
+        if self.quotechar is None:
+            # Without quoting, whether a terminator ends a record
+            # doesn't depend on anything before it, so search from
+            # the end.
+            end = len(data)
+            while True:
+                index = data.rfind(self.record_terminator, 0, end)
+                if index == -1:
+                    return None
+                if self.escape is None or not self._is_escaped(data, index):
+                    return index + len(self.record_terminator)
+                end = index
+        last_end = None
+        for last_end in self.record_ends(data):
+            pass
+        return last_end
+
+
+def _decompressed(fileobj: IO[bytes], hints: ValidatedRecordsHints) -> IO[bytes]:
+    if hints.compression == 'GZIP':
+        return gzip.GzipFile(fileobj=fileobj, mode='rb')  # type: ignore
+    elif hints.compression == 'BZIP':
+        return bz2.BZ2File(fileobj, mode='rb')
+    return fileobj
+
+
+def can_stage_in_slices(records_format: BaseRecordsFormat,
+                        fail_if_cant_handle_hint: bool) -> bool:
+    "Whether stage_in_slices() can split data in this records format."
+    if not isinstance(records_format, DelimitedRecordsFormat):
+        return False
+    hints = records_format.validate(fail_if_cant_handle_hint=fail_if_cant_handle_hint)
+    if hints.compression not in (None, 'GZIP', 'BZIP'):
+        return False
+    return RecordBoundaryFinder.can_split(hints)
+
+
+class _SlicePartWriter:
+    """Deals chunks of records out round-robin to gzipped temporary
+    files, starting each file with the header row (if any), as
+    Redshift's IGNOREHEADER applies to each file loaded."""
+
+    def __init__(self,
+                 stack: ExitStack,
+                 num_parts: int,
+                 header: Optional[bytes] = None) -> None:
+        self.stack = stack
+        self.num_parts = num_parts
+        self.header = header
+        self.rawfiles: List[IO[bytes]] = []
+        self.gzipfiles: List[gzip.GzipFile] = []
+        self.num_chunks = 0
+
+    def write_chunk(self, chunk: bytes) -> None:
+        part = self.num_chunks % self.num_parts
+        if part == len(self.gzipfiles):
+            rawfile = self.stack.enter_context(tempfile.TemporaryFile(prefix='slice_part'))
+            gzipfile = gzip.GzipFile(fileobj=rawfile, mode='wb', compresslevel=COMPRESSLEVEL)
+            if self.header is not None:
+                gzipfile.write(self.header)
+            self.rawfiles.append(rawfile)
+            self.gzipfiles.append(gzipfile)
+        self.gzipfiles[part].write(chunk)
+        self.num_chunks += 1
+
+    def finish(self) -> List[IO[bytes]]:
+        "Finish writing, returning the parts rewound to be read from."
+        for gzipfile, rawfile in zip(self.gzipfiles, self.rawfiles):
+            gzipfile.close()
+            rawfile.seek(0)
+        return self.rawfiles
+
+
+def _split_file(fileobj: IO[bytes],
+                finder: RecordBoundaryFinder,
+                header_row: bool) -> Iterator[Tuple[Optional[bytes], bytes]]:
+    """Yield (header, chunk) tuples with chunks of about CHUNK_SIZE
+    bytes made up of whole records, with the header row of the file
+    (or None) separated out."""
+    header: Optional[bytes] = None
+    buffer = b''
+    while True:
+        data = fileobj.read(CHUNK_SIZE)
+        buffer += data
+        if header_row and header is None:
+            header_end = finder.first_record_end(buffer)
+            if header_end is None:
+                if data:
+                    continue
+                if not buffer:
+                    return
+                # a header row with nothing after it
+                buffer += finder.record_terminator
+                header_end = len(buffer)
+            header, buffer = buffer[:header_end], buffer[header_end:]
+        if not data:
+            if buffer:
+                if not buffer.endswith(finder.record_terminator):
+                    # Another file's records will follow in the
+                    # same part
+                    buffer += finder.record_terminator
+                yield header, buffer
+            return
+        if len(buffer) < CHUNK_SIZE:
+            continue
+        end = finder.last_record_end(buffer)
+        if end is None:
+            continue
+        yield header, buffer[:end]
+        buffer = buffer[end:]
+
+
+def stage_in_slices(directory: RecordsDirectory,
+                    records_format: DelimitedRecordsFormat,
+                    fail_if_cant_handle_hint: bool,
+                    num_parts: int,
+                    new_loc: BaseDirectoryUrl) ->\
+        Optional[Tuple[RecordsDirectory, DelimitedRecordsFormat]]:
+    """Copy the records in directory to new_loc split into up to
+    num_parts gzipped files of about the same size, so that COPY can
+    load a file on each slice of the cluster at once rather than
+    however many files the records happened to be written into.
+
+    Returns a new RecordsDirectory with a manifest listing every part,
+    along with the format of the parts (GZIP compressed), or None if
+    there were no records to stage.
+
+    Check can_stage_in_slices() before calling this.
+    """
+    hints = records_format.validate(fail_if_cant_handle_hint=fail_if_cant_handle_hint)
+    finder = RecordBoundaryFinder(hints)
+    new_records_format = records_format.alter_hints({'compression': 'GZIP'})
+    with ExitStack() as stack:
+        writer = _SlicePartWriter(stack, num_parts)
+        with stage(TRANSFER):
+            for url in directory.manifest_entry_urls():
+                loc = directory.loc.file_in_this_directory(directory.path_of_url(url))
+                logger.info(f"Splitting {loc.url} into parts for each slice...")
+                with loc.open() as f:
+                    for header, chunk in _split_file(_decompressed(f, hints),
+                                                     finder,
+                                                     header_row=hints.header_row):
+                        if writer.header is None:
+                            writer.header = header
+                        writer.write_chunk(chunk)
+            parts = writer.finish()
+            if len(parts) == 0:
+                return None
+            logger.info(f"Uploading {len(parts)} parts to {new_loc.url}...")
+            # Made up front, as creating S3 locations isn't safe to
+            # do from several threads at once
+            filenames = [new_records_format.generate_filename('part{:0>4}'.format(i))
+                         for i in range(len(parts))]
+            uploads = [(new_loc.file_in_this_directory(filename), part)
+                       for filename, part in zip(filenames, parts)]
+
+            def upload_part(upload: Tuple[BaseFileUrl, IO[bytes]]) -> Tuple[str, int]:
+                target_loc, part = upload
+                length = target_loc.upload_fileobj(part)
+                record_bytes_written(length)
+                record_files_moved(1)
+                return target_loc.url, length
+
+            uploaded = map_concurrently(upload_part, uploads)
+    url_details: UrlDetails = {
+        url: {
+            'content_length': length,
+        }
+        for url, length in uploaded
+    }
+    new_directory = RecordsDirectory(records_loc=new_loc)
+    new_directory.save_preliminary_manifest(url_details)
+    new_directory.save_format(new_records_format)
+    new_directory.finalize_manifest()
+    return new_directory, new_records_format
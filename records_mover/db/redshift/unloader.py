@@ -1,5 +1,5 @@
 from contextlib import contextmanager
-from sqlalchemy_redshift.commands import UnloadFromSelect
+from .commands import UnloadFromSelect
 from ...records.records_directory import RecordsDirectory
 import sqlalchemy
 from sqlalchemy import MetaData
@@ -12,17 +12,31 @@ from ...records.unload_plan import RecordsUnloadPlan
 from ...records.records_format import (
     BaseRecordsFormat, DelimitedRecordsFormat, ParquetRecordsFormat
 )
-from typing import Union, Callable, Optional, List, Iterator
+from typing import Any, Union, Callable, Optional, List, Iterator, Mapping, TYPE_CHECKING
 from ...url.base import BaseDirectoryUrl
 from botocore.credentials import Credentials
+from ..quoting import literal_text
 from ..errors import CredsDoNotSupportS3Export, NoTemporaryBucketConfiguration
 from ...records.delimited import complain_on_unhandled_hints
 from ..unloader import Unloader
 from ...check_db_conn_engine import check_db_conn_engine
+from .data_api import RedshiftDataApi
+if TYPE_CHECKING:
+    from boto3.session import RedshiftDataDescribeStatementOutput  # noqa
 
 
 logger = logging.getLogger(__name__)
 
+# Unlike pg_last_unload_count(), this doesn't depend on the UNLOAD
+# having been run in the current session.
+UNLOAD_HISTORY_SQL = text("""
+SELECT status, unloaded_rows, unloaded_files_count
+FROM sys_unload_history
+WHERE STRPOS(unloaded_location, :unload_location) = 1
+ORDER BY start_time DESC
+LIMIT 1
+""")
+
 
 class RedshiftUnloader(Unloader):
     def __init__(self,
@@ -31,11 +45,15 @@ class RedshiftUnloader(Unloader):
                  s3_temp_base_loc: Optional[BaseDirectoryUrl],
                  db_conn: Optional[sqlalchemy.engine.Connection] = None,
                  db_engine: Optional[sqlalchemy.engine.Engine] = None,
+                 data_api: Optional[RedshiftDataApi] = None,
                  **kwargs) -> None:
         check_db_conn_engine(db=db, db_conn=db_conn, db_engine=db_engine)
         super().__init__(db=db, db_conn=db_conn, db_engine=db_engine)
         self.table = table
         self.s3_temp_base_loc = s3_temp_base_loc
+        # If provided, UNLOADs are submitted through the Redshift Data
+        # API rather than run on our connection.
+        self.data_api = data_api
 
     @contextmanager
     def temporary_unloadable_directory_loc(self) -> Iterator[BaseDirectoryUrl]:
@@ -51,9 +69,18 @@ class RedshiftUnloader(Unloader):
             with self.s3_temp_base_loc.temporary_directory() as temp_loc:
                 yield temp_loc
 
+    def _table_select(self,
+                      schema: str,
+                      table: str,
+                      unload_plan: RecordsUnloadPlan) -> str:
+        table_obj = Table(table, MetaData(), schema=schema)
+        query = sqlalchemy.select('*', table_obj)  # type: ignore[arg-type]  # noqa: F821
+        if unload_plan.where is not None:
+            query = query.where(text(unload_plan.where))
+        return str(query)
+
     def unload_to_s3_directory(self,
-                               schema: str,
-                               table: str,
+                               select: str,
                                unload_plan: RecordsUnloadPlan,
                                directory: RecordsDirectory) -> Optional[int]:
         logger.info(f"Starting Redshift unload to {directory.loc} as "
@@ -64,7 +91,8 @@ class RedshiftUnloader(Unloader):
         processing_instructions = unload_plan.processing_instructions
         redshift_options = redshift_unload_options(unhandled_hints,
                                                    unload_plan.records_format,
-                                                   processing_instructions.fail_if_cant_handle_hint)
+                                                   processing_instructions.fail_if_cant_handle_hint,
+                                                   processing_instructions)
         if isinstance(unload_plan.records_format, DelimitedRecordsFormat):
             complain_on_unhandled_hints(processing_instructions.fail_if_dont_understand,
                                         unhandled_hints, unload_plan.records_format.hints)
@@ -84,13 +112,13 @@ class RedshiftUnloader(Unloader):
             #
             register_secret(aws_creds.token)
             register_secret(aws_creds.secret_key)
-            table_obj = Table(table, MetaData(), schema=schema)
-            select = str(sqlalchemy.select('*', table_obj))  # type: ignore[arg-type]  # noqa: F821
-            unload = UnloadFromSelect(select=text(select),
+            unload = UnloadFromSelect(select=literal_text(select),
                                       access_key_id=aws_creds.access_key,
                                       secret_access_key=aws_creds.secret_key,
                                       session_token=aws_creds.token, manifest=True,
                                       unload_location=directory.loc.url, **redshift_options)
+            if self.data_api is not None:
+                return self._unload_via_data_api(unload, directory)
             try:
                 self.db_conn.execute(unload)
                 out = self.db_conn.execute(text("SELECT pg_last_unload_count()"))
@@ -119,18 +147,65 @@ class RedshiftUnloader(Unloader):
 
             return rows
 
+    def _unload_history(self, unload_location: str) -> Optional[Mapping[str, Any]]:
+        "Latest row of SYS_UNLOAD_HISTORY for an UNLOAD to the given location, if any."
+        try:
+            out = self.db_conn.execute(UNLOAD_HISTORY_SQL, {'unload_location': unload_location})
+            row = out.fetchone()
+            out.close()
+            return row
+        except sqlalchemy.exc.DatabaseError:
+            logger.debug("Could not read SYS_UNLOAD_HISTORY", exc_info=True)
+            return None
+
+    def _unload_via_data_api(self,
+                             unload: UnloadFromSelect,
+                             directory: RecordsDirectory) -> Optional[int]:
+        assert self.data_api is not None
+        # The statement is sent as-is rather than through a DBAPI
+        # driver, so it shouldn't have '%' escaped for one.
+        dialect = type(self.db_engine.dialect)(paramstyle='named')
+        sql = str(unload.compile(dialect=dialect, compile_kwargs={'literal_binds': True}))
+        unload_location = directory.loc.url
+        statement_id = self.data_api.submit(sql)
+
+        def log_progress(description: 'RedshiftDataDescribeStatementOutput') -> None:
+            history = self._unload_history(unload_location)
+            if history is None:
+                logger.info(f"Unload is {description['Status'].lower()}...")
+            else:
+                logger.info(f"Unload is {history['status'].strip().lower()}: "
+                            f"{history['unloaded_rows']} rows in "
+                            f"{history['unloaded_files_count']} files so far...")
+
+        self.data_api.wait(statement_id, on_poll=log_progress)
+        history = self._unload_history(unload_location)
+        if history is None:
+            logger.warning("Could not find unload in SYS_UNLOAD_HISTORY; row count is unknown")
+            return None
+        rows: int = history['unloaded_rows']
+        logger.info(f"Just unloaded {rows} rows")
+        return rows
+
     def unload(self,
                schema: str,
                table: str,
                unload_plan: RecordsUnloadPlan,
                directory: RecordsDirectory) -> Optional[int]:
+        return self.unload_query(self._table_select(schema, table, unload_plan),
+                                 unload_plan, directory)
+
+    def unload_query(self,
+                     query: str,
+                     unload_plan: RecordsUnloadPlan,
+                     directory: RecordsDirectory) -> Optional[int]:
         if directory.scheme == 's3':
             s3_directory = directory
-            return self.unload_to_s3_directory(schema, table, unload_plan, s3_directory)
+            return self.unload_to_s3_directory(query, unload_plan, s3_directory)
         else:
             with self.temporary_s3_directory_loc() as temp_s3_loc:
                 s3_directory = RecordsDirectory(records_loc=temp_s3_loc)
-                out = self.unload_to_s3_directory(schema, table, unload_plan, s3_directory)
+                out = self.unload_to_s3_directory(query, unload_plan, s3_directory)
                 directory.copy_from(temp_s3_loc)
                 return out
 
@@ -141,6 +216,9 @@ class RedshiftUnloader(Unloader):
         # Redshift to unload into
         return self.s3_temp_base_loc is not None
 
+    def can_unload_partitioned(self) -> bool:
+        return True
+
     def known_supported_records_formats_for_unload(self) -> List[BaseRecordsFormat]:
         return [DelimitedRecordsFormat(variant='bluelabs'), ParquetRecordsFormat()]
 
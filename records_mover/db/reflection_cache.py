@@ -0,0 +1,114 @@
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from sqlalchemy.schema import Table
+from typing import Callable, Optional, Tuple, TYPE_CHECKING
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine  # noqa
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_TABLES = 128
+DEFAULT_TTL_SECONDS = 300.0
+
+
+class TableReflectionCache:
+    def __init__(self,
+                 max_tables: int = DEFAULT_MAX_TABLES,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """A size-bounded, time-bounded LRU cache of reflected SQLAlchemy
+        Table objects.
+
+        Each table is reflected into its own MetaData object, so
+        evicting an entry releases all memory associated with it -
+        unlike reflecting into a shared MetaData, which grows with
+        every table ever looked at.
+
+        :param max_tables: Maximum number of tables to keep.  The least
+           recently used table is evicted once this is exceeded.
+        :param ttl_seconds: Number of seconds after which a cached table
+           is considered stale and will be reflected again, to pick up
+           DDL run outside of records-mover.
+        :param clock: Source of the current time, in seconds.
+
+        Fast reflections (see DBDriver.fast_reflect_table()) lack
+        defaults and constraints, so they are cached separately from
+        full ones: a full reflection can stand in for a fast one, but
+        not the other way around.
+        """
+        self.max_tables = max_tables
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: 'OrderedDict[Tuple[str, str, bool], Tuple[float, Table]]' =\
+            OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, schema: str, table: str, fast: bool = False) -> Optional[Table]:
+        if fast:
+            table_obj = self.get(schema, table)
+            if table_obj is not None:
+                return table_obj
+        key = (schema, table, fast)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, table_obj = entry
+            if self.clock() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return table_obj
+
+    def put(self, schema: str, table: str, table_obj: Table, fast: bool = False) -> None:
+        key = (schema, table, fast)
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl_seconds, table_obj)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_tables:
+                evicted_key, _ = self._entries.popitem(last=False)
+                logger.debug(f"Evicting reflected table {evicted_key} from cache")
+
+    def get_or_reflect(self,
+                       schema: str,
+                       table: str,
+                       reflect: Callable[[], Table],
+                       fast: bool = False) -> Table:
+        table_obj = self.get(schema, table, fast=fast)
+        if table_obj is None:
+            # Reflection can be slow, so don't hold the lock while it
+            # happens; at worst two threads reflect the same table.
+            table_obj = reflect()
+            self.put(schema, table, table_obj, fast=fast)
+        return table_obj
+
+    def invalidate(self, schema: str, table: str) -> None:
+        with self._lock:
+            for fast in (False, True):
+                self._entries.pop((schema, table, fast), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_caches: 'weakref.WeakKeyDictionary[Engine, TableReflectionCache]' = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def reflection_cache_for_engine(db_engine: 'Engine') -> TableReflectionCache:
+    """Return the table reflection cache shared by all DBDrivers talking
+    to the given engine.  The cache goes away with the engine."""
+    with _caches_lock:
+        cache = _caches.get(db_engine)
+        if cache is None:
+            cache = TableReflectionCache()
+            _caches[db_engine] = cache
+        return cache
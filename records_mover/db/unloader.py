@@ -42,6 +42,20 @@ class Unloader(DBConnMixin, metaclass=ABCMeta):
         info)."""
         ...
 
+    @abstractmethod
+    def unload_query(self,
+                     query: str,
+                     unload_plan: RecordsUnloadPlan,
+                     directory: RecordsDirectory) -> Optional[int]:
+        """Export the results of a SELECT statement to the RecordsDirectory
+        instance named 'directory' using the same bulk export
+        mechanism as unload(), so that the query runs inside the
+        database rather than being staged in a table first.
+
+        Returns number of rows loaded (if database provides that
+        info)."""
+        ...
+
     @abstractmethod
     def known_supported_records_formats_for_unload(self) -> List[BaseRecordsFormat]:
         """Supplies a list of the records formats which can be bulk exported
@@ -70,6 +84,12 @@ class Unloader(DBConnMixin, metaclass=ABCMeta):
         this database and clean it up when done"""
         ...
 
+    def can_unload_partitioned(self) -> bool:
+        """Determine whether unloads honor the partition_by processing
+        instruction, writing records into 'column=value/'
+        subdirectories."""
+        return False
+
     def best_records_format(self) -> Optional[BaseRecordsFormat]:
         """Returns the ideal records format for export by this database.
         Useful in the absence of other constraints."""
@@ -1,4 +1,4 @@
-from records_mover.db.quoting import quote_schema_and_table, quote_value
+from records_mover.db.quoting import quote_value
 from sqlalchemy.engine import Engine
 
 
@@ -6,9 +6,8 @@ GIG_IN_BYTES = 1024 * 1024 * 1024
 
 
 def vertica_export_sql(db_engine: Engine,
-                       schema: str,
+                       source: str,
                        s3_url: str,
-                       table: str,
                        delimiter: str,
                        record_terminator: str,
                        to_charset: str,
@@ -17,7 +16,7 @@ def vertica_export_sql(db_engine: Engine,
     # https://my.vertica.com/docs/8.1.x/HTML/index.htm#Authoring/SQLReferenceManual/Functions/VerticaFunctions/s3export.htm
     template = """
         SELECT S3EXPORT( * USING PARAMETERS {params})
-        OVER(PARTITION BEST) FROM {schema_and_table}
+        OVER(PARTITION BEST) FROM {source}
     """
 
     def quote(value: str) -> str:
@@ -32,8 +31,7 @@ def vertica_export_sql(db_engine: Engine,
     }
 
     params = ", ".join([f"{key}={value}" for key, value in params_data.items()])
-    schema_and_table = quote_schema_and_table(None, schema, table, db_engine=db_engine)
     sql = template.format(params=params,
-                          schema_and_table=schema_and_table)
+                          source=source)
 
     return sql
@@ -1,3 +1,4 @@
+import io
 import urllib
 import vertica_python
 import sqlalchemy
@@ -5,10 +6,13 @@ from .import_sql import vertica_import_sql
 from .records_import_options import vertica_import_options
 from .io_base_wrapper import IOBaseWrapper
 from ...url.resolver import UrlResolver
+from ...url.base import BaseFileUrl
 from ...records.load_plan import RecordsLoadPlan
 from ...records.delimited import complain_on_unhandled_hints
+from ...records.records_directory import RecordsDirectory
 from ...records.records_format import DelimitedRecordsFormat, BaseRecordsFormat
 from ...records.processing_instructions import ProcessingInstructions
+from ...utils.concurrency import map_concurrently
 from ..loader import LoaderFromFileobj
 from typing import IO, Union, List, Type, Optional
 import logging
@@ -16,6 +20,16 @@ from ...check_db_conn_engine import check_db_conn_engine
 
 logger = logging.getLogger(__name__)
 
+# Vertica recommends DIRECT loads, which write straight to disk (ROS)
+# rather than buffering rows in memory (WOS) first, for loads of
+# 100MB or more.
+DIRECT_LOAD_MIN_BYTES = 100 * 1024 * 1024
+
+# Amount of data read from a stream at a time and sent to Vertica as
+# a single CopyData message.  Larger than the driver's default, which
+# cuts down on per-read overhead when streaming big files.
+COPY_BUFFER_SIZE = 1024 * 1024
+
 
 class VerticaLoader(LoaderFromFileobj):
     def __init__(self,
@@ -29,11 +43,11 @@ class VerticaLoader(LoaderFromFileobj):
         self.db_conn = db_conn
         self.db_engine = db_engine
 
-    def load_from_fileobj(self,
-                          schema: str,
-                          table: str,
-                          load_plan: RecordsLoadPlan,
-                          fileobj: IO[bytes]) -> None:
+    def _import_sql(self,
+                    schema: str,
+                    table: str,
+                    load_plan: RecordsLoadPlan,
+                    load_method: Optional[str] = None) -> str:
         records_format = load_plan.records_format
         if not isinstance(records_format, DelimitedRecordsFormat):
             raise NotImplementedError("Not currently able to load "
@@ -44,33 +58,96 @@ class VerticaLoader(LoaderFromFileobj):
         complain_on_unhandled_hints(processing_instructions.fail_if_dont_understand,
                                     unhandled_hints,
                                     records_format.hints)
+        if load_method is not None:
+            vertica_options['load_method'] = load_method
 
         # vertica_options isn't yet a TypedDict that matches the
         # vertica_import_sql options, so suppress type checking
-        import_sql = vertica_import_sql(db_engine=self.db_engine, table=table,
-                                        schema=schema, **vertica_options)   # type: ignore
+        return vertica_import_sql(db_engine=self.db_engine, table=table,
+                                  schema=schema, **vertica_options)   # type: ignore
+
+    def _copy_stream(self, fileobj: IO[bytes]) -> IO[bytes]:
+        if isinstance(fileobj, urllib.response.addinfourl):
+            # Vertica driver is a little too aggressive validating
+            # streams and checks type, not behavior, and it
+            # rejects some third-party streams.
+            #
+            # In this case, give it the underlying stream where that
+            # has the type it's looking for, so reads don't go
+            # through any extra layers of Python, or otherwise wrap
+            # it in something with that type.
+            if isinstance(fileobj.fp, io.IOBase):
+                return fileobj.fp
+            return IOBaseWrapper(fileobj)  # type: ignore
+        return fileobj
+
+    def _copy(self, import_sql: str, fileobj: IO[bytes]) -> None:
         rawconn = None
         try:
             rawconn = self.db_engine.raw_connection()
             cursor = rawconn.cursor()
             logger.info(import_sql)
-            if isinstance(fileobj, urllib.response.addinfourl):
-                # Vertica driver is a little too aggressive validating
-                # streams and checks type, not behavior, and it
-                # rejects some third-party streams.
-                #
-                # In this case, give it something with the type it's
-                # looking for:
-                compatible_fileobj = IOBaseWrapper(fileobj)
-                cursor.copy(import_sql, compatible_fileobj)
-            else:
-                cursor.copy(import_sql, fileobj)
+            cursor.copy(import_sql, self._copy_stream(fileobj), buffer_size=COPY_BUFFER_SIZE)
             logger.info('Copy complete')
-            return None
         finally:
             if rawconn is not None:
                 rawconn.close()
 
+    def load_from_fileobj(self,
+                          schema: str,
+                          table: str,
+                          load_plan: RecordsLoadPlan,
+                          fileobj: IO[bytes]) -> None:
+        import_sql = self._import_sql(schema, table, load_plan)
+        self._copy(import_sql, fileobj)
+        return None
+
+    def max_concurrent_fileobj_loads(self) -> int:
+        # Each COPY runs on its own connection from the engine's pool,
+        # and Vertica works on several COPY streams at once, so this
+        # keeps more of the cluster busy than loading files one by
+        # one.
+        return 4
+
+    def load_method(self, directory: RecordsDirectory) -> Optional[str]:
+        """Load method to use for the records in directory: DIRECT if
+        the manifest shows enough data to go straight to disk, or None
+        to leave it up to the import options."""
+        manifest = directory.get_manifest()
+        if manifest is None:
+            return None
+        total_bytes = 0
+        for entry in manifest['entries']:
+            meta = entry.get('meta')
+            if meta is not None:
+                total_bytes += meta['content_length']
+        if total_bytes >= DIRECT_LOAD_MIN_BYTES:
+            return 'DIRECT'
+        return None
+
+    def load(self,
+             schema: str,
+             table: str,
+             load_plan: RecordsLoadPlan,
+             directory: RecordsDirectory) -> None:
+        import_sql = self._import_sql(schema, table, load_plan,
+                                      load_method=self.load_method(directory))
+        # Resolved before starting the COPY streams, as resolving S3
+        # URLs isn't thread-safe
+        locs = [self.url_resolver.file_url(url) for url in directory.manifest_entry_urls()]
+        num_streams = min(self.max_concurrent_fileobj_loads(), len(locs))
+        if num_streams > 1:
+            logger.info(f"Loading {len(locs)} files into Vertica "
+                        f"over {num_streams} COPY streams")
+
+        def load_loc(loc: BaseFileUrl) -> None:
+            with loc.open() as f:
+                logger.info(f"Loading {loc.url} into {schema}.{table}...")
+                self._copy(import_sql, f)
+
+        map_concurrently(load_loc, locs, max_workers=num_streams)
+        return None
+
     def load_failure_exception(self) -> Type[Exception]:
         return vertica_python.errors.CopyRejected
 
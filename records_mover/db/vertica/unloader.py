@@ -1,5 +1,5 @@
 from ...check_db_conn_engine import check_db_conn_engine
-from records_mover.db.quoting import quote_value
+from records_mover.db.quoting import quote_schema_and_table, quote_value, literal_text
 import sqlalchemy
 from sqlalchemy import text
 from contextlib import contextmanager
@@ -53,15 +53,30 @@ class VerticaUnloader(Unloader):
                table: str,
                unload_plan: RecordsUnloadPlan,
                directory: RecordsDirectory) -> Optional[int]:
+        source = quote_schema_and_table(None, schema, table, db_engine=self.db_engine)
+        if unload_plan.where is not None:
+            source = f"(SELECT * FROM {source} WHERE {unload_plan.where}) AS records_mover_query"
+        return self._unload(source, unload_plan, directory)
+
+    def unload_query(self,
+                     query: str,
+                     unload_plan: RecordsUnloadPlan,
+                     directory: RecordsDirectory) -> Optional[int]:
+        return self._unload(f"({query}) AS records_mover_query", unload_plan, directory)
+
+    def _unload(self,
+                source: str,
+                unload_plan: RecordsUnloadPlan,
+                directory: RecordsDirectory) -> Optional[int]:
         if not self.s3_export_available():
             raise NotImplementedError('S3 currently required for Vertica bulk unload')
         try:
             if directory.scheme == 's3':
-                return self.unload_to_s3_directory(schema, table, unload_plan, directory)
+                return self.unload_to_s3_directory(source, unload_plan, directory)
             else:
                 with self.temporary_unloadable_directory_loc() as temp_s3_loc:
                     s3_directory = RecordsDirectory(records_loc=temp_s3_loc)
-                    out = self.unload_to_s3_directory(schema, table, unload_plan, s3_directory)
+                    out = self.unload_to_s3_directory(source, unload_plan, s3_directory)
                     directory.copy_from(temp_s3_loc)
                     return out
         except LoadUnloadError as e:
@@ -82,8 +97,7 @@ class VerticaUnloader(Unloader):
         return available
 
     def unload_to_s3_directory(self,
-                               schema: str,
-                               table: str,
+                               source: str,
                                unload_plan: RecordsUnloadPlan,
                                directory: RecordsDirectory) -> int:
         if not isinstance(unload_plan.records_format, DelimitedRecordsFormat):
@@ -117,12 +131,11 @@ class VerticaUnloader(Unloader):
                                     unload_plan.records_format.hints)
 
         export_sql = vertica_export_sql(db_engine=self.db_engine,
-                                        table=table,
-                                        schema=schema,
+                                        source=source,
                                         s3_url=directory.loc.url,
                                         **vertica_options)
         logger.info(export_sql)
-        export_result = self.db_conn.execute(text(export_sql)).fetchall()
+        export_result = self.db_conn.execute(literal_text(export_sql)).fetchall()
         directory.save_preliminary_manifest()
         export_count = 0
         for record in export_result:
@@ -1,10 +1,10 @@
-from ..driver import DBDriver
+from ..driver import DBDriver, scratch_table_name
 import sqlalchemy
 from sqlalchemy.sql import text
 from sqlalchemy import select
-from sqlalchemy.schema import Table, Column
+from sqlalchemy.schema import Table, Column, MetaData
 import logging
-from typing import Optional, Union, Tuple
+from typing import List, Optional, Union, Tuple
 from ...url.resolver import UrlResolver
 from ...url.base import BaseDirectoryUrl
 from .loader import VerticaLoader
@@ -15,6 +15,7 @@ from ...utils.limits import (INT64_MIN, INT64_MAX,
                              FLOAT64_SIGNIFICAND_BITS,
                              num_digits)
 from ...check_db_conn_engine import check_db_conn_engine
+from ..quoting import quote_table_only
 
 
 logger = logging.getLogger(__name__)
@@ -54,6 +55,31 @@ class VerticaDBDriver(DBDriver):
         except sqlalchemy.exc.ProgrammingError:
             return False
 
+    def create_table_like(self, schema: str, table: str, like_table: str) -> None:
+        self.db_conn.execute(text(f"CREATE TABLE {self._quote_schema_and_table(schema, table)} "
+                                  f"LIKE {self._quote_schema_and_table(schema, like_table)} "
+                                  "INCLUDING PROJECTIONS"))
+
+    def replace_table(self, schema: str, table: str, replacement_table: str) -> None:
+        # Vertica renames a list of tables as a single atomic
+        # operation.  (SWAP_PARTITIONS_BETWEEN_TABLES() would only
+        # work for partitioned tables.)
+        old_table = scratch_table_name(table, 'old')
+        self.db_conn.execute(text("ALTER TABLE "
+                                  f"{self._quote_schema_and_table(schema, table)}, "
+                                  f"{self._quote_schema_and_table(schema, replacement_table)} "
+                                  f"RENAME TO {quote_table_only(None, old_table, self.db_engine)}, "
+                                  f"{quote_table_only(None, table, self.db_engine)}"))
+        self.db_conn.execute(text(f"DROP TABLE {self._quote_schema_and_table(schema, old_table)}"))
+
+    def merge_table(self,
+                    schema: str,
+                    table: str,
+                    source_table: str,
+                    key_columns: List[str]) -> None:
+        self.db_conn.execute(text(self._merge_statement(schema, table,
+                                                        source_table, key_columns)))
+
     def schema_sql(self, schema: str, table: str) -> str:
         sql = text("SELECT EXPORT_OBJECTS('', :schema_and_table , false)")
         result = self.db_conn.execute(sql, {'schema_and_table': f"{schema}.{table}"}).fetchall()
@@ -64,9 +90,9 @@ class VerticaDBDriver(DBDriver):
             # maybe a permission error?
             return super().schema_sql(schema, table)
 
-    def table(self,
-              schema: str,
-              table: str) -> Table:
+    def autoload_table(self,
+                       schema: str,
+                       table: str) -> Table:
         # sqlalchemy-vertica driver uses system tables that are
         # suuuuper slow in Vertica databases--this is a compromise
         # that pulls column info but not other things
@@ -82,7 +108,7 @@ class VerticaDBDriver(DBDriver):
                    for colinfo in self.db_engine.dialect.get_columns(self.db_conn,
                                                                      table,
                                                                      schema=schema)]
-        t = Table(table, self.meta, schema=schema, *columns)
+        t = Table(table, MetaData(), schema=schema, *columns)
         return t
 
     def integer_limits(self,
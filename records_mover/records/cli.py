@@ -1,11 +1,9 @@
 """CLI to move records from place to place"""
 import argparse
 from odictliteral import odict
-from .airbyte.airbyte import AirbyteEngine
-from .job.schema import method_to_json_schema
-from .job.mover import run_records_mover_job
-from ..utils.json_schema import method_signature_to_json_schema
-from .processing_instructions import ProcessingInstructions
+from .job.cached_schemas import (
+    processing_instructions_schema, source_method_schema, target_method_schema
+)
 from records_mover.cli.job_config_schema_as_args_parser import (
     JobConfigSchemaAsArgsParser, arguments_output_to_config
 )
@@ -14,23 +12,52 @@ from ..mover_types import JsonSchema, JobConfig
 from ..version import __version__
 import sys
 import os
-from typing import Callable, Dict, Any, TYPE_CHECKING
+import json
+from typing import Callable, Dict, Any, Iterable, List, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
-    from records_mover import Session
+    from .results import MoveResult  # noqa
+
+# skip in-memory sources/targets like dataframes that don't make
+# sense from the command-line
+SOURCE_METHOD_NAME_BY_CLI_NAME = {
+    'table': 'table',
+    'gsheet': 'google_sheet',
+    'recordsdir': 'directory_from_url',
+    'url': 'data_url',
+    'file': 'local_file'
+}
+TARGET_METHOD_NAME_BY_CLI_NAME = {
+    'gsheet': 'google_sheet',
+    'table': 'table',
+    'recordsdir': 'directory_from_url',
+    'url': 'data_url',
+    'file': 'local_file',
+    'spectrum': 'spectrum',
+}
+
+
+def subjob_names() -> List[str]:
+    return [f"{source}2{target}"
+            for source in SOURCE_METHOD_NAME_BY_CLI_NAME
+            for target in TARGET_METHOD_NAME_BY_CLI_NAME]
+
 
+def selected_subjob_names(argv: Iterable[str]) -> List[str]:
+    """Find the subcommand(s) named on the command line, so that only
+    their argument parsers need to be fully built."""
+    known_subjob_names = set(subjob_names())
+    return [arg for arg in argv if arg in known_subjob_names]
 
-def populate_subparser(bootstrap_session: 'Session',
-                       sub_parser: argparse.ArgumentParser,
+
+def populate_subparser(sub_parser: argparse.ArgumentParser,
                        source_method_name: str,
                        target_method_name: str,
                        subjob_name: str) -> JobConfig:
-    source_method = getattr(bootstrap_session.records.sources, source_method_name)
-    target_method = getattr(bootstrap_session.records.targets, target_method_name)
     job_config_schema = {
         "type": "object",
         "properties": odict[
-            'source': method_to_json_schema(source_method),  # type: ignore
-            'target': method_to_json_schema(target_method),  # type: ignore
+            'source': source_method_schema(source_method_name),  # type: ignore
+            'target': target_method_schema(target_method_name),  # type: ignore
         ],
         "required": ["source", "target"],
     }
@@ -42,49 +69,37 @@ def populate_subparser(bootstrap_session: 'Session',
 def make_job_fn(source_method_name: str,
                 target_method_name: str,
                 name: str,
-                job_config_schema: JsonSchema) -> Callable[[Dict[str, Any]], None]:
-    def job_fn(raw_config: Dict[str, Any]) -> None:
+                job_config_schema: JsonSchema) -> Callable[[Dict[str, Any]], 'MoveResult']:
+    def job_fn(raw_config: Dict[str, Any]) -> 'MoveResult':
+        from .job.mover import run_records_mover_job
+
         job_config = arguments_output_to_config(raw_config)
-        run_records_mover_job(source_method_name,
-                              target_method_name,
-                              job_name=name,
-                              config=job_config)
+        return run_records_mover_job(source_method_name,
+                                     target_method_name,
+                                     job_name=name,
+                                     config=job_config)
     return job_fn
 
 
-def build_parser() -> argparse.ArgumentParser:
-    # skip in-memory sources/targets like dataframes that don't make
-    # sense from the command-line
-    source_method_name_by_cli_name = {
-        'table': 'table',
-        'gsheet': 'google_sheet',
-        'recordsdir': 'directory_from_url',
-        'url': 'data_url',
-        'file': 'local_file'
-    }
-    target_method_name_by_cli_name = {
-        'gsheet': 'google_sheet',
-        'table': 'table',
-        'recordsdir': 'directory_from_url',
-        'url': 'data_url',
-        'file': 'local_file',
-        'spectrum': 'spectrum',
-    }
-    sources = source_method_name_by_cli_name.keys()
-    targets = target_method_name_by_cli_name.keys()
+def build_parser(subjobs_to_populate: Optional[Iterable[str]] = None) -> argparse.ArgumentParser:
+    """Build the mvrec argument parser.
 
+    :param subjobs_to_populate: Names of the subcommands (e.g.,
+       'table2recordsdir') whose arguments should be configured.  Other
+       subcommands are listed in the help but accept no arguments.  If
+       not specified, all subcommands are configured.
+    """
     description = 'Move tabular data ("records") from one place to another'
     parser = argparse.ArgumentParser(description=description,
                                      formatter_class=argparse.ArgumentDefaultsHelpFormatter)
-    pi_config_schema =\
-        method_signature_to_json_schema(ProcessingInstructions.__init__,
-                                        special_handling={},
-                                        parameters_to_ignore=['self'])
-    JobConfigSchemaAsArgsParser(config_json_schema=pi_config_schema,
+    JobConfigSchemaAsArgsParser(config_json_schema=processing_instructions_schema(),
                                 argument_parser=parser).configure_arg_parser()
 
     # https://stackoverflow.com/questions/15405636/pythons-argparse-to-show-programs-version-with-prog-and-version-string-formatt
     parser.add_argument('-V', '--version', action='version', version="%(prog)s ("+__version__+")")
+    parser.add_argument('--json', action='store_true',
+                        help='Print the result of the move, including timing and volume '
+                        'metrics for each stage, to stdout as JSON')
 
     airbyte_feature_flag = os.getenv('RECORDS_MOVER_AIRBYTE_ENABLED')
     if airbyte_feature_flag is not None:
@@ -92,17 +107,16 @@ def build_parser() -> argparse.ArgumentParser:
                             help='Returns health of the configured airbyte instance')
 
     subparsers = parser.add_subparsers(help='subcommand_help')
-    from records_mover import Session
-    bootstrap_session = Session()
-    for source in sources:
-        for target in targets:
+    populate_all = subjobs_to_populate is None
+    subjobs_to_populate = set(subjobs_to_populate or [])
+    for source, source_method_name in SOURCE_METHOD_NAME_BY_CLI_NAME.items():
+        for target, target_method_name in TARGET_METHOD_NAME_BY_CLI_NAME.items():
             name = f"{source}2{target}"
             sub_parser = subparsers.add_parser(name, help=f"Copy from {source} to {target}")
-            source_method_name = source_method_name_by_cli_name[source]
-            target_method_name = target_method_name_by_cli_name[target]
+            if not populate_all and name not in subjobs_to_populate:
+                continue
             job_config_schema = \
-                populate_subparser(bootstrap_session,
-                                   sub_parser, source_method_name, target_method_name,
+                populate_subparser(sub_parser, source_method_name, target_method_name,
                                    subjob_name=name)
             sub_parser.set_defaults(func=make_job_fn(source_method_name=source_method_name,
                                                      target_method_name=target_method_name,
@@ -118,13 +132,16 @@ def main() -> None:
     warnings.filterwarnings("ignore",
                             "Your application has authenticated using end user credentials")
 
-    parser = build_parser()
+    parser = build_parser(selected_subjob_names(sys.argv[1:]))
     args = parser.parse_args()
     raw_config = vars(args)
+    output_json = raw_config.pop('json', False)
     func = getattr(args, 'func', None)
     healthcheck = getattr(args, 'healthcheck', False)
     if healthcheck:
         from records_mover import Session
+        from .airbyte.airbyte import AirbyteEngine
+
         session = Session()
         engine = AirbyteEngine(session)
         result = engine.healthcheck()
@@ -137,7 +154,9 @@ def main() -> None:
     else:
         set_stream_logging()
         try:
-            func(raw_config)
+            result = func(raw_config)
         except Exception:
             # This is logged above using a redacting logger
             sys.exit(1)
+        if output_json:
+            print(json.dumps(result.to_data()))
@@ -19,4 +19,6 @@ def sniff_compression_from_url(url: str) -> HintCompression:
                 return "BZIP"
             elif ext.lower() == '.lzo':
                 return "LZO"
+            elif ext.lower() in ('.zst', '.zstd'):
+                return "ZSTD"
     return None
@@ -9,6 +9,7 @@ logger = logging.getLogger(__name__)
 pandas_compression_from_hint: Dict[HintCompression, Optional[str]] = {
     'GZIP': 'gzip',
     'BZIP': 'bz2',
+    'ZSTD': 'zstd',
     None: None,
 }
 
@@ -97,7 +97,7 @@ class LiteralHint(Hint[LiteralHintT]):
 
             pass
         else:
-            return JsonSchemaDocument(list(types_set),
+            return JsonSchemaDocument(sorted(types_set),
                                       enum=self.valid_values,
                                       description=self.description)
 
@@ -35,6 +35,12 @@ def rewound_decompressed_fileobj(fileobj: IO[bytes],
                                       'to decompress LZO files for inspection')
         elif compression == 'BZIP':
             yield bz2.BZ2File(mode='rb', filename=fileobj_after_rewind)
+        elif compression == 'ZSTD':
+            import zstandard
+
+            with zstandard.ZstdDecompressor().stream_reader(fileobj_after_rewind,
+                                                            closefd=False) as reader:
+                yield reader
         else:
             _assert_never(compression)
 
@@ -176,6 +182,7 @@ def sniff_compression_hint(fileobj: IO[bytes]) -> HintCompression:
         magic_dict: Dict[bytes, HintCompression] = {
             b"\x1f\x8b\x08": "GZIP",
             b"\x42\x5a\x68": "BZIP",
+            b"\x28\xb5\x2f\xfd": "ZSTD",
             # "\x50\x4b\x03\x04": "zip"
         }
 
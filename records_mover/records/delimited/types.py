@@ -14,7 +14,7 @@ HintQuoting = Literal["all", "minimal", "nonnumeric", None]
 
 HintEscape = Literal["\\", None]
 
-HintCompression = Literal['GZIP', 'BZIP', 'LZO', None]
+HintCompression = Literal['GZIP', 'BZIP', 'LZO', 'ZSTD', None]
 
 # The trick here works on Literal[True, False] but not on bool:
 #
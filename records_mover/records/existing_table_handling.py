@@ -34,3 +34,29 @@ class ExistingTableHandling(Enum):
     loading data into the table, which may not honor triggers and
     integrity constraints.
     """
+
+    STAGE_AND_SWAP = 5
+    """Load into a new staging table with the same structure as the
+    existing table, then replace the existing table with it.  Readers
+    see the old data until the load completes, and the replacement is
+    a quick metadata change (a rename, where the database allows)
+    rather than a rewrite of the data.  Note that permissions on the
+    old table other than those given by the add_*_perms_for options
+    are not carried over.  Databases which track dependencies (e.g.,
+    Postgres, or Redshift for views other than late-binding ones)
+    refuse to drop a table which views depend on, so on those the
+    move fails, leaving the existing table and its views as they
+    were.  On Postgres, the staging table's serial columns keep using
+    the existing table's sequences, which are handed over to it
+    before the existing table is dropped.
+    """
+
+    UPSERT = 6
+    """Load into a new staging table with the same structure as the
+    existing table, then merge it into the existing table: rows whose
+    upsert_key columns match an existing row replace that row, and
+    the rest are added.  The merge uses the database's native upsert
+    where there is one; note that Postgres requires a unique index
+    or constraint on the key columns, and MySQL matches rows on the
+    table's own primary and unique keys.
+    """
@@ -0,0 +1,113 @@
+"""Pre-computed JSON schemas for the records sources and targets exposed
+on the mvrec command line.
+
+Building these schemas means introspecting each factory method's
+signature and docstring, which requires importing the modules the
+sources and targets live in (and their dependencies).  To keep CLI
+startup fast, the results are stored alongside this module in
+job_schemas.json and only recomputed when an entry is missing.
+
+After changing the signature or docstring of a source or target
+method used by the CLI, regenerate the table with:
+
+    python -m records_mover.records.job.cached_schemas
+"""
+import json
+import logging
+import os
+from typing import Any, Dict, Iterable, Optional
+from ...mover_types import JsonSchema
+
+
+logger = logging.getLogger(__name__)
+
+SCHEMAS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'job_schemas.json')
+
+_cached_job_schemas: Optional[Dict[str, Any]] = None
+
+
+def load_cached_job_schemas() -> Dict[str, Any]:
+    global _cached_job_schemas
+
+    if _cached_job_schemas is None:
+        try:
+            with open(SCHEMAS_PATH, 'r') as f:
+                _cached_job_schemas = json.load(f)
+        except FileNotFoundError:
+            logger.debug(f"No cached job schemas found at {SCHEMAS_PATH}")
+            _cached_job_schemas = {}
+    return _cached_job_schemas
+
+
+def source_method_schema(source_method_name: str) -> JsonSchema:
+    cached: Optional[JsonSchema] =\
+        load_cached_job_schemas().get('sources', {}).get(source_method_name)
+    if cached is not None:
+        return cached
+    from ..sources import RecordsSources
+    from .schema import method_to_json_schema
+
+    return method_to_json_schema(getattr(RecordsSources, source_method_name))
+
+
+def target_method_schema(target_method_name: str) -> JsonSchema:
+    cached: Optional[JsonSchema] =\
+        load_cached_job_schemas().get('targets', {}).get(target_method_name)
+    if cached is not None:
+        return cached
+    from ..targets import RecordsTargets
+    from .schema import method_to_json_schema
+
+    return method_to_json_schema(getattr(RecordsTargets, target_method_name))
+
+
+def processing_instructions_schema() -> JsonSchema:
+    cached: Optional[JsonSchema] = load_cached_job_schemas().get('processing_instructions')
+    if cached is not None:
+        return cached
+    return generate_processing_instructions_schema()
+
+
+def generate_processing_instructions_schema() -> JsonSchema:
+    from ...utils.json_schema import method_signature_to_json_schema
+    from ..processing_instructions import ProcessingInstructions
+
+    return method_signature_to_json_schema(ProcessingInstructions.__init__,
+                                           special_handling={},
+                                           parameters_to_ignore=['self'])
+
+
+def generate_job_schemas(source_method_names: Iterable[str],
+                         target_method_names: Iterable[str]) -> Dict[str, Any]:
+    from ..sources import RecordsSources
+    from ..targets import RecordsTargets
+    from .schema import method_to_json_schema
+
+    return {
+        'processing_instructions': generate_processing_instructions_schema(),
+        'sources': {
+            name: method_to_json_schema(getattr(RecordsSources, name))
+            for name in sorted(source_method_names)
+        },
+        'targets': {
+            name: method_to_json_schema(getattr(RecordsTargets, name))
+            for name in sorted(target_method_names)
+        },
+    }
+
+
+def generate_cli_job_schemas() -> Dict[str, Any]:
+    from ..cli import SOURCE_METHOD_NAME_BY_CLI_NAME, TARGET_METHOD_NAME_BY_CLI_NAME
+
+    return generate_job_schemas(SOURCE_METHOD_NAME_BY_CLI_NAME.values(),
+                                TARGET_METHOD_NAME_BY_CLI_NAME.values())
+
+
+def write_cached_job_schemas(path: str = SCHEMAS_PATH) -> None:
+    with open(path, 'w') as f:
+        json.dump(generate_cli_job_schemas(), f, indent=2)
+        f.write('\n')
+
+
+if __name__ == '__main__':
+    write_cached_job_schemas()
@@ -0,0 +1,181 @@
+"""Timing and volume measurements collected over the course of a
+records move, to help find where time is being spent."""
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, TYPE_CHECKING
+from ..utils.counting_fileobj import CountingFileobj
+if TYPE_CHECKING:
+    from .records_format import BaseRecordsFormat  # noqa
+
+
+# Deciding on a technique to move records
+NEGOTIATION = 'negotiation'
+# Sniffing the records format of incoming data
+SNIFFING = 'sniffing'
+# Inferring a records schema from incoming data
+SCHEMA_INFERENCE = 'schema_inference'
+# Bulk export of a database table
+UNLOAD = 'unload'
+# Copying data files between locations
+TRANSFER = 'transfer'
+# Bulk import into a database table
+LOAD = 'load'
+# Creating, dropping or clearing out the target table
+DDL = 'ddl'
+
+
+class MoveMetrics:
+    def __init__(self) -> None:
+        """Measurements of a records move.  Volume fields are None if
+        the move path taken doesn't track them."""
+        self.move_paths: List[str] = []
+        "Techniques chosen to move the records, outermost first"
+        self.stage_seconds: Dict[str, float] = {}
+        "Wall clock time spent in each stage of the move, in seconds"
+        self.bytes_read: Optional[int] = None
+        "Number of bytes streamed from the source through records mover"
+        self.bytes_written: Optional[int] = None
+        "Number of bytes written to the target by records mover"
+        self.files_moved: Optional[int] = None
+        "Number of data files written or copied"
+        self.rows: Optional[int] = None
+        """Number of rows moved - either as reported by the source or
+        target, or (if that isn't available) counted from delimited
+        data as it streams through.  Counted rows are approximate if
+        quoted fields contain newlines."""
+        # Parts of a move may run in worker threads (e.g., when
+        # handling shards of a records directory concurrently)
+        self._lock = threading.Lock()
+
+    def add_stage_seconds(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+
+    def add_bytes_read(self, num_bytes: int) -> None:
+        with self._lock:
+            self.bytes_read = (self.bytes_read or 0) + num_bytes
+
+    def add_bytes_written(self, num_bytes: int) -> None:
+        with self._lock:
+            self.bytes_written = (self.bytes_written or 0) + num_bytes
+
+    def add_files_moved(self, num_files: int) -> None:
+        with self._lock:
+            self.files_moved = (self.files_moved or 0) + num_files
+
+    def add_rows(self, num_rows: int) -> None:
+        with self._lock:
+            self.rows = (self.rows or 0) + num_rows
+
+    def to_data(self) -> Dict[str, Any]:
+        return {
+            'move_path': self.move_paths,
+            'stage_seconds': self.stage_seconds,
+            'bytes_read': self.bytes_read,
+            'bytes_written': self.bytes_written,
+            'files_moved': self.files_moved,
+            'rows': self.rows,
+        }
+
+
+_current_metrics: 'ContextVar[Optional[MoveMetrics]]' = \
+    ContextVar('records_mover_move_metrics', default=None)
+
+
+def current_metrics() -> Optional[MoveMetrics]:
+    """Return the metrics being collected for the move in progress, if any."""
+    return _current_metrics.get()
+
+
+@contextmanager
+def collect_metrics() -> Iterator[MoveMetrics]:
+    """Collect metrics for the code run within this context.  If
+    metrics are already being collected (e.g., for a move() called
+    from within another move()), the same metrics object is reused."""
+    metrics = current_metrics()
+    if metrics is not None:
+        yield metrics
+        return
+    metrics = MoveMetrics()
+    token = _current_metrics.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _current_metrics.reset(token)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time the code run within this context as part of the given
+    stage of the move in progress, if metrics are being collected."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics = current_metrics()
+        if metrics is not None:
+            metrics.add_stage_seconds(name, time.perf_counter() - start)
+
+
+def record_move_path(move_path: str, negotiation_start: float) -> None:
+    metrics = current_metrics()
+    if metrics is not None:
+        metrics.move_paths.append(move_path)
+        metrics.add_stage_seconds(NEGOTIATION, time.perf_counter() - negotiation_start)
+
+
+def record_bytes_read(num_bytes: int) -> None:
+    metrics = current_metrics()
+    if metrics is not None:
+        metrics.add_bytes_read(num_bytes)
+
+
+def record_bytes_written(num_bytes: int) -> None:
+    metrics = current_metrics()
+    if metrics is not None:
+        metrics.add_bytes_written(num_bytes)
+
+
+def record_files_moved(num_files: int) -> None:
+    metrics = current_metrics()
+    if metrics is not None:
+        metrics.add_files_moved(num_files)
+
+
+def rows_in_stream(counting_fileobj: CountingFileobj,
+                   records_format: 'BaseRecordsFormat',
+                   num_files: int = 1) -> Optional[int]:
+    """Estimate the number of rows in delimited data which has streamed
+    through the given file object, or None if that can't be done
+    cheaply (e.g., the data is compressed or not newline-delimited)."""
+    from .records_format import DelimitedRecordsFormat
+
+    if not isinstance(records_format, DelimitedRecordsFormat):
+        return None
+    hints = records_format.hints
+    if hints['compression'] is not None or hints['record-terminator'] not in ('\n', '\r\n'):
+        return None
+    if counting_fileobj.bytes_count == 0:
+        return 0
+    lines = counting_fileobj.newline_count
+    if not counting_fileobj.ends_with_newline:
+        lines += 1
+    if hints['header-row']:
+        lines -= num_files
+    return max(lines, 0)
+
+
+def record_streamed(counting_fileobj: CountingFileobj,
+                    records_format: 'BaseRecordsFormat',
+                    num_files: int = 1) -> None:
+    """Record bytes and (if they can be cheaply counted) rows which
+    have been read from the source through the given file object."""
+    metrics = current_metrics()
+    if metrics is None:
+        return
+    metrics.add_bytes_read(counting_fileobj.bytes_count)
+    rows = rows_in_stream(counting_fileobj, records_format, num_files)
+    if rows is not None:
+        metrics.add_rows(rows)
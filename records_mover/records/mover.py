@@ -10,7 +10,9 @@ from .targets import base as targets_base
 from .processing_instructions import ProcessingInstructions
 from .records_format import BaseRecordsFormat
 from .results import MoveResult
+from .metrics import collect_metrics, record_move_path
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +51,19 @@ def move(records_source: RecordsSource,
 
     :rtype: records_mover.records.MoveResult
     """
+    with collect_metrics() as metrics:
+        result = _move(records_source, records_target, processing_instructions)
+        if isinstance(records_source, sources_base.SupportsMoveComplete):
+            result = records_source.move_complete(result)
+        if result.move_count is not None:
+            metrics.rows = result.move_count
+        return result._replace(metrics=metrics)
+
+
+def _move(records_source: RecordsSource,
+          records_target: RecordsTarget,
+          processing_instructions: ProcessingInstructions) -> MoveResult:
+    negotiation_start = time.perf_counter()
     records_source.validate()
     records_target.validate()
     # This method works by looking for whether copy-related methods
@@ -68,6 +83,7 @@ def move(records_source: RecordsSource,
         # Tell the destination to load directly from wherever the
         # source is, without needing to make any copies of the data or
         # streaming it through the current box.
+        record_move_path('direct_from_records_directory', negotiation_start)
         directory = records_source.records_directory()
         logger.info(f"Mover: copying from {records_source} to {records_target} "
                     f"by moving from records directory in {directory}...")
@@ -79,6 +95,7 @@ def move(records_source: RecordsSource,
           isinstance(records_target, MightSupportMoveFromFileobjsSource) and
           records_target.can_move_from_fileobjs_source() and
           records_target.can_move_from_format(records_source.records_format)):
+        record_move_path('from_fileobjs_source', negotiation_start)
         logger.info(f"Mover: copying from {records_source} to {records_target} "
                     "by moving directly from stream...")
         # See if we can stream from the source to the destination directly
@@ -91,10 +108,17 @@ def move(records_source: RecordsSource,
         # if target can accept records and doesn't specify a
         # records_format, or uses the same as the source, we can just
         # dump bytes directly!
+        record_move_path('to_records_directory', negotiation_start)
         directory = records_target.records_directory()
         logger.info(f"Mover: copying from {records_source} to {records_target} "
                     f"by writing to {directory.scheme} records directory")
-        pi = processing_instructions
+        pi = records_target.\
+            processing_instructions_for_records_directory(processing_instructions)
+        if pi.partition_by and not records_source.can_move_to_partitions():
+            # Checked before the target is prepared, which may mean
+            # clearing out what's already there
+            raise NotImplementedError(f"Teach me how to write records partitioned by "
+                                      f"{pi.partition_by} from {records_source}")
         records_format = records_source.compatible_format(records_target)
         assert records_format is not None  # we checked compatibility above
         records_target.pre_load_hook()
@@ -107,6 +131,7 @@ def move(records_source: RecordsSource,
     elif (isinstance(records_source, sources_base.SupportsRecordsDirectory) and
           isinstance(records_target, SupportsMoveFromRecordsDirectory) and
           records_target.can_move_from_format(records_source.records_format)):
+        record_move_path('from_records_directory', negotiation_start)
         directory = records_source.records_directory()
         logger.info(f"Mover: copying from {records_source} to {records_target} "
                     "by loading from {directory.scheme} directory...")
@@ -119,6 +144,7 @@ def move(records_source: RecordsSource,
         #     variable has type "BaseRecordsFormat")
         target_records_format: BaseRecordsFormat \
           = getattr(records_target, "records_format", None)  # type: ignore
+        record_move_path('via_fileobjs_source', negotiation_start)
         logger.info(f"Mover: copying from {records_source} to {records_target} "
                     f"by first writing {records_source} to {target_records_format} "
                     "records format (if easy to rewrite)...")
@@ -133,12 +159,14 @@ def move(records_source: RecordsSource,
           records_source.
             can_move_to_scheme(records_target.temporary_loadable_directory_scheme()) and
           records_target.can_move_from_temp_loc_after_filling_it()):
+        record_move_path('via_temp_loc', negotiation_start)
         logger.info(f"Mover: copying from {records_source} to {records_target} "
                     f"by filling in a temporary location...")
         return records_target.move_from_temp_loc_after_filling_it(records_source,
                                                                   processing_instructions)
     elif (isinstance(records_source, SupportsToDataframesSource) and
           isinstance(records_target, SupportsMoveFromDataframes)):
+        record_move_path('from_dataframes_source', negotiation_start)
         logger.info(f"Mover: copying from {records_source} to {records_target} "
                     f"by converting to dataframe...")
         with records_source.to_dataframes_source(processing_instructions) as dataframes_source:
@@ -146,6 +174,7 @@ def move(records_source: RecordsSource,
                 move_from_dataframes_source(dfs_source=dataframes_source,
                                             processing_instructions=processing_instructions)
     elif (isinstance(records_source, SupportsToDataframesSource)):
+        record_move_path('via_dataframes_source', negotiation_start)
         logger.info(f"Mover: copying from {records_source} to {records_target} "
                     f"by first converting to dataframe...")
         with records_source.to_dataframes_source(processing_instructions) as dataframes_source:
@@ -474,6 +474,12 @@ def pandas_read_csv_options(records_format: DelimitedRecordsFormat,
         pandas_options['compression'] = 'gzip'
     elif hints.compression == 'BZIP':
         pandas_options['compression'] = 'bz2'
+    elif hints.compression == 'ZSTD':
+        if version.parse(pd.__version__) < version.parse('1.4.0'):
+            # Support for Zstandard was added in pandas 1.4
+            cant_handle_hint(fail_if_cant_handle_hint, 'compression', hints)
+        else:
+            pandas_options['compression'] = 'zstd'
     else:
         cant_handle_hint(fail_if_cant_handle_hint, 'compression', hints)
     quiet_remove(unhandled_hints, 'compression')
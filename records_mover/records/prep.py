@@ -3,6 +3,7 @@ from sqlalchemy.engine import Connection
 from records_mover.db.quoting import quote_schema_and_table
 from records_mover.records.existing_table_handling import ExistingTableHandling
 from records_mover.db import DBDriver
+from records_mover.db.driver import scratch_table_name
 from records_mover.records.table import TargetTableDetails
 import logging
 from sqlalchemy import text, Table, MetaData, delete
@@ -15,16 +16,21 @@ class TablePrep:
     def __init__(self, target_table_details: TargetTableDetails) -> None:
         self.tbl = target_table_details
 
-    def add_permissions(self, conn: Connection, driver: DBDriver) -> None:
+    def add_permissions(self,
+                        conn: Connection,
+                        driver: DBDriver,
+                        table_name: Optional[str] = None) -> None:
+        if table_name is None:
+            table_name = self.tbl.table_name
         schema_and_table: str = quote_schema_and_table(None,
                                                        self.tbl.schema_name,
-                                                       self.tbl.table_name,
+                                                       table_name,
                                                        db_engine=driver.db_engine)
         if self.tbl.add_group_perms_for is not None:
             logger.info(f"Adding permissions for {schema_and_table} "
                         f"to group {self.tbl.add_group_perms_for}")
             driver.set_grant_permissions_for_groups(self.tbl.schema_name,
-                                                    self.tbl.table_name,
+                                                    table_name,
                                                     self.tbl.add_group_perms_for,
                                                     None,
                                                     db_conn=conn)
@@ -33,7 +39,7 @@ class TablePrep:
                         f"to {self.tbl.add_user_perms_for}")
             driver.\
                 set_grant_permissions_for_users(self.tbl.schema_name,
-                                                self.tbl.table_name,
+                                                table_name,
                                                 self.tbl.add_user_perms_for,
                                                 None,
                                                 db_conn=conn)
@@ -42,13 +48,17 @@ class TablePrep:
         logger.info('Creating table...')
         conn.execute(text(schema_sql))
         logger.info(f"Just ran {schema_sql}")
+        driver.invalidate_table(self.tbl.schema_name, self.tbl.table_name)
         self.add_permissions(conn, driver)
         logger.info("Table prepped")
 
     def prep_table_for_load(self,
                             schema_sql: str,
                             existing_table_handling: ExistingTableHandling,
-                            driver: DBDriver) -> None:
+                            driver: DBDriver) -> str:
+        """Prepare the target table for loading, returning the name of
+        the table (in the same schema) which the data should be loaded
+        into."""
         logger.info("Looking for existing table..")
         db_engine = driver.db_engine
         db_conn = driver.db_conn
@@ -62,9 +72,7 @@ class TablePrep:
                                                            db_engine=db_engine,)
             if (how_to_prep == ExistingTableHandling.TRUNCATE_AND_OVERWRITE):
                 logger.info("Truncating...")
-                meta = MetaData()
-                table = Table(self.tbl.table_name, meta, schema=self.tbl.schema_name)
-                db_conn.execute(table.delete().where(True))
+                driver.truncate_table(self.tbl.schema_name, self.tbl.table_name)
                 logger.info("Truncated.")
             elif (how_to_prep == ExistingTableHandling.DELETE_AND_OVERWRITE):
                 logger.info("Deleting rows...")
@@ -72,31 +80,68 @@ class TablePrep:
                 db_conn.execute(delete(table_obj).where(True))
                 logger.info("Deleted")
             elif (how_to_prep == ExistingTableHandling.DROP_AND_RECREATE):
-                with db_engine.connect() as conn:
-                    with conn.begin():
-                        logger.info(f"The connection object is: {conn}")
-                        logger.info("Dropping and recreating...")
-                        meta = MetaData()
-                        table = Table(self.tbl.table_name, meta, schema=self.tbl.schema_name)
-                        drop_table_sql = f"DROP TABLE {schema_and_table}"
-                        conn.execute(DropTable(table))  # type: ignore[arg-type]  # noqa: F821
-                        logger.info(f"Just ran {drop_table_sql}")
-                        self.create_table(schema_sql, conn, driver)
+                logger.info("Dropping and recreating...")
+                meta = MetaData()
+                table = Table(self.tbl.table_name, meta, schema=self.tbl.schema_name)
+                drop_table_sql = f"DROP TABLE {schema_and_table}"
+                db_conn.execute(DropTable(table))  # type: ignore[arg-type]  # noqa: F821
+                logger.info(f"Just ran {drop_table_sql}")
+                self.create_table(schema_sql, db_conn, driver)
+            elif (how_to_prep in (ExistingTableHandling.STAGE_AND_SWAP,
+                                  ExistingTableHandling.UPSERT)):
+                staging_table_name = scratch_table_name(self.tbl.table_name, 'staging')
+                logger.info(f"Creating staging table {staging_table_name}...")
+                driver.create_table_like(self.tbl.schema_name,
+                                         staging_table_name,
+                                         self.tbl.table_name)
+                self.add_permissions(db_conn, driver, staging_table_name)
+                return staging_table_name
             elif (how_to_prep == ExistingTableHandling.APPEND):
                 logger.info("Appending rows...")
             else:
                 raise ValueError(f"Don't know how to handle {how_to_prep}")
         else:
-            with db_engine.connect() as conn:
-                with conn.begin():
-                    self.create_table(schema_sql, conn, driver)
+            self.create_table(schema_sql, db_conn, driver)
+        return self.tbl.table_name
+
+    def swap_in_staging_table(self, staging_table_name: str, driver: DBDriver) -> None:
+        """Replace the target table with a loaded staging table returned by
+        prep()."""
+        logger.info(f"Replacing table with staging table {staging_table_name}...")
+        driver.replace_table(self.tbl.schema_name, self.tbl.table_name, staging_table_name)
+        driver.invalidate_table(self.tbl.schema_name, self.tbl.table_name)
+        logger.info("Replaced.")
+
+    def merge_staging_table(self, staging_table_name: str, driver: DBDriver) -> None:
+        """Upsert a loaded staging table returned by prep() into the
+        target table, then drop it."""
+        assert self.tbl.upsert_key is not None
+        logger.info(f"Merging staging table {staging_table_name} on {self.tbl.upsert_key}...")
+        driver.merge_table(self.tbl.schema_name, self.tbl.table_name,
+                           staging_table_name, self.tbl.upsert_key)
+        self.drop_staging_table(staging_table_name, driver)
+        logger.info("Merged.")
+
+    def apply_staging_table(self, staging_table_name: str, driver: DBDriver) -> None:
+        """Move the data in a loaded staging table returned by prep() into
+        the target table, as specified by its existing_table_handling."""
+        if self.tbl.existing_table_handling == ExistingTableHandling.UPSERT:
+            self.merge_staging_table(staging_table_name, driver)
+        else:
+            self.swap_in_staging_table(staging_table_name, driver)
+
+    def drop_staging_table(self, staging_table_name: str, driver: DBDriver) -> None:
+        """Clean up a staging table returned by prep() after a failed load."""
+        logger.info(f"Dropping staging table {staging_table_name}...")
+        table = Table(staging_table_name, MetaData(), schema=self.tbl.schema_name)
+        driver.db_conn.execute(DropTable(table))  # type: ignore[arg-type]  # noqa: F821
 
     def prep(self,
              schema_sql: str,
              driver: DBDriver,
-             existing_table_handling: Optional[ExistingTableHandling] = None) -> None:
+             existing_table_handling: Optional[ExistingTableHandling] = None) -> str:
         if existing_table_handling is None:
             existing_table_handling = self.tbl.existing_table_handling
-        self.prep_table_for_load(schema_sql=schema_sql,
-                                 existing_table_handling=existing_table_handling,
-                                 driver=driver)
+        return self.prep_table_for_load(schema_sql=schema_sql,
+                                        existing_table_handling=existing_table_handling,
+                                        driver=driver)
@@ -4,6 +4,8 @@ from records_mover.db import DBDriver
 from records_mover.records.prep import TablePrep
 from records_mover.records.table import TargetTableDetails
 from records_mover.records.existing_table_handling import ExistingTableHandling
+from records_mover.records.metrics import stage, DDL, LOAD
+import sqlalchemy
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,33 +14,71 @@ logger = logging.getLogger(__name__)
 def prep_and_load(tbl: TargetTableDetails,
                   prep: TablePrep,
                   schema_sql: str,
-                  load: Callable[[DBDriver], Optional[int]],
+                  load: Callable[[DBDriver, str], Optional[int]],
                   load_exception_type: Type[Exception],
-                  reset_before_reload: Callable[[], None] = lambda: None) -> MoveResult:
-    logger.info("Connecting to database...")
-    with tbl.db_engine.connect() as db_conn:
-        with db_conn.begin():
+                  reset_before_reload: Callable[[], None] = lambda: None,
+                  driver: Optional[DBDriver] = None) -> MoveResult:
+    """Prep the target table and load it, all on a single database
+    connection.
+
+    load is called with the driver and the name of the table to load
+    into, which may be a staging table in the same schema rather than
+    the target table itself (see ExistingTableHandling.STAGE_AND_SWAP
+    and UPSERT).
+
+    If a driver is passed in, its connection is reused for the
+    prep and load; otherwise one connection is opened for the
+    duration of this call.
+    """
+    if driver is None:
+        logger.info("Connecting to database...")
+        with tbl.db_engine.connect() as db_conn:
             driver = tbl.db_driver(db=None, db_conn=db_conn)
-            prep.prep(schema_sql=schema_sql, driver=driver)
-    with tbl.db_engine.connect() as db_conn:
+            return prep_and_load(tbl, prep, schema_sql, load, load_exception_type,
+                                 reset_before_reload=reset_before_reload,
+                                 driver=driver)
+    db_conn = driver.db_conn
+    with db_conn.begin(), stage(DDL):
+        load_table_name = prep.prep(schema_sql=schema_sql, driver=driver)
+    staging = load_table_name != tbl.table_name
+    try:
+        # This second transaction ensures the table has been created
+        # before non-transactional statements like Redshift's COPY
+        # take place.  Otherwise you'll get an error like:
+        #
+        #  Cannot COPY into nonexistent table
+        with db_conn.begin(), stage(LOAD):
+            import_count = load(driver, load_table_name)
+    except BaseException as e:
+        if staging:
+            _drop_staging_table(prep, load_table_name, driver)
+        if not isinstance(e, load_exception_type) or not tbl.drop_and_recreate_on_load_error:
+            raise
+        reset_before_reload()
         with db_conn.begin():
-            # This second transaction ensures the table has been created
-            # before non-transactional statements like Redshift's COPY
-            # take place.  Otherwise you'll get an error like:
-            #
-            #  Cannot COPY into nonexistent table
-            driver = tbl.db_driver(db=None, db_conn=db_conn)
+            with stage(DDL):
+                prep.prep(schema_sql=schema_sql,
+                          driver=driver,
+                          existing_table_handling=ExistingTableHandling.DROP_AND_RECREATE)
+            with stage(LOAD):
+                import_count = load(driver, tbl.table_name)
+    else:
+        if staging:
             try:
-                import_count = load(driver)
-            except load_exception_type:
-                if not tbl.drop_and_recreate_on_load_error:
-                    raise
-                reset_before_reload()
-                with tbl.db_engine.connect() as db_conn:
-                    with db_conn.begin():
-                        driver = tbl.db_driver(db=None, db_conn=db_conn)
-                        prep.prep(schema_sql=schema_sql,
-                                  driver=driver,
-                                  existing_table_handling=ExistingTableHandling.DROP_AND_RECREATE)
-                        import_count = load(driver)
-            return MoveResult(move_count=import_count, output_urls=None)
+                # Readers see the table as it was until this commits.
+                with db_conn.begin(), stage(LOAD):
+                    prep.apply_staging_table(load_table_name, driver)
+            except BaseException:
+                _drop_staging_table(prep, load_table_name, driver)
+                raise
+    return MoveResult(move_count=import_count, output_urls=None)
+
+
+def _drop_staging_table(prep: TablePrep, staging_table_name: str, driver: DBDriver) -> None:
+    # Called while handling a load or swap error, which is more
+    # interesting than anything which goes wrong here.
+    try:
+        with driver.db_conn.begin():
+            prep.drop_staging_table(staging_table_name, driver)
+    except sqlalchemy.exc.SQLAlchemyError:
+        logger.warning(f"Could not drop staging table {staging_table_name}", exc_info=True)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 # An arbitrary 4 mb csv I looked at ran around 100,000 lines.
 # Assuming we want to limit our memory usage to, say, 400MB of memory,
@@ -12,7 +12,11 @@ class ProcessingInstructions:
                  fail_if_cant_handle_hint: bool = True,
                  fail_if_row_invalid: bool = True,
                  max_inference_rows: Optional[int] = DEFAULT_MAX_SAMPLE_SIZE,
-                 max_failure_rows: Optional[int] = None) -> None:
+                 max_failure_rows: Optional[int] = None,
+                 max_file_size: Optional[int] = None,
+                 parallel_export: bool = True,
+                 partition_by: Optional[List[str]] = None,
+                 parquet_row_group_size: Optional[int] = None) -> None:
         """Directives on how to handle different situations when processing
         records.  Note that not all vendor mechanisms support this
         level of configurability; when choosing between optimizing for
@@ -43,6 +47,26 @@ class ProcessingInstructions:
            controls the maximum number of rows we'll look at.  Higher values will be more likely to
            result in a schema that can be loaded into, but will take longer to load.  If set to
            None, the entire file will be processed.
+
+        :param max_file_size: When exporting from a database, the maximum size in bytes of each
+           file written into the records directory; larger exports are split across more files.
+           If None, the database's default is used.  Currently honored by Redshift.
+
+        :param parallel_export: When exporting from a database, whether the database may write
+           files in parallel (e.g., one or more per Redshift slice).  If False, files are written
+           one after another, resulting in fewer, larger files, at the cost of a slower export.
+           Currently honored by Redshift and BigQuery (which, if True, shards exports too large
+           to fit into a single file).
+
+        :param partition_by: When exporting from a database, names of columns whose values
+           should be used to split the records into 'column=value/' subdirectories of the
+           records directory (e.g., for consumers which can skip partitions they don't need).
+           The columns are still written into the files themselves.  Currently honored by
+           Redshift.
+
+        :param parquet_row_group_size: When exporting Parquet files from a database, the target
+           size in bytes of each row group within a file.  If None, the database's default is
+           used.  Currently honored by Redshift, which accepts sizes from 32 to 128 MB.
         """
 
         self.fail_if_dont_understand = fail_if_dont_understand
@@ -50,3 +74,7 @@ class ProcessingInstructions:
         self.fail_if_row_invalid = fail_if_row_invalid
         self.max_failure_rows = max_failure_rows
         self.max_inference_rows = max_inference_rows
+        self.max_file_size = max_file_size
+        self.parallel_export = parallel_export
+        self.partition_by = partition_by
+        self.parquet_row_group_size = parquet_row_group_size
@@ -4,6 +4,9 @@ from .records_format_file import RecordsFormatFile
 from .records_schema_sql_file import RecordsSchemaSqlFile
 from .records_schema_json_file import RecordsSchemaJsonFile
 from .schema import RecordsSchema
+from .metrics import (
+    current_metrics, stage, record_bytes_written, record_files_moved, TRANSFER
+)
 from urllib.parse import urlparse
 from ..url.base import BaseDirectoryUrl, BaseFileUrl
 from .records_format import BaseRecordsFormat, DelimitedRecordsFormat
@@ -72,13 +75,16 @@ class RecordsDirectory:
         Prefer save_fileobjs when writing a complete records directory.
         """
         url_details: UrlDetails = {}
-        for target_name, fileobj in fileobjs_by_target_names.items():
-            target_loc = self.loc.file_in_this_directory(target_name)
-            logger.info(f"Uploading {target_loc.url}")
-            length: int = target_loc.upload_fileobj(fileobj)
-            url_details[target_loc.url] = {
-                'content_length': length,
-            }
+        with stage(TRANSFER):
+            for target_name, fileobj in fileobjs_by_target_names.items():
+                target_loc = self.loc.file_in_this_directory(target_name)
+                logger.info(f"Uploading {target_loc.url}")
+                length: int = target_loc.upload_fileobj(fileobj)
+                url_details[target_loc.url] = {
+                    'content_length': length,
+                }
+                record_bytes_written(length)
+                record_files_moved(1)
         return url_details
 
     def _build_manifest(self,
@@ -120,9 +126,23 @@ class RecordsDirectory:
         path = urlparse(url).path
         return path.split('/')[-1]
 
+    def path_of_url(self, url: str) -> str:
+        """Path of a manifest entry relative to this directory.
+
+        Partitioned exports write data files into 'column=value/'
+        subdirectories, where the same filenames show up in each
+        subdirectory, so entries can't be identified by filename
+        alone.  Entries outside of this directory (e.g., those of a
+        manifest copied from elsewhere) are identified by filename.
+        """
+        if url.startswith(self.loc.url):
+            return url[len(self.loc.url):]
+        return self._filename_of_url(url)
+
     def copy_to(self, new_loc: BaseDirectoryUrl) -> 'RecordsDirectory':
         logger.info(f"Copying files from {self.loc} to {new_loc}...")
-        new_loc = self.loc.copy_to(new_loc)
+        with stage(TRANSFER):
+            new_loc = self.loc.copy_to(new_loc)
         # rebuild manifest to point to new URLs.
         new_directory = RecordsDirectory(records_loc=new_loc)
         # regenerate manifest with new URLs
@@ -134,8 +154,13 @@ class RecordsDirectory:
             for old_url
             in old_urls
             for old_loc
-            in [new_loc.file_in_this_directory(self._filename_of_url(old_url))]
+            in [new_loc.file_in_this_directory(self.path_of_url(old_url))]
         }
+        metrics = current_metrics()
+        if metrics is not None:
+            metrics.add_files_moved(len(new_urls))
+            metrics.add_bytes_written(sum(details['content_length']
+                                          for details in new_urls.values()))
         new_directory.save_preliminary_manifest(new_urls)
         old_finalized_manifest = self.loc.file_in_this_directory('_manifest')
         if old_finalized_manifest.exists():
@@ -177,21 +202,25 @@ class RecordsDirectory:
         records_format = self.load_format(fail_if_dont_understand=True)
         manifest_entry_urls = self.manifest_entry_urls()
         if len(manifest_entry_urls) == 1:
-            input_filename = self._filename_of_url(manifest_entry_urls[0])
-            input_loc = self.loc.file_in_this_directory(input_filename)
-            input_loc.copy_to(output_loc)
+            input_path = self.path_of_url(manifest_entry_urls[0])
+            input_loc = self.loc.file_in_this_directory(input_path)
+            with stage(TRANSFER):
+                input_loc.copy_to(output_loc)
+            record_files_moved(1)
         else:
             if isinstance(records_format, DelimitedRecordsFormat):
                 if records_format.hints['header-row']:
                     raise NotImplementedError("Please teach me how to concatenate "
                                               "delimited files with header row")
                 else:
-                    input_filenames = [self._filename_of_url(input_url)
-                                       for input_url in manifest_entry_urls]
-                    input_locs = [self.loc.file_in_this_directory(input_filename)
-                                  for input_filename in input_filenames]
+                    input_paths = [self.path_of_url(input_url)
+                                   for input_url in manifest_entry_urls]
+                    input_locs = [self.loc.file_in_this_directory(input_path)
+                                  for input_path in input_paths]
                     logger.info(f"Saving files from {self.loc.url} to {output_loc.url}")
-                    output_loc.concatenate_from(input_locs)
+                    with stage(TRANSFER):
+                        output_loc.concatenate_from(input_locs)
+                    record_files_moved(len(input_locs))
             else:
                 raise NotImplementedError("Please teach me how to concatenate this format of file")
 
@@ -201,7 +230,7 @@ class RecordsDirectory:
                          ms_between_polls: int = 50) -> None:
         manifest_loc = self.loc.file_in_this_directory(manifest_filename)
         manifest_loc.wait_to_exist(log_level=log_level, ms_between_polls=ms_between_polls)
-        manifest_locs = [self.loc.file_in_this_directory(self._filename_of_url(url))
+        manifest_locs = [self.loc.file_in_this_directory(self.path_of_url(url))
                          for url in self.manifest_entry_urls()]
         for loc in manifest_locs:
             loc.wait_to_exist(log_level=log_level, ms_between_polls=ms_between_polls)
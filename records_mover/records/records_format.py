@@ -216,6 +216,8 @@ class DelimitedRecordsFormat(BaseRecordsFormat):
             return f"{basename}.csv.gz"
         elif compression_type == 'BZIP':
             return f"{basename}.csv.bz2"
+        elif compression_type == 'ZSTD':
+            return f"{basename}.csv.zst"
         else:
             raise NotImplementedError("Teach me how to handle compression "
                                       f"type {compression_type}")
@@ -1,4 +1,6 @@
-from typing import NamedTuple, Optional, Mapping
+from typing import Any, Dict, NamedTuple, Optional, Mapping
+from .metrics import MoveMetrics
+from .watermark import watermark_to_data
 
 
 class MoveResult(NamedTuple):
@@ -16,3 +18,21 @@ class MoveResult(NamedTuple):
     output_urls: Optional[Mapping[str, str]]
     """A dictionary of short string aliases mapping to URLs of the
     resulting data (Optional[Mapping[str, str]])"""
+
+    metrics: Optional[MoveMetrics] = None
+    """Per-stage timings and data volumes of the move, filled in by
+    records_mover.records.move() (Optional[MoveMetrics])"""
+
+    high_watermark: Optional[Any] = None
+    """Highest value of the watermark column moved by an incremental
+    source, to be passed as the last watermark next time (Optional[Any])"""
+
+    def to_data(self) -> Dict[str, Any]:
+        data = {
+            'move_count': self.move_count,
+            'output_urls': None if self.output_urls is None else dict(self.output_urls),
+            'metrics': None if self.metrics is None else self.metrics.to_data(),
+        }
+        if self.high_watermark is not None:
+            data['high_watermark'] = watermark_to_data(self.high_watermark)
+        return data
@@ -14,6 +14,7 @@ from .statistics import RecordsSchemaFieldStatistics
 from .field_types import RECORDS_FIELD_TYPES
 if TYPE_CHECKING:
     from pandas import Series, Index
+    import pyarrow
     from sqlalchemy import Column
     from sqlalchemy.types import TypeEngine
     from records_mover.db import DBDriver  # noqa
@@ -159,6 +160,11 @@ class RecordsSchemaField:
 
         return field_to_sqlalchemy_column(self, driver)
 
+    def to_arrow_type(self) -> 'pyarrow.DataType':
+        from .arrow import field_to_arrow_type
+
+        return field_to_arrow_type(self)
+
     def cast_series_type(self, series: 'Series') -> 'Series':
         import pandas as pd
         if self.field_type == 'time':
@@ -0,0 +1,101 @@
+import datetime
+import logging
+import pyarrow as pa
+from typing import Optional, cast, TYPE_CHECKING
+from .constraints import (RecordsSchemaFieldIntegerConstraints,
+                          RecordsSchemaFieldDecimalConstraints)
+from ....utils.limits import INT64_MAX, INT64_MIN, num_digits
+if TYPE_CHECKING:
+    from pandas import Series
+    from ..field import RecordsSchemaField  # noqa
+
+
+logger = logging.getLogger(__name__)
+
+# Largest precision and scale Arrow can represent in a decimal type
+MAX_DECIMAL_PRECISION = 76
+MAX_DECIMAL128_PRECISION = 38
+
+
+def decimal_arrow_type(precision: int, scale: int) -> pa.DataType:
+    if precision > MAX_DECIMAL128_PRECISION:
+        return pa.decimal256(precision, scale)
+    return pa.decimal128(precision, scale)
+
+
+def integer_field_to_arrow_type(field: 'RecordsSchemaField') -> pa.DataType:
+    int_constraints =\
+        cast(Optional[RecordsSchemaFieldIntegerConstraints], field.constraints)
+    if int_constraints is None or int_constraints.min_ is None or int_constraints.max_ is None:
+        return pa.int64()
+    min_, max_ = int_constraints.min_, int_constraints.max_
+    if min_ >= INT64_MIN and max_ <= INT64_MAX:
+        return pa.int64()
+    precision = max(num_digits(abs(min_)), num_digits(abs(max_)))
+    if precision > MAX_DECIMAL_PRECISION:
+        logger.warning(f"Using float64 to represent very large integers in '{field.name}'")
+        return pa.float64()
+    return decimal_arrow_type(precision, 0)
+
+
+def decimal_field_to_arrow_type(field: 'RecordsSchemaField') -> pa.DataType:
+    decimal_constraints =\
+        cast(Optional[RecordsSchemaFieldDecimalConstraints], field.constraints)
+    if decimal_constraints is not None:
+        precision = decimal_constraints.fixed_precision
+        scale = decimal_constraints.fixed_scale
+        if precision is not None and scale is not None:
+            if precision <= MAX_DECIMAL_PRECISION:
+                return decimal_arrow_type(precision, scale)
+            logger.warning(f"Using float64 to represent NUMERIC({precision},{scale}) "
+                           f"in '{field.name}'")
+        elif (decimal_constraints.fp_total_bits is not None and
+              decimal_constraints.fp_total_bits <= 32):
+            return pa.float32()
+    return pa.float64()
+
+
+def field_to_arrow_type(field: 'RecordsSchemaField') -> pa.DataType:
+    if field.field_type == 'integer':
+        return integer_field_to_arrow_type(field)
+    elif field.field_type == 'decimal':
+        return decimal_field_to_arrow_type(field)
+    elif field.field_type == 'boolean':
+        return pa.bool_()
+    elif field.field_type == 'string':
+        return pa.string()
+    elif field.field_type == 'date':
+        return pa.date32()
+    elif field.field_type in ('time', 'timetz'):
+        return pa.time64('us')
+    elif field.field_type == 'datetime':
+        return pa.timestamp('us')
+    elif field.field_type == 'datetimetz':
+        return pa.timestamp('us', tz='UTC')
+    else:
+        raise NotImplementedError("Teach me how to handle records schema "
+                                  f"type {field.field_type}")
+
+
+def _parse_time(value: object) -> object:
+    if isinstance(value, str):
+        return datetime.time.fromisoformat(value)
+    return value
+
+
+def field_to_arrow_array(field: 'RecordsSchemaField', series: 'Series') -> pa.Array:
+    """Convert a series holding the data of the given field into an
+    Arrow array of the field's type."""
+    arrow_type = field_to_arrow_type(field)
+    if pa.types.is_time(arrow_type) and series.dtype == object:
+        # Times of day sometimes arrive as 'HH:MM:SS' strings (see
+        # RecordsSchemaField.cast_series_type()), which Arrow won't
+        # cast directly.
+        series = series.map(_parse_time)
+    array = pa.Array.from_pandas(series)
+    # Arrow refuses to convert floats straight into decimals when
+    # building an array with a given type, but will cast them.
+    #
+    # Pandas timestamps have nanosecond precision; as when writing
+    # them out as text, anything past microseconds is dropped.
+    return array.cast(arrow_type, safe=not pa.types.is_timestamp(arrow_type))
@@ -8,6 +8,7 @@ from .known_representation import RecordsSchemaKnownRepresentation
 from ..errors import UnsupportedSchemaError
 if TYPE_CHECKING:
     from pandas import DataFrame
+    import pyarrow
 
     from ....db import DBDriver  # noqa
     from typing_extensions import Literal
@@ -66,6 +67,11 @@ class RecordsSchema:
                                     table_name=table_name,
                                     driver=driver)
 
+    @staticmethod
+    def from_db_query(sql: str, driver: 'DBDriver') -> 'RecordsSchema':
+        from .sqlalchemy import schema_from_db_query
+        return schema_from_db_query(sql=sql, driver=driver)
+
     def to_data(self) -> 'RecordsSchemaDict':
         data: 'RecordsSchemaDict' = {
             'schema': 'bltypes/v1',
@@ -242,6 +248,20 @@ class RecordsSchema:
                                      processing_instructions=processing_instructions,
                                      include_index=include_index)
 
+    def to_arrow_schema(self) -> 'pyarrow.Schema':
+        """Arrow schema matching the types of this records schema, with
+        one field per records schema field."""
+        from .arrow import schema_to_arrow_schema
+        return schema_to_arrow_schema(self)
+
+    def dataframe_to_arrow_table(self, df: 'DataFrame', include_index: bool) -> 'pyarrow.Table':
+        """Convert a dataframe whose series (and index, if include_index
+        is True) are named to match this records schema into an Arrow
+        table with the types given by to_arrow_schema().
+        """
+        from .arrow import dataframe_to_arrow_table
+        return dataframe_to_arrow_table(self, df, include_index=include_index)
+
     def to_empty_dataframe(self) -> 'DataFrame':
         from pandas import DataFrame
         df_data: Dict[str, List[Any]] = {field.name: [] for field in self.fields}
@@ -0,0 +1,28 @@
+import pyarrow as pa
+from typing import TYPE_CHECKING
+from ..field.arrow import field_to_arrow_array
+if TYPE_CHECKING:
+    from pandas import DataFrame
+    from ..schema import RecordsSchema  # noqa
+
+
+def schema_to_arrow_schema(records_schema: 'RecordsSchema') -> pa.Schema:
+    return pa.schema([pa.field(field.name,
+                               field.to_arrow_type(),
+                               nullable=not (field.constraints is not None and
+                                             field.constraints.required))
+                      for field in records_schema.fields])
+
+
+def dataframe_to_arrow_table(records_schema: 'RecordsSchema',
+                             df: 'DataFrame',
+                             include_index: bool) -> pa.Table:
+    if include_index:
+        # RecordsMover supports only single indexes for the moment,
+        # which come first in the records schema.
+        #
+        # https://github.com/bluelabsio/records-mover/issues/92
+        df = df.reset_index()
+    arrays = [field_to_arrow_array(field, df[field.name])
+              for field in records_schema.fields]
+    return pa.Table.from_arrays(arrays, schema=schema_to_arrow_schema(records_schema))
@@ -2,7 +2,8 @@ import logging
 from sqlalchemy.schema import CreateTable, MetaData
 from sqlalchemy import Table
 from typing import Dict, TYPE_CHECKING
-from .known_representation import RecordsSchemaKnownRepresentation
+from .known_representation import (RecordsSchemaKnownRepresentation,
+                                   RecordsSchemaSqlKnownRepresentation)
 from ..field import RecordsSchemaField
 if TYPE_CHECKING:
     from ....db import DBDriver  # noqa
@@ -48,3 +49,25 @@ def schema_from_db_table(schema_name: str,
 
     return RecordsSchema(fields=fields,
                          known_representations=known_representations)
+
+
+def schema_from_db_query(sql: str,
+                         driver: 'DBDriver') -> 'RecordsSchema':
+    from ..schema import RecordsSchema  # noqa
+    logger.info('Pulling query result metadata...')
+    columns = driver.query_columns(sql)
+
+    # There's no table DDL to record for a query.
+    origin_representation = RecordsSchemaSqlKnownRepresentation(
+        type=f"sql/{driver.db_engine.dialect.name}", table_ddl=None)
+    known_representations: Dict[str, RecordsSchemaKnownRepresentation] = {
+        'origin': origin_representation
+    }
+
+    fields = [RecordsSchemaField.from_sqlalchemy_column(column=column,
+                                                        driver=driver,
+                                                        rep_type=origin_representation.type)
+              for column in columns]
+
+    return RecordsSchema(fields=fields,
+                         known_representations=known_representations)
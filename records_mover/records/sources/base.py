@@ -107,6 +107,11 @@ class SupportsMoveToRecordsDirectory(NegotiatesRecordsFormat, metaclass=ABCMeta)
         """
         pass
 
+    def can_move_to_partitions(self) -> bool:
+        """If true, move_to_records_directory() honors the partition_by
+        processing instruction."""
+        return False
+
     @abstractmethod
     def move_to_records_directory(self,
                                   records_directory: RecordsDirectory,
@@ -146,3 +151,12 @@ class SupportsToDataframesSource(RecordsSource, metaclass=ABCMeta):
             -> Iterator['DataframesRecordsSource']:
         """Convert current source to a DataframeSource and present it in a context manager"""
         pass
+
+
+class SupportsMoveComplete(RecordsSource, metaclass=ABCMeta):
+    @abstractmethod
+    def move_complete(self, result: MoveResult) -> MoveResult:
+        """Called by move() once records have been moved successfully
+        from this source.  Returns the result, possibly with details
+        added."""
+        pass
@@ -0,0 +1,138 @@
+from abc import ABCMeta, abstractmethod
+from typing import Optional
+from .base import (SupportsMoveToRecordsDirectory,
+                   SupportsToDataframesSource)
+from ...db import DBDriver
+from ...db.unloader import Unloader
+from ..records_directory import RecordsDirectory
+from ..processing_instructions import ProcessingInstructions
+from ..records_format import BaseRecordsFormat
+from ..unload_plan import RecordsUnloadPlan
+from ..results import MoveResult
+from ..metrics import stage, UNLOAD
+from sqlalchemy.engine import Engine
+from contextlib import contextmanager
+from ..schema import RecordsSchema
+from ...url.resolver import UrlResolver
+from records_mover.url.base import BaseDirectoryUrl
+import logging
+from typing import Iterator, List, TYPE_CHECKING
+if TYPE_CHECKING:
+    from pandas import DataFrame  # noqa
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseRecordsSource(SupportsMoveToRecordsDirectory,
+                            SupportsToDataframesSource,
+                            metaclass=ABCMeta):
+    """Records held in a database, unloaded in bulk where the
+    database's DBDriver provides an Unloader.
+
+    Subclasses say what is being unloaded (e.g., a table or the
+    results of a query) by implementing unload() and
+    pull_records_schema().
+    """
+    records_format: Optional[BaseRecordsFormat]
+
+    def __init__(self,
+                 driver: DBDriver,
+                 url_resolver: UrlResolver) -> None:
+        self.driver = driver
+        self.unloader = driver.unloader()
+        if self.unloader is not None:
+            self.records_format = self.unloader.best_records_format()
+        else:
+            self.records_format = None
+        self.url_resolver = url_resolver
+
+    def known_supported_records_formats(self) -> List[BaseRecordsFormat]:
+        unloader = self.driver.unloader()
+        if unloader is None:
+            return []
+        return unloader.known_supported_records_formats_for_unload()
+
+    def can_move_to_format(self,
+                           target_records_format: BaseRecordsFormat) -> bool:
+        unloader = self.driver.unloader()
+        if unloader is None:
+            return False
+        return unloader.can_unload_format(target_records_format)
+
+    def can_move_to_scheme(self, scheme: str) -> bool:
+        unloader = self.driver.unloader()
+        if unloader is None:
+            # bulk export is not provided by this database
+            logger.warning("No unloader configured for this database "
+                           f"type ({self.driver.db_engine.name})")
+            return False
+        can_unload = unloader.can_unload_to_scheme(scheme)
+        if not can_unload:
+            logger.warning(f"This database ({self.driver.db_engine.name}) is "
+                           f"not configured to export to {scheme}")
+        return can_unload
+
+    def can_move_to_partitions(self) -> bool:
+        unloader = self.driver.unloader()
+        if unloader is None:
+            return False
+        return unloader.can_unload_partitioned()
+
+    def with_cast_dataframe_types(self,
+                                  records_schema: RecordsSchema,
+                                  dfs: Iterator['DataFrame']) -> Iterator['DataFrame']:
+        for df in dfs:
+            yield records_schema.cast_dataframe_types(df)
+
+    @abstractmethod
+    def pull_records_schema(self) -> RecordsSchema:
+        pass
+
+    def unload_plan(self,
+                    records_format: BaseRecordsFormat,
+                    processing_instructions: ProcessingInstructions) -> RecordsUnloadPlan:
+        return RecordsUnloadPlan(records_format=records_format,
+                                 processing_instructions=processing_instructions)
+
+    @abstractmethod
+    def unload(self,
+               unloader: Unloader,
+               unload_plan: RecordsUnloadPlan,
+               directory: RecordsDirectory) -> Optional[int]:
+        """Unload into directory as specified by unload_plan, returning
+        the number of rows unloaded if known."""
+        pass
+
+    def move_to_records_directory(self,
+                                  records_directory: RecordsDirectory,
+                                  records_format: BaseRecordsFormat,
+                                  processing_instructions: ProcessingInstructions,
+                                  schema_name: Optional[str] = None,
+                                  table_name: Optional[str] = None,
+                                  engine: Optional[Engine] = None) -> MoveResult:
+        unload_plan = self.unload_plan(records_format, processing_instructions)
+        unloader = self.driver.unloader()
+        if unloader is None:
+            raise ValueError('This DBDriver does not support bulk unloading')
+        with stage(UNLOAD):
+            export_count = self.unload(unloader, unload_plan, records_directory)
+        records_schema = self.pull_records_schema()
+        records_directory.save_format(unload_plan.records_format)
+        records_schema = self.driver.tweak_records_schema_after_unload(records_schema,
+                                                                       unload_plan.records_format)
+        records_directory.save_schema(records_schema)
+        records_directory.finalize_manifest()
+
+        return MoveResult(move_count=export_count, output_urls=None)
+
+    @contextmanager
+    def temporary_unloadable_directory_loc(self) -> Iterator[BaseDirectoryUrl]:
+        """Yield a temporary directory that can be used to call move_to_records_directory() on."""
+        unloader = self.driver.unloader()
+        if unloader is None:
+            raise ValueError('This DBDriver does not support bulk unloading')
+        with unloader.temporary_unloadable_directory_loc() as temp_loc:
+            yield temp_loc
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}({self.driver.db_engine.name})"
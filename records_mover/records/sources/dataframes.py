@@ -3,6 +3,7 @@ from .base import SupportsToFileobjsSource
 from ..processing_instructions import ProcessingInstructions
 from ..pandas import pandas_to_csv_options
 from ..schema import RecordsSchema
+from ..metrics import stage, SCHEMA_INFERENCE
 from contextlib import contextmanager
 from ..records_format import BaseRecordsFormat, DelimitedRecordsFormat, ParquetRecordsFormat
 from .fileobjs import FileobjsSource  # noqa
@@ -101,19 +102,21 @@ class DataframesRecordsSource(SupportsToFileobjsSource):
 
     def schema_from_df(self, df: 'DataFrame',
                        processing_instructions: ProcessingInstructions) -> RecordsSchema:
-        records_schema = RecordsSchema.from_dataframe(df,
-                                                      self.processing_instructions,
-                                                      include_index=self.include_index)
-        if (processing_instructions.max_inference_rows is None or
-           processing_instructions.max_inference_rows > 0):
-            #
-            # If we were provided with a RecordsSchema, assume
-            # that the user wants us to use that verbatim (or they
-            # can call .refine_from_dataframe() themselves.
-            # Otherwise, gather information to create an efficient
-            # schema on the target of the move.
-            #
-            records_schema = records_schema.refine_from_dataframe(df, processing_instructions)
+        with stage(SCHEMA_INFERENCE):
+            records_schema = RecordsSchema.from_dataframe(df,
+                                                          self.processing_instructions,
+                                                          include_index=self.include_index)
+            if (processing_instructions.max_inference_rows is None or
+               processing_instructions.max_inference_rows > 0):
+                #
+                # If we were provided with a RecordsSchema, assume
+                # that the user wants us to use that verbatim (or they
+                # can call .refine_from_dataframe() themselves.
+                # Otherwise, gather information to create an efficient
+                # schema on the target of the move.
+                #
+                records_schema = records_schema.refine_from_dataframe(df,
+                                                                      processing_instructions)
 
         return records_schema
 
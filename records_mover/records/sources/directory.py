@@ -5,10 +5,13 @@ from ..records_directory import RecordsDirectory
 from ..records_format import DelimitedRecordsFormat
 from .. import PartialRecordsHints
 from contextlib import contextmanager
-from typing import Iterator, Optional
+import threading
+from typing import IO, Iterator, Optional
 from ..processing_instructions import ProcessingInstructions
 from ..records_format import BaseRecordsFormat
 from ...url.resolver import UrlResolver
+from ...url import BaseFileUrl
+from ...utils.concurrency import map_concurrently
 
 
 class RecordsDirectoryRecordsSource(SupportsRecordsDirectory,
@@ -38,9 +41,23 @@ class RecordsDirectoryRecordsSource(SupportsRecordsDirectory,
         locs = [self.url_resolver.file_url(url) for url in all_urls]
 
         with ExitStack() as stack:
+            # Opening a remote file can take a round trip or two, so
+            # open the shards of a large directory in parallel.  Each
+            # is registered for cleanup as soon as it's open, so that
+            # if another fails to open, those already open are closed
+            # on the way out; ExitStack isn't thread-safe, hence the
+            # lock.
+            stack_lock = threading.Lock()
+
+            def open_loc(loc: BaseFileUrl) -> IO[bytes]:
+                fileobj = loc.open()
+                with stack_lock:
+                    return stack.enter_context(fileobj)
+
+            fileobjs = map_concurrently(open_loc, locs)
             target_names_to_input_fileobjs = {
-                loc.filename(): stack.enter_context(loc.open())
-                for loc in locs
+                self.directory.path_of_url(loc.url): fileobj
+                for loc, fileobj in zip(locs, fileobjs)
             }
             records_schema = self.directory.load_schema_json_obj()
             with FileobjsSource.infer_if_needed(target_names_to_input_fileobjs,
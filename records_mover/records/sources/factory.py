@@ -13,7 +13,7 @@ from .directory import RecordsDirectoryRecordsSource
 from .. import PartialRecordsHints
 from .base import (SupportsRecordsDirectory, SupportsMoveToRecordsDirectory,  # noqa
                    SupportsToFileobjsSource, RecordsSource)
-from typing import Mapping, IO, Callable, Optional, Union, Iterable, TYPE_CHECKING
+from typing import Any, Mapping, IO, Callable, Optional, Union, Iterable, TYPE_CHECKING
 if TYPE_CHECKING:
     # see the 'gsheets' extras_require option in setup.py - needed for this!
     import google.auth.credentials  # noqa
@@ -25,6 +25,8 @@ if TYPE_CHECKING:
     from pandas import DataFrame  # noqa
     from .dataframes import DataframesRecordsSource  # noqa
     from .table import TableRecordsSource  # noqa
+    from .incremental_table import IncrementalTableRecordsSource  # noqa
+    from .query import QueryRecordsSource  # noqa
 
 
 class RecordsSources(object):
@@ -179,6 +181,64 @@ class RecordsSources(object):
             driver=self.db_driver(None, db_engine=db_engine,  # type: ignore[call-arg]
                                   db_conn=db_conn))
 
+    def incremental_table(self,
+                          db_engine: 'Engine',
+                          schema_name: str,
+                          table_name: str,
+                          watermark_column: str,
+                          last_watermark: Optional[Any] = None,
+                          watermark_store_path: Optional[str] = None,
+                          db_conn: Optional['Connection'] = None) ->\
+            'IncrementalTableRecordsSource':
+        """Represents the rows added to a SQLALchemy-accessible database table since the last move
+        as a source.  The highest watermark moved is returned as the high_watermark of the
+        MoveResult.
+
+        :param db_engine: SQLAlchemy database engine to pull data from.
+        :param schema_name: Schema name of a table to get data from.
+        :param table_name: Table name of a table to get data from.
+        :param watermark_column: Name of a column whose value increases as rows are added (e.g., an
+           auto-incrementing id or a creation timestamp).
+        :param last_watermark: Highest value of watermark_column already moved; rows up to and
+           including it are skipped.  If not specified, it is read from the watermark store.
+        :param watermark_store_path: Path of a local JSON file in which to remember the highest
+           watermark moved between runs.
+        :param db_conn: SQLAlchemy database connection to use to pull data from.
+        """
+        from .incremental_table import IncrementalTableRecordsSource  # noqa
+        from ..watermark import WatermarkStore  # noqa
+        watermark_store = None
+        if watermark_store_path is not None:
+            watermark_store = WatermarkStore(watermark_store_path)
+        return IncrementalTableRecordsSource(
+            schema_name=schema_name,
+            table_name=table_name,
+            url_resolver=self.url_resolver,
+            driver=self.db_driver(None, db_engine=db_engine,  # type: ignore[call-arg]
+                                  db_conn=db_conn),
+            watermark_column=watermark_column,
+            last_watermark=last_watermark,
+            watermark_store=watermark_store)
+
+    def query(self,
+              db_engine: 'Engine',
+              sql: str,
+              db_conn: Optional['Connection'] = None) -> 'QueryRecordsSource':
+        """Represents the results of a SQL SELECT statement as a source.  Where the database
+        supports bulk export, the statement is run as part of the export rather than staged in a
+        table first.
+
+        :param db_engine: SQLAlchemy database engine to pull data from.
+        :param sql: SELECT statement to run, in the SQL dialect of the database.
+        :param db_conn: SQLAlchemy database connection to use to pull data from.
+        """
+        from .query import QueryRecordsSource  # noqa
+        return QueryRecordsSource(
+            sql=sql,
+            url_resolver=self.url_resolver,
+            driver=self.db_driver(None, db_engine=db_engine,  # type: ignore[call-arg]
+                                  db_conn=db_conn))
+
     def directory_from_url(self,
                            url: str,
                            hints: PartialRecordsHints = {},
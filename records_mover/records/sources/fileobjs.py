@@ -4,6 +4,7 @@ from .base import (SupportsMoveToRecordsDirectory,
                    SupportsToDataframesSource)
 from ..records_directory import RecordsDirectory
 from ...utils.concat_files import ConcatFiles
+from ...utils.counting_fileobj import CountingFileobj
 import io
 from ..results import MoveResult
 from ..records_format import BaseRecordsFormat, DelimitedRecordsFormat
@@ -13,6 +14,7 @@ from ..processing_instructions import ProcessingInstructions
 from ...records.delimited import complain_on_unhandled_hints
 from ..delimited import python_encoding_from_hint
 from ..schema import RecordsSchema
+from ..metrics import stage, record_streamed, SNIFFING, SCHEMA_INFERENCE
 from records_mover.url.filesystem import FilesystemDirectoryUrl
 from records_mover.url.base import BaseDirectoryUrl
 import logging
@@ -59,9 +61,10 @@ class FileobjsSource(SupportsMoveToRecordsDirectory,
                 if initial_hints is None:
                     initial_hints = {}
                 logger.info(f"Determining records format with initial_hints={initial_hints}")
-                inferred_hints =\
-                    sniff_hints_from_fileobjs(list(target_names_to_input_fileobjs.values()),
-                                              initial_hints=initial_hints)
+                with stage(SNIFFING):
+                    inferred_hints =\
+                        sniff_hints_from_fileobjs(list(target_names_to_input_fileobjs.values()),
+                                                  initial_hints=initial_hints)
                 # 'csv' isn't the most precise variant or fastest
                 # variant to read, but given it's the default for Excel
                 # and Google Sheets, it's the most common on import.  So,
@@ -70,10 +73,11 @@ class FileobjsSource(SupportsMoveToRecordsDirectory,
                 records_format = DelimitedRecordsFormat(variant='csv',
                                                         hints=inferred_hints)
             if records_schema is None:
-                records_schema =\
-                    RecordsSchema.from_fileobjs(list(target_names_to_input_fileobjs.values()),
-                                                records_format=records_format,
-                                                processing_instructions=processing_instructions)
+                with stage(SCHEMA_INFERENCE):
+                    records_schema =\
+                        RecordsSchema.from_fileobjs(list(target_names_to_input_fileobjs.values()),
+                                                    records_format=records_format,
+                                                    processing_instructions=processing_instructions)
 
             yield FileobjsSource(target_names_to_input_fileobjs=target_names_to_input_fileobjs,
                                  records_format=records_format,
@@ -94,17 +98,19 @@ class FileobjsSource(SupportsMoveToRecordsDirectory,
                                   records_directory: RecordsDirectory,
                                   records_format: BaseRecordsFormat,
                                   processing_instructions: ProcessingInstructions) -> MoveResult:
-
-        def filename_from_url(url: str) -> str:
-            return url[url.rfind('/')+1:]
-
         if records_format != self.records_format:
             raise NotImplementedError(f"This directory can only accept {self.records_format}")
-        url_details = records_directory.save_fileobjs(self.target_names_to_input_fileobjs,
+        counting_fileobjs = {
+            target_name: CountingFileobj(fileobj)
+            for target_name, fileobj in self.target_names_to_input_fileobjs.items()
+        }
+        url_details = records_directory.save_fileobjs(counting_fileobjs,  # type: ignore
                                                       records_schema=self.records_schema,
                                                       records_format=self.records_format)
+        for counting_fileobj in counting_fileobjs.values():
+            record_streamed(counting_fileobj, self.records_format)
         output_urls = {
-            filename_from_url(url): url
+            records_directory.path_of_url(url): url
             for url in url_details
         }
         return MoveResult(output_urls=output_urls, move_count=None)
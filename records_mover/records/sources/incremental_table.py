@@ -0,0 +1,86 @@
+from .table import TableRecordsSource
+from .base import SupportsMoveComplete
+from ..results import MoveResult
+from ..watermark import WatermarkStore, watermark_sql
+from ...db import DBDriver
+from ...db.quoting import quote_column_name
+from ...url.resolver import UrlResolver
+from ...utils.lazyprop import lazyprop
+from sqlalchemy import Table, MetaData, column, func, select
+from sqlalchemy.sql.expression import ColumnClause
+import logging
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalTableRecordsSource(TableRecordsSource, SupportsMoveComplete):
+    """A database table as a source, moving only rows added since the
+    last move.
+
+    Rows are picked out by a watermark column whose values only ever
+    increase as rows are added (e.g., an auto-incrementing id or a
+    creation timestamp).  Rows with a value above last_watermark, up
+    to the highest value present when the move starts, are moved, and
+    that highest value is reported in MoveResult.high_watermark to be
+    passed in next time.  Alternatively, a WatermarkStore can be given
+    to remember it between runs.  Rows with a NULL watermark are never
+    moved.
+    """
+
+    def __init__(self,
+                 schema_name: str,
+                 table_name: str,
+                 driver: DBDriver,
+                 url_resolver: UrlResolver,
+                 watermark_column: str,
+                 last_watermark: Optional[Any] = None,
+                 watermark_store: Optional[WatermarkStore] = None) -> None:
+        super().__init__(schema_name=schema_name,
+                         table_name=table_name,
+                         driver=driver,
+                         url_resolver=url_resolver)
+        self.watermark_column = watermark_column
+        self.watermark_store = watermark_store
+        if last_watermark is None and watermark_store is not None:
+            last_watermark = watermark_store.get(self.watermark_key)
+        self.last_watermark = last_watermark
+
+    @property
+    def watermark_key(self) -> str:
+        return f"{self.schema_name}.{self.table_name}.{self.watermark_column}"
+
+    @lazyprop
+    def high_watermark(self) -> Optional[Any]:
+        """Highest watermark value present as of the start of the move, or
+        None if there are no rows past the last watermark."""
+        table = Table(self.table_name, MetaData(), schema=self.schema_name)
+        watermark: ColumnClause = column(self.watermark_column)
+        query = select(func.max(watermark)).select_from(table)
+        if self.last_watermark is not None:
+            query = query.where(watermark > self.last_watermark)
+        high_watermark = self.driver.db_conn.execute(query).scalar()
+        logger.info(f"Moving rows with {self.watermark_column} above {self.last_watermark} "
+                    f"up to {high_watermark}")
+        return high_watermark
+
+    def where(self) -> Optional[str]:
+        if self.high_watermark is None:
+            # Nothing new as of now; anything arriving during the move
+            # will be picked up next time.
+            return '1 = 0'
+        db_engine = self.driver.db_engine
+        quoted_column = quote_column_name(None, self.watermark_column, db_engine=db_engine)
+        where = f"{quoted_column} <= {watermark_sql(self.high_watermark, db_engine)}"
+        if self.last_watermark is not None:
+            where = (f"{quoted_column} > {watermark_sql(self.last_watermark, db_engine)} "
+                     f"AND {where}")
+        return where
+
+    def move_complete(self, result: MoveResult) -> MoveResult:
+        high_watermark = self.high_watermark
+        if high_watermark is None:
+            high_watermark = self.last_watermark
+        if self.watermark_store is not None and high_watermark is not None:
+            self.watermark_store.set(self.watermark_key, high_watermark)
+        return result._replace(high_watermark=high_watermark)
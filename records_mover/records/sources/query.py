@@ -0,0 +1,78 @@
+from typing import Optional
+from .database import DatabaseRecordsSource
+from ...db import DBDriver
+from ...db.quoting import literal_text
+from ...db.unloader import Unloader
+from ..records_directory import RecordsDirectory
+from ..processing_instructions import ProcessingInstructions
+from ..unload_plan import RecordsUnloadPlan
+from contextlib import contextmanager
+from ..schema import RecordsSchema
+from ...url.resolver import UrlResolver
+import logging
+from typing import Generator, Iterator, TYPE_CHECKING
+if TYPE_CHECKING:
+    from .dataframes import DataframesRecordsSource  # noqa
+    from pandas import DataFrame  # noqa
+
+logger = logging.getLogger(__name__)
+
+
+class QueryRecordsSource(DatabaseRecordsSource):
+    """The results of a SELECT statement as a source.
+
+    Where the database supports bulk export, the statement is run as
+    part of the export itself (e.g., inside a Redshift UNLOAD or a
+    Postgres COPY TO), so its projection and filters are applied by
+    the database and its results never need to be staged in a table.
+    """
+
+    def __init__(self,
+                 sql: str,
+                 driver: DBDriver,
+                 url_resolver: UrlResolver) -> None:
+        super().__init__(driver=driver, url_resolver=url_resolver)
+        # The statement gets wrapped in others, where a trailing
+        # semicolon would be a syntax error.
+        self.sql = sql.strip().rstrip(';').rstrip()
+
+    @contextmanager
+    def to_dataframes_source(self,
+                             processing_instructions: ProcessingInstructions) -> \
+            Iterator['DataframesRecordsSource']:
+        from .dataframes import DataframesRecordsSource  # noqa
+        import pandas
+
+        db_conn = self.driver.db_conn
+        records_schema = self.pull_records_schema()
+
+        num_columns = len(records_schema.fields)
+        if num_columns == 0:
+            raise ValueError("Query returns no columns")
+        entries_per_chunk = 2000000
+        chunksize = int(entries_per_chunk / num_columns)
+        logger.info(f"Exporting in chunks of up to {chunksize} rows by {num_columns} columns")
+
+        logger.info("Reading query results...")
+        chunks: Generator['DataFrame', None, None] = \
+            pandas.read_sql(literal_text(self.sql),
+                            con=db_conn,
+                            chunksize=chunksize)
+        try:
+            yield DataframesRecordsSource(dfs=self.with_cast_dataframe_types(records_schema,
+                                                                             chunks),
+                                          records_schema=records_schema,
+                                          processing_instructions=processing_instructions)
+        finally:
+            chunks.close()
+
+    def pull_records_schema(self) -> RecordsSchema:
+        return RecordsSchema.from_db_query(self.sql, driver=self.driver)
+
+    def unload(self,
+               unloader: Unloader,
+               unload_plan: RecordsUnloadPlan,
+               directory: RecordsDirectory) -> Optional[int]:
+        return unloader.unload_query(query=self.sql,
+                                     unload_plan=unload_plan,
+                                     directory=directory)
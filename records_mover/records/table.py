@@ -16,6 +16,7 @@ class TargetTableDetails(metaclass=ABCMeta):
     add_group_perms_for: Optional[Dict[str, List[str]]]
     existing_table_handling: ExistingTableHandling
     drop_and_recreate_on_load_error: bool
+    upsert_key: Optional[List[str]]
 
     # This should really be a like the above - but mypy gets confused
     # by a function being assigned as a field.
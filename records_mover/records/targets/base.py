@@ -68,6 +68,15 @@ class SupportsRecordsDirectory(NegotiatesRecordsFormat, metaclass=ABCMeta):
         to_fileobjs_source() for that situation."""
         pass
 
+    def processing_instructions_for_records_directory(self,
+                                                      processing_instructions:
+                                                      ProcessingInstructions) ->\
+            ProcessingInstructions:
+        """The processing instructions to fill in records_directory()
+        with.  Override this if the target needs the records laid out
+        in a particular way (e.g., partitioned by certain columns)."""
+        return processing_instructions
+
     def pre_load_hook(self) -> None:
         """This function will be called before data is loaded into the records
         directory.
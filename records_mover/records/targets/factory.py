@@ -76,7 +76,8 @@ class RecordsTargets(object):
               drop_and_recreate_on_load_error: bool = False,
               add_user_perms_for: Optional[Dict[str, List[str]]] = None,
               add_group_perms_for: Optional[Dict[str, List[str]]] = None,
-              db_conn: Optional['Connection'] = None) -> \
+              db_conn: Optional['Connection'] = None,
+              upsert_key: Optional[List[str]] = None) -> \
             'TableRecordsTarget':
         """Represents a SQLALchemy-accessible database table as as a target.
 
@@ -103,6 +104,9 @@ class RecordsTargets(object):
 
         :param db_conn: SQLAlchemy database connection to write data to.  If not specified, one
            will be created from the db_engine.
+
+        :param upsert_key: Names of the columns which identify a row, used to match incoming rows
+           with existing ones when existing_table_handling is UPSERT.
         """
         from .table import TableRecordsTarget  # noqa
         return TableRecordsTarget(schema_name=schema_name,
@@ -113,7 +117,8 @@ class RecordsTargets(object):
                                   drop_and_recreate_on_load_error=drop_and_recreate_on_load_error,
                                   add_user_perms_for=add_user_perms_for,
                                   add_group_perms_for=add_group_perms_for,
-                                  db_conn=db_conn)
+                                  db_conn=db_conn,
+                                  upsert_key=upsert_key)
 
     def google_sheet(self,
                      spreadsheet_id: str,
@@ -183,7 +188,8 @@ class RecordsTargets(object):
                  spectrum_base_url: Optional[str] = None,
                  spectrum_rdir_url: Optional[str] = None,
                  existing_table_handling: ExistingTableHandling =
-                 ExistingTableHandling.TRUNCATE_AND_OVERWRITE) ->\
+                 ExistingTableHandling.TRUNCATE_AND_OVERWRITE,
+                 partition_by: Optional[List[str]] = None) ->\
             'SpectrumRecordsTarget':
         """
         Represents a location in Amazon Redshift Spectrum as a target.
@@ -204,7 +210,16 @@ class RecordsTargets(object):
 
         :param existing_table_handling: When loading into a database table, controls how any
            existing table found will be handled.  This must be a
-           :class:`records_mover.records.ExistingTableHandling` object.
+           :class:`records_mover.records.ExistingTableHandling` object.  APPEND is supported
+           for partitioned tables: each move's files are written under a directory of their
+           own, then moved into their partitions under a name unique to that move, and any
+           new partitions are added.
+
+        :param partition_by: Names of columns to partition the table by.  Files are written
+           into Hive-style 'column=value/' directories (this requires a source which can write
+           partitions, e.g. a Redshift table or query--moves from other sources fail before
+           any existing files are deleted) and each partition is registered with the table,
+           so queries filtering on these columns only read the files they need.
         """
         from .spectrum import SpectrumRecordsTarget  # noqa
 
@@ -215,4 +230,5 @@ class RecordsTargets(object):
                                      url_resolver=self.url_resolver,
                                      spectrum_base_url=spectrum_base_url,
                                      spectrum_rdir_url=spectrum_rdir_url,
-                                     existing_table_handling=existing_table_handling)
+                                     existing_table_handling=existing_table_handling,
+                                     partition_by=partition_by)
@@ -6,6 +6,8 @@ from ..results import MoveResult
 from ..processing_instructions import ProcessingInstructions
 from ..records_format import BaseRecordsFormat, DelimitedRecordsFormat
 from ..delimited import complain_on_unhandled_hints
+from ..metrics import record_bytes_written
+from ...utils.counting_fileobj import CountingFileobj
 import logging
 from typing import IO, Union, TYPE_CHECKING
 if TYPE_CHECKING:
@@ -66,18 +68,20 @@ class FileobjTarget(SupportsMoveFromDataframes):
                 move_count += len(df.index)
             return move_count
 
+        counting_fileobj = CountingFileobj(self.fileobj)
         # Pandas' df.to_csv won't write a compressed file to a stream
         # (bleh).  Instead, if compression is set, write to a temp
         # file first.
         if self.records_format.hints['compression'] is None:
-            text_fileobj = io.TextIOWrapper(self.fileobj, encoding=encoding)
+            text_fileobj = io.TextIOWrapper(counting_fileobj, encoding=encoding)
             move_count = write_dfs(text_fileobj)
             text_fileobj.detach()
         else:
             with NamedTemporaryFile(prefix='mover_fileobj_target') as output_file: # noqa
                 move_count = write_dfs(output_file.name)
                 with open(output_file.name, "rb") as output_fileobj:
-                    copyfileobj(output_fileobj, self.fileobj)  # type: ignore
+                    copyfileobj(output_fileobj, counting_fileobj)
 
+        record_bytes_written(counting_fileobj.bytes_count)
         logger.info('CSV file written')
         return MoveResult(output_urls=None, move_count=move_count)
@@ -1,24 +1,35 @@
 # flake8: noqa
 
 from .base import SupportsRecordsDirectory
-from records_mover.db.quoting import quote_schema_and_table
+from records_mover.db.quoting import quote_schema_and_table, quote_column_name
 from ...db import DBDriver
 from ...url.resolver import UrlResolver
 from ...url import BaseDirectoryUrl
 from sqlalchemy.engine import Engine, Connection
 from ..records_directory import RecordsDirectory
 from ..records_format import ParquetRecordsFormat
+from ..processing_instructions import ProcessingInstructions
 from sqlalchemy.schema import CreateTable, MetaData, Table
 from ..existing_table_handling import ExistingTableHandling
-from typing import Optional, Callable, Union
+from typing import Optional, Callable, Union, List, Tuple, Dict
+from urllib.parse import unquote
+import copy
 import logging
+import secrets
 import sqlalchemy
 from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
 from sqlalchemy.schema import DropTable
 
 
 logger = logging.getLogger(__name__)
 
+# How Hive-style partitioning spells a NULL partition value
+HIVE_DEFAULT_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+
+# Redshift accepts up to this many partitions in one ALTER TABLE ADD PARTITION
+MAX_PARTITIONS_PER_ALTER = 100
+
 
 class SpectrumRecordsTarget(SupportsRecordsDirectory):
     def __init__(self,
@@ -32,7 +43,8 @@ class SpectrumRecordsTarget(SupportsRecordsDirectory):
                  spectrum_base_url: Optional[str],
                  spectrum_rdir_url: Optional[str],
                  existing_table_handling: ExistingTableHandling =
-                 ExistingTableHandling.TRUNCATE_AND_OVERWRITE) -> None:
+                 ExistingTableHandling.TRUNCATE_AND_OVERWRITE,
+                 partition_by: Optional[List[str]] = None) -> None:
         self.db = None
         self.db_engine = db_engine
         self.driver = db_driver(db=None,  # type: ignore[call-arg]
@@ -42,6 +54,10 @@ class SpectrumRecordsTarget(SupportsRecordsDirectory):
         self.table_name = table_name
         self.url_resolver = url_resolver
         self.existing_table_handling = existing_table_handling
+        self.partition_by = partition_by
+        # Identifies the current APPEND move, whose files are written
+        # into their own directory and then moved into place
+        self.append_id: Optional[str] = None
         self.output_loc = self.calculate_output_url(spectrum_base_url=spectrum_base_url,
                                                     spectrum_rdir_url=spectrum_rdir_url)
 
@@ -92,21 +108,88 @@ class SpectrumRecordsTarget(SupportsRecordsDirectory):
             logger.info(f"Deleting files in {self.output_loc}...")
             self.output_loc.purge_directory()
         elif self.existing_table_handling == ExistingTableHandling.APPEND:
-            raise NotImplementedError('APPEND mode not yet supported')
+            if not self.partition_by:
+                # The table reads the files listed in the records
+                # directory's manifest, which lists only the latest
+                # files written.
+                raise NotImplementedError('APPEND mode is only supported for partitioned tables')
+            logger.info(f"Appending partitions to {self.output_loc}...")
+            # Clear out anything left by an earlier failed attempt
+            self.records_directory().loc.purge_directory()
         else:
             raise NotImplementedError(f'Teach me how to handle {self.existing_table_handling}')
 
     def pre_load_hook(self) -> None:
         self.prep_bucket()
 
+    def processing_instructions_for_records_directory(self,
+                                                      processing_instructions:
+                                                      ProcessingInstructions) ->\
+            ProcessingInstructions:
+        if self.partition_by is None or processing_instructions.partition_by == self.partition_by:
+            return processing_instructions
+        if processing_instructions.partition_by is not None:
+            raise ValueError(f"Table is partitioned by {self.partition_by}, but was asked "
+                             f"to write partitions by {processing_instructions.partition_by}")
+        processing_instructions = copy.copy(processing_instructions)
+        processing_instructions.partition_by = self.partition_by
+        return processing_instructions
+
+    def append_loc(self) -> BaseDirectoryUrl:
+        if self.append_id is None:
+            self.append_id = secrets.token_hex(8)
+        return self.output_loc.directory_in_this_directory(f'_append_{self.append_id}')
+
     def records_directory(self) -> RecordsDirectory:
+        if self.existing_table_handling == ExistingTableHandling.APPEND:
+            # Writing straight into output_loc would collide with the
+            # files (manifest included) of earlier moves, so each
+            # append gets a directory of its own.  Redshift Spectrum
+            # ignores directories starting with '_'.
+            return RecordsDirectory(self.append_loc())
         return RecordsDirectory(self.output_loc)
 
-    def post_load_hook(self, num_rows_loaded: Optional[int]) -> None:
-        if self.existing_table_handling != ExistingTableHandling.DROP_AND_RECREATE:
-            return
+    def move_appended_files(self, directory: RecordsDirectory) -> None:
+        """Move the data files of an APPEND into their partitions below
+        output_loc, with names unique to this append."""
+        assert self.append_id is not None
+        for url in directory.manifest_entry_urls():
+            path = directory.path_of_url(url)
+            *partition_dirs, filename = path.split('/')
+            partition_loc = self.output_loc
+            for partition_dir in partition_dirs:
+                partition_loc = partition_loc.directory_in_this_directory(partition_dir)
+            loc = directory.loc.file_in_this_directory(path)
+            loc.rename_to(partition_loc.file_in_this_directory(f'{self.append_id}_{filename}'))
 
-        directory = self.records_directory()
+    def partitions(self, directory: RecordsDirectory) -> List[Tuple[List[str], str]]:
+        """Find the partitions written into the records directory, as
+        tuples of partition values (in partition_by order) and the URL
+        of the partition's directory."""
+        assert self.partition_by is not None
+        partition_by = [column.lower() for column in self.partition_by]
+        partitions: List[Tuple[List[str], str]] = []
+        for url in directory.manifest_entry_urls():
+            path = directory.path_of_url(url)
+            partition_dirs = path.split('/')[:-1]
+            columns = [partition_dir.split('=', 1)[0].lower() for partition_dir in partition_dirs]
+            if columns != partition_by:
+                raise NotImplementedError(f"Expected {url} to be written into partitions by "
+                                          f"{self.partition_by} - teach me how to partition "
+                                          "data from this source")
+            values = [unquote(partition_dir.split('=', 1)[1]) for partition_dir in partition_dirs]
+            if HIVE_DEFAULT_PARTITION in values:
+                logger.warning(f"Skipping {url}, as Redshift Spectrum does not support "
+                               "NULL partition values")
+                continue
+            partition_url = self.output_loc.url + '/'.join(partition_dirs) + '/'
+            if (values, partition_url) not in partitions:
+                partitions.append((values, partition_url))
+        return partitions
+
+    def create_table_sql(self,
+                         directory: RecordsDirectory,
+                         num_rows_loaded: Optional[int]) -> str:
         records_schema = directory.load_schema_json_obj()
         records_manifest = directory.get_manifest()
         assert records_manifest is not None  # just written before this was called
@@ -123,12 +206,34 @@ class SpectrumRecordsTarget(SupportsRecordsDirectory):
                 # https://github.com/bluelabsio/records-mover/issues/86
                 raise NotImplementedError("Teach me how to write a datetimetz to Redshift Spectrum "
                                           f"({column})")
+        partition_columns = []
+        if self.partition_by:
+            # Partition columns come from the partition directory
+            # names rather than from the data files, so they're
+            # declared separately from the rest of the columns.
+            columns_by_name = {column.name.lower(): column for column in columns}
+            for column_name in self.partition_by:
+                if column_name.lower() not in columns_by_name:
+                    raise ValueError(f"Partition column {column_name} not found in "
+                                     f"{[column.name for column in columns]}")
+                partition_column = columns_by_name[column_name.lower()]
+                partition_columns.append(partition_column)
+                columns.remove(partition_column)
 
         table = Table(self.table_name, meta,
                       prefixes=["EXTERNAL"],
                       *columns,
                       schema=self.schema_name)
         schema_sql = str(CreateTable(table, bind=self.driver.db_engine))
+        partitioned_by_clause = ''
+        if partition_columns:
+            dialect = self.driver.db_engine.dialect
+            partition_column_sql = ', '.join(
+                f"{quote_column_name(None, column.name, db_engine=self.driver.db_engine)} "
+                f"{column.type.compile(dialect=dialect)}"
+                for column in partition_columns
+            )
+            partitioned_by_clause = f"PARTITIONED BY ({partition_column_sql})\n"
         table_properties_clause = ''
         if num_rows_loaded is not None:
             table_properties_clause = f"\nTABLE PROPERTIES ('numRows'='{num_rows_loaded}')"
@@ -142,10 +247,73 @@ class SpectrumRecordsTarget(SupportsRecordsDirectory):
             # https://github.com/bluelabsio/records-mover/issues/87
             pass
         storage_clause = "STORED AS PARQUET\n"
-        location_clause = f"LOCATION '{self.output_loc.url}_manifest'\n"
-        schema_sql = schema_sql + storage_clause + location_clause + table_properties_clause
+        if partition_columns:
+            # Partitions are registered with their own locations
+            # below the table's.
+            location_clause = f"LOCATION '{self.output_loc.url}'\n"
+        else:
+            location_clause = f"LOCATION '{self.output_loc.url}_manifest'\n"
+        return (schema_sql + partitioned_by_clause + storage_clause + location_clause +
+                table_properties_clause)
+
+    def add_partitions_sql(self,
+                           partitions: List[Tuple[List[str], str]]) -> List[TextClause]:
+        assert self.partition_by is not None
+        db_engine = self.driver.db_engine
+        schema_and_table = quote_schema_and_table(None,
+                                                  self.schema_name,
+                                                  self.table_name,
+                                                  db_engine=db_engine)
+        quoted_columns = [quote_column_name(None, column_name, db_engine=db_engine)
+                          for column_name in self.partition_by]
+        statements = []
+        for start in range(0, len(partitions), MAX_PARTITIONS_PER_ALTER):
+            # Partition values and URLs (which may be URL-encoded, and
+            # so contain '%') are passed as bind variables to be
+            # quoted by the DBAPI driver.
+            batch = partitions[start:start + MAX_PARTITIONS_PER_ALTER]
+            params: Dict[str, str] = {}
+            partition_clauses = []
+            for i, (values, partition_url) in enumerate(batch):
+                partition_spec = []
+                for j, (quoted_column, value) in enumerate(zip(quoted_columns, values)):
+                    params[f'value_{i}_{j}'] = value
+                    partition_spec.append(f"{quoted_column}=:value_{i}_{j}")
+                params[f'location_{i}'] = partition_url
+                partition_clauses.append(f"PARTITION ({', '.join(partition_spec)}) "
+                                         f"LOCATION :location_{i}")
+            statements.append(text(f"ALTER TABLE {schema_and_table} ADD IF NOT EXISTS\n" +
+                                   ',\n'.join(partition_clauses)).bindparams(**params))
+        return statements
+
+    def post_load_hook(self, num_rows_loaded: Optional[int]) -> None:
+        directory = self.records_directory()
+        statements: List[Union[str, TextClause]] = []
+        if self.existing_table_handling == ExistingTableHandling.DROP_AND_RECREATE:
+            statements.append(self.create_table_sql(directory, num_rows_loaded))
+        elif (num_rows_loaded is not None and
+              self.existing_table_handling != ExistingTableHandling.APPEND):
+            # The table's contents were replaced, so keep the
+            # statistics used by the query optimizer up to date.
+            schema_and_table = quote_schema_and_table(None,
+                                                      self.schema_name,
+                                                      self.table_name,
+                                                      db_engine=self.driver.db_engine)
+            statements.append(f"ALTER TABLE {schema_and_table} "
+                              f"SET TABLE PROPERTIES ('numRows'='{num_rows_loaded}')")
+        appending = self.existing_table_handling == ExistingTableHandling.APPEND
+        if self.partition_by:
+            partitions = self.partitions(directory)
+            if appending:
+                self.move_appended_files(directory)
+            statements.extend(self.add_partitions_sql(partitions))
+        if statements:
+            self.execute_statements(statements)
+        if appending:
+            directory.loc.purge_directory()
+            self.append_id = None
 
-        logger.info(schema_sql)
+    def execute_statements(self, statements: List[Union[str, TextClause]]) -> None:
         with self.driver.db_engine.connect() as cursor:
             # without autocommit, we get "CREATE EXTERNAL TABLE cannot
             # run inside a transaction block"
@@ -156,4 +324,6 @@ class SpectrumRecordsTarget(SupportsRecordsDirectory):
             # https://github.com/hellonarrativ/spectrify/pull/13/files#diff-d604d159eb266aacefeebac327bacd26R57
 
             cursor.execution_options(isolation_level='AUTOCOMMIT')
-            cursor.execute(schema_sql)
+            for statement in statements:
+                logger.info(str(statement))
+                cursor.execute(statement)
@@ -5,13 +5,15 @@ from records_mover.pandas import purge_unnamed_unused_columns
 from records_mover.records.prep_and_load import prep_and_load
 from records_mover.records.schema import RecordsSchema
 from records_mover.records.processing_instructions import ProcessingInstructions
+from records_mover.records.load_plan import RecordsLoadPlan
 from records_mover.records.results import MoveResult
 from records_mover.records.targets.table.base import BaseTableMoveAlgorithm
 from records_mover.records.sources.dataframes import DataframesRecordsSource
 import logging
 import sqlalchemy
-from typing import TYPE_CHECKING
+from typing import Iterator, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
+    from pandas import DataFrame
     from .target import TableRecordsTarget  # Dodge circular dependency
 
 logger = logging.getLogger(__name__)
@@ -30,6 +32,10 @@ class DoMoveFromDataframesSource(BaseTableMoveAlgorithm):
         super().__init__(prep, target_table_details, processing_instructions)
 
     def move(self) -> MoveResult:
+        if self.table_target.can_move_from_dataframes_source_directly():
+            # No need to serialize the dataframes into a records
+            # format we then parse again on the way into the database
+            return self.move_from_dataframes_source_via_loader()
         target_supports_formats = len(self.table_target.known_supported_records_formats()) != 0
         if (target_supports_formats and self.table_target.can_move_from_fileobjs_source()):
             return self.move_from_dataframes_source_via_fileobjs()
@@ -69,29 +75,65 @@ class DoMoveFromDataframesSource(BaseTableMoveAlgorithm):
     def records_schema(self) -> RecordsSchema:
         return self.dfs_source.initial_records_schema(self.processing_instructions)
 
-    def load(self, driver: DBDriver) -> int:
+    def named_dfs(self) -> Iterator['DataFrame']:
+        for df in self.dfs_source.dfs:
+            df = purge_unnamed_unused_columns(df)
+            yield self.records_schema.\
+                assign_dataframe_names(include_index=self.dfs_source.include_index, df=df)
+
+    def move_from_dataframes_source_via_loader(self) -> MoveResult:
+        with self.tbl.db_engine.connect() as db_conn:
+            driver = self.tbl.db_driver(db=None, db_conn=db_conn)
+            loader = driver.loader_from_dataframes()
+            # This is only reached in move() when
+            # can_move_from_dataframes_source_directly() is true,
+            # which is only true when .loader_from_dataframes() is not None.
+            assert loader is not None
+            records_format = loader.dataframes_records_format()
+            records_schema = driver.tweak_records_schema_for_load(self.records_schema,
+                                                                  records_format)
+            schema_sql = records_schema.to_schema_sql(driver,
+                                                      self.tbl.schema_name,
+                                                      self.tbl.table_name)
+            plan = RecordsLoadPlan(records_format=records_format,
+                                   processing_instructions=self.processing_instructions)
+
+            def load(driver: DBDriver, table_name: str) -> Optional[int]:
+                return loader.load_from_dataframes(schema=self.tbl.schema_name,
+                                                   table=table_name,
+                                                   load_plan=plan,
+                                                   records_schema=records_schema,
+                                                   dfs=self.named_dfs(),
+                                                   include_index=self.dfs_source.include_index)
+
+            out = prep_and_load(self.tbl, self.prep, schema_sql, load,
+                                loader.load_failure_exception(), driver=driver)
+        logger.info(f"Loaded {out.move_count} rows into "
+                    f"{self.tbl.schema_name}.{self.tbl.table_name} directly from dataframes")
+        return out
+
+    def load(self, driver: DBDriver, table_name: str) -> int:
         rows_loaded = 0
-        with self.tbl.db_engine.connect() as conn:
-            with conn.begin():
-                for df in self.dfs_source.dfs:
-                    df = purge_unnamed_unused_columns(df)
-                    df = self.records_schema.\
-                        assign_dataframe_names(include_index=self.dfs_source.include_index, df=df)
-                    df.to_sql(name=self.tbl.table_name,
-                              con=conn,
-                              schema=self.tbl.schema_name,
-                              index=self.dfs_source.include_index,
-                              if_exists='append')
-                    rows_loaded += len(df.index)
+        # prep_and_load() has already begun a transaction on this
+        # connection
+        conn = driver.db_conn
+        for df in self.named_dfs():
+            df.to_sql(name=table_name,
+                      con=conn,
+                      schema=self.tbl.schema_name,
+                      index=self.dfs_source.include_index,
+                      if_exists='append')
+            rows_loaded += len(df.index)
         return rows_loaded
 
     def move_from_dataframes_source_via_insert(self) -> MoveResult:
-        driver = self.tbl.db_driver(db=None, db_engine=self.tbl.db_engine)
-        schema_sql = self.records_schema.to_schema_sql(driver,
-                                                       self.tbl.schema_name,
-                                                       self.tbl.table_name)
-        out = prep_and_load(self.tbl, self.prep, schema_sql, self.load,
-                            sqlalchemy.exc.InternalError)
+        with self.tbl.db_engine.connect() as db_conn:
+            driver = self.tbl.db_driver(db=None, db_conn=db_conn)
+            schema_sql = self.records_schema.to_schema_sql(driver,
+                                                           self.tbl.schema_name,
+                                                           self.tbl.table_name)
+            out = prep_and_load(self.tbl, self.prep, schema_sql, self.load,
+                                sqlalchemy.exc.InternalError, driver=driver)
         logger.info(f"Loaded {out.move_count} rows into "
                     f"{self.tbl.schema_name}.{self.tbl.table_name} via INSERT statement")
         return out
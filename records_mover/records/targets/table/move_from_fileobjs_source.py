@@ -7,6 +7,8 @@ from records_mover.records.load_plan import RecordsLoadPlan
 from records_mover.records.sources.fileobjs import FileobjsSource
 from records_mover.records.targets.table.base import BaseTableMoveAlgorithm
 from records_mover.utils.concat_files import ConcatFiles
+from records_mover.utils.counting_fileobj import CountingFileobj
+from records_mover.records.metrics import record_streamed
 from typing import Optional, IO
 import logging
 
@@ -24,22 +26,25 @@ class DoMoveFromFileobjsSource(BaseTableMoveAlgorithm):
         self.fileobjs_source = fileobjs_source
         all_fileobjs = list(self.fileobjs_source.target_names_to_input_fileobjs.values())
         if len(all_fileobjs) != 1:
-            self.fileobj = ConcatFiles(all_fileobjs)  # type: ignore
+            fileobj: IO[bytes] = ConcatFiles(all_fileobjs)  # type: ignore
         else:
-            self.fileobj = all_fileobjs[0]
+            fileobj = all_fileobjs[0]
+        self.num_files = len(all_fileobjs)
+        self.counting_fileobj = CountingFileobj(fileobj)
+        self.fileobj = self.counting_fileobj  # type: ignore
         self.records_format = self.fileobjs_source.records_format
         self.plan = RecordsLoadPlan(records_format=self.records_format,
                                     processing_instructions=processing_instructions)
         super().__init__(prep, target_table_details, processing_instructions)
 
-    def load(self, driver: DBDriver) -> Optional[int]:
+    def load(self, driver: DBDriver, table_name: str) -> Optional[int]:
         loader_from_fileobj = driver.loader_from_fileobj()
         # This is only reached in move() when
         # records_target.can_move_from_fileobjs_source() is true,
         # which is only true when .load_from_fileobj() is not None.
         assert loader_from_fileobj is not None
         return loader_from_fileobj.load_from_fileobj(schema=self.tbl.schema_name,
-                                                     table=self.tbl.table_name,
+                                                     table=table_name,
                                                      load_plan=self.plan,
                                                      fileobj=self.fileobj)
 
@@ -54,8 +59,8 @@ class DoMoveFromFileobjsSource(BaseTableMoveAlgorithm):
 
     def move(self) -> MoveResult:
         with self.tbl.db_engine.connect() as db_conn:
+            driver = self.tbl.db_driver(db=None, db_conn=db_conn)
             with db_conn.begin():
-                driver = self.tbl.db_driver(None, db_conn=db_conn)
                 schema_obj = self.fileobjs_source.records_schema
                 schema_sql = self.schema_sql_for_load(schema_obj, self.records_format, driver)
                 loader_from_fileobj = driver.loader_from_fileobj()
@@ -65,6 +70,9 @@ class DoMoveFromFileobjsSource(BaseTableMoveAlgorithm):
                 assert loader_from_fileobj is not None
                 load_exception = loader_from_fileobj.load_failure_exception()
 
-        return prep_and_load(self.tbl, self.prep, schema_sql, self.load,
-                             load_exception,
-                             self.reset_before_reload)
+            out = prep_and_load(self.tbl, self.prep, schema_sql, self.load,
+                                load_exception,
+                                self.reset_before_reload,
+                                driver=driver)
+        record_streamed(self.counting_fileobj, self.records_format, num_files=self.num_files)
+        return out
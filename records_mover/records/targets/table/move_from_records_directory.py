@@ -48,22 +48,22 @@ class DoMoveFromRecordsDirectory(BaseTableMoveAlgorithm):
         return RecordsLoadPlan(records_format=records_format,
                                processing_instructions=self.processing_instructions)
 
-    def load(self, driver: DBDriver) -> Optional[int]:
+    def load(self, driver: DBDriver, table_name: str) -> Optional[int]:
         plan = self.load_plan
         loader = driver.loader()
         # If we've gotten here, .can_move_from_format() has
         # returned True in the move() method, and that can only happen
         # if we have a valid loader.
         assert loader is not None
-        return loader.load(schema=self.tbl.schema_name, table=self.tbl.table_name,
+        return loader.load(schema=self.tbl.schema_name, table=table_name,
                            load_plan=plan, directory=self.directory)
 
     def move(self) -> MoveResult:
         logger.info("Connecting to database...")
 
         with self.tbl.db_engine.connect() as db_conn:
+            driver = self.tbl.db_driver(db=None, db_conn=db_conn)
             with db_conn.begin():
-                driver = self.tbl.db_driver(None, db_conn=db_conn)
                 loader = driver.loader()
                 # If we've gotten here, .can_move_from_format() has
                 # returned True in the move() method, and that can only happen
@@ -71,5 +71,5 @@ class DoMoveFromRecordsDirectory(BaseTableMoveAlgorithm):
                 assert loader is not None
                 load_exception_type = loader.load_failure_exception()
                 schema_sql = self.load_schema_sql(driver)
-        return prep_and_load(self.tbl, self.prep, schema_sql, self.load,
-                             load_exception_type)
+            return prep_and_load(self.tbl, self.prep, schema_sql, self.load,
+                                 load_exception_type, driver=driver)
@@ -21,6 +21,7 @@ from records_mover.records.targets.table.move_from_fileobjs_source import DoMove
 from records_mover.records.targets.table.move_from_temp_loc_after_filling_it import (
     DoMoveFromTempLocAfterFillingIt
 )
+from records_mover.utils.lazyprop import lazyprop
 import logging
 from typing import Callable, Union, Optional, Dict, List, TYPE_CHECKING
 if TYPE_CHECKING:
@@ -47,7 +48,10 @@ class TableRecordsTarget(SupportsMoveFromRecordsDirectory,
                  existing_table_handling: ExistingTableHandling =
                  ExistingTableHandling.DELETE_AND_OVERWRITE,
                  drop_and_recreate_on_load_error: bool = False,
-                 db_conn: Optional[Connection] = None) -> None:
+                 db_conn: Optional[Connection] = None,
+                 upsert_key: Optional[List[str]] = None) -> None:
+        if existing_table_handling == ExistingTableHandling.UPSERT and not upsert_key:
+            raise ValueError("Please specify upsert_key to use ExistingTableHandling.UPSERT")
         self.schema_name = schema_name
         self.table_name = table_name
         self.db_driver = db_driver  # type: ignore
@@ -57,6 +61,7 @@ class TableRecordsTarget(SupportsMoveFromRecordsDirectory,
         self.add_group_perms_for = add_group_perms_for
         self.existing_table_handling = existing_table_handling
         self.drop_and_recreate_on_load_error = drop_and_recreate_on_load_error
+        self.upsert_key = upsert_key
         self.prep = TablePrep(self)
         # advertise what format we prefer to be given for mover paths
         # that don't yet support full records negotiation.
@@ -64,6 +69,15 @@ class TableRecordsTarget(SupportsMoveFromRecordsDirectory,
         # https://github.com/bluelabsio/records-mover/issues/88
         self.records_format = next(iter(self.known_supported_records_formats()), None)
 
+    @lazyprop
+    def driver(self) -> DBDriver:
+        """DBDriver used to answer questions about the target database's
+        capabilities.  Built once and reused, as constructing a driver
+        (and its loaders) for every capability check adds up."""
+        return self.db_driver(None,
+                              db_engine=self.db_engine,
+                              db_conn=self.db_conn)
+
     def move_from_records_directory(self,
                                     directory: RecordsDirectory,
                                     processing_instructions: ProcessingInstructions,
@@ -84,16 +98,17 @@ class TableRecordsTarget(SupportsMoveFromRecordsDirectory,
                                         processing_instructions).move()
 
     def can_move_from_fileobjs_source(self) -> bool:
-        driver = self.db_driver(None,
-                                db_engine=self.db_engine,
-                                db_conn=self.db_conn)
+        driver = self.driver
         loader = driver.loader_from_fileobj()
         return loader is not None
 
+    def can_move_from_dataframes_source_directly(self) -> bool:
+        driver = self.driver
+        loader = driver.loader_from_dataframes()
+        return loader is not None
+
     def can_move_directly_from_scheme(self, scheme: str) -> bool:
-        driver = self.db_driver(None,
-                                db_engine=self.db_engine,
-                                db_conn=self.db_conn)
+        driver = self.driver
         loader = driver.loader()
         if loader is None:
             # can't bulk load at all, so can't load direct!
@@ -102,9 +117,7 @@ class TableRecordsTarget(SupportsMoveFromRecordsDirectory,
         return loader.best_scheme_to_load_from() == scheme
 
     def known_supported_records_formats(self) -> List[BaseRecordsFormat]:
-        driver = self.db_driver(None,
-                                db_engine=self.db_engine,
-                                db_conn=self.db_conn)
+        driver = self.driver
         loader = driver.loader()
         if loader is None:
             logger.warning(f"No loader configured for this database type ({self.db_engine.name})")
@@ -115,9 +128,7 @@ class TableRecordsTarget(SupportsMoveFromRecordsDirectory,
                              source_records_format: BaseRecordsFormat) -> bool:
         """Return true if writing the specified format satisfies our format
         needs"""
-        driver = self.db_driver(None,
-                                db_engine=self.db_engine,
-                                db_conn=self.db_conn)
+        driver = self.driver
         loader = driver.loader()
         if loader is None:
             logger.warning(f"No loader configured for this database type ({self.db_engine.name})")
@@ -125,9 +136,7 @@ class TableRecordsTarget(SupportsMoveFromRecordsDirectory,
         return loader.can_load_this_format(source_records_format)
 
     def can_move_from_temp_loc_after_filling_it(self) -> bool:
-        driver = self.db_driver(None,
-                                db_engine=self.db_engine,
-                                db_conn=self.db_conn)
+        driver = self.driver
         loader = driver.loader()
         if loader is None:
             logger.warning(f"No loader configured for this database type ({self.db_engine.name})")
@@ -144,9 +153,7 @@ class TableRecordsTarget(SupportsMoveFromRecordsDirectory,
         return has_scratch_location
 
     def temporary_loadable_directory_scheme(self) -> str:
-        driver = self.db_driver(None,
-                                db_engine=self.db_engine,
-                                db_conn=self.db_conn)
+        driver = self.driver
         loader = driver.loader()
         if loader is None:
             raise TypeError("Please check can_move_from_temp_loc_after_filling_it() "
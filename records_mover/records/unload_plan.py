@@ -1,11 +1,16 @@
 from .processing_instructions import ProcessingInstructions
 from .records_format import BaseRecordsFormat, DelimitedRecordsFormat
+from typing import Optional
 
 
 class RecordsUnloadPlan:
     def __init__(self,
                  records_format: BaseRecordsFormat = DelimitedRecordsFormat(),
-                 processing_instructions: ProcessingInstructions = ProcessingInstructions()) -> \
+                 processing_instructions: ProcessingInstructions = ProcessingInstructions(),
+                 where: Optional[str] = None) -> \
             None:
         self.records_format = records_format
         self.processing_instructions = processing_instructions
+        # SQL boolean expression (already quoted for the database in
+        # question) restricting which rows of the table are unloaded
+        self.where = where
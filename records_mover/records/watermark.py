@@ -0,0 +1,96 @@
+"""Tracking how far incremental moves have gotten through a table.
+
+A watermark is the highest value of some ever-increasing column
+(e.g., an auto-incrementing id, or a last-modified timestamp) which
+has been moved so far; the next move only needs rows above it.
+"""
+import datetime
+import json
+import os
+import tempfile
+from decimal import Decimal
+from typing import Any, Dict, Optional, TYPE_CHECKING
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine  # noqa
+
+
+def watermark_to_data(value: Any) -> Any:
+    """Represent a watermark value using only JSON types."""
+    if isinstance(value, datetime.datetime):
+        return {'datetime': value.isoformat()}
+    elif isinstance(value, datetime.date):
+        return {'date': value.isoformat()}
+    elif isinstance(value, Decimal):
+        return {'decimal': str(value)}
+    elif isinstance(value, (int, float, str)):
+        return value
+    raise TypeError(f"Can't use {type(value).__name__} values as a watermark")
+
+
+def watermark_from_data(data: Any) -> Any:
+    """Reverse watermark_to_data()."""
+    if isinstance(data, dict):
+        if 'datetime' in data:
+            return datetime.datetime.fromisoformat(data['datetime'])
+        elif 'date' in data:
+            return datetime.date.fromisoformat(data['date'])
+        elif 'decimal' in data:
+            return Decimal(data['decimal'])
+        raise ValueError(f"Could not understand watermark {data}")
+    return data
+
+
+def watermark_sql(value: Any, db_engine: 'Engine') -> str:
+    """Render a watermark value as a SQL literal.
+
+    Dates and times are written as ISO 8601 strings, which the
+    supported databases convert implicitly when compared with a
+    date or timestamp column.
+    """
+    from ..db.quoting import quote_value
+
+    if isinstance(value, bool):
+        raise TypeError("Can't use bool values as a watermark")
+    if isinstance(value, (int, float, Decimal)):
+        return repr(value) if isinstance(value, float) else str(value)
+    if isinstance(value, datetime.datetime):
+        return quote_value(None, value.isoformat(sep=' '), db_engine=db_engine)
+    if isinstance(value, datetime.date):
+        return quote_value(None, value.isoformat(), db_engine=db_engine)
+    if isinstance(value, str):
+        return quote_value(None, value, db_engine=db_engine)
+    raise TypeError(f"Can't use {type(value).__name__} values as a watermark")
+
+
+class WatermarkStore:
+    """Remembers watermarks between runs in a small local JSON file,
+    keyed by a name for each incremental source."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, 'r') as f:
+                data: Dict[str, Any] = json.load(f)
+                return data
+        except FileNotFoundError:
+            return {}
+
+    def get(self, key: str) -> Optional[Any]:
+        return watermark_from_data(self._load().get(key))
+
+    def set(self, key: str, value: Any) -> None:
+        data = self._load()
+        data[key] = watermark_to_data(value)
+        # Replace the file in one step so that a crash can't leave
+        # it half-written.
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.watermarks')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
@@ -1,9 +1,8 @@
 from config_resolver import get_config
-from db_facts.db_facts_types import DBFacts
 from .creds.base_creds import BaseCreds
 from .records.records import Records
 from .url.base import BaseFileUrl, BaseDirectoryUrl
-from typing import Union, Optional, IO
+from typing import Union, Optional, IO, Dict
 from .url.resolver import UrlResolver
 from records_mover.creds.creds_via_lastpass import CredsViaLastPass
 from records_mover.creds.creds_via_airflow import CredsViaAirflow
@@ -15,7 +14,9 @@ import sys
 import logging
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
+    from db_facts.db_facts_types import DBFacts  # noqa
     from .db import DBDriver  # noqa
+    from .db.engine_cache import EngineCache  # noqa
     from sqlalchemy.engine import Engine, Connection  # noqa
     import boto3  # noqa
     import google.cloud.storage  # noqa
@@ -60,7 +61,7 @@ def _infer_creds(session_type: str,
                  default_db_creds_name: Optional[str],
                  default_aws_creds_name: Optional[str],
                  default_gcp_creds_name: Optional[str],
-                 default_db_facts: Union[PleaseInfer, DBFacts],
+                 default_db_facts: Union[PleaseInfer, 'DBFacts'],
                  default_boto3_session: Union[PleaseInfer,
                                               'boto3.session.Session',
                                               None],
@@ -138,7 +139,7 @@ class Session():
                  session_type: Union[str, PleaseInfer] = PleaseInfer.token,
                  scratch_s3_url: Union[None, str, PleaseInfer] = PleaseInfer.token,
                  creds: Union[BaseCreds, PleaseInfer] = PleaseInfer.token,
-                 default_db_facts: Union[PleaseInfer, DBFacts] = PleaseInfer.token,
+                 default_db_facts: Union[PleaseInfer, 'DBFacts'] = PleaseInfer.token,
                  default_boto3_session: Union[PleaseInfer,
                                               'boto3.session.Session',
                                               None] = PleaseInfer.token,
@@ -148,7 +149,12 @@ class Session():
                  default_gcs_client: Union[PleaseInfer,
                                            'google.cloud.storage.Client',
                                            None] = PleaseInfer.token,
-                 scratch_gcs_url: Union[None, str, PleaseInfer] = PleaseInfer.token) -> None:
+                 scratch_gcs_url: Union[None, str, PleaseInfer] = PleaseInfer.token,
+                 db_pool_size: Optional[int] = None,
+                 db_pool_pre_ping: bool = True,
+                 db_pool_recycle: Optional[int] = None,
+                 fast_db_reflection: bool = False,
+                 redshift_data_api: bool = False) -> None:
         """This is an object which ties together configuration on how to do
         key things in order to move records.
 
@@ -200,6 +206,20 @@ class Session():
         :param scratch_gcs_url: A gs:// URL used as a base directory where temporary
            files/directories can be created.  This can be helpful for large imports into
            Google BigQuery.
+        :param db_pool_size: Number of connections to keep open in the connection pool of each
+           database engine handed out by this session.  If not specified, SQLAlchemy's default for
+           the database type is used.
+        :param db_pool_pre_ping: Whether to test pooled database connections for liveness before
+           reusing them.  Engines are cached for the life of the session, so this defaults to True.
+        :param db_pool_recycle: Number of seconds after which a pooled database connection is
+           replaced with a new one.  If not specified, connections are not recycled.
+        :param fast_db_reflection: If True, look up the columns of existing tables using a single
+           catalog query where the database type supports it, rather than SQLAlchemy's full
+           reflection.  Column defaults and constraints are not pulled in this mode.
+        :param redshift_data_api: If True, submit Amazon Redshift UNLOADs through the Redshift
+           Data API using the default AWS credentials, rather than running them on a database
+           connection.  Long exports then don't depend on a connection staying open for their
+           duration, and report an accurate row count afterwards.
         """
         if session_type is PleaseInfer.token:
             session_type = _infer_session_type()
@@ -223,6 +243,25 @@ class Session():
                                  scratch_gcs_url=scratch_gcs_url)
 
         self.creds = creds
+        self._db_pool_size = db_pool_size
+        self._db_pool_pre_ping = db_pool_pre_ping
+        self._db_pool_recycle = db_pool_recycle
+        self._engine_cache: Optional['EngineCache'] = None
+        self._fast_db_reflection = fast_db_reflection
+        self._redshift_data_api = redshift_data_api
+
+    @property
+    def engine_cache(self) -> 'EngineCache':
+        """Cache of SQLAlchemy Engine objects (and their connection pools)
+        handed out by :meth:`get_db_engine` and
+        :meth:`get_default_db_engine`, keyed by database credentials."""
+        if self._engine_cache is None:
+            from .db.engine_cache import EngineCache
+
+            self._engine_cache = EngineCache(pool_size=self._db_pool_size,
+                                             pool_pre_ping=self._db_pool_pre_ping,
+                                             pool_recycle=self._db_pool_recycle)
+        return self._engine_cache
 
     @property
     def url_resolver(self) -> UrlResolver:
@@ -236,13 +275,16 @@ class Session():
         depends on the session_type determined in the constructor, but
         can be overridden using the default_db_creds_name parameter.
 
+        Engines are cached per set of database credentials, so
+        repeated calls return the same Engine and reuse its connection
+        pool.
+
         :return: SQLALchemy Engine object
 
         """
-        from .db.connect import engine_from_db_facts
         db_facts = self.creds.default_db_facts()
 
-        return engine_from_db_facts(db_facts)
+        return self.engine_cache.engine_from_db_facts(db_facts)
 
     def get_db_engine(self,
                       db_creds_name: str,
@@ -251,15 +293,17 @@ class Session():
         The details of how that credential is looked up depends on the
         session_type determined in the constructor.
 
+        Engines are cached per set of database credentials, so
+        repeated calls return the same Engine and reuse its connection
+        pool.
+
         :param db_creds_name: Credential name to look up using the configured credentials provider.
         :return: SQLALchemy Engine object
         """
-        from .db.connect import engine_from_db_facts
-
         if creds_provider is None:
             creds_provider = self.creds
         db_facts = creds_provider.db_facts(db_creds_name)
-        return engine_from_db_facts(db_facts)
+        return self.engine_cache.engine_from_db_facts(db_facts)
 
     def db_driver(self,
                   db: Optional[Union['Engine', 'Connection']],
@@ -267,7 +311,14 @@ class Session():
                   db_engine: Optional['Engine'] = None) -> 'DBDriver':
         from .db.factory import db_driver
 
-        kwargs = {}
+        kwargs: Dict[str, object] = {}
+        if self._fast_db_reflection:
+            kwargs['fast_reflection'] = True
+        if self._redshift_data_api:
+            boto3_session = self.creds.default_boto3_session()
+            if boto3_session is None:
+                raise ValueError('Please configure AWS credentials to use the Redshift Data API')
+            kwargs['data_api_boto3_session'] = boto3_session
         scratch_s3_url = self.creds.default_scratch_s3_url()
         if scratch_s3_url is not None:
             try:
@@ -3,23 +3,17 @@ import secrets
 import logging
 import json
 from records_mover.mover_types import JsonValue
-from typing import TypeVar, Iterator, IO, Any, Optional, List, Union
+from records_mover.utils.concurrency import map_concurrently
+from records_mover.utils.file_copy import copy_fileobj
+from typing import TypeVar, Iterator, IO, Any, Optional, List, Union, Tuple
 
 V = TypeVar('V', bound='BaseDirectoryUrl')
 
 
-# Adapted from
-# https://github.com/python/cpython/blob/3.7/Lib/shutil.py
-# but this one returns the size copied
-def blcopyfileobj(fsrc: IO[bytes], fdst: IO[bytes], length: int = 16*1024) -> int:
-    """copy data from file-like object fsrc to file-like object fdst"""
-    written = 0
-    while 1:
-        buf = fsrc.read(length)
-        if not buf:
-            break
-        written = written + fdst.write(buf)
-    return written
+def blcopyfileobj(fsrc: IO[bytes], fdst: IO[bytes], length: Optional[int] = None) -> int:
+    """copy data from file-like object fsrc to file-like object fdst,
+    returning the size copied.  See copy_fileobj() for details."""
+    return copy_fileobj(fsrc, fdst, length)
 
 
 class BaseDirectoryUrl:
@@ -61,6 +55,7 @@ class BaseDirectoryUrl:
 
     def copy_to(self, other_loc: 'BaseDirectoryUrl') -> 'BaseDirectoryUrl':
         "Copy all entries to the specified directory and return it"
+        source_files: List[BaseFileUrl] = []
         for file_or_directory in self.files_and_directories_in_directory():
             if file_or_directory.is_directory():
                 source_subdirectory: BaseDirectoryUrl = file_or_directory  # type: ignore
@@ -68,10 +63,21 @@ class BaseDirectoryUrl:
                 other_subdirectory = other_loc.directory_in_this_directory(other_subdirname)
                 source_subdirectory.copy_to(other_subdirectory)
             else:
-                source_file: BaseFileUrl = file_or_directory  # type: ignore
-                other_filename = source_file.filename()
-                other_file = other_loc.file_in_this_directory(other_filename)
-                source_file.copy_to(other_file)
+                source_files.append(file_or_directory)  # type: ignore
+
+        # Create the target URLs here rather than in the threads
+        # below, as doing so can create clients from a shared session
+        # (e.g., boto3's), which isn't thread-safe.
+        copies = [(source_file, other_loc.file_in_this_directory(source_file.filename()))
+                  for source_file in source_files]
+
+        def copy_file(copy: Tuple[BaseFileUrl, BaseFileUrl]) -> BaseFileUrl:
+            source_file, other_file = copy
+            return source_file.copy_to(other_file)
+
+        # Sharded records directories can have many files; copy them
+        # in parallel.
+        map_concurrently(copy_file, copies)
         return other_loc
 
     def is_directory(self) -> bool:
@@ -1,9 +1,11 @@
 from contextlib import contextmanager
+import errno
 import os
 from urllib.parse import urlparse, unquote
 import tempfile
 from pathlib import Path
 from .base import BaseDirectoryUrl, BaseFileUrl
+from ..utils.file_copy import copy_file
 from typing import IO, Iterator, List, Union, Optional
 
 
@@ -28,14 +30,31 @@ class FilesystemFileUrl(BaseFilesystemUrl, BaseFileUrl):
         self.basename = os.path.basename(self.local_file_path)
 
     def open(self, mode: str = "rb") -> IO[bytes]:
+        if 'r' not in mode:
+            # Records directories can have data files in
+            # subdirectories (e.g., partitions of an export)
+            os.makedirs(os.path.dirname(self.local_file_path), exist_ok=True)
         return open(self.local_file_path, mode)
 
     def rename_to(self, new: 'BaseFileUrl') -> 'FilesystemFileUrl':
         if not isinstance(new, FilesystemFileUrl):
             raise TypeError(f'Can only rename to same type, not {new}')
-        os.rename(self.local_file_path, new.local_file_path)
+        try:
+            os.rename(self.local_file_path, new.local_file_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Different filesystems; copy it over instead
+            copy_file(self.local_file_path, new.local_file_path)
+            os.remove(self.local_file_path)
         return new
 
+    def copy_to(self, other_loc: 'BaseFileUrl') -> 'BaseFileUrl':
+        if not isinstance(other_loc, FilesystemFileUrl):
+            return super().copy_to(other_loc)
+        copy_file(self.local_file_path, other_loc.local_file_path)
+        return other_loc
+
     def filename(self) -> str:
         "Filename, stripped of any directory information"
         return self.basename
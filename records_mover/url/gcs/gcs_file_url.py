@@ -1,14 +1,50 @@
 from urllib.parse import urlparse, unquote
 from records_mover.url.gcs.gcs_directory_url import GCSDirectoryUrl
-from typing import IO
+from typing import IO, Iterator, List, Tuple
 from records_mover.url import BaseFileUrl
+from records_mover.utils.concurrency import imap_concurrently
 from smart_open.gcs import open as gs_open
 import google.cloud.storage
 from google.cloud.storage.blob import Blob
 import google.api_core.exceptions
+import logging
+import secrets
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+# GCS refuses to compose more than this many objects in one request
+MAX_COMPOSE_SOURCES = 32
+
+
+def _read_part(fileobj: IO[bytes], size: int) -> bytes:
+    """Read size bytes from fileobj, or fewer only at the end of the
+    stream--raw streams (e.g., HTTP responses) can return less than
+    asked for from any read."""
+    chunks = []
+    remaining = size
+    while remaining > 0:
+        chunk = fileobj.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
 
 
 class GCSFileUrl(BaseFileUrl):
+    # Size of each request in a resumable upload.  Must be a multiple
+    # of 256KB; bigger chunks mean fewer round trips at the cost of
+    # memory and of more data to resend if a request fails.
+    upload_chunk_size = 16 * MB
+    # Streams longer than this are split into parts of this size which
+    # are uploaded concurrently and then composed into the target
+    # object.  Up to max_concurrent_part_uploads + 1 parts are held in
+    # memory at a time.
+    composite_part_size = 64 * MB
+    max_concurrent_part_uploads = 4
+
     def __init__(self,
                  url: str,
                  gcs_client: google.cloud.storage.Client,
@@ -47,6 +83,76 @@ class GCSFileUrl(BaseFileUrl):
     def size(self) -> int:
         return self._blob_obj().size
 
+    def _upload_part(self, name: str, data: bytes) -> Blob:
+        blob = self.bucket_obj.blob(name, chunk_size=self.upload_chunk_size)
+        blob.upload_from_string(data, content_type='application/octet-stream')
+        return blob
+
+    def _compose(self, parts: List[Blob]) -> None:
+        target = self._blob_obj()
+        # Fold the parts into the target a batch at a time; the
+        # target can itself be one of the sources.
+        sources = parts[:MAX_COMPOSE_SOURCES]
+        remaining = parts[MAX_COMPOSE_SOURCES:]
+        target.compose(sources)
+        while remaining:
+            sources = [target] + remaining[:MAX_COMPOSE_SOURCES - 1]
+            remaining = remaining[MAX_COMPOSE_SOURCES - 1:]
+            target.compose(sources)
+
+    def upload_fileobj(self, fileobj: IO[bytes], mode: str = 'wb') -> int:
+        if mode != 'wb':
+            # use the single-threaded method that handles all modes
+            return super().upload_fileobj(fileobj, mode=mode)
+
+        first_part = _read_part(fileobj, self.composite_part_size)
+        if len(first_part) < self.composite_part_size:
+            blob = self.bucket_obj.blob(self.blob, chunk_size=self.upload_chunk_size)
+            blob.upload_from_string(first_part, content_type='application/octet-stream')
+            return len(first_part)
+
+        part_prefix = f"{self.blob}.part-{secrets.token_hex(8)}-"
+        part_names: List[str] = []
+        written = 0
+
+        def parts() -> Iterator[Tuple[str, bytes]]:
+            nonlocal written
+            data = first_part
+            while data:
+                name = f"{part_prefix}{len(part_names):05d}"
+                part_names.append(name)
+                written += len(data)
+                yield name, data
+                data = _read_part(fileobj, self.composite_part_size)
+
+        try:
+            part_blobs = list(imap_concurrently(lambda part: self._upload_part(*part),
+                                                parts(),
+                                                max_workers=self.max_concurrent_part_uploads))
+            logger.info(f"Composing {len(part_blobs)} parts into {self.url}")
+            self._compose(part_blobs)
+        finally:
+            # Parts which never made it up won't be there to delete
+            self.bucket_obj.delete_blobs(part_names, on_error=lambda blob: None)
+        return written
+
+    def store_string(self, contents: str) -> None:
+        self._blob_obj().upload_from_string(contents.encode('utf-8'),
+                                            content_type='application/octet-stream')
+
+    def copy_to(self, other_loc: 'BaseFileUrl') -> 'BaseFileUrl':
+        if not isinstance(other_loc, GCSFileUrl):
+            return super().copy_to(other_loc)
+        # Copy within GCS without the data passing through here.  Large
+        # objects (or those crossing locations) take several rewrite
+        # calls.
+        source = self._blob_obj()
+        destination = other_loc._blob_obj()
+        token, _, _ = destination.rewrite(source)
+        while token is not None:
+            token, _, _ = destination.rewrite(source, token=token)
+        return other_loc
+
     def rename_to(self, new: 'BaseFileUrl') -> 'BaseFileUrl':
         if not isinstance(new, GCSFileUrl):
             raise NotImplementedError('Cannot rename a GCS file to a non-GCS file')
@@ -1,11 +1,31 @@
 from .s3_base_url import S3BaseUrl
-from .awscli import aws_cli
 from ..base import BaseDirectoryUrl, BaseFileUrl
 from ..filesystem import FilesystemDirectoryUrl
-from typing import Dict, List
+from ...utils.concurrency import map_concurrently
+from boto3.s3.transfer import TransferConfig
+from typing import Dict, Iterator, List, Optional, TYPE_CHECKING
+import hashlib
+import logging
+import os
+if TYPE_CHECKING:
+    from boto3.session import ListObjectsResponseContentType
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
 
 
 class S3DirectoryUrl(S3BaseUrl, BaseDirectoryUrl):
+    # Number of objects downloaded at once when syncing to a local
+    # directory
+    max_concurrent_downloads = 8
+    # Objects larger than multipart_threshold are fetched with
+    # concurrent ranged GETs of multipart_chunksize bytes each, up to
+    # max_concurrent_ranges at a time per object.
+    multipart_threshold = 16 * MB
+    multipart_chunksize = 16 * MB
+    max_concurrent_ranges = 4
+
     def directory_in_this_directory(self, directory_name: str) -> 'S3DirectoryUrl':
         return self._directory(f"{self.url}{directory_name}/")
 
@@ -34,11 +54,74 @@ class S3DirectoryUrl(S3BaseUrl, BaseDirectoryUrl):
         if delete_keys['Objects']:
             self.s3_resource.meta.client.delete_objects(Bucket=self.bucket, Delete=delete_keys)
 
+    def _all_objects(self) -> Iterator['ListObjectsResponseContentType']:
+        "All objects under this directory, including those in subdirectories."
+        continuation_token: Optional[str] = None
+        while True:
+            if continuation_token is None:
+                resp = self.s3_client.list_objects_v2(Bucket=self.bucket, Prefix=self.key)
+            else:
+                resp = self.s3_client.list_objects_v2(Bucket=self.bucket, Prefix=self.key,
+                                                      ContinuationToken=continuation_token)
+            yield from resp.get('Contents', [])
+            if not resp.get('IsTruncated'):
+                return
+            continuation_token = resp['NextContinuationToken']
+
+    def _local_copy_is_current(self,
+                               obj: 'ListObjectsResponseContentType',
+                               local_path: str) -> bool:
+        try:
+            stat = os.stat(local_path)
+        except FileNotFoundError:
+            return False
+        if stat.st_size != obj['Size']:
+            return False
+        etag = obj['ETag'].strip('"')
+        if '-' not in etag:
+            # Objects uploaded in one piece have the MD5 of their
+            # contents as their ETag
+            md5 = hashlib.md5()
+            with open(local_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(MB), b''):
+                    md5.update(chunk)
+            return md5.hexdigest() == etag
+        # Multipart ETags depend on the part size used in the upload,
+        # so fall back to comparing modification times as 'aws s3
+        # sync' does.
+        return stat.st_mtime >= obj['LastModified'].timestamp()
+
+    def _sync_to_local(self, other_loc: FilesystemDirectoryUrl) -> None:
+        config = TransferConfig(multipart_threshold=self.multipart_threshold,
+                                multipart_chunksize=self.multipart_chunksize,
+                                max_concurrency=self.max_concurrent_ranges)
+
+        def download(obj: 'ListObjectsResponseContentType') -> None:
+            relative_key = obj['Key'][len(self.key):]
+            if relative_key == '' or relative_key.endswith('/'):
+                # Placeholder for an empty directory
+                return
+            local_path = os.path.join(other_loc.local_file_path, *relative_key.split('/'))
+            if self._local_copy_is_current(obj, local_path):
+                logger.debug(f"Skipping s3://{self.bucket}/{obj['Key']}; already downloaded")
+                return
+            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            self.s3_client.download_file(Bucket=self.bucket,
+                                         Key=obj['Key'],
+                                         Filename=local_path,
+                                         Config=config)
+            # Match the object so a later sync can tell it's current
+            last_modified = obj['LastModified'].timestamp()
+            os.utime(local_path, (last_modified, last_modified))
+
+        map_concurrently(download, list(self._all_objects()),
+                         max_workers=self.max_concurrent_downloads)
+
     def copy_to(self, other_loc: BaseDirectoryUrl) -> BaseDirectoryUrl:
         if not other_loc.is_directory():
             raise RuntimeError(f"Cannot copy a directory to a file ({other_loc.url})")
         elif isinstance(other_loc, FilesystemDirectoryUrl):
-            aws_cli('s3', 'sync', self.url, other_loc.local_file_path)
+            self._sync_to_local(other_loc)
             return other_loc
         else:
             return super(S3DirectoryUrl, self).copy_to(other_loc)
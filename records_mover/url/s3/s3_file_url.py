@@ -4,19 +4,30 @@ import smart_open
 from .s3_base_url import S3BaseUrl
 from ..base import BaseDirectoryUrl, BaseFileUrl
 from typing import IO, List, Optional
+import io
 import threading
 from time import sleep
+from botocore.exceptions import ClientError
 from s3_concat import S3Concat
 from smart_open.s3 import open as s3_open
 import packaging.version
+from ...utils.prefetching_reader import PrefetchingReader
 
 SMART_OPEN_VERSION = packaging.version.parse(smart_open.__version__)
 SMART_OPEN_USE_SESSION = SMART_OPEN_VERSION < packaging.version.parse("5.0.0")
 
 logger = logging.getLogger(__name__)
 
+MB = 1024 * 1024
+
 
 class S3FileUrl(S3BaseUrl, BaseFileUrl):
+    # Objects larger than prefetch_part_size are read with up to
+    # prefetch_depth concurrent ranged GETs of that size ahead of the
+    # reader, rather than over a single connection.
+    prefetch_part_size = 8 * MB
+    prefetch_depth = 4
+
     def __str__(self) -> str:
         return self.url
 
@@ -54,7 +65,26 @@ class S3FileUrl(S3BaseUrl, BaseFileUrl):
 
         return callback.length
 
+    def _fetch_range(self, start: int, end: int) -> bytes:
+        response = self.s3_client.get_object(Bucket=self.bucket,
+                                             Key=self.key,
+                                             Range=f"bytes={start}-{end - 1}")
+        return response['Body'].read()
+
     def open(self, mode: str = "rb") -> IO[bytes]:
+        if mode == 'rb':
+            try:
+                size = self.size()
+            except ClientError as e:
+                if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey'):
+                    raise FileNotFoundError(f"{self} not found")
+                raise
+            if size > self.prefetch_part_size:
+                reader = PrefetchingReader(self._fetch_range,
+                                           size=size,
+                                           part_size=self.prefetch_part_size,
+                                           depth=self.prefetch_depth)
+                return io.BufferedReader(reader)
         try:
             if SMART_OPEN_USE_SESSION:
                 return s3_open(bucket_id=self.bucket,
@@ -1,11 +1,149 @@
-from urllib.request import urlopen
-from typing import IO
+import http.client
+import io
+import logging
+import threading
+import time
+from urllib.error import URLError
+from urllib.parse import urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
+from typing import IO, List, Optional, Tuple
+from ..utils.prefetching_reader import PrefetchingReader
+
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+
+class RangedDownloader:
+    """Fetches byte ranges of a single URL, keeping one keep-alive
+    connection per calling thread.  Each range is retried up to
+    max_attempts times, picking up where the last attempt left off
+    rather than starting the range over."""
+
+    read_chunk_size = 64 * 1024
+    timeout_seconds = 60.0
+
+    def __init__(self, url: str, max_attempts: int) -> None:
+        self.url = url
+        parts = urlsplit(url)
+        self._scheme = parts.scheme
+        self._netloc = parts.netloc
+        self._path = parts.path or '/'
+        if parts.query:
+            self._path += '?' + parts.query
+        self._max_attempts = max_attempts
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[http.client.HTTPConnection] = []
+        self._closed = False
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn: Optional[http.client.HTTPConnection] = getattr(self._local, 'connection', None)
+        if conn is None:
+            if self._scheme == 'https':
+                conn = http.client.HTTPSConnection(self._netloc, timeout=self.timeout_seconds)
+            else:
+                conn = http.client.HTTPConnection(self._netloc, timeout=self.timeout_seconds)
+            self._local.connection = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _reset_connection(self) -> None:
+        conn = getattr(self._local, 'connection', None)
+        if conn is not None:
+            conn.close()
+            self._local.connection = None
+
+    def _fetch_into(self, received: bytearray, start: int, end: int) -> None:
+        offset = start + len(received)
+        conn = self._connection()
+        conn.request('GET', self._path, headers={'Range': f'bytes={offset}-{end - 1}'})
+        response = conn.getresponse()
+        if response.status != 206:
+            response.read()
+            raise http.client.HTTPException(f"Expected partial content for bytes "
+                                            f"{offset}-{end - 1} of {self.url}, "
+                                            f"got HTTP {response.status}")
+        while True:
+            chunk = response.read(self.read_chunk_size)
+            if not chunk:
+                break
+            received += chunk
+
+    def fetch_range(self, start: int, end: int) -> bytes:
+        received = bytearray()
+        attempt = 1
+        while True:
+            try:
+                self._fetch_into(received, start, end)
+                if len(received) >= end - start:
+                    return bytes(received)
+                raise http.client.IncompleteRead(bytes(received), end - start - len(received))
+            except (http.client.HTTPException, OSError) as e:
+                self._reset_connection()
+                if self._closed or attempt >= self._max_attempts:
+                    raise
+                logger.warning(f"Resuming download of bytes {start + len(received)}-{end - 1} "
+                               f"of {self.url} after error: {e}")
+                time.sleep(min(0.1 * 2 ** attempt, 5.0))
+                attempt += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            for conn in self._connections:
+                conn.close()
+            self._connections = []
 
 
 class UrllibFileMixin:
     url: str
 
+    # Files larger than this whose server accepts byte range requests
+    # are downloaded in parts of this size over several connections
+    # at once; latency per connection otherwise caps throughput.
+    ranged_download_part_size = 8 * MB
+    ranged_download_depth = 4
+    ranged_download_max_attempts = 5
+
+    def _ranged_download_target(self) -> Optional[Tuple[str, int]]:
+        """Return the URL (after any redirects) and size of this file
+        if it can be downloaded in ranges, or None."""
+        scheme, netloc = urlsplit(self.url)[:2]
+        if scheme not in ('http', 'https'):
+            return None
+        if getproxies().get(scheme) and not proxy_bypass(netloc):
+            # RangedDownloader connects directly; leave proxying to urllib
+            return None
+        try:
+            with urlopen(Request(self.url, method='HEAD')) as response:
+                final_url = response.geturl()
+                accept_ranges = response.headers.get('Accept-Ranges')
+                content_length = response.headers.get('Content-Length')
+                content_encoding = response.headers.get('Content-Encoding')
+        except (URLError, OSError) as e:
+            # Some servers don't implement HEAD; a plain GET may still work
+            logger.debug(f"Could not probe {self.url} for range support: {e}")
+            return None
+        if (not isinstance(accept_ranges, str) or accept_ranges.lower() != 'bytes' or
+           not isinstance(content_length, str) or not content_length.isdigit() or
+           content_encoding not in (None, 'identity')):
+            return None
+        return final_url, int(content_length)
+
     def open(self, mode: str = "rb") -> IO[bytes]:
         if mode != 'rb':
             raise NotImplementedError(f"Mode {mode} not supported on {self.url}")
+        target = self._ranged_download_target()
+        if target is not None and target[1] > self.ranged_download_part_size:
+            final_url, size = target
+            downloader = RangedDownloader(final_url, self.ranged_download_max_attempts)
+            reader = PrefetchingReader(downloader.fetch_range,
+                                       size=size,
+                                       part_size=self.ranged_download_part_size,
+                                       depth=self.ranged_download_depth,
+                                       on_close=downloader.close)
+            return io.BufferedReader(reader)
         return urlopen(self.url)
@@ -0,0 +1,53 @@
+import contextvars
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterable, Iterator, List, Sequence, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Enough to overlap network round trips when working with a sharded
+# records directory without hammering the remote end.
+DEFAULT_MAX_WORKERS = 8
+
+
+def map_concurrently(fn: Callable[[T], R],
+                     items: Sequence[T],
+                     max_workers: int = DEFAULT_MAX_WORKERS) -> List[R]:
+    """Call fn on each item using a pool of threads, returning results
+    in the same order as items.  Each call runs in a copy of the
+    caller's context, so move metrics are still collected.
+
+    Runs in the calling thread if there's nothing to gain from
+    concurrency.  If any call raises, the first exception (in item
+    order) is raised once all calls have finished.
+    """
+    if max_workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(contextvars.copy_context().run, fn, item)
+                   for item in items]
+    return [future.result() for future in futures]
+
+
+def imap_concurrently(fn: Callable[[T], R],
+                      items: Iterable[T],
+                      max_workers: int = DEFAULT_MAX_WORKERS) -> Iterator[R]:
+    """Like map_concurrently(), but pulls from items lazily and yields
+    results as they become available (still in order), with at most
+    max_workers calls in progress at a time.  Useful when items are
+    large (e.g., dataframe chunks) and shouldn't all be held in memory
+    at once.
+    """
+    if max_workers <= 1:
+        for item in items:
+            yield fn(item)
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: Deque['Future[R]'] = deque()
+        for item in items:
+            if len(pending) >= max_workers:
+                yield pending.popleft().result()
+            pending.append(executor.submit(contextvars.copy_context().run, fn, item))
+        while pending:
+            yield pending.popleft().result()
@@ -0,0 +1,106 @@
+import io
+from typing import IO, Any, Iterator, List
+
+
+class CountingFileobj(io.IOBase):
+    """Wraps a binary file object, counting the bytes and newlines
+    read from or written to it as they stream through.  Other
+    attributes are passed through to the wrapped file object.
+
+    Seeking back to the start resets the counts, so a stream which is
+    rewound and re-read (e.g., for a retried load) isn't double
+    counted.
+    """
+
+    def __init__(self, fileobj: IO[bytes]) -> None:
+        self.fileobj = fileobj
+        self.bytes_count = 0
+        self.newline_count = 0
+        self.ends_with_newline = True
+
+    def _count(self, data: bytes) -> None:
+        if data:
+            self.bytes_count += len(data)
+            self.newline_count += data.count(b'\n')
+            self.ends_with_newline = data.endswith(b'\n')
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.fileobj.read(size)
+        self._count(data)
+        return data
+
+    def read1(self, size: int = -1) -> bytes:
+        data = self.fileobj.read1(size)  # type: ignore
+        self._count(data)
+        return data
+
+    def readinto(self, b: Any) -> int:
+        n = self.fileobj.readinto(b)  # type: ignore
+        if n:
+            self._count(bytes(memoryview(b)[:n]))
+        return n
+
+    def readline(self, size: int = -1) -> bytes:  # type: ignore[override]
+        data = self.fileobj.readline(size)
+        self._count(data)
+        return data
+
+    def readlines(self, hint: int = -1) -> List[bytes]:
+        lines = self.fileobj.readlines(hint)
+        for line in lines:
+            self._count(line)
+        return lines
+
+    def __iter__(self) -> Iterator[bytes]:
+        for line in self.fileobj:
+            self._count(line)
+            yield line
+
+    def write(self, data: bytes) -> int:
+        out = self.fileobj.write(data)
+        self._count(data)
+        return out
+
+    def seek(self, *args: Any) -> int:
+        pos = self.fileobj.seek(*args)
+        if pos == 0:
+            self.bytes_count = 0
+            self.newline_count = 0
+            self.ends_with_newline = True
+        return pos
+
+    def tell(self) -> int:
+        return self.fileobj.tell()
+
+    def readable(self) -> bool:
+        return self.fileobj.readable()
+
+    def writable(self) -> bool:
+        return self.fileobj.writable()
+
+    def seekable(self) -> bool:
+        return self.fileobj.seekable()
+
+    def flush(self) -> None:
+        self.fileobj.flush()
+
+    def fileno(self) -> int:
+        return self.fileobj.fileno()
+
+    def isatty(self) -> bool:
+        return self.fileobj.isatty()
+
+    def close(self) -> None:
+        self.fileobj.close()
+
+    @property
+    def closed(self) -> bool:
+        return self.fileobj.closed
+
+    def __del__(self) -> None:
+        # io.IOBase closes itself when garbage collected; the wrapped
+        # file object belongs to the caller, so leave it open.
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.fileobj, name)
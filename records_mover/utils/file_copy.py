@@ -0,0 +1,171 @@
+"""Copying data between files, letting the kernel (or filesystem) do
+the work where both ends are local files."""
+import errno
+import io
+import logging
+import os
+import stat
+from typing import IO, Callable, List, Optional
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows
+    fcntl = None  # type: ignore
+
+
+logger = logging.getLogger(__name__)
+
+# ioctl to share a file's extents with another on copy-on-write
+# filesystems (btrfs, XFS, ...); see ioctl_ficlone(2).
+FICLONE = 0x40049409
+
+# Largest request to hand the kernel at once
+KERNEL_COPY_CHUNK_SIZE = 64 * 1024 * 1024
+
+# Buffer sizes used when copying through Python.  Small reads are
+# cheap for a trickling stream, but each read costs a round trip
+# through the interpreter, so the buffer grows while it keeps being
+# filled.
+MIN_BUFFER_SIZE = 64 * 1024
+MAX_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Errors meaning a given technique isn't supported for this pair of
+# files (different filesystems, append mode, old kernels, etc.), so
+# the next one should be tried.
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP, errno.ENOTSUP,
+    errno.EBADF, errno.ENOTSOCK, errno.EPERM,
+}
+
+_PLAIN_FILE_TYPES = (io.BufferedReader, io.BufferedWriter, io.BufferedRandom)
+
+
+def _local_fd(fileobj: IO[bytes]) -> Optional[int]:
+    """Return the descriptor of the local regular file fileobj reads
+    or writes unchanged, or None.
+
+    Wrappers which transform the data (e.g., gzip.GzipFile) also
+    offer fileno(), so only plain binary files are trusted.
+    """
+    if type(fileobj) in _PLAIN_FILE_TYPES:
+        raw = fileobj.raw  # type: ignore
+    else:
+        raw = fileobj
+    if type(raw) is not io.FileIO or raw.closed:
+        return None
+    fd = raw.fileno()
+    try:
+        if not stat.S_ISREG(os.fstat(fd).st_mode):
+            return None
+    except OSError:
+        return None
+    return fd
+
+
+def _copy_file_range_chunk(src_fd: int, dst_fd: int) -> int:
+    return os.copy_file_range(src_fd, dst_fd, KERNEL_COPY_CHUNK_SIZE)
+
+
+def _sendfile_chunk(src_fd: int, dst_fd: int) -> int:
+    offset = os.lseek(src_fd, 0, os.SEEK_CUR)
+    sent = os.sendfile(dst_fd, src_fd, offset, KERNEL_COPY_CHUNK_SIZE)
+    os.lseek(src_fd, offset + sent, os.SEEK_SET)
+    return sent
+
+
+def _kernel_copy_functions() -> List[Callable[[int, int], int]]:
+    functions: List[Callable[[int, int], int]] = []
+    if hasattr(os, 'copy_file_range'):
+        functions.append(_copy_file_range_chunk)
+    if hasattr(os, 'sendfile'):
+        functions.append(_sendfile_chunk)
+    return functions
+
+
+def _copy_fd(src_fd: int, dst_fd: int) -> int:
+    """Copy from the current offset of src_fd to its end into dst_fd
+    at its current offset, advancing both.  Returns bytes copied."""
+    copied = 0
+    for copy_chunk in _kernel_copy_functions():
+        try:
+            while True:
+                n = copy_chunk(src_fd, dst_fd)
+                if n == 0:
+                    return copied
+                copied += n
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+            # Any progress is reflected in the file offsets, so the
+            # next technique picks up where this one left off.
+            logger.debug(f"Falling back from {copy_chunk.__name__}: {e}")
+    while True:
+        buf = os.read(src_fd, MAX_BUFFER_SIZE)
+        if not buf:
+            return copied
+        view = memoryview(buf)
+        while view:
+            view = view[os.write(dst_fd, view):]
+        copied += len(buf)
+
+
+def _reflink(src_fd: int, dst_fd: int) -> bool:
+    if fcntl is None:
+        return False
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+    except OSError as e:
+        logger.debug(f"Could not clone file: {e}")
+        return False
+    return True
+
+
+def _buffered_copyfileobj(fsrc: IO[bytes], fdst: IO[bytes], length: Optional[int]) -> int:
+    size = length or MIN_BUFFER_SIZE
+    written = 0
+    while True:
+        buf = fsrc.read(size)
+        if not buf:
+            return written
+        written += fdst.write(buf)
+        if length is None and len(buf) == size and size < MAX_BUFFER_SIZE:
+            size *= 2
+
+
+def copy_fileobj(fsrc: IO[bytes], fdst: IO[bytes], length: Optional[int] = None) -> int:
+    """Copy the rest of fsrc into fdst, returning the number of bytes
+    copied.
+
+    If both are plain local files, the data is copied within the
+    kernel (copy_file_range(2), falling back to sendfile(2)) without
+    passing through Python.  Otherwise it is read and written in
+    chunks of length bytes or, if not given, in a buffer which grows
+    as long as data keeps coming.
+    """
+    src_fd = _local_fd(fsrc)
+    dst_fd = _local_fd(fdst) if src_fd is not None else None
+    if src_fd is None or dst_fd is None:
+        return _buffered_copyfileobj(fsrc, fdst, length)
+    # Line up the descriptors with any data buffered in Python
+    src_position = fsrc.tell()
+    fdst.flush()
+    dst_position = fdst.tell()
+    os.lseek(src_fd, src_position, os.SEEK_SET)
+    copied = _copy_fd(src_fd, dst_fd)
+    fsrc.seek(src_position + copied)
+    fdst.seek(dst_position + copied)
+    return copied
+
+
+def copy_file(src_path: str, dst_path: str) -> int:
+    """Copy one local file over another, returning the number of
+    bytes copied.
+
+    On copy-on-write filesystems the copy shares the original's
+    blocks (a reflink) and takes no time or space up front; otherwise
+    copy_fileobj() is used.
+    """
+    with open(src_path, 'rb') as fsrc, open(dst_path, 'wb') as fdst:
+        if _reflink(fsrc.fileno(), fdst.fileno()):
+            return os.fstat(fsrc.fileno()).st_size
+        return copy_fileobj(fsrc, fdst)
@@ -0,0 +1,118 @@
+import contextvars
+import io
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Optional
+
+
+class PrefetchingReader(io.RawIOBase):
+    """Sequential, seekable reader over a remote object of known size
+    which keeps several byte ranges in flight at once.
+
+    fetch_range(start, end) should return bytes [start, end) of the
+    object, e.g. via an HTTP Range request.  Up to depth ranges of
+    part_size bytes are fetched concurrently ahead of the read
+    position, so at most (depth + 1) * part_size bytes are buffered.
+    Wrap in io.BufferedReader() for efficient small reads.
+
+    on_close, if provided, is called when the reader is closed (e.g.,
+    to release connections used by fetch_range).
+    """
+
+    def __init__(self,
+                 fetch_range: Callable[[int, int], bytes],
+                 size: int,
+                 part_size: int,
+                 depth: int,
+                 on_close: Optional[Callable[[], None]] = None) -> None:
+        if part_size < 1 or depth < 1:
+            raise ValueError("part_size and depth must be positive")
+        self._fetch_range = fetch_range
+        self._size = size
+        self._part_size = part_size
+        self._depth = depth
+        self._on_close = on_close
+        self._executor = ThreadPoolExecutor(max_workers=depth)
+        self._pending: Deque['Future[bytes]'] = deque()
+        # Offset of the next range to be requested
+        self._next_offset = 0
+        self._buffer = memoryview(b'')
+        self._buffer_pos = 0
+        self._position = 0
+
+    def _fetch(self, start: int, end: int) -> bytes:
+        data = self._fetch_range(start, end)
+        if len(data) != end - start:
+            raise IOError(f"Expected {end - start} bytes at offset {start}, "
+                          f"got {len(data)}--did the object change while being read?")
+        return data
+
+    def _schedule(self) -> None:
+        while len(self._pending) < self._depth and self._next_offset < self._size:
+            start = self._next_offset
+            end = min(start + self._part_size, self._size)
+            self._pending.append(self._executor.submit(contextvars.copy_context().run,
+                                                       self._fetch, start, end))
+            self._next_offset = end
+
+    def _discard_pending(self) -> None:
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            new_position = offset
+        elif whence == io.SEEK_CUR:
+            new_position = self._position + offset
+        elif whence == io.SEEK_END:
+            new_position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+        if new_position < 0:
+            raise ValueError(f"Negative seek position {new_position}")
+        buffer_start = self._position - self._buffer_pos
+        if buffer_start <= new_position < buffer_start + len(self._buffer):
+            # Still within the part we've already got
+            self._buffer_pos = new_position - buffer_start
+        else:
+            self._discard_pending()
+            self._buffer = memoryview(b'')
+            self._buffer_pos = 0
+            self._next_offset = new_position
+        self._position = new_position
+        return new_position
+
+    def readinto(self, b: Any) -> int:
+        if self._buffer_pos >= len(self._buffer):
+            self._schedule()
+            if not self._pending:
+                return 0
+            self._buffer = memoryview(self._pending.popleft().result())
+            self._buffer_pos = 0
+            # Keep the pipeline full while the caller works through
+            # this part
+            self._schedule()
+        n = min(len(b), len(self._buffer) - self._buffer_pos)
+        b[:n] = self._buffer[self._buffer_pos:self._buffer_pos + n]
+        self._buffer_pos += n
+        self._position += n
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            self._discard_pending()
+            self._executor.shutdown(wait=False)
+            self._buffer = memoryview(b'')
+            if self._on_close is not None:
+                self._on_close()
+        super().close()
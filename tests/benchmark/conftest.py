@@ -0,0 +1,56 @@
+import datetime
+import io
+import pytest
+
+try:
+    import pytest_benchmark  # noqa
+except ImportError:
+    # pip3 install -e '.[benchmark]' to run these
+    collect_ignore_glob = ['test_*.py']
+
+
+# Big enough that per-row costs dominate per-call overhead, small
+# enough to keep a run of the whole suite to a minute or two.
+NUM_ROWS = 20000
+
+
+def synthetic_dataframe(num_rows: int = NUM_ROWS):
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed=42)
+    start = datetime.datetime(2000, 1, 1)
+    return pd.DataFrame({
+        'id': np.arange(num_rows),
+        'amount': rng.normal(loc=100.0, scale=25.0, size=num_rows).round(2),
+        'flag': rng.integers(0, 2, size=num_rows).astype(bool),
+        'name': [f"name {i % 997}" for i in range(num_rows)],
+        'description': [f"a longer, comma-containing \"quoted\" description {i}"
+                        for i in range(num_rows)],
+        'created_on': [(start + datetime.timedelta(days=i % 3650)).date()
+                       for i in range(num_rows)],
+        'updated_at': pd.date_range(start, periods=num_rows, freq='min'),
+    })
+
+
+def synthetic_csv_bytes(num_rows: int = NUM_ROWS) -> bytes:
+    out = io.StringIO()
+    synthetic_dataframe(num_rows).to_csv(out, index=False)
+    return out.getvalue().encode('utf-8')
+
+
+@pytest.fixture(scope='session')
+def df():
+    return synthetic_dataframe()
+
+
+@pytest.fixture(scope='session')
+def csv_bytes() -> bytes:
+    return synthetic_csv_bytes()
+
+
+@pytest.fixture
+def csv_file(tmp_path, csv_bytes) -> str:
+    path = tmp_path / 'data.csv'
+    path.write_bytes(csv_bytes)
+    return str(path)
@@ -0,0 +1,26 @@
+import io
+from records_mover.records.delimited.sniff import sniff_hints
+from records_mover.records.delimited.csv_streamer import stream_csv
+
+
+def test_sniff_hints(benchmark, csv_bytes):
+    def sniff():
+        return sniff_hints(io.BytesIO(csv_bytes), initial_hints={})
+
+    hints = benchmark(sniff)
+    assert hints['header-row'] is True
+
+
+def test_stream_csv(benchmark, csv_bytes):
+    hints = {
+        'header-row': True,
+        'compression': None,
+        'quoting': 'minimal',
+    }
+
+    def stream():
+        with stream_csv(io.BytesIO(csv_bytes), hints) as reader:
+            return reader.read()
+
+    df = benchmark.pedantic(stream, rounds=3)
+    assert len(df.index) > 0
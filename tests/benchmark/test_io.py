@@ -0,0 +1,81 @@
+import io
+import os
+import pytest
+from mock import patch
+from records_mover.url.base import blcopyfileobj
+from records_mover.url.filesystem import FilesystemFileUrl
+from records_mover.utils import file_copy
+from records_mover.utils.concat_files import ConcatFiles
+
+
+# 64MB in 1MB pieces
+CHUNK = b'x' * (1024 * 1024)
+NUM_CHUNKS = 64
+
+
+def test_concat_files(benchmark):
+    def read_all():
+        fileobjs = [io.BytesIO(CHUNK) for _ in range(NUM_CHUNKS)]
+        concat = ConcatFiles(fileobjs)
+        total = 0
+        while True:
+            data = concat.read(64 * 1024)
+            if not data:
+                return total
+            total += len(data)
+
+    assert benchmark(read_all) == len(CHUNK) * NUM_CHUNKS
+
+
+def test_blcopyfileobj(benchmark):
+    data = CHUNK * NUM_CHUNKS
+
+    def copy():
+        return blcopyfileobj(io.BytesIO(data), io.BytesIO())
+
+    assert benchmark(copy) == len(data)
+
+
+@pytest.fixture(scope='module')
+def large_file(tmp_path_factory):
+    path = tmp_path_factory.mktemp('io') / 'large.bin'
+    with open(path, 'wb') as f:
+        for _ in range(NUM_CHUNKS * 4):
+            f.write(CHUNK)
+    return str(path)
+
+
+def copy_between_local_files(benchmark, src_path, dst_path):
+    def copy():
+        with open(src_path, 'rb') as fsrc, open(dst_path, 'wb') as fdst:
+            return blcopyfileobj(fsrc, fdst)
+
+    assert benchmark(copy) == len(CHUNK) * NUM_CHUNKS * 4
+
+
+def test_local_file_copy_kernel(benchmark, large_file, tmp_path):
+    copy_between_local_files(benchmark, large_file, str(tmp_path / 'copy.bin'))
+
+
+@pytest.mark.parametrize('technique', ['copy_file_range', 'sendfile', 'buffered'])
+def test_local_file_copy_techniques(benchmark, large_file, tmp_path, technique):
+    functions = {
+        'copy_file_range': [file_copy._copy_file_range_chunk],
+        'sendfile': [file_copy._sendfile_chunk],
+        'buffered': [],
+    }[technique]
+    if technique == 'copy_file_range' and not hasattr(os, 'copy_file_range'):
+        pytest.skip('os.copy_file_range() not available')
+    with patch.object(file_copy, '_kernel_copy_functions', return_value=functions):
+        copy_between_local_files(benchmark, large_file, str(tmp_path / 'copy.bin'))
+
+
+def test_local_file_copy_url(benchmark, large_file, tmp_path):
+    source = FilesystemFileUrl(f'file://{large_file}')
+    target = FilesystemFileUrl(f"file://{tmp_path / 'copy.bin'}")
+
+    def copy():
+        source.copy_to(target)
+        return target.size()
+
+    assert benchmark(copy) == len(CHUNK) * NUM_CHUNKS * 4
@@ -0,0 +1,64 @@
+import os
+import pytest
+import sqlalchemy
+from records_mover import Session
+from records_mover.records.existing_table_handling import ExistingTableHandling
+
+
+@pytest.fixture
+def records(monkeypatch):
+    monkeypatch.setenv('RECORDS_MOVER_SESSION_TYPE', 'env')
+    return Session().records
+
+
+@pytest.fixture
+def db_engine(tmp_path):
+    # Stand-in for a real database, so these run without any services
+    db_engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'benchmark.sqlite'}")
+    yield db_engine
+    db_engine.dispose()
+
+
+def test_move_file_to_records_directory(benchmark, records, csv_file, tmp_path):
+    counter = iter(range(1000000))
+
+    def move():
+        output_dir = tmp_path / f'out{next(counter)}'
+        output_dir.mkdir()
+        source = records.sources.data_url(f'file://{csv_file}')
+        target = records.targets.directory_from_url(f'file://{output_dir}/')
+        return records.move(source, target)
+
+    result = benchmark.pedantic(move, rounds=3)
+    assert result.metrics.files_moved == 1
+
+
+def test_move_file_to_table(benchmark, records, csv_file, db_engine):
+    def move():
+        source = records.sources.data_url(f'file://{csv_file}')
+        target = records.targets.table(db_engine=db_engine,
+                                       schema_name='main',
+                                       table_name='benchmark',
+                                       existing_table_handling=ExistingTableHandling.
+                                       DROP_AND_RECREATE)
+        return records.move(source, target)
+
+    benchmark.pedantic(move, rounds=3)
+    with db_engine.connect() as db_conn:
+        count = db_conn.execute(sqlalchemy.text('SELECT COUNT(*) FROM main.benchmark')).scalar()
+    assert count > 0
+
+
+def test_move_table_to_file(benchmark, records, df, db_engine, tmp_path):
+    df.to_sql('benchmark', db_engine, schema='main', index=False)
+    output_file = os.path.join(str(tmp_path), 'out.csv')
+
+    def move():
+        source = records.sources.table(db_engine=db_engine,
+                                       schema_name='main',
+                                       table_name='benchmark')
+        target = records.targets.data_url(f'file://{output_file}')
+        return records.move(source, target)
+
+    benchmark.pedantic(move, rounds=3)
+    assert os.path.getsize(output_file) > 0
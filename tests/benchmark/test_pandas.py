@@ -0,0 +1,20 @@
+from records_mover.records.pandas import prep_df_for_csv_output
+from records_mover.records.processing_instructions import ProcessingInstructions
+from records_mover.records.records_format import DelimitedRecordsFormat
+from records_mover.records.schema import RecordsSchema
+
+
+def test_prep_df_for_csv_output(benchmark, df):
+    processing_instructions = ProcessingInstructions()
+    records_schema = RecordsSchema.from_dataframe(df, processing_instructions,
+                                                  include_index=False)
+    records_schema = records_schema.refine_from_dataframe(df, processing_instructions)
+    records_format = DelimitedRecordsFormat(variant='bluelabs',
+                                            hints={'compression': None})
+    out = benchmark(prep_df_for_csv_output,
+                    df,
+                    include_index=False,
+                    records_schema=records_schema,
+                    records_format=records_format,
+                    processing_instructions=processing_instructions)
+    assert len(out.index) == len(df.index)
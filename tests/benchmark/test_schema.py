@@ -0,0 +1,23 @@
+from records_mover.records.processing_instructions import ProcessingInstructions
+from records_mover.records.schema import RecordsSchema
+
+
+def test_records_schema_from_dataframe(benchmark, df):
+    processing_instructions = ProcessingInstructions()
+    records_schema = benchmark(RecordsSchema.from_dataframe,
+                               df, processing_instructions, include_index=False)
+    assert len(records_schema.fields) == len(df.columns)
+
+
+def test_records_schema_refine_from_dataframe(benchmark, df):
+    processing_instructions = ProcessingInstructions()
+
+    def setup():
+        # Refining records statistics on the schema, so start from a
+        # freshly inferred one each round
+        records_schema = RecordsSchema.from_dataframe(df, processing_instructions,
+                                                      include_index=False)
+        return (records_schema, df, processing_instructions), {}
+
+    refined = benchmark.pedantic(RecordsSchema.refine_from_dataframe, setup=setup, rounds=5)
+    assert len(refined.fields) == len(df.columns)
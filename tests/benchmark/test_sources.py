@@ -0,0 +1,23 @@
+from records_mover.records.processing_instructions import ProcessingInstructions
+from records_mover.records.records_format import DelimitedRecordsFormat
+from records_mover.records.schema import RecordsSchema
+from records_mover.records.sources.dataframes import DataframesRecordsSource
+
+
+def test_serialize_dfs(benchmark, df):
+    processing_instructions = ProcessingInstructions()
+    records_format = DelimitedRecordsFormat(variant='bluelabs',
+                                            hints={'compression': None})
+    # Supply the schema up front so that only serialization is measured
+    records_schema = RecordsSchema.from_dataframe(df, processing_instructions,
+                                                  include_index=False)
+    chunks = [df.iloc[i:i + 5000] for i in range(0, len(df.index), 5000)]
+
+    def serialize():
+        source = DataframesRecordsSource(dfs=iter(chunks), records_schema=records_schema)
+        with source.to_fileobjs_source(processing_instructions,
+                                       records_format_if_possible=records_format) \
+                as fileobjs_source:
+            return len(fileobjs_source.target_names_to_input_fileobjs)
+
+    assert benchmark.pedantic(serialize, rounds=3) == len(chunks)
@@ -0,0 +1,69 @@
+import io
+import time
+import pytest
+from mock import Mock, patch
+from records_mover.db.vertica.loader import VerticaLoader
+from records_mover.records.load_plan import RecordsLoadPlan
+from records_mover.records.processing_instructions import ProcessingInstructions
+from records_mover.records.records_format import DelimitedRecordsFormat
+
+
+# 4 files of 16MB each
+FILE = b'x' * (16 * 1024 * 1024)
+NUM_FILES = 4
+
+# Stand-in for the time Vertica spends on each CopyData message, so
+# these measure how well loads overlap that rather than the speed of
+# a real cluster.
+SECONDS_PER_MESSAGE = 0.0005
+
+
+class FakeRawConnection:
+    """Reads COPY data the way vertica_python does, counting the bytes
+    consumed rather than sending them anywhere."""
+
+    def __init__(self, bytes_consumed):
+        self.bytes_consumed = bytes_consumed
+
+    def cursor(self):
+        return self
+
+    def copy(self, sql, data, buffer_size=131072):
+        while True:
+            chunk = data.read(buffer_size)
+            if not chunk:
+                break
+            time.sleep(SECONDS_PER_MESSAGE)
+            self.bytes_consumed.append(len(chunk))
+
+    def close(self):
+        pass
+
+
+@pytest.mark.parametrize('streams,buffer_size', [(1, 128 * 1024), (4, 1024 * 1024)])
+def test_vertica_load(benchmark, streams, buffer_size):
+    urls = [f'file:///data{i}.csv' for i in range(NUM_FILES)]
+    mock_directory = Mock(name='directory')
+    mock_directory.manifest_entry_urls.return_value = urls
+    mock_directory.get_manifest.return_value = {
+        'entries': [{'url': url, 'mandatory': True, 'meta': {'content_length': len(FILE)}}
+                    for url in urls]
+    }
+    mock_url_resolver = Mock(name='url_resolver')
+    mock_url_resolver.file_url.return_value.open.side_effect = lambda: io.BytesIO(FILE)
+    loader = VerticaLoader(url_resolver=mock_url_resolver, db=None,
+                           db_engine=Mock(name='db_engine'))
+    bytes_consumed = []
+    loader.db_engine.raw_connection.side_effect = lambda: FakeRawConnection(bytes_consumed)
+    load_plan = RecordsLoadPlan(records_format=DelimitedRecordsFormat(variant='vertica'),
+                                processing_instructions=ProcessingInstructions())
+
+    def load():
+        bytes_consumed.clear()
+        loader.load('myschema', 'mytable', load_plan, mock_directory)
+        return sum(bytes_consumed)
+
+    with patch('records_mover.db.vertica.loader.vertica_import_sql'), \
+            patch.object(loader, 'max_concurrent_fileobj_loads', return_value=streams), \
+            patch('records_mover.db.vertica.loader.COPY_BUFFER_SIZE', buffer_size):
+        assert benchmark.pedantic(load, rounds=3) == len(FILE) * NUM_FILES
@@ -0,0 +1,71 @@
+import unittest
+
+from records_mover.db.bigquery.extract_job_config_options import extract_job_config
+from records_mover.records.unload_plan import RecordsUnloadPlan
+from records_mover.records.processing_instructions import ProcessingInstructions
+from records_mover.records.records_format import (
+    AvroRecordsFormat, DelimitedRecordsFormat, ParquetRecordsFormat
+)
+
+
+class TestExtractJobConfig(unittest.TestCase):
+    def setUp(self):
+        self.processing_instructions = ProcessingInstructions(fail_if_dont_understand=True,
+                                                              fail_if_cant_handle_hint=True)
+
+    def extract(self, records_format, unhandled_hints=None):
+        unload_plan = RecordsUnloadPlan(processing_instructions=self.processing_instructions,
+                                        records_format=records_format)
+        if unhandled_hints is None:
+            unhandled_hints = set()
+        return extract_job_config(unhandled_hints, unload_plan).to_api_repr()['extract']
+
+    def test_extract_job_config_avro(self):
+        self.assertEqual(self.extract(AvroRecordsFormat()),
+                         {'destinationFormat': 'AVRO', 'useAvroLogicalTypes': True})
+
+    def test_extract_job_config_parquet(self):
+        self.assertEqual(self.extract(ParquetRecordsFormat()),
+                         {'destinationFormat': 'PARQUET'})
+
+    def test_extract_job_config_bigquery_variant(self):
+        # BigQuery's date/time output can't be described with hints
+        with self.assertRaises(NotImplementedError):
+            self.extract(DelimitedRecordsFormat(variant='bigquery'))
+
+    def test_extract_job_config_bigquery_variant_ignoring_hints(self):
+        self.processing_instructions.fail_if_cant_handle_hint = False
+        records_format = DelimitedRecordsFormat(variant='bigquery')
+        unhandled_hints = set(records_format.hints.keys())
+        self.assertEqual(self.extract(records_format, unhandled_hints), {
+            'compression': 'GZIP',
+            'destinationFormat': 'CSV',
+            'fieldDelimiter': ',',
+            'printHeader': True,
+        })
+        self.assertEqual(unhandled_hints, set())
+
+    def test_extract_job_config_bigquery_variant_uncompressed_tab_no_header(self):
+        self.processing_instructions.fail_if_cant_handle_hint = False
+        records_format = DelimitedRecordsFormat(variant='bigquery',
+                                                hints={
+                                                    'compression': None,
+                                                    'field-delimiter': '\t',
+                                                    'header-row': False,
+                                                })
+        self.assertEqual(self.extract(records_format), {
+            'compression': 'NONE',
+            'destinationFormat': 'CSV',
+            'fieldDelimiter': '\t',
+            'printHeader': False,
+        })
+
+    def test_extract_job_config_bzip(self):
+        records_format = DelimitedRecordsFormat(variant='bigquery',
+                                                hints={'compression': 'BZIP'})
+        with self.assertRaises(NotImplementedError):
+            self.extract(records_format)
+
+    def test_extract_job_config_bluelabs(self):
+        with self.assertRaises(NotImplementedError):
+            self.extract(DelimitedRecordsFormat(variant='bluelabs'))
@@ -39,6 +39,19 @@ class TestRecordsCopy(unittest.TestCase):
                                     max_failure_rows=0)
         self.assertIs(out['format'], Format.avro)
 
+    def test_redshift_copy_options_zstd(self):
+        records_format = DelimitedRecordsFormat(variant='bluelabs',
+                                                hints={'compression': 'ZSTD'})
+        unhandled_hints = set(records_format.hints.keys())
+        out = redshift_copy_options(unhandled_hints,
+                                    records_format,
+                                    fail_if_cant_handle_hint=True,
+                                    fail_if_row_invalid=True,
+                                    max_failure_rows=0)
+        self.assertIsNone(out['compression'])
+        self.assertTrue(out['zstd'])
+        self.assertNotIn('compression', unhandled_hints)
+
     def test_redshift_copy_options_dateformat(self):
         # The records spec's date/time formats are based on Redshift's
         # spec originally, so it's expected that everything here would
@@ -1,7 +1,8 @@
 import unittest
 from typing import Set
 from records_mover.db.redshift.records_unload import redshift_unload_options
-from records_mover.records import DelimitedRecordsFormat
+from records_mover.records import DelimitedRecordsFormat, ParquetRecordsFormat
+from records_mover.records.processing_instructions import ProcessingInstructions
 from ...records.datetime_cases import (
     DATE_CASES, DATETIMETZ_CASES, DATETIME_CASES, TIMEONLY_CASES
 )
@@ -117,3 +118,48 @@ class TestRecordsUnload(unittest.TestCase):
                 else:
                     raise
             self.assertNotIn(dateformat, expected_failures)
+
+    def test_redshift_unload_options_zstd(self):
+        records_format = DelimitedRecordsFormat(variant='bluelabs',
+                                                hints={'compression': 'ZSTD'})
+        unhandled_hints = set(records_format.hints.keys())
+        out = redshift_unload_options(unhandled_hints,
+                                      records_format,
+                                      fail_if_cant_handle_hint=True)
+        self.assertTrue(out['zstd'])
+        self.assertNotIn('gzip', out)
+        self.assertNotIn('compression', unhandled_hints)
+
+    def test_redshift_unload_options_file_layout(self):
+        processing_instructions = ProcessingInstructions(max_file_size=100 * 1024 * 1024,
+                                                         parallel_export=False,
+                                                         partition_by=['a', 'b'],
+                                                         parquet_row_group_size=64 * 1024 * 1024)
+        out = redshift_unload_options(set(),
+                                      ParquetRecordsFormat(),
+                                      fail_if_cant_handle_hint=True,
+                                      processing_instructions=processing_instructions)
+        self.assertEqual(out['max_file_size'], 100 * 1024 * 1024)
+        self.assertFalse(out['parallel'])
+        self.assertEqual(out['partition_by'], ['a', 'b'])
+        self.assertEqual(out['row_group_size'], 64 * 1024 * 1024)
+
+    def test_redshift_unload_options_row_group_size_out_of_range(self):
+        for row_group_size in [1024 * 1024, 129 * 1024 * 1024]:
+            processing_instructions = ProcessingInstructions(parquet_row_group_size=row_group_size)
+            with self.assertRaises(ValueError):
+                redshift_unload_options(set(),
+                                        ParquetRecordsFormat(),
+                                        fail_if_cant_handle_hint=True,
+                                        processing_instructions=processing_instructions)
+
+    def test_redshift_unload_options_row_group_size_delimited(self):
+        processing_instructions = ProcessingInstructions(parquet_row_group_size=64 * 1024 * 1024)
+        records_format = DelimitedRecordsFormat(variant='bluelabs')
+        unhandled_hints = set(records_format.hints.keys())
+        out = redshift_unload_options(unhandled_hints,
+                                      records_format,
+                                      fail_if_cant_handle_hint=True,
+                                      processing_instructions=processing_instructions)
+        self.assertNotIn('row_group_size', out)
+        self.assertNotIn('parallel', out)
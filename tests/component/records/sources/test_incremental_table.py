@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+import sqlalchemy
+from records_mover.db.factory import db_driver
+from records_mover.records.existing_table_handling import ExistingTableHandling
+from records_mover.records.mover import move
+from records_mover.records.sources.incremental_table import IncrementalTableRecordsSource
+from records_mover.records.targets.table import TableRecordsTarget
+from records_mover.records.watermark import WatermarkStore
+from mock import Mock
+
+
+class TestIncrementalTable(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.tempdir.name, 'mover.sqlite')
+        self.db_engine = sqlalchemy.create_engine(f'sqlite:///{db_path}')
+        # SQLite locks the whole file while rows are being read out of
+        # it, so copy them into a different one.
+        target_db_path = os.path.join(self.tempdir.name, 'target.sqlite')
+        self.target_db_engine = sqlalchemy.create_engine(f'sqlite:///{target_db_path}')
+        self.watermark_store = WatermarkStore(os.path.join(self.tempdir.name, 'watermarks.json'))
+        self.add_rows([(1, 'a'), (2, 'b'), (None, 'never')])
+
+    def tearDown(self):
+        self.db_engine.dispose()
+        self.target_db_engine.dispose()
+        self.tempdir.cleanup()
+
+    def add_rows(self, rows):
+        with self.db_engine.begin() as conn:
+            conn.execute(sqlalchemy.text('CREATE TABLE IF NOT EXISTS main.events '
+                                         '(id INTEGER, name TEXT)'))
+            for row in rows:
+                conn.execute(sqlalchemy.text('INSERT INTO main.events VALUES (:id, :name)'),
+                             {'id': row[0], 'name': row[1]})
+
+    def move_new_rows(self):
+        source = IncrementalTableRecordsSource(schema_name='main',
+                                               table_name='events',
+                                               driver=db_driver(db=None,
+                                                                db_engine=self.db_engine),
+                                               url_resolver=Mock(name='url_resolver'),
+                                               watermark_column='id',
+                                               watermark_store=self.watermark_store)
+        target = TableRecordsTarget(schema_name='main',
+                                    table_name='events_copy',
+                                    db_engine=self.target_db_engine,
+                                    db_driver=db_driver,
+                                    existing_table_handling=ExistingTableHandling.APPEND)
+        return move(source, target)
+
+    def copied_rows(self):
+        with self.target_db_engine.connect() as conn:
+            return conn.execute(sqlalchemy.text('SELECT id, name FROM main.events_copy '
+                                                'ORDER BY id')).fetchall()
+
+    def test_moves_only_new_rows(self):
+        result = self.move_new_rows()
+        self.assertEqual(2, result.high_watermark)
+        self.assertEqual(2, result.to_data()['high_watermark'])
+        self.assertEqual([(1, 'a'), (2, 'b')], self.copied_rows())
+
+        self.add_rows([(3, 'c')])
+        result = self.move_new_rows()
+        self.assertEqual(3, result.high_watermark)
+        self.assertEqual([(1, 'a'), (2, 'b'), (3, 'c')], self.copied_rows())
+
+        result = self.move_new_rows()
+        self.assertEqual(3, result.high_watermark)
+        self.assertEqual(3, self.watermark_store.get('main.events.id'))
+        self.assertEqual([(1, 'a'), (2, 'b'), (3, 'c')], self.copied_rows())
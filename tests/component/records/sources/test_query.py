@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+import sqlalchemy
+from mock import Mock
+from records_mover.db.factory import db_driver
+from records_mover.records.existing_table_handling import ExistingTableHandling
+from records_mover.records.mover import move
+from records_mover.records.sources.query import QueryRecordsSource
+from records_mover.records.targets.table import TableRecordsTarget
+
+
+class TestQuery(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.tempdir.name, 'mover.sqlite')
+        self.db_engine = sqlalchemy.create_engine(f'sqlite:///{db_path}')
+        # SQLite locks the whole file while rows are being read out of
+        # it, so copy them into a different one.
+        target_db_path = os.path.join(self.tempdir.name, 'target.sqlite')
+        self.target_db_engine = sqlalchemy.create_engine(f'sqlite:///{target_db_path}')
+        with self.db_engine.begin() as conn:
+            conn.execute(sqlalchemy.text('CREATE TABLE main.events (id INTEGER, name TEXT)'))
+            conn.execute(sqlalchemy.text("INSERT INTO main.events VALUES "
+                                         "(1, 'a'), (2, 'b'), (3, 'c')"))
+
+    def tearDown(self):
+        self.db_engine.dispose()
+        self.target_db_engine.dispose()
+        self.tempdir.cleanup()
+
+    def test_move_query_results(self):
+        source = QueryRecordsSource(sql="SELECT name, id * 10 AS tens FROM main.events "
+                                        "WHERE id >= 2;",
+                                    driver=db_driver(db=None, db_engine=self.db_engine),
+                                    url_resolver=Mock(name='url_resolver'))
+        self.assertEqual(['name', 'tens'],
+                         [field.name for field in source.pull_records_schema().fields])
+        target = TableRecordsTarget(schema_name='main',
+                                    table_name='events_copy',
+                                    db_engine=self.target_db_engine,
+                                    db_driver=db_driver,
+                                    existing_table_handling=ExistingTableHandling.APPEND)
+        move(source, target)
+        with self.target_db_engine.connect() as conn:
+            rows = conn.execute(sqlalchemy.text('SELECT name, tens FROM main.events_copy '
+                                                'ORDER BY name')).fetchall()
+        self.assertEqual([('b', '20'), ('c', '30')], rows)
@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+import sqlalchemy
+from records_mover.db.factory import db_driver
+from records_mover.records.existing_table_handling import ExistingTableHandling
+from records_mover.records.mover import move
+from records_mover.records.sources.dataframes import DataframesRecordsSource
+from records_mover.records.targets.table import TableRecordsTarget
+
+
+class TestConnectionReuse(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.tempdir.name, 'mover.sqlite')
+        # SQLAlchemy defaults to NullPool for file-based SQLite; use a
+        # real pool as server databases would
+        self.db_engine = sqlalchemy.create_engine(f'sqlite:///{db_path}',
+                                                  poolclass=sqlalchemy.pool.QueuePool)
+        self.checkouts = 0
+        self.connects = 0
+
+        def count_checkout(dbapi_conn, connection_record, connection_proxy):
+            self.checkouts += 1
+
+        def count_connect(dbapi_conn, connection_record):
+            self.connects += 1
+
+        sqlalchemy.event.listen(self.db_engine, 'checkout', count_checkout)
+        sqlalchemy.event.listen(self.db_engine, 'connect', count_connect)
+
+    def tearDown(self):
+        self.db_engine.dispose()
+        self.tempdir.cleanup()
+
+    def move_df(self, existing_table_handling: ExistingTableHandling) -> int:
+        df = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+        source = DataframesRecordsSource(dfs=[df])
+        target = TableRecordsTarget(schema_name='main',
+                                    table_name='mytable',
+                                    db_engine=self.db_engine,
+                                    db_driver=db_driver,
+                                    existing_table_handling=existing_table_handling)
+        move(source, target)
+        with self.db_engine.connect() as conn:
+            return conn.execute(sqlalchemy.text('SELECT COUNT(*) FROM main.mytable')).scalar()
+
+    def test_move_uses_single_connection(self):
+        self.assertEqual(3, self.move_df(ExistingTableHandling.DELETE_AND_OVERWRITE))
+        # one checkout for the move itself, one for the verification
+        # query above
+        self.assertEqual(2, self.checkouts)
+
+    def test_repeated_moves_reuse_pooled_connection(self):
+        self.move_df(ExistingTableHandling.DELETE_AND_OVERWRITE)
+        self.assertEqual(3, self.move_df(ExistingTableHandling.DROP_AND_RECREATE))
+        self.assertEqual(6, self.move_df(ExistingTableHandling.APPEND))
+        self.assertEqual(6, self.checkouts)
+        self.assertEqual(1, self.connects)
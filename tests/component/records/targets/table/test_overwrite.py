@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+import sqlalchemy
+from records_mover.db.factory import db_driver
+from records_mover.records.existing_table_handling import ExistingTableHandling
+from records_mover.records.mover import move
+from records_mover.records.sources.dataframes import DataframesRecordsSource
+from records_mover.records.targets.table import TableRecordsTarget
+
+
+class TestOverwrite(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.tempdir.name, 'mover.sqlite')
+        self.db_engine = sqlalchemy.create_engine(f'sqlite:///{db_path}')
+        with self.db_engine.begin() as conn:
+            conn.execute(sqlalchemy.text('CREATE TABLE main.mytable (a INTEGER NOT NULL, b TEXT)'))
+            conn.execute(sqlalchemy.text("INSERT INTO main.mytable VALUES (0, 'old')"))
+
+    def tearDown(self):
+        self.db_engine.dispose()
+        self.tempdir.cleanup()
+
+    def move_df(self, existing_table_handling: ExistingTableHandling, **kwargs) -> None:
+        df = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+        source = DataframesRecordsSource(dfs=[df])
+        target = TableRecordsTarget(schema_name='main',
+                                    table_name='mytable',
+                                    db_engine=self.db_engine,
+                                    db_driver=db_driver,
+                                    existing_table_handling=existing_table_handling,
+                                    **kwargs)
+        move(source, target)
+
+    def rows(self):
+        with self.db_engine.connect() as conn:
+            return conn.execute(sqlalchemy.text('SELECT a, b FROM main.mytable '
+                                                'ORDER BY a')).fetchall()
+
+    def table_names(self):
+        return sorted(sqlalchemy.inspect(self.db_engine).get_table_names(schema='main'))
+
+    def test_truncate_and_overwrite(self):
+        self.move_df(ExistingTableHandling.TRUNCATE_AND_OVERWRITE)
+        self.assertEqual([(1, 'x'), (2, 'y'), (3, 'z')], self.rows())
+
+    def test_stage_and_swap(self):
+        self.move_df(ExistingTableHandling.STAGE_AND_SWAP)
+        self.assertEqual([(1, 'x'), (2, 'y'), (3, 'z')], self.rows())
+        self.assertEqual(['mytable'], self.table_names())
+        columns = sqlalchemy.inspect(self.db_engine).get_columns('mytable', schema='main')
+        self.assertEqual([('a', False), ('b', True)],
+                         [(column['name'], column['nullable']) for column in columns])
+
+    def test_stage_and_swap_load_failure_keeps_old_table(self):
+        df = pd.DataFrame({'a': [1, None], 'b': ['x', 'y']})
+        source = DataframesRecordsSource(dfs=[df])
+        target = TableRecordsTarget(schema_name='main',
+                                    table_name='mytable',
+                                    db_engine=self.db_engine,
+                                    db_driver=db_driver,
+                                    existing_table_handling=ExistingTableHandling.STAGE_AND_SWAP)
+        with self.assertRaises(sqlalchemy.exc.IntegrityError):
+            move(source, target)
+        self.assertEqual([(0, 'old')], self.rows())
+        self.assertEqual(['mytable'], self.table_names())
+
+    def test_upsert(self):
+        with self.db_engine.begin() as conn:
+            conn.execute(sqlalchemy.text("INSERT INTO main.mytable VALUES (2, 'old')"))
+        self.move_df(ExistingTableHandling.UPSERT, upsert_key=['a'])
+        self.assertEqual([(0, 'old'), (1, 'x'), (2, 'y'), (3, 'z')], self.rows())
+        self.assertEqual(['mytable'], self.table_names())
@@ -10,6 +10,11 @@ class TestDataUrlTarget(unittest.TestCase):
         target = DataUrlTarget(url, records_format=None)
         self.assertEqual(target.records_format.hints['compression'], 'GZIP')
 
+    def test_zstd_compression_inferred_no_records_format(self):
+        url = FilesystemFileUrl('file:///foo/bar/baz.csv.zst')
+        target = DataUrlTarget(url, records_format=None)
+        self.assertEqual(target.records_format.hints['compression'], 'ZSTD')
+
     def test_no_compression_inferred_no_records_format(self):
         url = FilesystemFileUrl('file:///foo/bar/baz.csv')
         target = DataUrlTarget(url, records_format=None)
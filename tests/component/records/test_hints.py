@@ -4,6 +4,7 @@ from records_mover.records.delimited.sniff import (
 import io
 import gzip
 import bz2
+import zstandard
 import unittest
 import json
 import os
@@ -133,6 +134,28 @@ class TestHints(unittest.TestCase):
                     if str(e) != config.get('raises'):
                         raise
 
+    def test_sniff_hints_zstd_sniffed(self):
+        for basename in self.sample_file_basenames():
+            csv_filename = f'{self.hint_sniffing_dir}/{basename}.csv'
+            config_filename = f'{self.hint_sniffing_dir}/{basename}.json'
+            with open(config_filename, 'r') as config_fileobj:
+                config = json.load(config_fileobj)
+            required_hints = config['required']
+            initial_hints = config['initial_hints']
+            required_hints['compression'] = 'ZSTD'
+
+            with open(csv_filename, 'rb') as uncompressed_fileobj:
+                zstd_data = zstandard.compress(uncompressed_fileobj.read())
+                fileobj = io.BytesIO(zstd_data)
+                try:
+                    hints = sniff_hints(fileobj, initial_hints=initial_hints)
+                    self.assertTrue(set(required_hints.items()).issubset(set(hints.items())),
+                                    f"Expected at least these hints while reading {basename}: "
+                                    f"{required_hints}, found these hints: {hints}")
+                except Exception as e:
+                    if str(e) != config.get('raises'):
+                        raise
+
     def test_sniff_hints_from_fileobjs_nonseekable(self):
         csv = 'Liberté,égalité,fraternité\n"“a”",2,3\n'
         csv_bytes = csv.encode('utf-8', errors='replace')
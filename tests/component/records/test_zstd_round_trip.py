@@ -0,0 +1,64 @@
+from records_mover.records.processing_instructions import ProcessingInstructions
+from records_mover.records.records_format import DelimitedRecordsFormat
+from records_mover.records.sources.dataframes import DataframesRecordsSource
+from records_mover.records.sources.fileobjs import FileobjsSource
+from records_mover.records.targets.fileobj import FileobjTarget
+from records_mover.records.delimited.sniff import sniff_compression_hint
+from records_mover.records.pandas.read_csv_options import pandas_read_csv_options
+from records_mover.records.pandas.to_csv_options import pandas_to_csv_options
+from mock import MagicMock, patch
+import pandas as pd
+import zstandard
+import unittest
+import io
+
+
+class TestZstdRoundTrip(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'id': [1, 2, 3],
+            'name': ['a', 'b, with comma', 'c'],
+        })
+        self.processing_instructions = ProcessingInstructions()
+
+    def write_zstd_csv(self, variant):
+        records_format = DelimitedRecordsFormat(variant=variant,
+                                                hints={'compression': 'ZSTD'})
+        fileobj = io.BytesIO()
+        target = FileobjTarget(fileobj=fileobj, records_format=records_format)
+        dfs_source = DataframesRecordsSource(dfs=[self.df])
+        out = target.move_from_dataframes_source(dfs_source, self.processing_instructions)
+        self.assertEqual(out.move_count, 3)
+        return fileobj.getvalue()
+
+    def test_round_trip(self):
+        compressed = self.write_zstd_csv('csv')
+        self.assertEqual(sniff_compression_hint(io.BytesIO(compressed)), 'ZSTD')
+        self.assertEqual(zstandard.ZstdDecompressor().decompressobj().decompress(compressed),
+                         b'id,name\n1,a\n2,"b, with comma"\n3,c\n')
+
+        with FileobjsSource.infer_if_needed(
+                target_names_to_input_fileobjs={'data.csv.zst': io.BytesIO(compressed)},
+                processing_instructions=self.processing_instructions,
+                records_format=None,
+                records_schema=None,
+                initial_hints={}) as source:
+            self.assertEqual(source.records_format.hints['compression'], 'ZSTD')
+            with source.to_dataframes_source(self.processing_instructions) as dfs_source:
+                df = pd.concat(list(dfs_source.dfs))
+        pd.testing.assert_frame_equal(df.reset_index(drop=True), self.df)
+
+    @patch('records_mover.records.pandas.to_csv_options.pd')
+    @patch('records_mover.records.pandas.read_csv_options.pd')
+    def test_old_pandas(self, mock_read_pd, mock_to_pd):
+        mock_read_pd.__version__ = '1.3.5'
+        mock_to_pd.__version__ = '1.3.5'
+        records_format = DelimitedRecordsFormat(variant='csv', hints={'compression': 'ZSTD'})
+        with self.assertRaisesRegex(NotImplementedError, 'compression'):
+            pandas_to_csv_options(records_format, set(records_format.hints),
+                                  self.processing_instructions)
+        with self.assertRaisesRegex(NotImplementedError, 'compression'):
+            pandas_read_csv_options(records_format,
+                                    MagicMock(name='records_schema'),
+                                    set(records_format.hints),
+                                    self.processing_instructions)
@@ -25,3 +25,25 @@ class TestBaseDirectoryUrl(unittest.TestCase):
         mock_directory_url = MockDirectoryUrl(mock_url)
         self.assertEqual(set(mock_directory_url.files_and_directories_in_directory()),
                          {mock_file_1, mock_file_2, mock_dir_1, mock_dir_2})
+
+    def test_copy_to(self):
+        mock_files = [Mock(name=f'file_{i}') for i in range(3)]
+        for i, mock_file in enumerate(mock_files):
+            mock_file.is_directory.return_value = False
+            mock_file.filename.return_value = f'part-{i}'
+        mock_other_loc = Mock(name='other_loc')
+
+        class MockDirectoryUrl(BaseDirectoryUrl):
+            def __init__(self, url):
+                pass
+
+            def files_and_directories_in_directory(self):
+                return mock_files
+
+        out = MockDirectoryUrl('gs://bucket/dir/').copy_to(mock_other_loc)
+        self.assertEqual(out, mock_other_loc)
+        for mock_file in mock_files:
+            mock_file.copy_to.assert_called_with(mock_other_loc.file_in_this_directory.return_value)
+        self.assertEqual(sorted(c[0][0] for c in
+                                mock_other_loc.file_in_this_directory.call_args_list),
+                         ['part-0', 'part-1', 'part-2'])
@@ -0,0 +1,111 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from records_mover.url.http import HttpFileUrl
+import io
+import re
+import threading
+import unittest
+
+
+CONTENT = bytes(range(256)) * 1000
+
+
+class RangeRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def send_common_headers(self, length):
+        if self.server.accept_ranges:
+            self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('Content-Length', str(length))
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_common_headers(len(CONTENT))
+        self.end_headers()
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.gets += 1
+        range_header = self.headers.get('Range')
+        if range_header is None or not self.server.accept_ranges:
+            self.send_response(200)
+            self.send_common_headers(len(CONTENT))
+            self.end_headers()
+            self.wfile.write(CONTENT)
+            return
+        start, end = map(int, re.match(r'bytes=(\d+)-(\d+)', range_header).groups())
+        body = CONTENT[start:end + 1]
+        self.send_response(206)
+        self.send_common_headers(len(body))
+        self.send_header('Content-Range', f'bytes {start}-{end}/{len(CONTENT)}')
+        self.end_headers()
+        with self.server.lock:
+            drop = self.server.drops_remaining > 0
+            if drop:
+                self.server.drops_remaining -= 1
+        if drop:
+            # Send half the part and hang up
+            self.wfile.write(body[:len(body) // 2])
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+
+class TestHttpFileUrlRangedDownload(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), RangeRequestHandler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.connections = 0
+        self.server.gets = 0
+        self.server.accept_ranges = True
+        self.server.drops_remaining = 0
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        host, port = self.server.server_address
+        self.http_file_url = HttpFileUrl(f'http://{host}:{port}/data.bin')
+        self.http_file_url.ranged_download_part_size = 10000
+        self.http_file_url.ranged_download_depth = 3
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_open_downloads_in_parts_over_kept_alive_connections(self):
+        with self.http_file_url.open() as f:
+            self.assertIsInstance(f, io.BufferedReader)
+            self.assertEqual(f.read(), CONTENT)
+        self.assertEqual(self.server.gets, 26)
+        # One for the HEAD, plus one per concurrent worker
+        self.assertLessEqual(self.server.connections, 1 + 3)
+
+    def test_open_resumes_dropped_parts(self):
+        self.server.drops_remaining = 2
+        with self.http_file_url.open() as f:
+            self.assertEqual(f.read(), CONTENT)
+        self.assertEqual(self.server.gets, 26 + 2)
+
+    def test_open_seek(self):
+        with self.http_file_url.open() as f:
+            f.seek(123456)
+            self.assertEqual(f.read(10), CONTENT[123456:123466])
+
+    def test_open_without_range_support(self):
+        self.server.accept_ranges = False
+        with self.http_file_url.open() as f:
+            self.assertNotIsInstance(f, io.BufferedReader)
+            self.assertEqual(f.read(), CONTENT)
+        self.assertEqual(self.server.gets, 1)
+
+    def test_open_small_file(self):
+        self.http_file_url.ranged_download_part_size = len(CONTENT)
+        with self.http_file_url.open() as f:
+            self.assertEqual(f.read(), CONTENT)
+        self.assertEqual(self.server.gets, 1)
@@ -20,7 +20,7 @@ class TestCredsViaEnv(unittest.TestCase):
                                scopes=('https://www.googleapis.com/auth/spreadsheets',))
         self.assertEqual(out, mock_Credentials.from_service_account_info.return_value)
 
-    @patch('records_mover.creds.creds_via_env.db')
+    @patch('db_facts.db')
     def test_db_facts(self, mock_db):
         creds_via_env = CredsViaEnv(default_db_creds_name=None,
                                     default_aws_creds_name=None,
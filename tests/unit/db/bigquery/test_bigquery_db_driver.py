@@ -18,6 +18,20 @@ class TestBigQueryDBDriver(unittest.TestCase):
                                                    db_engine=self.mock_db_engine,
                                                    url_resolver=self.mock_url_resolver)
 
+    def test_columns_from_cursor_description(self):
+        description = [
+            ('id', 'INTEGER', None, None, None, None, True),
+            ('amount', 'NUMERIC', None, None, None, None, True),
+            ('created', 'TIMESTAMP', None, None, None, None, True),
+            ('location', 'GEOGRAPHY', None, None, None, None, True),
+        ]
+        out = self.bigquery_db_driver.columns_from_cursor_description(description)
+        self.assertEqual(['id', 'amount', 'created', 'location'], [c.name for c in out])
+        self.assertIsInstance(out[0].type, sqlalchemy.types.Integer)
+        self.assertIsInstance(out[1].type, sqlalchemy.types.Numeric)
+        self.assertIsInstance(out[2].type, sqlalchemy.types.TIMESTAMP)
+        self.assertIsInstance(out[3].type, sqlalchemy.types.String)
+
     def test_load_implemented(self):
         mock_schema = Mock(name='mock_schema')
         mock_table = Mock(name='mock_table')
@@ -32,6 +46,14 @@ class TestBigQueryDBDriver(unittest.TestCase):
                  directory=mock_directory)
         self.assertEqual(ret, self.mock_BigQueryLoader.return_value.load.return_value)
 
+    def test_loader_from_dataframes(self):
+        self.assertEqual(self.bigquery_db_driver.loader_from_dataframes(),
+                         self.mock_BigQueryLoader.return_value)
+
+    @patch.dict('sys.modules', {'pyarrow': None})
+    def test_loader_from_dataframes_no_pyarrow(self):
+        self.assertIsNone(self.bigquery_db_driver.loader_from_dataframes())
+
     def test_can_load_this_format(self):
         mock_source_records_format = Mock(name='source_records_format', spec=DelimitedRecordsFormat)
         out = self.bigquery_db_driver.loader_from_fileobj().\
@@ -121,3 +143,13 @@ class TestBigQueryDBDriver(unittest.TestCase):
         max_value = 200
         out = self.bigquery_db_driver.type_for_integer(min_value, max_value)
         self.assertEqual(type(out), sqlalchemy.types.Numeric)
+
+    def test_replace_table(self):
+        self.mock_db_engine.dialect.preparer.return_value.quote = lambda s: f"`{s}`"
+        mock_db_conn = self.mock_db_engine.connect.return_value
+        self.bigquery_db_driver.replace_table('mydataset', 'mytable', 'mytable_staging')
+        sqls = [str(call.args[0]) for call in mock_db_conn.execute.call_args_list]
+        self.assertEqual(sqls, [
+            'CREATE OR REPLACE TABLE `mydataset`.`mytable` COPY `mydataset`.`mytable_staging`',
+            'DROP TABLE `mydataset`.`mytable_staging`',
+        ])
@@ -279,6 +279,76 @@ class TestBigQueryLoader(unittest.TestCase):
 
         self.assertEqual(out, mock_job.output_rows)
 
+    @patch('records_mover.db.bigquery.loader.load_job_config')
+    def test_load_with_fileobj_fallback_sharded(self, mock_load_job_config):
+        mock_db = Mock(name='mock_db')
+        mock_url_resolver = MagicMock(name='mock_url_resolver')
+        big_query_loader = BigQueryLoader(db=None, url_resolver=mock_url_resolver,
+                                          gcs_temp_base_loc=None, db_conn=mock_db)
+        mock_load_plan = Mock(name='mock_load_plan')
+        mock_load_plan.records_format = Mock(name='records_format', spec=DelimitedRecordsFormat)
+        mock_load_plan.records_format.hints = {}
+
+        mock_connection = mock_db.engine.raw_connection.return_value.connection
+        mock_client = mock_connection._client
+        mock_client.get_table.return_value.schema = []
+        mock_job = mock_client.load_table_from_file.return_value
+        mock_job.output_rows = 42
+
+        mock_directory = Mock(name='directory')
+        mock_directory.scheme = 's3'
+        urls = [f's3://bucket/dir/part-{i}.avro' for i in range(6)]
+        mock_directory.manifest_entry_urls.return_value = urls
+
+        out = big_query_loader.load(schema='my_project.my_dataset',
+                                    table='mytable',
+                                    load_plan=mock_load_plan,
+                                    directory=mock_directory)
+        self.assertEqual(sorted(c[0][0] for c in mock_url_resolver.file_url.call_args_list),
+                         urls)
+        self.assertEqual(mock_client.load_table_from_file.call_count, 6)
+        # Every file lands in the same staging table, which is then
+        # appended to the target table in one go
+        staging_table_names = {c[0][1] for c in mock_client.load_table_from_file.call_args_list}
+        self.assertEqual(len(staging_table_names), 1)
+        staging_table_name, = staging_table_names
+        self.assertTrue(staging_table_name.startswith('my_project.my_dataset.mytable_staging_'))
+        self.assertEqual(mock_client.copy_table.call_args[0],
+                         (staging_table_name, 'my_project.my_dataset.mytable'))
+        mock_client.delete_table.assert_called_with(staging_table_name, not_found_ok=True)
+        self.assertEqual(out, 6 * 42)
+
+    @patch('records_mover.db.bigquery.loader.load_job_config')
+    def test_load_with_fileobj_fallback_sharded_failure(self, mock_load_job_config):
+        mock_db = Mock(name='mock_db')
+        mock_url_resolver = MagicMock(name='mock_url_resolver')
+        big_query_loader = BigQueryLoader(db=None, url_resolver=mock_url_resolver,
+                                          gcs_temp_base_loc=None, db_conn=mock_db)
+        mock_load_plan = Mock(name='mock_load_plan')
+        mock_load_plan.records_format = Mock(name='records_format', spec=DelimitedRecordsFormat)
+        mock_load_plan.records_format.hints = {}
+
+        mock_connection = mock_db.engine.raw_connection.return_value.connection
+        mock_client = mock_connection._client
+        mock_client.get_table.return_value.schema = []
+        mock_job = mock_client.load_table_from_file.return_value
+        mock_job.result.side_effect = [None, ValueError('bad file')]
+        mock_job.output_rows = 42
+
+        mock_directory = Mock(name='directory')
+        mock_directory.scheme = 's3'
+        mock_directory.manifest_entry_urls.return_value = ['s3://bucket/dir/part-0.avro',
+                                                           's3://bucket/dir/part-1.avro']
+
+        with self.assertRaises(ValueError):
+            big_query_loader.load(schema='my_project.my_dataset',
+                                  table='mytable',
+                                  load_plan=mock_load_plan,
+                                  directory=mock_directory)
+        # Nothing reaches the target table
+        mock_client.copy_table.assert_not_called()
+        mock_client.delete_table.assert_called_once()
+
     def test_known_supported_records_formats_for_load(self):
         mock_db = Mock(name='db')
         mock_url_resolver = Mock(name='url_resolver')
@@ -348,3 +418,80 @@ class TestBigQueryLoader(unittest.TestCase):
         bigquery_loader = BigQueryLoader(db=None, url_resolver=mock_url_resolver,
                                          gcs_temp_base_loc=mock_gcs_temp_base_loc, db_conn=mock_db)
         self.assertEqual('gs', bigquery_loader.best_scheme_to_load_from())
+
+    def test_load_from_dataframes(self):
+        import pyarrow
+
+        mock_db = Mock(name='mock_db')
+        mock_url_resolver = MagicMock(name='mock_url_resolver')
+        big_query_loader = BigQueryLoader(db=None, url_resolver=mock_url_resolver,
+                                          gcs_temp_base_loc=None, db_conn=mock_db)
+        mock_load_plan = Mock(name='mock_load_plan')
+        mock_records_schema = Mock(name='records_schema')
+        mock_records_schema.dataframe_to_arrow_table.return_value =\
+            pyarrow.table({'a': [1, 2, 3]})
+        mock_df_1 = Mock(name='df_1')
+        mock_df_2 = Mock(name='df_2')
+
+        mock_connection = mock_db.engine.raw_connection.return_value.connection
+        mock_client = mock_connection._client
+        mock_client.get_table.return_value.location = 'some-location'
+        mock_client.get_table.return_value.schema = []
+        mock_client.load_table_from_file.return_value.output_rows = 3
+        out = big_query_loader.load_from_dataframes(schema='my_project.my_dataset',
+                                                    table='mytable',
+                                                    load_plan=mock_load_plan,
+                                                    records_schema=mock_records_schema,
+                                                    dfs=[mock_df_1, mock_df_2],
+                                                    include_index=False)
+        self.assertEqual(out, 6)
+        mock_records_schema.dataframe_to_arrow_table.\
+            assert_any_call(mock_df_1, include_index=False)
+        mock_records_schema.dataframe_to_arrow_table.\
+            assert_any_call(mock_df_2, include_index=False)
+        staging_table = mock_client.create_table.call_args[0][0]
+        staging_table_name = f"{staging_table.project}.{staging_table.dataset_id}." +\
+            staging_table.table_id
+        self.assertTrue(staging_table_name.startswith('my_project.my_dataset.mytable_staging_'))
+        self.assertIsNotNone(staging_table.expires)
+        self.assertEqual(mock_client.load_table_from_file.call_count, 2)
+        fileobj, destination = mock_client.load_table_from_file.call_args[0]
+        self.assertEqual(destination, staging_table_name)
+        self.assertEqual(fileobj.read(4), b'PAR1')
+        job_config = mock_client.load_table_from_file.call_args[1]['job_config']
+        self.assertEqual(job_config.source_format, 'PARQUET')
+        mock_client.copy_table.assert_called_once()
+        self.assertEqual(mock_client.copy_table.call_args[0],
+                         (staging_table_name, 'my_project.my_dataset.mytable'))
+        self.assertEqual(mock_client.copy_table.call_args[1]['job_config'].write_disposition,
+                         'WRITE_APPEND')
+        mock_client.delete_table.assert_called_with(staging_table_name, not_found_ok=True)
+
+    def test_load_from_dataframes_error(self):
+        import pyarrow
+
+        mock_db = Mock(name='mock_db')
+        mock_url_resolver = MagicMock(name='mock_url_resolver')
+        big_query_loader = BigQueryLoader(db=None, url_resolver=mock_url_resolver,
+                                          gcs_temp_base_loc=None, db_conn=mock_db)
+        mock_load_plan = Mock(name='mock_load_plan')
+        mock_records_schema = Mock(name='records_schema')
+        mock_records_schema.dataframe_to_arrow_table.return_value =\
+            pyarrow.table({'a': [1, 2, 3]})
+
+        mock_connection = mock_db.engine.raw_connection.return_value.connection
+        mock_client = mock_connection._client
+        mock_client.project = 'my_project'
+        mock_client.get_table.return_value.schema = []
+        mock_client.load_table_from_file.return_value.result.side_effect = ValueError('bad')
+        with self.assertRaises(ValueError):
+            big_query_loader.load_from_dataframes(schema='my_dataset',
+                                                  table='mytable',
+                                                  load_plan=mock_load_plan,
+                                                  records_schema=mock_records_schema,
+                                                  dfs=[Mock(name='df')],
+                                                  include_index=False)
+        mock_client.copy_table.assert_not_called()
+        mock_client.delete_table.assert_called_once()
+        self.assertTrue(mock_client.delete_table.call_args[0][0].
+                        startswith('my_project.my_dataset.mytable_staging_'))
@@ -1,10 +1,18 @@
+import tempfile
 import unittest
+from urllib.parse import urlparse, unquote
+from typing import List
+from google.api_core.exceptions import BadRequest
 
 from records_mover.db.bigquery.unloader import BigQueryUnloader
 from records_mover.records.records_format import (
-    DelimitedRecordsFormat, AvroRecordsFormat
+    DelimitedRecordsFormat, AvroRecordsFormat, ParquetRecordsFormat
 )
 from records_mover.db.errors import NoTemporaryBucketConfiguration
+from records_mover.records.processing_instructions import ProcessingInstructions
+from records_mover.records.unload_plan import RecordsUnloadPlan
+from records_mover.records.records_directory import RecordsDirectory
+from records_mover.url.filesystem import FilesystemDirectoryUrl
 from mock import MagicMock, Mock
 from unittest.mock import ANY
 
@@ -33,6 +41,8 @@ class TestBigQueryUnloader(unittest.TestCase):
             db_conn=mock_db)
         delimited_format = DelimitedRecordsFormat()
         self.assertFalse(big_query_unloader.can_unload_format(delimited_format))
+        bigquery_format = DelimitedRecordsFormat(variant='bigquery')
+        self.assertFalse(big_query_unloader.can_unload_format(bigquery_format))
 
     def test_can_unload_to_scheme_gs_true(self):
         mock_db = Mock(name='mock_db')
@@ -76,10 +86,11 @@ class TestBigQueryUnloader(unittest.TestCase):
             url_resolver=mock_url_resolver,
             gcs_temp_base_loc=mock_gcs_temp_base_loc,
             db_conn=mock_db)
-        self.assertEqual([type(format)
-                          for format in
-                          big_query_unloader.known_supported_records_formats_for_unload()],
-                         [AvroRecordsFormat])
+        self.assertEqual(big_query_unloader.known_supported_records_formats_for_unload(),
+                         [AvroRecordsFormat(),
+                          ParquetRecordsFormat()])
+        for records_format in big_query_unloader.known_supported_records_formats_for_unload():
+            self.assertTrue(big_query_unloader.can_unload_format(records_format))
 
     def test_temporary_unloadable_directory_loc_raises(self):
         mock_db = Mock(name='mock_db')
@@ -121,6 +132,7 @@ class TestBigQueryUnloader(unittest.TestCase):
         mock_table = 'mytable'
         mock_unload_plan = Mock(name='unload_plan')
         mock_unload_plan.records_format = AvroRecordsFormat()
+        mock_unload_plan.where = None
         mock_directory = Mock(name='directory')
         mock_directory.scheme = 'gs'
         big_query_unloader.unload(schema=mock_schema,
@@ -135,4 +147,109 @@ class TestBigQueryUnloader(unittest.TestCase):
         mock_client.extract_table.assert_called_with('myproject.mydataset.mytable',
                                                      mock_url,
                                                      job_config=ANY)
-        mock_directory.save_preliminary_manifest.assert_called_with()
+        mock_directory.loc.files_matching_prefix.assert_not_called()
+        mock_directory.save_preliminary_manifest.assert_called_with({
+            mock_url: {
+                'content_length': mock_destination_uri.size.return_value
+            }
+        })
+
+    def test_unload_query(self):
+        mock_db = Mock(name='mock_db')
+        big_query_unloader = BigQueryUnloader(
+            db=None,
+            url_resolver=MagicMock(name='mock_url_resolver'),
+            gcs_temp_base_loc=MagicMock(name='gcs_temp_base_loc'),
+            db_conn=mock_db)
+        mock_unload_plan = Mock(name='unload_plan')
+        mock_unload_plan.records_format = AvroRecordsFormat()
+        mock_directory = Mock(name='directory')
+        mock_directory.scheme = 'gs'
+        mock_directory.loc.files_matching_prefix.return_value = []
+        big_query_unloader.unload_query(query='SELECT a FROM mydataset.mytable WHERE b > 3',
+                                        unload_plan=mock_unload_plan,
+                                        directory=mock_directory)
+        mock_client = mock_db.engine.raw_connection.return_value.connection._client
+        mock_client.query.assert_called_with('SELECT a FROM mydataset.mytable WHERE b > 3')
+        mock_query_job = mock_client.query.return_value
+        mock_query_job.result.assert_called_with()
+        mock_url = mock_directory.loc.file_in_this_directory.return_value.url
+        mock_client.extract_table.assert_called_with(mock_query_job.destination,
+                                                     mock_url,
+                                                     job_config=ANY)
+
+    def test_unload_sharded(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            mock_db = Mock(name='mock_db')
+            fake_client = FakeShardingClient(num_shards=3)
+            mock_db.engine.raw_connection.return_value.connection._client = fake_client
+            big_query_unloader = BigQueryUnloader(
+                db=None,
+                url_resolver=MagicMock(name='mock_url_resolver'),
+                gcs_temp_base_loc=None,
+                db_conn=mock_db)
+            mock_unload_plan = Mock(name='unload_plan')
+            mock_unload_plan.records_format = AvroRecordsFormat()
+            mock_unload_plan.where = None
+            directory = RecordsDirectory(FilesystemDirectoryUrl(f'file://{tempdir}/'))
+            # Stand in for a GCS bucket with a local directory
+            directory.scheme = 'gs'
+            big_query_unloader.unload(schema='myproject.mydataset',
+                                      table='mytable',
+                                      unload_plan=mock_unload_plan,
+                                      directory=directory)
+            self.assertEqual(fake_client.destination_paths,
+                             [f'{tempdir}/output.avro', f'{tempdir}/part-*.avro'])
+            self.assertEqual(directory.get_manifest(), {
+                'entries': [
+                    {
+                        'url': f'file://{tempdir}/part-00000000000{i}.avro',
+                        'mandatory': True,
+                        'meta': {'content_length': len(f'shard {i}')},
+                    }
+                    for i in range(3)
+                ]
+            })
+
+    def test_unload_too_large_without_parallel_export(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            mock_db = Mock(name='mock_db')
+            fake_client = FakeShardingClient(num_shards=3)
+            mock_db.engine.raw_connection.return_value.connection._client = fake_client
+            big_query_unloader = BigQueryUnloader(
+                db=None,
+                url_resolver=MagicMock(name='mock_url_resolver'),
+                gcs_temp_base_loc=None,
+                db_conn=mock_db)
+            unload_plan = RecordsUnloadPlan(
+                records_format=AvroRecordsFormat(),
+                processing_instructions=ProcessingInstructions(parallel_export=False))
+            directory = RecordsDirectory(FilesystemDirectoryUrl(f'file://{tempdir}/'))
+            directory.scheme = 'gs'
+            with self.assertRaises(BadRequest):
+                big_query_unloader.unload(schema='myproject.mydataset',
+                                          table='mytable',
+                                          unload_plan=unload_plan,
+                                          directory=directory)
+            self.assertEqual(fake_client.destination_paths, [f'{tempdir}/output.avro'])
+
+
+class FakeShardingClient:
+    """Refuses to extract into a single file, and writes a wildcard
+    extract out as several local files, the way BigQuery does for
+    larger tables."""
+
+    def __init__(self, num_shards: int) -> None:
+        self.num_shards = num_shards
+        self.destination_paths: List[str] = []
+
+    def extract_table(self, source, destination_uri, job_config):
+        path = unquote(urlparse(destination_uri).path)
+        self.destination_paths.append(path)
+        if '*' not in path:
+            raise BadRequest(f'Table {source} too large to be exported to a single file. '
+                             'Specify a uri including a * to shard export.')
+        for i in range(self.num_shards):
+            with open(path.replace('*', f'{i:012d}'), 'w') as f:
+                f.write(f'shard {i}')
+        return Mock(name='job')
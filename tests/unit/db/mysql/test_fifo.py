@@ -0,0 +1,42 @@
+from records_mover.db.mysql.fifo import fileobj_as_local_file
+from mock import Mock, call
+import io
+import os
+import stat
+import unittest
+
+
+class FailingFileobj(io.RawIOBase):
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        raise OSError('connection reset')
+
+
+class TestFifo(unittest.TestCase):
+    def test_streams_fileobj(self):
+        with fileobj_as_local_file(io.BytesIO(b'a,b\n1,2\n')) as path:
+            self.assertTrue(stat.S_ISFIFO(os.stat(path).st_mode))
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), b'a,b\n1,2\n')
+        self.assertFalse(os.path.exists(path))
+
+    def test_never_read(self):
+        with self.assertRaises(ValueError):
+            with fileobj_as_local_file(io.BytesIO(b'a,b\n1,2\n')):
+                raise ValueError('LOAD DATA failed')
+
+    def test_read_error(self):
+        with self.assertRaises(OSError):
+            with fileobj_as_local_file(FailingFileobj()) as path:
+                with open(path, 'rb') as f:
+                    self.assertEqual(f.read(), b'')
+
+    def test_read_by_pymysql(self):
+        from pymysql.connections import _send_local_file  # type: ignore[import-untyped]
+        mock_conn = Mock(name='conn')
+        mock_conn.max_allowed_packet = 4
+        with fileobj_as_local_file(io.BytesIO(b'a,b\n1,2\n')) as path:
+            _send_local_file(path, mock_conn)
+        mock_conn.write_packet.assert_has_calls([call(b'a,b\n'), call(b'1,2\n')])
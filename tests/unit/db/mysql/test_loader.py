@@ -1,4 +1,5 @@
 from unittest.mock import MagicMock, patch, Mock
+import sqlalchemy
 import unittest
 from records_mover.url.filesystem import FilesystemDirectoryUrl, FilesystemFileUrl
 from records_mover.records import DelimitedRecordsFormat
@@ -39,11 +40,7 @@ class TestLoader(unittest.TestCase):
 
     @patch('records_mover.db.mysql.loader.mysql_load_options')
     @patch('records_mover.db.mysql.loader.complain_on_unhandled_hints')
-    @patch('records_mover.db.mysql.loader.tempfile')
-    @patch('records_mover.db.mysql.loader.Path')
     def test_load_happy_path(self,
-                             mock_Path,
-                             mock_tempfile,
                              mock_complain_on_unhandled_hints,
                              mock_mysql_load_options):
         mock_schema = Mock(name='schema')
@@ -70,3 +67,117 @@ class TestLoader(unittest.TestCase):
                                mock_directory)
         self.mock_db_engine.connect.return_value.execute.assert_called_with(mock_sql)
         self.assertEqual(out, None)
+
+    @patch('records_mover.db.mysql.loader.fileobj_as_local_file')
+    @patch('records_mover.db.mysql.loader.mysql_load_options')
+    @patch('records_mover.db.mysql.loader.complain_on_unhandled_hints')
+    def test_load_streams_remote_files(self,
+                                       mock_complain_on_unhandled_hints,
+                                       mock_mysql_load_options,
+                                       mock_fileobj_as_local_file):
+        mock_load_plan = Mock(name='load_plan')
+        mock_load_plan.records_format = Mock(name='records_format', spec=DelimitedRecordsFormat)
+        mock_load_plan.records_format.hints = {}
+        mock_directory = Mock(name='directory')
+        mock_directory.manifest_entry_urls.return_value = ['s3://bucket/dir/data.csv']
+        mock_loc = MagicMock(name='loc')
+        self.mock_url_resolver.file_url.return_value = mock_loc
+        mock_fileobj = mock_loc.open.return_value.__enter__.return_value
+        mock_filename = mock_fileobj_as_local_file.return_value.__enter__.return_value
+        mock_load_options = mock_mysql_load_options.return_value
+        mock_sql = mock_load_options.generate_load_data_sql.return_value
+
+        out = self.loader.load('myschema', 'mytable', mock_load_plan, mock_directory)
+        self.mock_url_resolver.file_url.assert_called_with('s3://bucket/dir/data.csv')
+        mock_fileobj_as_local_file.assert_called_with(mock_fileobj)
+        mock_load_options.generate_load_data_sql.\
+            assert_called_with(filename=mock_filename,
+                               table_name='mytable',
+                               schema_name='myschema')
+        self.mock_db_engine.connect.return_value.execute.assert_called_with(mock_sql)
+        self.assertIsNone(out)
+
+    def test_max_concurrent_fileobj_loads(self):
+        # load_from_fileobj() shares one connection
+        self.assertEqual(self.loader.max_concurrent_fileobj_loads(), 1)
+
+    @patch('records_mover.db.mysql.loader.fileobj_as_local_file')
+    @patch('records_mover.db.mysql.loader.mysql_load_options')
+    @patch('records_mover.db.mysql.loader.complain_on_unhandled_hints')
+    def test_load_from_fileobj(self,
+                               mock_complain_on_unhandled_hints,
+                               mock_mysql_load_options,
+                               mock_fileobj_as_local_file):
+        mock_load_plan = Mock(name='load_plan')
+        mock_load_plan.records_format = Mock(name='records_format', spec=DelimitedRecordsFormat)
+        mock_load_plan.records_format.hints = {}
+        mock_fileobj = Mock(name='fileobj')
+        mock_filename = mock_fileobj_as_local_file.return_value.__enter__.return_value
+        mock_load_options = mock_mysql_load_options.return_value
+        mock_sql = mock_load_options.generate_load_data_sql.return_value
+
+        out = self.loader.load_from_fileobj('myschema', 'mytable', mock_load_plan, mock_fileobj)
+        mock_fileobj_as_local_file.assert_called_with(mock_fileobj)
+        mock_load_options.generate_load_data_sql.\
+            assert_called_with(filename=mock_filename,
+                               table_name='mytable',
+                               schema_name='myschema')
+        self.mock_db_engine.connect.return_value.execute.assert_called_with(mock_sql)
+        self.assertIsNone(out)
+
+    def mock_concurrent_load(self, mock_mysql_load_options):
+        mock_load_plan = Mock(name='load_plan')
+        mock_load_plan.records_format = Mock(name='records_format', spec=DelimitedRecordsFormat)
+        mock_load_plan.records_format.hints = {}
+        mock_directory = Mock(name='directory')
+        mock_directory.manifest_entry_urls.return_value = [f'file:///dir/{i}.csv'
+                                                           for i in range(6)]
+
+        def file_url(url):
+            mock_loc = Mock(name=url, spec=FilesystemFileUrl)
+            mock_loc.local_file_path = url[len('file://'):]
+            return mock_loc
+
+        self.mock_url_resolver.file_url.side_effect = file_url
+        mock_load_options = mock_mysql_load_options.return_value
+        mock_load_options.generate_load_data_sql.side_effect =\
+            lambda filename, table_name, schema_name: filename
+        mock_db_conns = [MagicMock(name=f'db_conn_{i}') for i in range(4)]
+        self.mock_db_engine.connect.return_value.__enter__.side_effect = mock_db_conns
+        return mock_load_plan, mock_directory, mock_db_conns
+
+    @patch('records_mover.db.mysql.loader.mysql_load_options')
+    @patch('records_mover.db.mysql.loader.complain_on_unhandled_hints')
+    def test_load_concurrently(self,
+                               mock_complain_on_unhandled_hints,
+                               mock_mysql_load_options):
+        mock_load_plan, mock_directory, mock_db_conns =\
+            self.mock_concurrent_load(mock_mysql_load_options)
+
+        self.loader.load('myschema', 'mytable', mock_load_plan, mock_directory)
+        loaded = {}
+        for i, mock_db_conn in enumerate(mock_db_conns):
+            loaded[i] = [args[0] for args, kwargs in mock_db_conn.execute.call_args_list]
+            mock_db_conn.begin.return_value.commit.assert_called_with()
+            mock_db_conn.begin.return_value.rollback.assert_not_called()
+        self.assertEqual(loaded, {
+            0: ['/dir/0.csv', '/dir/4.csv'],
+            1: ['/dir/1.csv', '/dir/5.csv'],
+            2: ['/dir/2.csv'],
+            3: ['/dir/3.csv'],
+        })
+
+    @patch('records_mover.db.mysql.loader.mysql_load_options')
+    @patch('records_mover.db.mysql.loader.complain_on_unhandled_hints')
+    def test_load_concurrently_rolls_back_on_failure(self,
+                                                     mock_complain_on_unhandled_hints,
+                                                     mock_mysql_load_options):
+        mock_load_plan, mock_directory, mock_db_conns =\
+            self.mock_concurrent_load(mock_mysql_load_options)
+        mock_db_conns[2].execute.side_effect = sqlalchemy.exc.OperationalError('LOAD', {}, None)
+
+        with self.assertRaises(sqlalchemy.exc.OperationalError):
+            self.loader.load('myschema', 'mytable', mock_load_plan, mock_directory)
+        for mock_db_conn in mock_db_conns:
+            mock_db_conn.begin.return_value.rollback.assert_called_with()
+            mock_db_conn.begin.return_value.commit.assert_not_called()
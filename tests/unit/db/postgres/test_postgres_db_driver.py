@@ -0,0 +1,61 @@
+import unittest
+from mock import MagicMock, Mock, patch
+from records_mover.db.postgres.postgres_db_driver import PostgresDBDriver
+import sqlalchemy
+
+
+class TestPostgresDBDriver(unittest.TestCase):
+    @patch('records_mover.db.postgres.postgres_db_driver.PostgresUnloader')
+    @patch('records_mover.db.postgres.postgres_db_driver.PostgresLoader')
+    def setUp(self, mock_PostgresLoader, mock_PostgresUnloader):
+        self.mock_db_conn = MagicMock(name='db_conn')
+        mock_db_engine = MagicMock(name='db_engine')
+        mock_db_engine.dialect.preparer.return_value.quote = lambda s: f'"{s}"'
+        self.postgres_db_driver = PostgresDBDriver(db=None,
+                                                   db_conn=self.mock_db_conn,
+                                                   db_engine=mock_db_engine,
+                                                   url_resolver=Mock(name='url_resolver'))
+        mock_table = Mock(name='table')
+        mock_table.columns = [sqlalchemy.Column('id'), sqlalchemy.Column('name')]
+        self.postgres_db_driver.table = Mock(name='table', return_value=mock_table)
+
+    def test_create_table_like(self):
+        self.postgres_db_driver.create_table_like('myschema', 'mytable_staging', 'mytable')
+        sql = str(self.mock_db_conn.execute.call_args.args[0])
+        self.assertEqual(sql, 'CREATE TABLE "myschema"."mytable_staging" '
+                         '(LIKE "myschema"."mytable" INCLUDING ALL)')
+
+    def test_merge_table(self):
+        self.postgres_db_driver.merge_table('myschema', 'mytable', 'mytable_staging', ['id'])
+        sql = str(self.mock_db_conn.execute.call_args.args[0])
+        self.assertEqual(sql,
+                         'INSERT INTO "myschema"."mytable" ("id", "name") '
+                         'SELECT "id", "name" FROM "myschema"."mytable_staging" '
+                         'ON CONFLICT ("id") DO UPDATE SET "name" = EXCLUDED."name"')
+
+    def test_merge_table_all_key_columns(self):
+        self.postgres_db_driver.merge_table('myschema', 'mytable', 'mytable_staging',
+                                            ['id', 'name'])
+        sql = str(self.mock_db_conn.execute.call_args.args[0])
+        self.assertTrue(sql.endswith('ON CONFLICT ("id", "name") DO NOTHING'))
+
+    @patch('records_mover.db.driver.scratch_table_name')
+    def test_replace_table_serial_column(self, mock_scratch_table_name):
+        mock_scratch_table_name.return_value = 'mytable_old'
+        # "id" is a serial column, whose sequence mytable_id_seq is
+        # used by the nextval() default copied into mytable_staging
+        self.mock_db_conn.execute.return_value.fetchall.return_value = [
+            ('myschema', 'mytable_id_seq', 'id'),
+        ]
+        self.postgres_db_driver.replace_table('myschema', 'mytable', 'mytable_staging')
+        calls = self.mock_db_conn.execute.call_args_list
+        self.assertEqual(calls[0].args[1], {'schema': 'myschema',
+                                            'table': 'mytable',
+                                            'new_table': 'mytable_staging'})
+        self.assertEqual([str(call.args[0]) for call in calls[1:]], [
+            'ALTER SEQUENCE "myschema"."mytable_id_seq" '
+            'OWNED BY "myschema"."mytable_staging"."id"',
+            'ALTER TABLE "myschema"."mytable" RENAME TO "mytable_old"',
+            'ALTER TABLE "myschema"."mytable_staging" RENAME TO "mytable"',
+            'DROP TABLE "myschema"."mytable_old"',
+        ])
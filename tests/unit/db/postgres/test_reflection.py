@@ -0,0 +1,107 @@
+import unittest
+import sqlalchemy
+from collections import namedtuple
+from mock import MagicMock
+from sqlalchemy.dialects.postgresql.base import PGDialect
+from sqlalchemy.dialects import postgresql
+from records_mover.db.postgres.reflection import (
+    column_type_from_format_type, columns_from_cursor_description, fast_reflect_table
+)
+
+
+Row = namedtuple('Row', ['name', 'format_type', 'notnull'])
+TypeRow = namedtuple('TypeRow', ['oid', 'format_type'])
+
+
+class TestPostgresReflection(unittest.TestCase):
+    def type_for(self, format_type):
+        return column_type_from_format_type(format_type, PGDialect.ischema_names)
+
+    def test_varchar(self):
+        out = self.type_for('character varying(256)')
+        self.assertIsInstance(out, postgresql.VARCHAR)
+        self.assertEqual(out.length, 256)
+
+    def test_numeric(self):
+        out = self.type_for('numeric(18,2)')
+        self.assertIsInstance(out, postgresql.NUMERIC)
+        self.assertEqual((out.precision, out.scale), (18, 2))
+
+    def test_double_precision(self):
+        out = self.type_for('double precision')
+        self.assertIsInstance(out, postgresql.DOUBLE_PRECISION)
+        self.assertEqual(out.precision, 53)
+
+    def test_timestamptz(self):
+        out = self.type_for('timestamp(3) with time zone')
+        self.assertIsInstance(out, postgresql.TIMESTAMP)
+        self.assertTrue(out.timezone)
+        self.assertEqual(out.precision, 3)
+
+    def test_timestamp(self):
+        out = self.type_for('timestamp without time zone')
+        self.assertIsInstance(out, postgresql.TIMESTAMP)
+        self.assertFalse(out.timezone)
+
+    def test_integer(self):
+        self.assertIsInstance(self.type_for('integer'), postgresql.INTEGER)
+
+    def test_array_unsupported(self):
+        self.assertIsNone(self.type_for('integer[]'))
+
+    def test_unknown_type_unsupported(self):
+        self.assertIsNone(self.type_for('my_custom_enum'))
+
+    def test_fast_reflect_table(self):
+        mock_db = MagicMock(name='db')
+        mock_db.dialect.ischema_names = PGDialect.ischema_names
+        mock_db.execute.return_value.fetchall.return_value = [
+            Row('id', 'bigint', True),
+            Row('name', 'character varying(10)', False),
+        ]
+        out = fast_reflect_table(mock_db, 'myschema', 'mytable')
+        self.assertEqual(out.name, 'mytable')
+        self.assertEqual(out.schema, 'myschema')
+        self.assertEqual([c.name for c in out.columns], ['id', 'name'])
+        self.assertFalse(out.columns['id'].nullable)
+        self.assertTrue(out.columns['name'].nullable)
+        self.assertEqual(out.columns['name'].type.length, 10)
+        self.assertEqual(mock_db.execute.call_count, 1)
+        self.assertEqual(mock_db.execute.call_args[0][1],
+                         {'schema': 'myschema', 'table': 'mytable'})
+
+    def test_fast_reflect_table_not_found(self):
+        mock_db = MagicMock(name='db')
+        mock_db.execute.return_value.fetchall.return_value = []
+        self.assertIsNone(fast_reflect_table(mock_db, 'myschema', 'mytable'))
+
+    def test_fast_reflect_table_unknown_type(self):
+        mock_db = MagicMock(name='db')
+        mock_db.dialect.ischema_names = PGDialect.ischema_names
+        mock_db.execute.return_value.fetchall.return_value = [
+            Row('id', 'bigint', True),
+            Row('tags', 'text[]', False),
+        ]
+        self.assertIsNone(fast_reflect_table(mock_db, 'myschema', 'mytable'))
+
+    def test_columns_from_cursor_description(self):
+        mock_db = MagicMock(name='db')
+        mock_db.dialect.ischema_names = PGDialect.ischema_names
+        mock_db.execute.return_value.fetchall.return_value = [
+            TypeRow(20, 'bigint'),
+            TypeRow(1700, 'numeric'),
+            TypeRow(1007, 'integer[]'),
+        ]
+        description = [
+            ('id', 20, None, 8, None, None, None),
+            ('amount', 1700, None, -1, 18, 2, None),
+            ('tags', 1007, None, -1, None, None, None),
+        ]
+        out = columns_from_cursor_description(mock_db, description)
+        self.assertEqual([c.name for c in out], ['id', 'amount', 'tags'])
+        self.assertIsInstance(out[0].type, postgresql.BIGINT)
+        self.assertIsInstance(out[1].type, postgresql.NUMERIC)
+        self.assertEqual((out[1].type.precision, out[1].type.scale), (18, 2))
+        self.assertIsInstance(out[2].type, sqlalchemy.types.String)
+        self.assertEqual(mock_db.execute.call_count, 1)
+        self.assertEqual(mock_db.execute.call_args[0][1], {'oids': [20, 1007, 1700]})
@@ -30,6 +30,7 @@ class TestPostgresUnloader(unittest.TestCase):
                                    spec=DelimitedRecordsFormat)
         mock_records_format.hints = {}
         mock_unload_plan.records_format = mock_records_format
+        mock_unload_plan.where = None
         mock_date_output_style = "DATE_OUTPUT_STYLE"
         mock_date_order_style = "DATE_ORDER_STYLE"
         mock_postgres_options = {
@@ -88,6 +89,7 @@ class TestPostgresUnloader(unittest.TestCase):
                                    spec=DelimitedRecordsFormat)
         mock_records_format.hints = {}
         mock_unload_plan.records_format = mock_records_format
+        mock_unload_plan.where = None
         mock_date_output_style = "DATE_OUTPUT_STYLE"
         mock_date_order_style = None
         mock_postgres_options = {
@@ -146,3 +148,32 @@ class TestPostgresUnloader(unittest.TestCase):
 
     def test_can_unload_to_scheme_any_true(self):
         self.assertTrue(self.unloader.can_unload_to_scheme(Mock()))
+
+    @patch('records_mover.db.postgres.unloader.quote_value')
+    @patch('records_mover.db.postgres.unloader.copy_to')
+    @patch('records_mover.db.postgres.unloader.complain_on_unhandled_hints')
+    @patch('records_mover.db.postgres.unloader.postgres_copy_to_options')
+    def test_unload_query(self,
+                          mock_postgres_copy_to_options,
+                          mock_complain_on_unhandled_hints,
+                          mock_copy_to,
+                          mock_quote_value):
+        mock_unload_plan = Mock(name='unload_plan')
+        mock_directory = MagicMock(name='directory')
+        mock_records_format = Mock(name='records_format',
+                                   spec=DelimitedRecordsFormat)
+        mock_records_format.hints = {}
+        mock_unload_plan.records_format = mock_records_format
+        mock_postgres_copy_to_options.return_value = ('ISO', 'MDY', {'abc': 123})
+        mock_quote_value.return_value = "ABC"
+        self.unloader.unload_query("SELECT a FROM myschema.mytable WHERE b > 3",
+                                   mock_unload_plan,
+                                   mock_directory)
+        mock_fileobj = mock_directory.loc.file_in_this_directory.return_value.open.\
+            return_value.__enter__.return_value
+        mock_copy_to.assert_called_with(ANY,
+                                        mock_fileobj,
+                                        self.mock_db,
+                                        abc=123)
+        self.assertEqual("SELECT a FROM myschema.mytable WHERE b > 3",
+                         str(mock_copy_to.call_args.args[0]))
@@ -32,6 +32,11 @@ class BaseTestRedshiftDBDriver(unittest.TestCase):
         mock_records_unload_plan.records_format.format_type = 'delimited'
         mock_records_unload_plan.records_format.variant = None
         mock_records_unload_plan.processing_instructions = create_autospec(ProcessingInstructions)
+        mock_records_unload_plan.processing_instructions.max_file_size = None
+        mock_records_unload_plan.processing_instructions.parallel_export = True
+        mock_records_unload_plan.processing_instructions.partition_by = None
+        mock_records_unload_plan.processing_instructions.parquet_row_group_size = None
+        mock_records_unload_plan.where = None
         self.mock_records_unload_plan = mock_records_unload_plan
 
         mock_records_load_plan = create_autospec(RecordsLoadPlan)
@@ -156,3 +156,53 @@ class TestRedshiftLoader(unittest.TestCase):
 
     def test_has_temporary_loadable_directory_loc_true(self):
         self.assertTrue(self.redshift_loader.has_temporary_loadable_directory_loc())
+
+    @patch('records_mover.db.redshift.loader.RecordsLoadPlan')
+    @patch('records_mover.db.redshift.loader.stage_in_slices')
+    @patch('records_mover.db.redshift.loader.num_slices')
+    @patch('records_mover.db.redshift.loader.can_stage_in_slices')
+    def test_stage_to_s3_in_slices(self,
+                                   mock_can_stage_in_slices,
+                                   mock_num_slices,
+                                   mock_stage_in_slices,
+                                   mock_RecordsLoadPlan):
+        mock_load_plan = Mock(name='load_plan')
+        mock_load_plan.records_format = Mock(name='records_format', spec=DelimitedRecordsFormat)
+        mock_directory = Mock(name='directory')
+        mock_temp_s3_loc = Mock(name='temp_s3_loc')
+        mock_can_stage_in_slices.return_value = True
+        mock_num_slices.return_value = 4
+        mock_s3_directory = Mock(name='s3_directory')
+        mock_staged_records_format = Mock(name='staged_records_format')
+        mock_stage_in_slices.return_value = (mock_s3_directory, mock_staged_records_format)
+        fail_if_cant_handle_hint =\
+            mock_load_plan.processing_instructions.fail_if_cant_handle_hint
+
+        out = self.redshift_loader.stage_to_s3(mock_load_plan, mock_directory, mock_temp_s3_loc)
+        mock_num_slices.assert_called_with(self.redshift_loader.db_engine)
+        mock_stage_in_slices.assert_called_with(mock_directory,
+                                                mock_load_plan.records_format,
+                                                fail_if_cant_handle_hint,
+                                                num_parts=4,
+                                                new_loc=mock_temp_s3_loc)
+        mock_RecordsLoadPlan.\
+            assert_called_with(records_format=mock_staged_records_format,
+                               processing_instructions=mock_load_plan.processing_instructions)
+        self.assertEqual(out, (mock_s3_directory, mock_RecordsLoadPlan.return_value))
+        mock_directory.copy_to.assert_not_called()
+
+    @patch('records_mover.db.redshift.loader.num_slices')
+    @patch('records_mover.db.redshift.loader.can_stage_in_slices')
+    def test_stage_to_s3_no_slice_count(self,
+                                        mock_can_stage_in_slices,
+                                        mock_num_slices):
+        mock_load_plan = Mock(name='load_plan')
+        mock_load_plan.records_format = Mock(name='records_format', spec=DelimitedRecordsFormat)
+        mock_directory = Mock(name='directory')
+        mock_temp_s3_loc = Mock(name='temp_s3_loc')
+        mock_can_stage_in_slices.return_value = True
+        mock_num_slices.return_value = None
+
+        out = self.redshift_loader.stage_to_s3(mock_load_plan, mock_directory, mock_temp_s3_loc)
+        mock_directory.copy_to.assert_called_with(mock_temp_s3_loc)
+        self.assertEqual(out, (mock_directory.copy_to.return_value, mock_load_plan))
@@ -1,4 +1,6 @@
 from .base_test_redshift_db_driver import BaseTestRedshiftDBDriver
+from records_mover.db.redshift.redshift_db_driver import RedshiftDBDriver
+from mock import Mock, patch
 import sqlalchemy
 
 
@@ -96,3 +98,18 @@ class TestRedshiftDBDriver(BaseTestRedshiftDBDriver):
                                                                 input_fp_significand_bits)
             self.assertEqual(type(actual_col_type), sqlalchemy.sql.sqltypes.Float)
             self.assertEqual(actual_col_type.precision, expected_fp_significand_bits)
+
+    @patch('records_mover.db.redshift.redshift_db_driver.RedshiftDataApi')
+    def test_data_api(self, mock_RedshiftDataApi):
+        mock_boto3_session = Mock(name='boto3_session')
+        driver = RedshiftDBDriver(db=None,
+                                  s3_temp_base_loc=self.mock_s3_temp_base_loc,
+                                  db_engine=self.mock_db_engine,
+                                  data_api_boto3_session=mock_boto3_session)
+        mock_RedshiftDataApi.from_db_engine.assert_called_with(self.mock_db_engine,
+                                                               mock_boto3_session)
+        self.assertEqual(driver.unloader().data_api,
+                         mock_RedshiftDataApi.from_db_engine.return_value)
+
+    def test_no_data_api(self):
+        self.assertIsNone(self.redshift_db_driver.unloader().data_api)
@@ -1,7 +1,9 @@
 from .base_test_redshift_db_driver import BaseTestRedshiftDBDriver
 from ...records.format_hints import bluelabs_format_hints
-from records_mover.records import DelimitedRecordsFormat
-from mock import patch
+from records_mover.records import DelimitedRecordsFormat, ParquetRecordsFormat
+from sqlalchemy_redshift.commands import Format
+from records_mover.db.redshift.unloader import UNLOAD_HISTORY_SQL
+from mock import patch, Mock, ANY
 
 
 def fake_text(s):
@@ -12,11 +14,11 @@ class TestRedshiftDBDriverUnload(BaseTestRedshiftDBDriver):
     maxDiff = None
 
     @patch('records_mover.db.redshift.unloader.UnloadFromSelect')
-    @patch('records_mover.db.redshift.unloader.text')
+    @patch('records_mover.db.redshift.unloader.literal_text')
     def test_unload_to_non_s3(self,
-                              mock_text,
+                              mock_literal_text,
                               mock_UnloadFromSelect):
-        mock_text.side_effect = fake_text
+        mock_literal_text.side_effect = fake_text
         self.mock_records_unload_plan.processing_instructions.fail_if_dont_understand = True
         self.mock_records_unload_plan.processing_instructions.fail_if_cant_handle_hint = True
         self.mock_records_unload_plan.records_format =\
@@ -52,11 +54,11 @@ class TestRedshiftDBDriverUnload(BaseTestRedshiftDBDriver):
         self.assertEqual(456, rows)
 
     @patch('records_mover.db.redshift.unloader.UnloadFromSelect')
-    @patch('records_mover.db.redshift.unloader.text')
+    @patch('records_mover.db.redshift.unloader.literal_text')
     def test_unload(self,
-                    mock_text,
+                    mock_literal_text,
                     mock_UnloadFromSelect):
-        mock_text.side_effect = fake_text
+        mock_literal_text.side_effect = fake_text
         self.mock_records_unload_plan.processing_instructions.fail_if_dont_understand = True
         self.mock_records_unload_plan.processing_instructions.fail_if_cant_handle_hint = True
         self.mock_records_unload_plan.records_format =\
@@ -86,3 +88,111 @@ class TestRedshiftDBDriverUnload(BaseTestRedshiftDBDriver):
         }
         mock_UnloadFromSelect.assert_called_with(**expected_args)
         self.assertEqual(456, rows)
+
+    @patch('records_mover.db.redshift.unloader.UnloadFromSelect')
+    @patch('records_mover.db.redshift.unloader.literal_text')
+    def test_unload_query(self,
+                          mock_literal_text,
+                          mock_UnloadFromSelect):
+        mock_literal_text.side_effect = fake_text
+        self.mock_records_unload_plan.processing_instructions.fail_if_dont_understand = True
+        self.mock_records_unload_plan.processing_instructions.fail_if_cant_handle_hint = True
+        self.mock_records_unload_plan.records_format =\
+            DelimitedRecordsFormat(variant='bluelabs',
+                                   hints=bluelabs_format_hints)
+        self.mock_directory.scheme = 's3'
+        self.mock_db_engine.connect.return_value \
+            .execute.return_value \
+            .scalar.return_value = 12
+        rows = self.redshift_db_driver.unloader().\
+            unload_query(query="SELECT a FROM myschema.mytable WHERE b = 'x'",
+                         unload_plan=self.mock_records_unload_plan,
+                         directory=self.mock_directory)
+
+        mock_UnloadFromSelect.\
+            assert_called_with(access_key_id='fake_aws_id',
+                               add_quotes=False,
+                               delimiter=',',
+                               escape=True,
+                               gzip=True,
+                               manifest=True,
+                               secret_access_key='fake_aws_secret',
+                               select=("SELECT a FROM myschema.mytable WHERE b = 'x'",),
+                               session_token='fake_aws_token',
+                               unload_location='s3://mybucket/myparent/mychild/')
+        self.assertEqual(12, rows)
+
+    @patch('records_mover.db.redshift.unloader.UnloadFromSelect')
+    @patch('records_mover.db.redshift.unloader.literal_text')
+    def test_unload_file_layout(self,
+                                mock_literal_text,
+                                mock_UnloadFromSelect):
+        mock_literal_text.side_effect = fake_text
+        processing_instructions = self.mock_records_unload_plan.processing_instructions
+        processing_instructions.fail_if_dont_understand = True
+        processing_instructions.fail_if_cant_handle_hint = True
+        processing_instructions.max_file_size = 256 * 1024 * 1024
+        processing_instructions.parallel_export = False
+        processing_instructions.partition_by = ['event_date']
+        processing_instructions.parquet_row_group_size = 64 * 1024 * 1024
+        self.mock_records_unload_plan.records_format = ParquetRecordsFormat()
+        self.mock_directory.scheme = 's3'
+        self.mock_db_engine.connect.return_value \
+            .execute.return_value \
+            .scalar.return_value = 12
+        self.redshift_db_driver.unloader().\
+            unload(schema='myschema',
+                   table='mytable',
+                   unload_plan=self.mock_records_unload_plan,
+                   directory=self.mock_directory)
+
+        mock_UnloadFromSelect.\
+            assert_called_with(access_key_id='fake_aws_id',
+                               format=Format.parquet,
+                               manifest=True,
+                               max_file_size=256 * 1024 * 1024,
+                               parallel=False,
+                               partition_by=['event_date'],
+                               row_group_size=64 * 1024 * 1024,
+                               secret_access_key='fake_aws_secret',
+                               select=('SELECT * \nFROM myschema.mytable',),
+                               session_token='fake_aws_token',
+                               unload_location='s3://mybucket/myparent/mychild/')
+
+    @patch('records_mover.db.redshift.unloader.UnloadFromSelect')
+    @patch('records_mover.db.redshift.unloader.literal_text')
+    def test_unload_via_data_api(self,
+                                 mock_literal_text,
+                                 mock_UnloadFromSelect):
+        mock_literal_text.side_effect = fake_text
+        self.mock_records_unload_plan.processing_instructions.fail_if_dont_understand = True
+        self.mock_records_unload_plan.processing_instructions.fail_if_cant_handle_hint = True
+        self.mock_records_unload_plan.records_format =\
+            DelimitedRecordsFormat(variant='bluelabs',
+                                   hints=bluelabs_format_hints)
+        self.mock_directory.scheme = 's3'
+        mock_data_api = Mock(name='data_api')
+        mock_history = {'status': 'completed ', 'unloaded_rows': 789, 'unloaded_files_count': 4}
+        self.mock_db_engine.connect.return_value \
+            .execute.return_value \
+            .fetchone.return_value = mock_history
+        unloader = self.redshift_db_driver.unloader()
+        unloader.data_api = mock_data_api
+
+        def wait(statement_id, on_poll):
+            on_poll({'Status': 'STARTED'})
+            return {'Status': 'FINISHED'}
+
+        mock_data_api.wait.side_effect = wait
+        rows = unloader.unload(schema='myschema',
+                               table='mytable',
+                               unload_plan=self.mock_records_unload_plan,
+                               directory=self.mock_directory)
+
+        mock_unload = mock_UnloadFromSelect.return_value
+        mock_data_api.submit.assert_called_with(str(mock_unload.compile.return_value))
+        mock_data_api.wait.assert_called_with(mock_data_api.submit.return_value, on_poll=ANY)
+        self.mock_db_engine.connect.return_value.execute.\
+            assert_called_with(UNLOAD_HISTORY_SQL,
+                               {'unload_location': 's3://mybucket/myparent/mychild/'})
+        self.assertEqual(789, rows)
@@ -0,0 +1,144 @@
+from records_mover.db.redshift.slice_staging import (
+    RecordBoundaryFinder, can_stage_in_slices, num_slices, stage_in_slices
+)
+from records_mover.records.records_format import DelimitedRecordsFormat, AvroRecordsFormat
+from mock import Mock, MagicMock, patch
+import gzip
+import io
+import sqlalchemy
+import threading
+import unittest
+
+
+def hints_of(variant, **hints):
+    return DelimitedRecordsFormat(variant=variant,
+                                  hints=hints).validate(fail_if_cant_handle_hint=True)
+
+
+class TestRecordBoundaryFinder(unittest.TestCase):
+    def test_can_split(self):
+        self.assertTrue(RecordBoundaryFinder.can_split(hints_of('csv')))
+        self.assertTrue(RecordBoundaryFinder.can_split(hints_of('bluelabs')))
+        self.assertFalse(RecordBoundaryFinder.can_split(hints_of('bluelabs', quoting='all')))
+        self.assertFalse(RecordBoundaryFinder.can_split(hints_of('csv', encoding='UTF16')))
+
+    def test_unquoted(self):
+        finder = RecordBoundaryFinder(hints_of('bluelabs', escape=None))
+        data = b'a,b\nc,d\ne'
+        self.assertEqual(list(finder.record_ends(data)), [4, 8])
+        self.assertEqual(finder.first_record_end(data), 4)
+        self.assertEqual(finder.last_record_end(data), 8)
+        self.assertIsNone(finder.last_record_end(b'a,b'))
+
+    def test_escaped(self):
+        finder = RecordBoundaryFinder(hints_of('bluelabs'))
+        data = b'a\\\nb\nc\\\\\nd\\\n'
+        self.assertEqual(list(finder.record_ends(data)), [5, 9])
+        self.assertEqual(finder.last_record_end(data), 9)
+        self.assertIsNone(finder.last_record_end(b'a\\\n'))
+
+    def test_quoted(self):
+        finder = RecordBoundaryFinder(hints_of('csv'))
+        data = b'"a\nb",c\n"d""\n",e\n"f\n'
+        self.assertEqual(list(finder.record_ends(data)), [8, 17])
+        self.assertEqual(finder.first_record_end(data), 8)
+        self.assertEqual(finder.last_record_end(data), 17)
+
+    def test_crlf(self):
+        finder = RecordBoundaryFinder(hints_of('csv', **{'record-terminator': '\r\n'}))
+        self.assertEqual(finder.last_record_end(b'a\r\nb\r\nc'), 6)
+
+
+class TestSliceStaging(unittest.TestCase):
+    def test_can_stage_in_slices(self):
+        self.assertTrue(can_stage_in_slices(DelimitedRecordsFormat(variant='csv'), True))
+        self.assertTrue(can_stage_in_slices(DelimitedRecordsFormat(variant='bluelabs'), True))
+        self.assertFalse(can_stage_in_slices(DelimitedRecordsFormat(variant='csv',
+                                                                    hints={
+                                                                        'compression': 'LZO'
+                                                                    }),
+                                             True))
+        self.assertFalse(can_stage_in_slices(AvroRecordsFormat(), True))
+
+    def test_num_slices(self):
+        mock_db_engine = MagicMock(name='db_engine')
+        mock_db_conn = mock_db_engine.connect.return_value.__enter__.return_value
+        mock_db_conn.execute.return_value.scalar.return_value = 4
+        self.assertEqual(num_slices(mock_db_engine), 4)
+        self.assertEqual(str(mock_db_conn.execute.call_args[0][0]),
+                         'SELECT COUNT(*) FROM stv_slices')
+
+    def test_num_slices_unavailable(self):
+        mock_db_engine = MagicMock(name='db_engine')
+        mock_db_conn = mock_db_engine.connect.return_value.__enter__.return_value
+        mock_db_conn.execute.side_effect = sqlalchemy.exc.ProgrammingError('SELECT', {}, None)
+        self.assertIsNone(num_slices(mock_db_engine))
+
+    @patch('records_mover.db.redshift.slice_staging.RecordsDirectory')
+    @patch('records_mover.db.redshift.slice_staging.CHUNK_SIZE', 8)
+    def test_stage_in_slices(self, mock_RecordsDirectory):
+        records_format = DelimitedRecordsFormat(variant='csv', hints={'compression': 'GZIP'})
+        inputs = {
+            'data1.csv.gz': gzip.compress(b'a,b\n1,2\n3,4\n5,6\n7,8\n'),
+            'data2.csv.gz': gzip.compress(b'a,b\n"9\n",10'),
+        }
+        mock_directory = Mock(name='directory')
+        mock_directory.manifest_entry_urls.return_value = list(inputs)
+        mock_directory.path_of_url.side_effect = lambda url: url
+
+        def file_in_this_directory(path):
+            mock_loc = Mock(name=path)
+            mock_loc.open.return_value = io.BytesIO(inputs[path])
+            return mock_loc
+
+        mock_directory.loc.file_in_this_directory.side_effect = file_in_this_directory
+        uploads = {}
+        resolving_threads = []
+
+        def new_file_in_this_directory(filename):
+            resolving_threads.append(threading.current_thread())
+            mock_loc = Mock(name=filename)
+            mock_loc.url = f's3://bucket/dir/{filename}'
+
+            def upload_fileobj(fileobj):
+                data = fileobj.read()
+                uploads[filename] = gzip.decompress(data)
+                return len(data)
+
+            mock_loc.upload_fileobj.side_effect = upload_fileobj
+            return mock_loc
+
+        mock_new_loc = Mock(name='new_loc')
+        mock_new_loc.file_in_this_directory.side_effect = new_file_in_this_directory
+
+        out_directory, out_records_format = stage_in_slices(mock_directory,
+                                                            records_format,
+                                                            True,
+                                                            num_parts=2,
+                                                            new_loc=mock_new_loc)
+        self.assertEqual(uploads, {
+            'part0000.csv.gz': b'a,b\n1,2\n3,4\n5,6\n"9\n",10\n',
+            'part0001.csv.gz': b'a,b\n7,8\n',
+        })
+        self.assertEqual(out_records_format,
+                         DelimitedRecordsFormat(variant='csv', hints={'compression': 'GZIP'}))
+        mock_RecordsDirectory.assert_called_with(records_loc=mock_new_loc)
+        self.assertEqual(out_directory, mock_RecordsDirectory.return_value)
+        url_details = out_directory.save_preliminary_manifest.call_args[0][0]
+        self.assertEqual(sorted(url_details), ['s3://bucket/dir/part0000.csv.gz',
+                                               's3://bucket/dir/part0001.csv.gz'])
+        out_directory.save_format.assert_called_with(out_records_format)
+        out_directory.finalize_manifest.assert_called_with()
+        self.assertEqual(resolving_threads, [threading.current_thread()] * 2)
+
+    def test_stage_in_slices_empty(self):
+        mock_directory = Mock(name='directory')
+        mock_directory.manifest_entry_urls.return_value = ['data.csv']
+        mock_directory.loc.file_in_this_directory.return_value.open.return_value =\
+            io.BytesIO(b'a,b\n')
+        out = stage_in_slices(mock_directory,
+                              DelimitedRecordsFormat(variant='csv', hints={'compression': None}),
+                              True,
+                              num_parts=2,
+                              new_loc=Mock(name='new_loc'))
+        self.assertIsNone(out)
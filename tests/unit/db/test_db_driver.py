@@ -1,6 +1,6 @@
 from .fakes import fake_text
 import unittest
-from mock import Mock, MagicMock
+from mock import Mock, MagicMock, patch
 from records_mover.db.driver import GenericDBDriver
 import sqlalchemy
 
@@ -17,11 +17,115 @@ class TestDBDriver(unittest.TestCase):
                                          url_resolver=self.mock_url_resolver,
                                          text=fake_text)
 
+    def test_query_columns(self):
+        class FakeTypeObject:
+            def __init__(self, *values):
+                self.values = values
+
+            def __eq__(self, other):
+                return other in self.values
+
+        mock_dbapi = self.mock_db_engine.dialect.dbapi
+        mock_dbapi.NUMBER = FakeTypeObject(1, 2)
+        mock_dbapi.DATETIME = FakeTypeObject(3)
+        mock_dbapi.BINARY = FakeTypeObject(4)
+        mock_result = self.mock_db_engine.connect.return_value.execute.return_value
+        mock_result.cursor.description = [
+            ('a', 2, None, None, 10, 2, None),
+            ('b', 3, None, None, None, None, None),
+            ('c', 4, None, None, None, None, None),
+            ('d', 5, None, None, None, None, None),
+            ('e', None, None, None, None, None, None),
+        ]
+        out = self.db_driver.query_columns('SELECT a, b, c, d, e FROM x')
+        self.assertEqual(str(self.mock_db_engine.connect.return_value.execute.call_args[0][0]),
+                         'SELECT * FROM (SELECT a, b, c, d, e FROM x) AS records_mover_query '
+                         'WHERE 1 = 0')
+        mock_result.close.assert_called_with()
+        self.assertEqual(['a', 'b', 'c', 'd', 'e'], [column.name for column in out])
+        self.assertIsInstance(out[0].type, sqlalchemy.types.Numeric)
+        self.assertEqual((10, 2), (out[0].type.precision, out[0].type.scale))
+        self.assertIsInstance(out[1].type, sqlalchemy.types.DateTime)
+        self.assertIsInstance(out[2].type, sqlalchemy.types.LargeBinary)
+        self.assertIsInstance(out[3].type, sqlalchemy.types.String)
+        self.assertIsInstance(out[4].type, sqlalchemy.types.String)
+
+    def test_query_columns_with_colons(self):
+        mock_result = self.mock_db_engine.connect.return_value.execute.return_value
+        mock_result.cursor.description = [('j', None, None, None, None, None, None)]
+        self.db_driver.query_columns("""SELECT '{"k":1}'::json AS j""")
+        self.assertEqual(str(self.mock_db_engine.connect.return_value.execute.call_args[0][0]),
+                         """SELECT * FROM (SELECT '{"k":1}'::json AS j) AS records_mover_query """
+                         'WHERE 1 = 0')
+
     def test_table(self):
         out = self.db_driver.table('my_schema', 'my_table')
         self.assertEqual(out.name, 'my_table')
         self.assertEqual(out.schema, 'my_schema')
 
+    def test_table_cached(self):
+        self.db_driver.autoload_table = Mock(name='autoload_table')
+        out1 = self.db_driver.table('my_schema', 'my_cached_table')
+        out2 = self.db_driver.table('my_schema', 'my_cached_table')
+        self.assertEqual(out1, self.db_driver.autoload_table.return_value)
+        self.assertEqual(out2, self.db_driver.autoload_table.return_value)
+        self.db_driver.autoload_table.assert_called_once_with('my_schema', 'my_cached_table')
+        self.db_driver.invalidate_table('my_schema', 'my_cached_table')
+        self.db_driver.table('my_schema', 'my_cached_table')
+        self.assertEqual(self.db_driver.autoload_table.call_count, 2)
+
+    def test_table_cached_by_reflection_mode(self):
+        fast_db_driver = GenericDBDriver(db=None,
+                                         db_engine=self.mock_db_engine,
+                                         s3_temp_base_loc=self.mock_s3_temp_base_loc,
+                                         url_resolver=self.mock_url_resolver,
+                                         fast_reflection=True)
+        fast_db_driver.fast_reflect_table = Mock(name='fast_reflect_table')
+        self.db_driver.autoload_table = Mock(name='autoload_table')
+        fast_out = fast_db_driver.table('my_schema', 'my_mixed_table')
+        self.assertEqual(fast_out, fast_db_driver.fast_reflect_table.return_value)
+        # The fast reflection lacks defaults and constraints, so isn't
+        # handed out to drivers which want the full thing
+        out = self.db_driver.table('my_schema', 'my_mixed_table')
+        self.assertEqual(out, self.db_driver.autoload_table.return_value)
+        self.db_driver.invalidate_table('my_schema', 'my_mixed_table')
+
+    def test_reflect_table_fast_falls_back(self):
+        self.db_driver.fast_reflection = True
+        self.db_driver.autoload_table = Mock(name='autoload_table')
+        out = self.db_driver.reflect_table('my_schema', 'my_table')
+        self.assertEqual(out, self.db_driver.autoload_table.return_value)
+
+    def test_reflect_table_fast(self):
+        self.db_driver.fast_reflection = True
+        self.db_driver.fast_reflect_table = Mock(name='fast_reflect_table')
+        self.db_driver.autoload_table = Mock(name='autoload_table')
+        out = self.db_driver.reflect_table('my_schema', 'my_table')
+        self.assertEqual(out, self.db_driver.fast_reflect_table.return_value)
+        self.db_driver.autoload_table.assert_not_called()
+
+    @patch('records_mover.db.driver.scratch_table_name')
+    @patch('records_mover.db.driver.quote_table_only')
+    @patch('records_mover.db.driver.quote_schema_and_table')
+    def test_replace_table(self,
+                           mock_quote_schema_and_table,
+                           mock_quote_table_only,
+                           mock_scratch_table_name):
+        mock_scratch_table_name.return_value = 'mytable_old'
+        mock_quote_schema_and_table.side_effect = lambda _, schema, table, db_engine: \
+            f'[{schema}].[{table}]'
+        mock_quote_table_only.side_effect = lambda _, table, db_engine: f'[{table}]'
+        self.db_driver.replace_table('myschema', 'mytable', 'mytable_staging')
+        mock_db_conn = self.mock_db_engine.connect.return_value
+        sqls = [str(call.args[0]) for call in mock_db_conn.execute.call_args_list]
+        # No CASCADE, so dependent views make this fail rather than
+        # being dropped along with the old table.
+        self.assertEqual(sqls, [
+            'ALTER TABLE [myschema].[mytable] RENAME TO [mytable_old]',
+            'ALTER TABLE [myschema].[mytable_staging] RENAME TO [mytable]',
+            'DROP TABLE [myschema].[mytable_old]',
+        ])
+
     def test_supports_time_type(self):
         out = self.db_driver.supports_time_type()
         self.assertEqual(out, True)
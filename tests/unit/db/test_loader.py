@@ -0,0 +1,45 @@
+from records_mover.db.loader import LoaderFromFileobj
+from mock import Mock, MagicMock
+import threading
+import unittest
+
+
+class ConcurrentLoader(LoaderFromFileobj):
+    def __init__(self, url_resolver):
+        self.url_resolver = url_resolver
+        self.loaded = []
+
+    def load_from_fileobj(self, schema, table, load_plan, fileobj):
+        self.loaded.append(fileobj)
+        return 1
+
+    def max_concurrent_fileobj_loads(self):
+        return 4
+
+    def can_load_this_format(self, source_records_format):
+        return True
+
+    def known_supported_records_formats_for_load(self):
+        return []
+
+
+class TestLoaderFromFileobj(unittest.TestCase):
+    def test_load_resolves_urls_on_calling_thread(self):
+        resolving_threads = []
+
+        def file_url(url):
+            resolving_threads.append(threading.current_thread())
+            mock_loc = MagicMock(name=url)
+            mock_loc.url = url
+            return mock_loc
+
+        mock_url_resolver = Mock(name='url_resolver')
+        mock_url_resolver.file_url.side_effect = file_url
+        loader = ConcurrentLoader(mock_url_resolver)
+        mock_directory = Mock(name='directory')
+        mock_directory.manifest_entry_urls.return_value = [f's3://bucket/dir/part{i}'
+                                                           for i in range(8)]
+        out = loader.load('myschema', 'mytable', Mock(name='load_plan'), mock_directory)
+        self.assertEqual(out, 8)
+        self.assertEqual(len(loader.loaded), 8)
+        self.assertEqual(resolving_threads, [threading.current_thread()] * 8)
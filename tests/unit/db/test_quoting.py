@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import Mock, call
 from records_mover.db import quoting
+from sqlalchemy.dialects import postgresql
 
 
 class TestQuoting(unittest.TestCase):
@@ -45,3 +46,9 @@ class TestQuoting(unittest.TestCase):
         mock_preparer.quote.assert_called_with(quotable_value)
         mock_engine.dialect.preparer.assert_called_with(mock_engine.dialect,
                                                         initial_quote="'")
+
+    def test_literal_text(self):
+        sql = "SELECT 1 AS a, '{\"k\":1}' AS j, b::date, '12:30:00'::time AS t FROM x"
+        text = quoting.literal_text(sql)
+        self.assertEqual(text.compile(dialect=postgresql.dialect()).params, {})
+        self.assertEqual(str(text.compile(dialect=postgresql.dialect())), sql)
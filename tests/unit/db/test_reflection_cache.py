@@ -0,0 +1,71 @@
+import unittest
+from mock import Mock
+from records_mover.db.reflection_cache import TableReflectionCache, reflection_cache_for_engine
+
+
+class TestTableReflectionCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        self.cache = TableReflectionCache(max_tables=2,
+                                          ttl_seconds=60,
+                                          clock=lambda: self.now)
+
+    def test_get_or_reflect_reflects_once(self):
+        mock_reflect = Mock(name='reflect')
+        out1 = self.cache.get_or_reflect('myschema', 'mytable', mock_reflect)
+        out2 = self.cache.get_or_reflect('myschema', 'mytable', mock_reflect)
+        self.assertEqual(out1, mock_reflect.return_value)
+        self.assertEqual(out2, mock_reflect.return_value)
+        mock_reflect.assert_called_once_with()
+
+    def test_evicts_least_recently_used(self):
+        mock_a = Mock(name='a')
+        mock_b = Mock(name='b')
+        mock_c = Mock(name='c')
+        self.cache.put('s', 'a', mock_a)
+        self.cache.put('s', 'b', mock_b)
+        self.assertEqual(self.cache.get('s', 'a'), mock_a)
+        self.cache.put('s', 'c', mock_c)
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNone(self.cache.get('s', 'b'))
+        self.assertEqual(self.cache.get('s', 'a'), mock_a)
+        self.assertEqual(self.cache.get('s', 'c'), mock_c)
+
+    def test_expires_after_ttl(self):
+        mock_table = Mock(name='table')
+        self.cache.put('s', 't', mock_table)
+        self.now += 59
+        self.assertEqual(self.cache.get('s', 't'), mock_table)
+        self.now += 1
+        self.assertIsNone(self.cache.get('s', 't'))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_invalidate(self):
+        self.cache.put('s', 't', Mock(name='table'))
+        self.cache.invalidate('s', 't')
+        self.assertIsNone(self.cache.get('s', 't'))
+        self.cache.invalidate('s', 'never_cached')
+
+    def test_fast_cached_separately(self):
+        mock_fast = Mock(name='fast')
+        mock_full = Mock(name='full')
+        self.cache.put('s', 't', mock_fast, fast=True)
+        self.assertIsNone(self.cache.get('s', 't'))
+        self.assertEqual(self.cache.get('s', 't', fast=True), mock_fast)
+        self.cache.put('s', 't', mock_full)
+        self.assertEqual(self.cache.get('s', 't'), mock_full)
+        self.assertEqual(self.cache.get('s', 't', fast=True), mock_full)
+        self.cache.invalidate('s', 't')
+        self.assertEqual(len(self.cache), 0)
+
+    def test_clear(self):
+        self.cache.put('s', 't', Mock(name='table'))
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_one_cache_per_engine(self):
+        mock_engine_1 = Mock(name='engine_1')
+        mock_engine_2 = Mock(name='engine_2')
+        cache_1 = reflection_cache_for_engine(mock_engine_1)
+        self.assertIs(cache_1, reflection_cache_for_engine(mock_engine_1))
+        self.assertIsNot(cache_1, reflection_cache_for_engine(mock_engine_2))
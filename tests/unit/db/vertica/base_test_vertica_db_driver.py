@@ -32,6 +32,7 @@ class BaseTestVerticaDBDriver(unittest.TestCase):
         mock_records_unload_plan.records_format.format_type = 'delimited'
         mock_records_unload_plan.records_format.variant = None
         mock_records_unload_plan.processing_instructions = ProcessingInstructions()
+        mock_records_unload_plan.where = None
         self.mock_records_unload_plan = mock_records_unload_plan
 
         mock_records_load_plan = Mock()
@@ -1,10 +1,52 @@
 from records_mover.db.vertica.loader import VerticaLoader
+from records_mover.db.vertica.io_base_wrapper import IOBaseWrapper
 from records_mover.records.records_format import DelimitedRecordsFormat
+import io
+import threading
 import unittest
+import urllib.response
 import vertica_python
 from mock import patch, Mock
 
 
+def fake_vertica_import_options(unhandled_hints, load_plan):
+    unhandled_hints.clear()
+    return {'load_method': 'AUTO'}
+
+
+class FakeCursor:
+    """Reads COPY data the way vertica_python does, recording what was
+    read rather than sending it anywhere."""
+
+    def __init__(self):
+        self.sql = None
+        self.stream = None
+        self.reads = 0
+        self.bytes_consumed = 0
+
+    def copy(self, sql, data, buffer_size=131072):
+        self.sql = sql
+        self.stream = data
+        while True:
+            self.reads += 1
+            chunk = data.read(buffer_size)
+            if not chunk:
+                break
+            self.bytes_consumed += len(chunk)
+
+
+class FakeRawConnection:
+    def __init__(self):
+        self.fake_cursor = FakeCursor()
+        self.closed = False
+
+    def cursor(self):
+        return self.fake_cursor
+
+    def close(self):
+        self.closed = True
+
+
 class TestVerticaLoader(unittest.TestCase):
     maxDiff = None
 
@@ -13,6 +55,18 @@ class TestVerticaLoader(unittest.TestCase):
         mock_db = Mock(name='db')
         self.vertica_loader = VerticaLoader(url_resolver=mock_url_resolver, db=None,
                                             db_conn=mock_db)
+        self.mock_url_resolver = mock_url_resolver
+        self.raw_connections = []
+        lock = threading.Lock()
+
+        def raw_connection():
+            raw_connection = FakeRawConnection()
+            with lock:
+                self.raw_connections.append(raw_connection)
+            return raw_connection
+
+        self.vertica_loader.db_engine = Mock(name='db_engine')
+        self.vertica_loader.db_engine.raw_connection.side_effect = raw_connection
 
     @patch('records_mover.db.vertica.loader.ProcessingInstructions')
     @patch('records_mover.db.vertica.loader.RecordsLoadPlan')
@@ -40,3 +94,118 @@ class TestVerticaLoader(unittest.TestCase):
     def test_load_failure_exception(self):
         out = self.vertica_loader.load_failure_exception()
         self.assertEqual(vertica_python.errors.CopyRejected, out)
+
+    @patch('records_mover.db.vertica.loader.vertica_import_sql')
+    @patch('records_mover.db.vertica.loader.vertica_import_options')
+    def test_load_from_fileobj(self, mock_vertica_import_options, mock_vertica_import_sql):
+        mock_vertica_import_options.side_effect = fake_vertica_import_options
+        mock_load_plan = Mock(name='load_plan')
+        mock_load_plan.records_format = DelimitedRecordsFormat(variant='vertica')
+        data = b'x' * (3 * 1024 * 1024)
+        self.vertica_loader.load_from_fileobj('myschema', 'mytable', mock_load_plan,
+                                              io.BytesIO(data))
+        mock_vertica_import_sql.assert_called_with(db_engine=self.vertica_loader.db_engine,
+                                                   schema='myschema',
+                                                   table='mytable',
+                                                   load_method='AUTO')
+        [raw_connection] = self.raw_connections
+        cursor = raw_connection.fake_cursor
+        self.assertEqual(cursor.sql, mock_vertica_import_sql.return_value)
+        self.assertEqual(cursor.bytes_consumed, len(data))
+        # 1MB at a time, plus the read which finds the end of the
+        # stream, rather than 24 reads of the driver's default 128KB
+        self.assertEqual(cursor.reads, 4)
+        self.assertTrue(raw_connection.closed)
+
+    @patch('records_mover.db.vertica.loader.vertica_import_sql')
+    @patch('records_mover.db.vertica.loader.vertica_import_options')
+    def test_load_from_fileobj_addinfourl(self,
+                                          mock_vertica_import_options,
+                                          mock_vertica_import_sql):
+        mock_vertica_import_options.side_effect = fake_vertica_import_options
+        mock_load_plan = Mock(name='load_plan')
+        mock_load_plan.records_format = DelimitedRecordsFormat(variant='vertica')
+        fp = io.BytesIO(b'a,b\n1,2\n')
+        fileobj = urllib.response.addinfourl(fp, headers={}, url='http://example.com/data')
+        self.vertica_loader.load_from_fileobj('myschema', 'mytable', mock_load_plan, fileobj)
+        cursor = self.raw_connections[0].fake_cursor
+        # Read straight from the underlying stream, without a wrapper
+        self.assertIs(cursor.stream, fp)
+        self.assertEqual(cursor.bytes_consumed, 8)
+
+    @patch('records_mover.db.vertica.loader.vertica_import_sql')
+    @patch('records_mover.db.vertica.loader.vertica_import_options')
+    def test_load_from_fileobj_addinfourl_wrapped(self,
+                                                  mock_vertica_import_options,
+                                                  mock_vertica_import_sql):
+        mock_vertica_import_options.side_effect = fake_vertica_import_options
+        mock_load_plan = Mock(name='load_plan')
+        mock_load_plan.records_format = DelimitedRecordsFormat(variant='vertica')
+        mock_fp = Mock(name='fp')
+        mock_fp.read.side_effect = [b'a,b\n1,2\n', b'']
+        fileobj = urllib.response.addinfourl(mock_fp, headers={}, url='ftp://example.com/data')
+        self.vertica_loader.load_from_fileobj('myschema', 'mytable', mock_load_plan, fileobj)
+        cursor = self.raw_connections[0].fake_cursor
+        self.assertIsInstance(cursor.stream, IOBaseWrapper)
+        self.assertEqual(cursor.bytes_consumed, 8)
+
+    @patch('records_mover.db.vertica.loader.DIRECT_LOAD_MIN_BYTES', 1000)
+    @patch('records_mover.db.vertica.loader.vertica_import_sql')
+    @patch('records_mover.db.vertica.loader.vertica_import_options')
+    def test_load_concurrently(self, mock_vertica_import_options, mock_vertica_import_sql):
+        mock_vertica_import_options.side_effect = fake_vertica_import_options
+        mock_load_plan = Mock(name='load_plan')
+        mock_load_plan.records_format = DelimitedRecordsFormat(variant='vertica')
+        inputs = {
+            f's3://bucket/dir/data{i}.csv': b'x' * (200 + i)
+            for i in range(6)
+        }
+        mock_directory = Mock(name='directory')
+        mock_directory.manifest_entry_urls.return_value = list(inputs)
+        mock_directory.get_manifest.return_value = {
+            'entries': [
+                {'url': url, 'mandatory': True, 'meta': {'content_length': len(data)}}
+                for url, data in inputs.items()
+            ]
+        }
+
+        resolving_threads = []
+
+        def file_url(url):
+            resolving_threads.append(threading.current_thread())
+            mock_loc = Mock(name=url)
+            mock_loc.url = url
+            mock_loc.open.return_value = io.BytesIO(inputs[url])
+            return mock_loc
+
+        self.mock_url_resolver.file_url.side_effect = file_url
+        out = self.vertica_loader.load('myschema', 'mytable', mock_load_plan, mock_directory)
+        self.assertIsNone(out)
+        self.assertEqual(resolving_threads, [threading.current_thread()] * len(inputs))
+        mock_vertica_import_sql.assert_called_once_with(db_engine=self.vertica_loader.db_engine,
+                                                        schema='myschema',
+                                                        table='mytable',
+                                                        load_method='DIRECT')
+        # One COPY stream per file, each on its own pooled connection
+        self.assertEqual(len(self.raw_connections), len(inputs))
+        self.assertEqual(sorted(raw_connection.fake_cursor.bytes_consumed
+                                for raw_connection in self.raw_connections),
+                         sorted(len(data) for data in inputs.values()))
+        self.assertTrue(all(raw_connection.closed for raw_connection in self.raw_connections))
+
+    def test_load_method(self):
+        mock_directory = Mock(name='directory')
+        mock_directory.get_manifest.return_value = {
+            'entries': [
+                {'url': 's3://bucket/dir/data0.csv', 'mandatory': True,
+                 'meta': {'content_length': 50 * 1024 * 1024}},
+                {'url': 's3://bucket/dir/data1.csv', 'mandatory': True},
+            ]
+        }
+        self.assertIsNone(self.vertica_loader.load_method(mock_directory))
+        mock_directory.get_manifest.return_value['entries'][1]['meta'] = {
+            'content_length': 50 * 1024 * 1024
+        }
+        self.assertEqual(self.vertica_loader.load_method(mock_directory), 'DIRECT')
+        mock_directory.get_manifest.return_value = None
+        self.assertIsNone(self.vertica_loader.load_method(mock_directory))
@@ -13,17 +13,14 @@ class TestVerticaUnloaderNoAwsCreds(unittest.TestCase):
         mock_out.fetchall.return_value = []
         unloader = VerticaUnloader(db=None, s3_temp_base_loc=mock_s3_temp_base_loc,
                                    db_conn=mock_db)
-        mock_table = Mock(name='table')
         mock_unload_plan = Mock(name='unload_plan')
-        mock_schema = Mock(name='schema')
         mock_directory = Mock(name='directory')
         mock_unload_plan.records_format = Mock(spec=DelimitedRecordsFormat)
         mock_unload_plan.records_format.hints = {}
         mock_unload_plan.records_format.format_type = 'delimited'
 
         with self.assertRaises(CredsDoNotSupportS3Export):
-            unloader.unload_to_s3_directory(schema=mock_schema,
-                                            table=mock_table,
+            unloader.unload_to_s3_directory(source='myschema.mytable',
                                             unload_plan=mock_unload_plan,
                                             directory=mock_directory)
 
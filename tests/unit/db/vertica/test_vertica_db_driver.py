@@ -1,5 +1,5 @@
 from .base_test_vertica_db_driver import BaseTestVerticaDBDriver
-from mock import Mock
+from mock import Mock, patch
 from ...records.format_hints import (vertica_format_hints)
 import sqlalchemy
 
@@ -22,6 +22,45 @@ class TestVerticaDBDriver(BaseTestVerticaDBDriver):
 
         self.assertEqual(579, export_count)
 
+    def test_unload_where(self):
+        mock_result = Mock(name='result')
+        mock_result.rows = 12
+        self.mock_db_engine.execute.return_value.fetchall.return_value = [mock_result]
+        self.mock_records_unload_plan.processing_instructions.fail_if_dont_understand = True
+        self.mock_records_unload_plan.processing_instructions.fail_if_cant_handle_hint = True
+        self.mock_records_unload_plan.records_format.hints = vertica_format_hints
+        self.mock_records_unload_plan.where = 'id > 3'
+        self.mock_directory.scheme = 's3'
+        export_count = self.vertica_db_driver\
+            .unloader().unload(schema='myschema',
+                               table='mytable',
+                               unload_plan=self.mock_records_unload_plan,
+                               directory=self.mock_directory)
+
+        self.assertEqual(12, export_count)
+        export_sql = str(self.mock_db_engine.execute.call_args[0][0])
+        self.assertIn('S3EXPORT', export_sql)
+        self.assertIn('WHERE id > 3', export_sql)
+
+    def test_unload_query(self):
+        mock_result = Mock(name='result')
+        mock_result.rows = 7
+        self.mock_db_engine.execute.return_value.fetchall.return_value = [mock_result]
+        self.mock_records_unload_plan.processing_instructions.fail_if_dont_understand = True
+        self.mock_records_unload_plan.processing_instructions.fail_if_cant_handle_hint = True
+        self.mock_records_unload_plan.records_format.hints = vertica_format_hints
+        self.mock_directory.scheme = 's3'
+        export_count = self.vertica_db_driver\
+            .unloader().unload_query(query='SELECT a FROM myschema.mytable WHERE b > 3',
+                                     unload_plan=self.mock_records_unload_plan,
+                                     directory=self.mock_directory)
+
+        self.assertEqual(7, export_count)
+        export_sql = str(self.mock_db_engine.execute.call_args[0][0])
+        self.assertIn('OVER(PARTITION BEST) FROM '
+                      '(SELECT a FROM myschema.mytable WHERE b > 3) AS records_mover_query',
+                      export_sql)
+
     def test_unload_to_non_s3(self):
         mock_result = Mock(name='result')
         mock_result.rows = 579
@@ -102,3 +141,35 @@ class TestVerticaDBDriver(BaseTestVerticaDBDriver):
         out = self.vertica_db_driver.type_for_floating_point(12, 8)
         self.assertEqual(type(out), sqlalchemy.sql.sqltypes.Float)
         self.assertEqual(out.precision, 8)
+
+    def test_create_table_like(self):
+        self.vertica_db_driver.create_table_like('myschema', 'mytable_staging', 'mytable')
+        sql = str(self.mock_db_engine.execute.call_args.args[0])
+        self.assertEqual(sql, 'CREATE TABLE [myschema].[mytable_staging] '
+                         'LIKE [myschema].[mytable] INCLUDING PROJECTIONS')
+
+    @patch('records_mover.db.vertica.vertica_db_driver.scratch_table_name')
+    def test_replace_table(self, mock_scratch_table_name):
+        mock_scratch_table_name.return_value = 'mytable_old'
+        self.vertica_db_driver.replace_table('myschema', 'mytable', 'mytable_staging')
+        sqls = [str(call.args[0]) for call in self.mock_db_engine.execute.call_args_list]
+        self.assertEqual(sqls, [
+            'ALTER TABLE [myschema].[mytable], [myschema].[mytable_staging] '
+            'RENAME TO [mytable_old], [mytable]',
+            'DROP TABLE [myschema].[mytable_old]',
+        ])
+        mock_scratch_table_name.assert_called_with('mytable', 'old')
+
+    def test_merge_table(self):
+        mock_table = Mock(name='table')
+        mock_table.columns = [sqlalchemy.Column('id'), sqlalchemy.Column('name')]
+        self.vertica_db_driver.table = Mock(name='table', return_value=mock_table)
+        self.vertica_db_driver.merge_table('myschema', 'mytable', 'mytable_staging', ['id'])
+        sql = str(self.mock_db_engine.execute.call_args.args[0])
+        self.assertEqual(sql,
+                         'MERGE INTO [myschema].[mytable] AS tgt '
+                         'USING [myschema].[mytable_staging] AS src '
+                         'ON tgt.[id] = src.[id] '
+                         'WHEN MATCHED THEN UPDATE SET [name] = src.[name] '
+                         'WHEN NOT MATCHED THEN INSERT ([id], [name]) '
+                         'VALUES (src.[id], src.[name])')
@@ -59,12 +59,15 @@ class TestVerticaDBDriverLoad(BaseTestVerticaDBDriver):
         mock_loc = self.mock_url_resolver.file_url.return_value
         mock_loc.open = MagicMock(name='open')
         self.mock_directory.manifest_entry_urls.return_value = [mock_data_url]
+        self.mock_directory.get_manifest.return_value = {
+            'entries': [{'url': mock_data_url, 'mandatory': True}]
+        }
         export_count = self.vertica_db_driver.loader().load(
             schema='myschema',
             table='mytable',
             load_plan=self.mock_records_load_plan,
             directory=self.mock_directory)
-        load_call = call(mock_vertica_import_sql.return_value, ANY)
+        load_call = call(mock_vertica_import_sql.return_value, ANY, buffer_size=ANY)
         mock_cursor = self.mock_db_engine.raw_connection.return_value.cursor.return_value
         mock_cursor.copy.assert_has_calls([load_call])
         self.assertEqual(None, export_count)
@@ -0,0 +1,66 @@
+import datetime
+import unittest
+import pandas as pd
+import pyarrow as pa
+from records_mover.records.schema.field import RecordsSchemaField
+from records_mover.records.schema.field.arrow import field_to_arrow_array
+
+
+def field_from_data(field_type, constraints=None):
+    data = {'type': field_type}
+    if constraints is not None:
+        data['constraints'] = constraints
+    return RecordsSchemaField.from_data('a', data)
+
+
+class TestArrow(unittest.TestCase):
+    def test_to_arrow_type(self):
+        expectations = [
+            (field_from_data('integer'), pa.int64()),
+            (field_from_data('integer', {'required': False, 'min': '-10', 'max': '10'}),
+             pa.int64()),
+            (field_from_data('integer',
+                             {'required': False, 'min': '0', 'max': '10000000000000000000'}),
+             pa.decimal128(20, 0)),
+            (field_from_data('integer', {'required': False, 'min': '0', 'max': '9' * 80}),
+             pa.float64()),
+            (field_from_data('decimal', {'required': False,
+                                         'fixed_precision': 10, 'fixed_scale': 2}),
+             pa.decimal128(10, 2)),
+            (field_from_data('decimal', {'required': False,
+                                         'fixed_precision': 50, 'fixed_scale': 2}),
+             pa.decimal256(50, 2)),
+            (field_from_data('decimal', {'required': False,
+                                         'fp_total_bits': 32, 'fp_significand_bits': 24}),
+             pa.float32()),
+            (field_from_data('decimal'), pa.float64()),
+            (field_from_data('boolean'), pa.bool_()),
+            (field_from_data('string'), pa.string()),
+            (field_from_data('date'), pa.date32()),
+            (field_from_data('time'), pa.time64('us')),
+            (field_from_data('timetz'), pa.time64('us')),
+            (field_from_data('datetime'), pa.timestamp('us')),
+            (field_from_data('datetimetz'), pa.timestamp('us', tz='UTC')),
+        ]
+        for field, expected_type in expectations:
+            self.assertEqual(field.to_arrow_type(), expected_type, field.to_data())
+
+    def test_field_to_arrow_array_decimal(self):
+        field = field_from_data('decimal', {'required': False,
+                                            'fixed_precision': 10, 'fixed_scale': 2})
+        out = field_to_arrow_array(field, pd.Series([1.25, None]))
+        self.assertEqual(out.type, pa.decimal128(10, 2))
+        self.assertEqual(out.to_pylist()[1], None)
+        self.assertEqual(str(out.to_pylist()[0]), '1.25')
+
+    def test_field_to_arrow_array_time_strings(self):
+        field = field_from_data('time')
+        out = field_to_arrow_array(field, pd.Series(['12:34:56', None]))
+        self.assertEqual(out.to_pylist(), [datetime.time(12, 34, 56), None])
+
+    def test_field_to_arrow_array_datetime_truncates_nanoseconds(self):
+        field = field_from_data('datetime')
+        out = field_to_arrow_array(field,
+                                   pd.Series(pd.to_datetime(['2020-01-01 01:02:03.123456789'])))
+        self.assertEqual(out.to_pylist(),
+                         [datetime.datetime(2020, 1, 1, 1, 2, 3, 123456)])
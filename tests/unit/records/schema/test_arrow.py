@@ -0,0 +1,43 @@
+import datetime
+import unittest
+import pandas as pd
+import pyarrow as pa
+from records_mover.records.schema import RecordsSchema
+
+
+class TestArrow(unittest.TestCase):
+    def setUp(self):
+        self.records_schema = RecordsSchema.from_data({
+            'schema': 'bltypes/v1',
+            'fields': {
+                'id': {
+                    'type': 'integer',
+                    'constraints': {'required': True, 'min': '0', 'max': '100'},
+                },
+                'name': {
+                    'type': 'string',
+                },
+                'updated': {
+                    'type': 'datetimetz',
+                },
+            },
+        })
+
+    def test_to_arrow_schema(self):
+        self.assertEqual(self.records_schema.to_arrow_schema(),
+                         pa.schema([pa.field('id', pa.int64(), nullable=False),
+                                    pa.field('name', pa.string()),
+                                    pa.field('updated', pa.timestamp('us', tz='UTC'))]))
+
+    def test_dataframe_to_arrow_table(self):
+        df = pd.DataFrame({
+            'name': ['a', None],
+            'updated': pd.to_datetime(['2020-01-01 01:02:03', None], utc=True),
+        }, index=pd.Index([1, 2], name='id'))
+        out = self.records_schema.dataframe_to_arrow_table(df, include_index=True)
+        self.assertEqual(out.schema, self.records_schema.to_arrow_schema())
+        self.assertEqual(out.column('id').to_pylist(), [1, 2])
+        self.assertEqual(out.column('name').to_pylist(), ['a', None])
+        self.assertEqual(out.column('updated').to_pylist(),
+                         [datetime.datetime(2020, 1, 1, 1, 2, 3, tzinfo=datetime.timezone.utc),
+                          None])
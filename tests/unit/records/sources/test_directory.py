@@ -43,3 +43,53 @@ class TestRecordsDirectoryRecordsSource(unittest.TestCase):
                                    processing_instructions=mock_processing_instructions,
                                    records_format=self.mock_records_format.alter_hints.return_value,
                                    records_schema=mock_records_schema)
+
+    @patch('records_mover.records.sources.fileobjs.FileobjsSource.infer_if_needed')
+    def test_to_fileobjs_source_sharded(self, mock_infer_if_needed):
+        mock_processing_instructions = Mock(name='processing_instructions')
+        urls = [f'gs://bucket/dir/part-{i}.avro' for i in range(3)]
+        self.mock_directory.manifest_entry_urls.return_value = urls
+        locs = {}
+
+        def file_url(url):
+            loc = MagicMock(name=url)
+            loc.url = url
+            locs[url] = loc
+            return loc
+
+        self.source.url_resolver.file_url.side_effect = file_url
+        self.mock_directory.path_of_url.side_effect = lambda url: url.split('/')[-1]
+        with self.source.to_fileobjs_source(processing_instructions=mock_processing_instructions):
+            target_names_to_input_fileobjs = mock_infer_if_needed.call_args[0][0]
+            self.assertEqual(target_names_to_input_fileobjs, {
+                url.split('/')[-1]: locs[url].open.return_value.__enter__.return_value
+                for url in urls
+            })
+            for loc in locs.values():
+                loc.open.return_value.__exit__.assert_not_called()
+        for loc in locs.values():
+            loc.open.return_value.__exit__.assert_called()
+
+    @patch('records_mover.records.sources.fileobjs.FileobjsSource.infer_if_needed')
+    def test_to_fileobjs_source_sharded_open_fails(self, mock_infer_if_needed):
+        mock_processing_instructions = Mock(name='processing_instructions')
+        urls = [f'gs://bucket/dir/part-{i}.avro' for i in range(3)]
+        self.mock_directory.manifest_entry_urls.return_value = urls
+        locs = {}
+
+        def file_url(url):
+            loc = MagicMock(name=url)
+            loc.url = url
+            if url == urls[1]:
+                loc.open.side_effect = OSError('no such file')
+            locs[url] = loc
+            return loc
+
+        self.source.url_resolver.file_url.side_effect = file_url
+        with self.assertRaises(OSError):
+            with self.source.\
+                    to_fileobjs_source(processing_instructions=mock_processing_instructions):
+                pass
+        mock_infer_if_needed.assert_not_called()
+        for url in [urls[0], urls[2]]:
+            locs[url].open.return_value.__exit__.assert_called()
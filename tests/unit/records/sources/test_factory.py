@@ -78,6 +78,39 @@ class TestFactory(unittest.TestCase):
                                                    url_resolver=self.mock_url_resolver)
         self.assertEqual(out, mock_TableRecordsSource.return_value)
 
+    @patch('records_mover.records.sources.query.QueryRecordsSource')
+    def test_query(self,
+                   mock_QueryRecordsSource):
+        mock_db_engine = Mock(name='db_engine')
+        out = self.records_sources.query(db_engine=mock_db_engine,
+                                         sql='SELECT 1')
+        mock_QueryRecordsSource.assert_called_with(sql='SELECT 1',
+                                                   driver=self.mock_db_driver.return_value,
+                                                   url_resolver=self.mock_url_resolver)
+        self.assertEqual(out, mock_QueryRecordsSource.return_value)
+
+    @patch('records_mover.records.watermark.WatermarkStore')
+    @patch('records_mover.records.sources.incremental_table.IncrementalTableRecordsSource')
+    def test_incremental_table(self,
+                               mock_IncrementalTableRecordsSource,
+                               mock_WatermarkStore):
+        mock_db_engine = Mock(name='db_engine')
+        out = self.records_sources.incremental_table(schema_name='myschema',
+                                                     table_name='mytable',
+                                                     db_engine=mock_db_engine,
+                                                     watermark_column='id',
+                                                     watermark_store_path='watermarks.json')
+        mock_WatermarkStore.assert_called_with('watermarks.json')
+        mock_IncrementalTableRecordsSource.\
+            assert_called_with(schema_name='myschema',
+                               table_name='mytable',
+                               driver=self.mock_db_driver.return_value,
+                               url_resolver=self.mock_url_resolver,
+                               watermark_column='id',
+                               last_watermark=None,
+                               watermark_store=mock_WatermarkStore.return_value)
+        self.assertEqual(out, mock_IncrementalTableRecordsSource.return_value)
+
     @patch('records_mover.records.sources.google_sheets.GoogleSheetsRecordsSource')
     def test_google_sheet(self, mock_GoogleSheetsRecordsSource):
         mock_spreadsheet_id = Mock(name='spreadsheet_id')
@@ -1,6 +1,6 @@
 from records_mover.records.sources.fileobjs import FileobjsSource
 from records_mover.records.records_format import DelimitedRecordsFormat
-from mock import Mock, patch
+from mock import ANY, Mock, patch
 import unittest
 
 
@@ -168,7 +168,10 @@ class TestFileobjsSource(unittest.TestCase):
                                        mock_MoveResult):
         mock_records_format = Mock(name='records_format')
         mock_records_schema = Mock(name='records_schema')
-        mock_target_names_to_input_fileobjs = Mock(name='target_names_to_input_fileobjs')
+        mock_fileobj = Mock(name='fileobj')
+        mock_target_names_to_input_fileobjs = {
+            'file.mumble': mock_fileobj
+        }
         mock_processing_instructions = Mock(name='processing_instructions')
 
         source = FileobjsSource(target_names_to_input_fileobjs=mock_target_names_to_input_fileobjs,
@@ -183,13 +186,18 @@ class TestFileobjsSource(unittest.TestCase):
         }
 
         mock_records_directory.save_fileobjs.return_value = mock_url_details
+        mock_records_directory.path_of_url.return_value = 'file.mumble'
 
         out = source.move_to_records_directory(mock_records_directory,
                                                mock_records_format,
                                                mock_processing_instructions)
-        mock_records_directory.save_fileobjs.assert_called_with(mock_target_names_to_input_fileobjs,
+        mock_records_directory.save_fileobjs.assert_called_with(ANY,
                                                                 records_format=mock_records_format,
                                                                 records_schema=mock_records_schema)
+        saved_fileobjs = mock_records_directory.save_fileobjs.call_args[0][0]
+        self.assertEqual(list(saved_fileobjs.keys()), ['file.mumble'])
+        self.assertIs(saved_fileobjs['file.mumble'].fileobj, mock_fileobj)
+        mock_records_directory.path_of_url.assert_called_with(mock_url)
         mock_MoveResult.assert_called_with(move_count=None,
                                            output_urls={'file.mumble': 'vmb://dir/file.mumble'})
         self.assertEqual(out, mock_MoveResult.return_value)
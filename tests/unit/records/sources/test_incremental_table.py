@@ -0,0 +1,56 @@
+from records_mover.records.sources.incremental_table import IncrementalTableRecordsSource
+from records_mover.records.results import MoveResult
+from mock import MagicMock, Mock, patch
+import unittest
+
+
+@patch('records_mover.records.sources.incremental_table.quote_column_name')
+class TestIncrementalTableRecordsSource(unittest.TestCase):
+    def setUp(self):
+        self.mock_driver = MagicMock(name='driver')
+        self.mock_watermark_store = Mock(name='watermark_store')
+        self.mock_watermark_store.get.return_value = 10
+        self.source =\
+            IncrementalTableRecordsSource(schema_name='myschema',
+                                          table_name='mytable',
+                                          driver=self.mock_driver,
+                                          url_resolver=Mock(name='url_resolver'),
+                                          watermark_column='id',
+                                          watermark_store=self.mock_watermark_store)
+
+    def set_high_watermark(self, high_watermark):
+        self.mock_driver.db_conn.execute.return_value.scalar.return_value = high_watermark
+
+    def test_init_reads_store(self, mock_quote_column_name):
+        self.mock_watermark_store.get.assert_called_with('myschema.mytable.id')
+        self.assertEqual(10, self.source.last_watermark)
+
+    def test_where(self, mock_quote_column_name):
+        mock_quote_column_name.return_value = '"id"'
+        self.set_high_watermark(20)
+        self.assertEqual('"id" > 10 AND "id" <= 20', self.source.where())
+        query = str(self.mock_driver.db_conn.execute.call_args[0][0])
+        self.assertIn('max(id)', query)
+        self.assertIn('WHERE id >', query)
+
+    def test_where_first_move(self, mock_quote_column_name):
+        mock_quote_column_name.return_value = '"id"'
+        self.source.last_watermark = None
+        self.set_high_watermark(20)
+        self.assertEqual('"id" <= 20', self.source.where())
+
+    def test_where_nothing_new(self, mock_quote_column_name):
+        self.set_high_watermark(None)
+        self.assertEqual('1 = 0', self.source.where())
+
+    def test_move_complete(self, mock_quote_column_name):
+        self.set_high_watermark(20)
+        out = self.source.move_complete(MoveResult(move_count=10, output_urls=None))
+        self.assertEqual(MoveResult(move_count=10, output_urls=None, high_watermark=20), out)
+        self.mock_watermark_store.set.assert_called_with('myschema.mytable.id', 20)
+
+    def test_move_complete_nothing_new(self, mock_quote_column_name):
+        self.set_high_watermark(None)
+        out = self.source.move_complete(MoveResult(move_count=0, output_urls=None))
+        self.assertEqual(10, out.high_watermark)
+        self.mock_watermark_store.set.assert_called_with('myschema.mytable.id', 10)
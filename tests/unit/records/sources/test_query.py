@@ -0,0 +1,62 @@
+from records_mover.records.sources.query import QueryRecordsSource
+from mock import MagicMock, Mock, patch
+import unittest
+
+
+class TestQueryRecordsSource(unittest.TestCase):
+    def setUp(self):
+        self.mock_driver = MagicMock(name='driver')
+        self.mock_unloader = self.mock_driver.unloader.return_value
+        self.mock_url_resolver = Mock(name='url_resolver')
+        self.query_records_source =\
+            QueryRecordsSource(sql='  SELECT a, b FROM myschema.mytable WHERE c > 3 ;\n',
+                               driver=self.mock_driver,
+                               url_resolver=self.mock_url_resolver)
+
+    def test_init_strips_semicolon(self):
+        self.assertEqual('SELECT a, b FROM myschema.mytable WHERE c > 3',
+                         self.query_records_source.sql)
+
+    @patch('records_mover.records.sources.database.RecordsUnloadPlan')
+    @patch('records_mover.records.sources.database.MoveResult')
+    @patch('records_mover.records.sources.query.RecordsSchema')
+    def test_move_to_records_directory(self,
+                                       mock_RecordsSchema,
+                                       mock_MoveResult,
+                                       mock_RecordsUnloadPlan):
+        mock_records_directory = Mock(name='records_directory')
+        mock_records_format = Mock(name='records_format')
+        mock_processing_instructions = Mock(name='processing_instructions')
+        out = self.query_records_source.move_to_records_directory(mock_records_directory,
+                                                                  mock_records_format,
+                                                                  mock_processing_instructions)
+        mock_RecordsUnloadPlan.\
+            assert_called_with(records_format=mock_records_format,
+                               processing_instructions=mock_processing_instructions)
+        mock_unload_plan = mock_RecordsUnloadPlan.return_value
+        self.mock_unloader.unload_query.\
+            assert_called_with(query='SELECT a, b FROM myschema.mytable WHERE c > 3',
+                               unload_plan=mock_unload_plan,
+                               directory=mock_records_directory)
+        mock_RecordsSchema.from_db_query.\
+            assert_called_with('SELECT a, b FROM myschema.mytable WHERE c > 3',
+                               driver=self.mock_driver)
+        self.mock_driver.tweak_records_schema_after_unload.\
+            assert_called_with(mock_RecordsSchema.from_db_query.return_value,
+                               mock_unload_plan.records_format)
+        mock_records_directory.save_schema.\
+            assert_called_with(self.mock_driver.tweak_records_schema_after_unload.return_value)
+        mock_records_directory.save_format.assert_called_with(mock_unload_plan.records_format)
+        mock_records_directory.finalize_manifest.assert_called_with()
+        mock_export_count = self.mock_unloader.unload_query.return_value
+        mock_MoveResult.assert_called_with(move_count=mock_export_count,
+                                           output_urls=None)
+        self.assertEqual(out, mock_MoveResult.return_value)
+
+    def test_move_to_records_directory_no_unloader(self):
+        self.mock_driver.unloader.return_value = None
+        with self.assertRaises(ValueError):
+            mock_processing_instructions = Mock(name='processing_instructions')
+            self.query_records_source.move_to_records_directory(Mock(name='records_directory'),
+                                                                Mock(name='records_format'),
+                                                                mock_processing_instructions)
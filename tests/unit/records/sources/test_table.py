@@ -61,7 +61,7 @@ class TestTableRecordsSource(unittest.TestCase):
         mock_chunks.close.assert_called()
 
     @patch('records_mover.records.sources.table.RecordsUnloadPlan')
-    @patch('records_mover.records.sources.table.MoveResult')
+    @patch('records_mover.records.sources.database.MoveResult')
     @patch('records_mover.records.sources.table.RecordsSchema')
     def test_move_to_records_directory(self,
                                        mock_RecordsSchema,
@@ -75,7 +75,8 @@ class TestTableRecordsSource(unittest.TestCase):
                                                                   mock_processing_instructions)
         mock_RecordsUnloadPlan.\
             assert_called_with(records_format=mock_records_format,
-                               processing_instructions=mock_processing_instructions)
+                               processing_instructions=mock_processing_instructions,
+                               where=None)
         mock_unload_plan = mock_RecordsUnloadPlan.return_value
         self.mock_unloader.unload.assert_called_with(schema=self.mock_schema_name,
                                                      table=self.mock_table_name,
@@ -92,7 +93,7 @@ class TestTableRecordsSource(unittest.TestCase):
         self.assertEqual(out, mock_result)
 
     @patch('records_mover.records.sources.table.RecordsUnloadPlan')
-    @patch('records_mover.records.sources.table.MoveResult')
+    @patch('records_mover.records.sources.database.MoveResult')
     @patch('records_mover.records.sources.table.RecordsSchema')
     def test_has_compatible_format_1(self,
                                      mock_RecordsSchema,
@@ -128,7 +129,7 @@ class TestTableRecordsSource(unittest.TestCase):
         self.assertEqual(True, out)
 
     @patch('records_mover.records.sources.table.RecordsUnloadPlan')
-    @patch('records_mover.records.sources.table.MoveResult')
+    @patch('records_mover.records.sources.database.MoveResult')
     @patch('records_mover.records.sources.table.RecordsSchema')
     def test_has_compatible_format_2(self,
                                      mock_RecordsSchema,
@@ -192,3 +193,13 @@ class TestTableRecordsSource(unittest.TestCase):
             self.assertEqual(loc,
                              self.mock_unloader.temporary_unloadable_directory_loc.
                              return_value.__enter__.return_value)
+
+    def test_can_move_to_partitions(self):
+        self.mock_unloader.can_unload_partitioned.return_value = False
+        self.assertFalse(self.table_records_source.can_move_to_partitions())
+        self.mock_unloader.can_unload_partitioned.return_value = True
+        self.assertTrue(self.table_records_source.can_move_to_partitions())
+
+    def test_can_move_to_partitions_no_unloader(self):
+        self.mock_driver.unloader.return_value = None
+        self.assertFalse(self.table_records_source.can_move_to_partitions())
@@ -16,6 +16,7 @@ class TestDoMoveFromDataframesSource(unittest.TestCase):
         self.mock_dfs_source = MagicMock(name='dfs_source')
         self.mock_table_target = Mock(name='table_target')
         self.mock_table_target = Mock(name='table_target')
+        self.mock_table_target.can_move_from_dataframes_source_directly.return_value = False
         self.algo =\
             DoMoveFromDataframesSource(prep=self.mock_prep,
                                        table_target=self.mock_table_target,
@@ -55,21 +56,64 @@ class TestDoMoveFromDataframesSource(unittest.TestCase):
                                self.mock_processing_instructions)
         self.assertEqual(out, expected_ret)
 
+    @patch('records_mover.records.targets.table.move_from_dataframes_source.RecordsLoadPlan')
+    @patch('records_mover.records.targets.table.move_from_dataframes_source.' +
+           'purge_unnamed_unused_columns')
+    @patch('records_mover.records.targets.table.move_from_dataframes_source.prep_and_load')
+    def test_move_via_loader(self,
+                             mock_prep_and_load,
+                             mock_purge_unnamed_unused_columns,
+                             mock_RecordsLoadPlan):
+        self.mock_table_target.can_move_from_dataframes_source_directly.return_value = True
+        mock_df = Mock(name='df')
+        self.mock_dfs_source.dfs = [mock_df]
+        mock_driver = self.mock_tbl.db_driver.return_value
+        mock_loader = mock_driver.loader_from_dataframes.return_value
+        mock_records_format = mock_loader.dataframes_records_format.return_value
+        mock_records_schema = self.mock_dfs_source.initial_records_schema.return_value
+        mock_tweaked_records_schema = mock_driver.tweak_records_schema_for_load.return_value
+        mock_schema_sql = mock_tweaked_records_schema.to_schema_sql.return_value
+
+        out = self.algo.move()
+        mock_driver.tweak_records_schema_for_load.assert_called_with(mock_records_schema,
+                                                                     mock_records_format)
+        mock_tweaked_records_schema.to_schema_sql.assert_called_with(mock_driver,
+                                                                     self.mock_tbl.schema_name,
+                                                                     self.mock_tbl.table_name)
+        self.assertEqual(mock_prep_and_load.call_args[0][2], mock_schema_sql)
+        self.assertEqual(mock_prep_and_load.call_args[0][4],
+                         mock_loader.load_failure_exception.return_value)
+        self.assertEqual(out, mock_prep_and_load.return_value)
+
+        load = mock_prep_and_load.call_args[0][3]
+        self.assertEqual(load(mock_driver, 'mytable_staging'),
+                         mock_loader.load_from_dataframes.return_value)
+        kwargs = mock_loader.load_from_dataframes.call_args[1]
+        self.assertEqual(kwargs['table'], 'mytable_staging')
+        self.assertEqual(kwargs['records_schema'], mock_tweaked_records_schema)
+        self.assertEqual(kwargs['load_plan'], mock_RecordsLoadPlan.return_value)
+        self.assertEqual(list(kwargs['dfs']),
+                         [mock_records_schema.assign_dataframe_names.return_value])
+        mock_purge_unnamed_unused_columns.assert_called_with(mock_df)
+        self.mock_table_target.move_from_fileobjs_source.assert_not_called()
+
     @patch('records_mover.records.targets.table.move_from_dataframes_source.prep_and_load')
     def test_move_via_insert(self, mock_prep_and_load):
         self.mock_table_target.known_supported_records_formats.return_value = []
         mock_driver = self.mock_tbl.db_driver.return_value
         mock_records_schema = self.mock_dfs_source.initial_records_schema.return_value
         mock_schema_sql = mock_records_schema.to_schema_sql.return_value
+        mock_db = self.mock_tbl.db_engine.connect.return_value.__enter__.return_value
         out = self.algo.move()
-        self.mock_tbl.db_driver.assert_called_with(db=None, db_engine=self.mock_tbl.db_engine)
+        self.mock_tbl.db_driver.assert_called_with(db=None, db_conn=mock_db)
         self.mock_dfs_source.initial_records_schema.\
             assert_called_with(self.mock_processing_instructions)
         mock_records_schema.to_schema_sql.assert_called_with(mock_driver,
                                                              self.mock_tbl.schema_name,
                                                              self.mock_tbl.table_name)
         mock_prep_and_load.assert_called_with(self.mock_tbl, self.mock_prep, mock_schema_sql,
-                                              self.algo.load, sqlalchemy.exc.InternalError)
+                                              self.algo.load, sqlalchemy.exc.InternalError,
+                                              driver=mock_driver)
         self.assertEqual(out, mock_prep_and_load.return_value)
 
     @patch('records_mover.records.targets.table.move_from_dataframes_source.' +
@@ -79,15 +123,15 @@ class TestDoMoveFromDataframesSource(unittest.TestCase):
         mock_df = Mock(name='df')
         mock_records_schema = self.mock_dfs_source.initial_records_schema.return_value
         self.mock_dfs_source.dfs = [mock_df]
-        mock_db = self.mock_tbl.db_engine.connect.return_value.__enter__.return_value
+        mock_db = mock_driver.db_conn
         mock_df_1 = mock_purge_unnamed_unused_columns.return_value
         mock_df_2 = mock_records_schema.assign_dataframe_names.return_value
         mock_df_2.index = [1, 2, 3]
-        out = self.algo.load(mock_driver)
+        out = self.algo.load(mock_driver, 'mytable_staging')
         mock_purge_unnamed_unused_columns.assert_called_with(mock_df)
         mock_records_schema.assign_dataframe_names.\
             assert_called_with(include_index=self.mock_dfs_source.include_index, df=mock_df_1)
-        mock_df_2.to_sql.assert_called_with(name=self.mock_tbl.table_name,
+        mock_df_2.to_sql.assert_called_with(name='mytable_staging',
                                             con=mock_db,
                                             schema=self.mock_tbl.schema_name,
                                             index=self.mock_dfs_source.include_index,
@@ -16,6 +16,7 @@ class TestDoMoveFromFileobjsSource(unittest.TestCase):
         self.mock_RecordsLoadPlan = mock_RecordsLoadPlan
         self.mock_prep = Mock(name='prep', spec=TablePrep)
         self.mock_tbl = MagicMock(name='tbl')
+        self.mock_prep.prep.return_value = self.mock_tbl.table_name
         self.mock_processing_instructions = Mock(name='processing_instructions',
                                                  spec='ProcessingInstructions')
         self.mock_fileobjs_source = Mock(name='fileobjs_source', spec=FileobjsSource)
@@ -51,12 +52,13 @@ class TestDoMoveFromFileobjsSource(unittest.TestCase):
             assert_called_with(schema=self.mock_tbl.schema_name,
                                table=self.mock_tbl.table_name,
                                load_plan=self.mock_plan,
-                               fileobj=self.mock_fileobj)
+                               fileobj=self.algo.fileobj)
         mock_tweaked_records_schema.to_schema_sql.\
             assert_called_with(mock_driver,
                                self.mock_tbl.schema_name,
                                self.mock_tbl.table_name)
         self.assertEqual(out.move_count, mock_import_count)
+        self.assertIs(self.algo.fileobj.fileobj, self.mock_fileobj)
 
     def test_move_with_load_failure_dont_recreate_reraise(self):
         class MyException(Exception):
@@ -89,7 +91,7 @@ class TestDoMoveFromFileobjsSource(unittest.TestCase):
             assert_called_with(schema=self.mock_tbl.schema_name,
                                table=self.mock_tbl.table_name,
                                load_plan=self.mock_plan,
-                               fileobj=self.mock_fileobj)
+                               fileobj=self.algo.fileobj)
 
     def test_move_with_load_failure_recreate(self):
         class MyException(Exception):
@@ -132,5 +134,5 @@ class TestDoMoveFromFileobjsSource(unittest.TestCase):
             assert_called_with(schema=self.mock_tbl.schema_name,
                                table=self.mock_tbl.table_name,
                                load_plan=mock_plan,
-                               fileobj=self.mock_fileobj)
+                               fileobj=self.algo.fileobj)
         self.assertEqual(out.move_count, mock_import_count)
@@ -11,6 +11,7 @@ class TestDoMoveFromRecordsDirectory(unittest.TestCase):
     def setUp(self):
         self.mock_prep = Mock(name='prep', spec=TablePrep)
         self.mock_tbl = MagicMock(name='tbl')
+        self.mock_prep.prep.return_value = self.mock_tbl.table_name
         self.mock_directory = Mock(name='directory', spec=RecordsDirectory)
         self.mock_processing_instructions = Mock(name='processing_instructions')
         self.mock_override_records_format = Mock(name='override_records_format')
@@ -13,7 +13,7 @@ class TestDoMoveFromTempLocAfterFillingIt(unittest.TestCase):
                   mock_RecordsDirectory):
         mock_prep = Mock(name='prep', spec=TablePrep)
         mock_tbl = MagicMock(name='tbl')
-        mock_table_target = Mock(name='table_target')
+        mock_table_target = MagicMock(name='table_target')
         mock_records_source = Mock(name='records_source')
         mock_processing_instructions = Mock(name='processing_instructions',
                                             spec='ProcessingInstructions')
@@ -24,14 +24,14 @@ class TestDoMoveFromTempLocAfterFillingIt(unittest.TestCase):
                                                processing_instructions=mock_processing_instructions)
         mock_records_format = mock_records_source.compatible_format.return_value
         mock_pis = mock_processing_instructions
-        mock_driver = mock_tbl.db_driver.return_value
+        mock_driver = mock_table_target.driver
         mock_loader = mock_driver.loader.return_value
         mock_temp_loc =\
             mock_loader.temporary_loadable_directory_loc.return_value.__enter__.return_value
         mock_directory = mock_RecordsDirectory.return_value
         out = algo.move()
         mock_records_source.compatible_format.assert_called_with(mock_table_target)
-        mock_tbl.db_driver.assert_called_with(db=None, db_engine=mock_tbl.db_engine)
+        mock_tbl.db_driver.assert_not_called()
         mock_RecordsDirectory.assert_called_with(records_loc=mock_temp_loc)
         mock_records_source.move_to_records_directory.\
             assert_called_with(records_directory=mock_directory,
@@ -1,6 +1,7 @@
 import unittest
 from mock import Mock
 from records_mover.records.targets.table import TableRecordsTarget
+from records_mover.records.existing_table_handling import ExistingTableHandling
 
 
 class TestTarget(unittest.TestCase):
@@ -39,6 +40,11 @@ class TestTarget(unittest.TestCase):
 
         self.mock_db_driver.assert_called_with(None, db_engine=self.mock_db_engine, db_conn=None)
 
+    def test_can_move_from_dataframes_source_directly_no_loader(self):
+        mock_driver = self.mock_db_driver.return_value
+        mock_driver.loader_from_dataframes.return_value = None
+        self.assertFalse(self.target.can_move_from_dataframes_source_directly())
+
     def test_can_move_directly_from_scheme_no_loader(self):
         mock_driver = self.mock_db_driver.return_value
         mock_driver.loader.return_value = None
@@ -78,3 +84,22 @@ class TestTarget(unittest.TestCase):
         out = self.target.temporary_loadable_directory_scheme()
         self.assertEqual(out,
                          mock_loader.temporary_loadable_directory_scheme.return_value)
+
+    def test_capability_checks_reuse_driver(self):
+        self.target.can_move_from_fileobjs_source()
+        self.target.can_move_directly_from_scheme('s3')
+        self.target.known_supported_records_formats()
+        self.target.can_move_from_temp_loc_after_filling_it()
+        self.target.temporary_loadable_directory_scheme()
+
+        self.mock_db_driver.assert_called_once_with(None,
+                                                    db_engine=self.mock_db_engine,
+                                                    db_conn=None)
+
+    def test_upsert_requires_upsert_key(self):
+        with self.assertRaises(ValueError):
+            TableRecordsTarget(schema_name=self.mock_schema_name,
+                               table_name=self.mock_table_name,
+                               db_engine=self.mock_db_engine,
+                               db_driver=self.mock_db_driver,
+                               existing_table_handling=ExistingTableHandling.UPSERT)
@@ -46,7 +46,8 @@ class TestFactory(unittest.TestCase):
                                existing_table_handling=existing_table_handling,
                                add_group_perms_for=None,
                                add_user_perms_for=None,
-                               db_conn=None)
+                               db_conn=None,
+                               upsert_key=None)
         self.assertEqual(table, mock_TableRecordsTarget.return_value)
 
     @patch('records_mover.records.targets.google_sheets.GoogleSheetsRecordsTarget')
@@ -1,9 +1,45 @@
 import unittest
+from typing import Dict
 from records_mover.records.targets.spectrum import SpectrumRecordsTarget
 from records_mover.records.existing_table_handling import ExistingTableHandling
+from records_mover.records.processing_instructions import ProcessingInstructions
+from sqlalchemy import Column, Date, Integer, String
+from sqlalchemy.dialects import postgresql
 from mock import Mock, patch, MagicMock
 
 
+class FakeS3Url:
+    """Just enough of an S3 location, keeping objects in a dict, to
+    watch files move around."""
+    def __init__(self, url: str, objects: Dict[str, bytes]) -> None:
+        self.url = url
+        self.scheme = 's3'
+        self.objects = objects
+
+    def directory_in_this_directory(self, name: str) -> 'FakeS3Url':
+        return FakeS3Url(f'{self.url}{name}/', self.objects)
+
+    def file_in_this_directory(self, name: str) -> 'FakeS3Url':
+        return FakeS3Url(f'{self.url}{name}', self.objects)
+
+    def purge_directory(self) -> None:
+        for url in [url for url in self.objects if url.startswith(self.url)]:
+            del self.objects[url]
+
+    def rename_to(self, new: 'FakeS3Url') -> 'FakeS3Url':
+        if new.url in self.objects:
+            raise AssertionError(f'{new.url} would be overwritten')
+        self.objects[new.url] = self.objects.pop(self.url)
+        return new
+
+    def unload(self, paths: Dict[str, bytes]) -> None:
+        for path, contents in paths.items():
+            url = f'{self.url}{path}'
+            if url in self.objects:
+                raise AssertionError(f'{url} already exists')
+            self.objects[url] = contents
+
+
 class TestSpectrum(unittest.TestCase):
     @patch('records_mover.records.targets.spectrum.ParquetRecordsFormat')
     def setUp(self,
@@ -92,3 +128,213 @@ class TestSpectrum(unittest.TestCase):
                                                "STORED AS PARQUET\n"
                                                "LOCATION 's3://output-loc/_manifest'\n\n"
                                                "TABLE PROPERTIES ('numRows'='123')")
+
+
+class TestSpectrumPartitioned(unittest.TestCase):
+    def setUp(self):
+        mock_url_resolver = Mock(name='url_resolver')
+        mock_db_driver = Mock(name='db_driver')
+        self.mock_driver = mock_db_driver.return_value
+        self.mock_db = MagicMock(name='db')
+        self.mock_db.dialect = postgresql.dialect()
+        self.mock_driver.db_engine = self.mock_db
+        self.mock_output_loc = mock_url_resolver.directory_url.return_value
+        self.mock_output_loc.url = 's3://output-loc/'
+        self.mock_output_loc.scheme = 's3'
+        self.mock_url_resolver = mock_url_resolver
+        self.mock_db_driver = mock_db_driver
+        self.mock_cursor = self.mock_db.connect.return_value.__enter__.return_value
+
+    def target(self, existing_table_handling):
+        return SpectrumRecordsTarget(schema_name='myschema',
+                                     table_name='mytable',
+                                     db_engine=self.mock_db,
+                                     db_driver=self.mock_db_driver,
+                                     url_resolver=self.mock_url_resolver,
+                                     spectrum_base_url=None,
+                                     spectrum_rdir_url='s3://output-loc/',
+                                     existing_table_handling=existing_table_handling,
+                                     partition_by=['region', 'day'])
+
+    def mock_directory(self, mock_RecordsDirectory, paths):
+        mock_directory = mock_RecordsDirectory.return_value
+        mock_directory.manifest_entry_urls.return_value = [
+            f's3://output-loc/{path}' for path in paths
+        ]
+        mock_directory.path_of_url.side_effect = lambda url: url[len('s3://output-loc/'):]
+        return mock_directory
+
+    def executed(self):
+        out = []
+        for args, kwargs in self.mock_cursor.execute.call_args_list:
+            statement = args[0]
+            if isinstance(statement, str):
+                out.append((statement, {}))
+            else:
+                out.append((str(statement), statement.compile().params))
+        return out
+
+    def test_processing_instructions_for_records_directory(self):
+        target = self.target(ExistingTableHandling.DROP_AND_RECREATE)
+        processing_instructions = ProcessingInstructions()
+        out = target.processing_instructions_for_records_directory(processing_instructions)
+        self.assertEqual(out.partition_by, ['region', 'day'])
+        self.assertIsNone(processing_instructions.partition_by)
+
+    def test_processing_instructions_for_records_directory_conflict(self):
+        target = self.target(ExistingTableHandling.DROP_AND_RECREATE)
+        processing_instructions = ProcessingInstructions(partition_by=['day'])
+        with self.assertRaises(ValueError):
+            target.processing_instructions_for_records_directory(processing_instructions)
+
+    def test_pre_load_hook_append(self):
+        target = self.target(ExistingTableHandling.APPEND)
+        target.pre_load_hook()
+        self.mock_output_loc.purge_directory.assert_not_called()
+        mock_append_loc = self.mock_output_loc.directory_in_this_directory.return_value
+        mock_append_loc.purge_directory.assert_called_with()
+        self.mock_output_loc.directory_in_this_directory.\
+            assert_called_with(f'_append_{target.append_id}')
+
+    @patch('records_mover.records.targets.spectrum.CreateTable')
+    @patch('records_mover.records.targets.spectrum.RecordsDirectory')
+    def test_post_load_hook_creates_partitioned_table(self,
+                                                      mock_RecordsDirectory,
+                                                      mock_CreateTable):
+        target = self.target(ExistingTableHandling.DROP_AND_RECREATE)
+        mock_directory = self.mock_directory(mock_RecordsDirectory, [
+            'region=us%20east/day=2020-01-01/0000_part_00.parquet',
+            'region=us%20east/day=2020-01-01/0001_part_00.parquet',
+            "region=o'hare/day=2020-01-02/0000_part_00.parquet",
+            'region=__HIVE_DEFAULT_PARTITION__/day=2020-01-02/0000_part_00.parquet',
+        ])
+        mock_records_schema = mock_directory.load_schema_json_obj.return_value
+        fields = []
+        for column in [Column('value', Integer()),
+                       Column('region', String(32)),
+                       Column('day', Date())]:
+            mock_field = Mock(name='field')
+            mock_field.to_sqlalchemy_column.return_value = column
+            fields.append(mock_field)
+        mock_records_schema.fields = fields
+        mock_CreateTable.return_value = "CREATE EXTERNAL TABLE ... "
+
+        target.post_load_hook(num_rows_loaded=123)
+        table = mock_CreateTable.call_args[0][0]
+        self.assertEqual([column.name for column in table.columns], ['value'])
+        self.mock_cursor.execution_options.assert_called_with(isolation_level='AUTOCOMMIT')
+        self.assertEqual(self.executed(), [
+            ("CREATE EXTERNAL TABLE ... "
+             "PARTITIONED BY (region VARCHAR(32), day DATE)\n"
+             "STORED AS PARQUET\n"
+             "LOCATION 's3://output-loc/'\n\n"
+             "TABLE PROPERTIES ('numRows'='123')", {}),
+            ("ALTER TABLE myschema.mytable ADD IF NOT EXISTS\n"
+             "PARTITION (region=:value_0_0, day=:value_0_1) LOCATION :location_0,\n"
+             "PARTITION (region=:value_1_0, day=:value_1_1) LOCATION :location_1",
+             {
+                 'value_0_0': 'us east',
+                 'value_0_1': '2020-01-01',
+                 'location_0': 's3://output-loc/region=us%20east/day=2020-01-01/',
+                 'value_1_0': "o'hare",
+                 'value_1_1': '2020-01-02',
+                 'location_1': "s3://output-loc/region=o'hare/day=2020-01-02/",
+             }),
+        ])
+
+    @patch('records_mover.records.targets.spectrum.RecordsDirectory')
+    def test_post_load_hook_appends_partitions(self, mock_RecordsDirectory):
+        target = self.target(ExistingTableHandling.APPEND)
+        self.mock_directory(mock_RecordsDirectory, [
+            'region=west/day=2020-01-03/0000_part_00.parquet',
+        ])
+        target.post_load_hook(num_rows_loaded=5)
+        self.assertEqual(self.executed(), [
+            ("ALTER TABLE myschema.mytable ADD IF NOT EXISTS\n"
+             "PARTITION (region=:value_0_0, day=:value_0_1) LOCATION :location_0",
+             {
+                 'value_0_0': 'west',
+                 'value_0_1': '2020-01-03',
+                 'location_0': 's3://output-loc/region=west/day=2020-01-03/',
+             }),
+        ])
+
+    @patch('records_mover.records.targets.spectrum.RecordsDirectory')
+    def test_post_load_hook_updates_num_rows(self, mock_RecordsDirectory):
+        target = self.target(ExistingTableHandling.TRUNCATE_AND_OVERWRITE)
+        self.mock_directory(mock_RecordsDirectory, [
+            'region=west/day=2020-01-03/0000_part_00.parquet',
+        ])
+        target.post_load_hook(num_rows_loaded=5)
+        self.assertEqual([statement for statement, params in self.executed()], [
+            "ALTER TABLE myschema.mytable SET TABLE PROPERTIES ('numRows'='5')",
+            "ALTER TABLE myschema.mytable ADD IF NOT EXISTS\n"
+            "PARTITION (region=:value_0_0, day=:value_0_1) LOCATION :location_0",
+        ])
+
+    @patch('records_mover.records.targets.spectrum.RecordsDirectory')
+    def test_post_load_hook_unpartitioned_files(self, mock_RecordsDirectory):
+        target = self.target(ExistingTableHandling.APPEND)
+        self.mock_directory(mock_RecordsDirectory, ['data001.parquet'])
+        with self.assertRaises(NotImplementedError):
+            target.post_load_hook(num_rows_loaded=5)
+
+    @patch('records_mover.records.targets.spectrum.RecordsDirectory')
+    def test_two_appends_to_same_target(self, mock_RecordsDirectory):
+        objects: Dict[str, bytes] = {
+            's3://output-loc/region=west/day=2020-01-03/0000_part_00.parquet': b'original',
+        }
+        self.mock_url_resolver.directory_url.return_value = FakeS3Url('s3://output-loc/',
+                                                                      objects)
+
+        def records_directory(loc):
+            mock_directory = Mock(name='directory')
+            mock_directory.loc = loc
+            mock_directory.manifest_entry_urls.side_effect = lambda: [
+                url for url in objects if url.startswith(loc.url)
+            ]
+            mock_directory.path_of_url.side_effect = lambda url: url[len(loc.url):]
+            return mock_directory
+
+        mock_RecordsDirectory.side_effect = records_directory
+        target = self.target(ExistingTableHandling.APPEND)
+        run_ids = []
+        for contents, day in [(b'first', '2020-01-03'), (b'second', '2020-01-04')]:
+            directory = target.records_directory()
+            target.pre_load_hook()
+            run_ids.append(target.append_id)
+            # What Redshift UNLOAD would write, always with the same
+            # filenames
+            directory.loc.unload({
+                'region=west/day=2020-01-03/0000_part_00.parquet': contents,
+                f'region=west/day={day}/0001_part_00.parquet': contents,
+            })
+            target.post_load_hook(num_rows_loaded=2)
+            self.assertIsNone(target.append_id)
+
+        first, second = run_ids
+        self.assertNotEqual(first, second)
+        self.assertEqual(objects, {
+            's3://output-loc/region=west/day=2020-01-03/0000_part_00.parquet': b'original',
+            f's3://output-loc/region=west/day=2020-01-03/{first}_0000_part_00.parquet': b'first',
+            f's3://output-loc/region=west/day=2020-01-03/{first}_0001_part_00.parquet': b'first',
+            f's3://output-loc/region=west/day=2020-01-03/{second}_0000_part_00.parquet':
+            b'second',
+            f's3://output-loc/region=west/day=2020-01-04/{second}_0001_part_00.parquet':
+            b'second',
+        })
+        self.assertEqual([params for statement, params in self.executed()], [
+            {
+                'value_0_0': 'west',
+                'value_0_1': '2020-01-03',
+                'location_0': 's3://output-loc/region=west/day=2020-01-03/',
+            },
+            {
+                'value_0_0': 'west',
+                'value_0_1': '2020-01-03',
+                'location_0': 's3://output-loc/region=west/day=2020-01-03/',
+                'value_1_0': 'west',
+                'value_1_1': '2020-01-04',
+                'location_1': 's3://output-loc/region=west/day=2020-01-04/',
+            },
+        ])
@@ -1,31 +1,24 @@
+import json
 import unittest
 
 import mock
-from mock import patch, call, Mock
-from records_mover.records.cli import main
+from mock import patch, call
+from records_mover.records.cli import main, build_parser, selected_subjob_names
+from records_mover.records.metrics import MoveMetrics
+from records_mover.records.results import MoveResult
 
 
-@patch('google.cloud.storage.Client')
-@patch('google.auth.default')
 @patch('records_mover.records.cli.argparse')
-@patch('records_mover.records.cli.method_to_json_schema')
-@patch('records_mover.records.cli.run_records_mover_job')
 @patch('records_mover.records.cli.JobConfigSchemaAsArgsParser')
 @patch('records_mover.records.cli.arguments_output_to_config')
-@patch('records_mover.session.get_config')
 class TestCLI(unittest.TestCase):
+    @patch('records_mover.records.cli.sys')
     def test_main(self,
-                  mock_get_config,
+                  mock_sys,
                   mock_arguments_output_to_config,
                   mock_JobConfigSchemaAsArgsParser,
-                  mock_run_records_mover_job,
-                  mock_method_to_json_schema,
-                  mock_argparse,
-                  mock_google_auth_default,
-                  mock_google_cloud_storage_Client):
-        mock_credentials = Mock(name='credentials')
-        mock_project = Mock(name='project')
-        mock_google_auth_default.return_value = (mock_credentials, mock_project)
+                  mock_argparse):
+        mock_sys.argv = ['mvrec']
         mock_parser = mock_argparse.ArgumentParser.return_value
         mock_subparsers = mock_parser.add_subparsers.return_value
         mock_args = mock.MagicMock()
@@ -36,3 +29,89 @@ class TestCLI(unittest.TestCase):
         mock_subparsers.add_parser.assert_has_calls([call('table2recordsdir',
                                                           help='Copy from table to recordsdir')])
         mock_parser.parse_args.assert_called_with()
+        # only the top-level processing instructions arguments are configured
+        self.assertEqual(mock_JobConfigSchemaAsArgsParser.call_count, 1)
+
+    @patch('records_mover.records.job.mover.run_records_mover_job')
+    @patch('records_mover.records.cli.sys')
+    def test_main_runs_selected_subjob(self,
+                                       mock_sys,
+                                       mock_run_records_mover_job,
+                                       mock_arguments_output_to_config,
+                                       mock_JobConfigSchemaAsArgsParser,
+                                       mock_argparse):
+        mock_sys.argv = ['mvrec', 'table2recordsdir', 'mydb', 'myschema', 'mytable', 's3://a/']
+        mock_parser = mock_argparse.ArgumentParser.return_value
+        mock_subparsers = mock_parser.add_subparsers.return_value
+        mock_sub_parser = mock_subparsers.add_parser.return_value
+        mock_args = mock.MagicMock()
+        mock_args.healthcheck = False
+        mock_parser.parse_args.return_value = mock_args
+        main()
+        # processing instructions, plus the one selected subcommand
+        self.assertEqual(mock_JobConfigSchemaAsArgsParser.call_count, 2)
+        self.assertEqual(mock_sub_parser.set_defaults.call_count, 1)
+        job_fn = mock_sub_parser.set_defaults.call_args[1]['func']
+        raw_config = {'a': 'b'}
+        job_fn(raw_config)
+        mock_arguments_output_to_config.assert_called_with(raw_config)
+        mock_run_records_mover_job.\
+            assert_called_with('table', 'directory_from_url',
+                               job_name='table2recordsdir',
+                               config=mock_arguments_output_to_config.return_value)
+
+
+class TestBuildParser(unittest.TestCase):
+    def test_selected_subjob_names(self):
+        self.assertEqual(selected_subjob_names(['--foo', 'table2file', 'file2table']),
+                         ['table2file', 'file2table'])
+        self.assertEqual(selected_subjob_names(['--help']), [])
+
+    def test_build_parser_populates_only_selected(self):
+        parser = build_parser(['table2file'])
+        args = parser.parse_args(['table2file', 'mydb', 'myschema', 'mytable', '/tmp/foo.csv'])
+        self.assertEqual(vars(args)['source.db_name'], 'mydb')
+        self.assertIsNotNone(args.func)
+
+        args = parser.parse_args(['file2table'])
+        self.assertIsNone(getattr(args, 'func', None))
+
+    def test_build_parser_populates_all_by_default(self):
+        parser = build_parser()
+        args = parser.parse_args(['file2table', '/tmp/foo.csv', 'mydb', 'myschema', 'mytable'])
+        self.assertEqual(vars(args)['target.db_name'], 'mydb')
+        self.assertIsNotNone(args.func)
+
+
+class TestCLIJsonOutput(unittest.TestCase):
+    @patch('records_mover.records.cli.set_stream_logging')
+    @patch('records_mover.records.job.mover.run_records_mover_job')
+    def test_main_json(self,
+                       mock_run_records_mover_job,
+                       mock_set_stream_logging):
+        metrics = MoveMetrics()
+        metrics.move_paths.append('from_fileobjs_source')
+        metrics.add_stage_seconds('load', 1.5)
+        metrics.add_bytes_read(100)
+        metrics.rows = 10
+        mock_run_records_mover_job.return_value = MoveResult(move_count=10,
+                                                             output_urls=None,
+                                                             metrics=metrics)
+        argv = ['mvrec', '--json', 'file2table', '/tmp/foo.csv', 'mydb', 'myschema', 'mytable']
+        with patch('sys.argv', argv), patch('builtins.print') as mock_print:
+            main()
+        config = mock_run_records_mover_job.call_args[1]['config']
+        self.assertNotIn('json', config)
+        output = json.loads(mock_print.call_args[0][0])
+        self.assertEqual(output, {
+            'move_count': 10,
+            'output_urls': None,
+            'metrics': {
+                'move_path': ['from_fileobjs_source'],
+                'stage_seconds': {'load': 1.5},
+                'bytes_read': 100,
+                'bytes_written': None,
+                'files_moved': None,
+                'rows': 10,
+            }
+        })
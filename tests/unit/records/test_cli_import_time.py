@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+import unittest
+from typing import Dict
+
+import records_mover
+
+
+# Generous, to stay reliable on slow CI machines - before CLI startup
+# was made lazy, this import alone took several times as long.
+MAX_IMPORT_SECONDS = 2.0
+
+# Pulling any of these in means CLI startup (including 'mvrec --help')
+# pays for loading database drivers, dataframe libraries or cloud SDKs.
+HEAVY_MODULES = [
+    'boto3',
+    'botocore',
+    'db_facts',
+    'google.cloud',
+    'numpy',
+    'pandas',
+    'requests',
+    'sqlalchemy',
+]
+
+
+def import_times(module_name: str) -> Dict[str, int]:
+    """Import the given module in a fresh interpreter, returning the
+    cumulative import time in microseconds of every module loaded."""
+    env = dict(os.environ)
+    package_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(records_mover.__file__)))
+    env['PYTHONPATH'] = os.pathsep.join([package_parent_dir, env.get('PYTHONPATH', '')])
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+                            env=env,
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE,
+                            universal_newlines=True,
+                            check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, _, cumulative, name = [field.strip() for field in line.replace(':', '|', 1).split('|')]
+        times[name] = int(cumulative)
+    return times
+
+
+class TestCLIImportTime(unittest.TestCase):
+    def test_cli_import_avoids_heavy_modules(self):
+        times = import_times('records_mover.records.cli')
+        self.assertIn('records_mover.records.cli', times)
+        for heavy_module in HEAVY_MODULES:
+            self.assertNotIn(heavy_module, times)
+
+    def test_cli_import_time_bounded(self):
+        times = import_times('records_mover.records.cli')
+        self.assertLess(times['records_mover.records.cli'] / 1000000.0, MAX_IMPORT_SECONDS)
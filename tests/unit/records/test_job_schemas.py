@@ -0,0 +1,37 @@
+import unittest
+
+from mock import patch
+from records_mover.records.job.cached_schemas import (
+    generate_cli_job_schemas, load_cached_job_schemas, source_method_schema,
+    target_method_schema
+)
+from records_mover.records.job.schema import method_to_json_schema
+from records_mover.records.sources import RecordsSources
+from records_mover.records.targets import RecordsTargets
+
+
+class TestCachedJobSchemas(unittest.TestCase):
+    maxDiff = None
+
+    def test_cached_schemas_up_to_date(self):
+        # If this fails, regenerate the table with:
+        #
+        #   python -m records_mover.records.job.cached_schemas
+        self.assertEqual(load_cached_job_schemas(), generate_cli_job_schemas())
+
+    @patch('records_mover.records.job.cached_schemas.load_cached_job_schemas')
+    def test_source_method_schema_not_cached(self, mock_load_cached_job_schemas):
+        mock_load_cached_job_schemas.return_value = {}
+        self.assertEqual(source_method_schema('table'),
+                         method_to_json_schema(RecordsSources.table))
+
+    @patch('records_mover.records.job.cached_schemas.load_cached_job_schemas')
+    def test_target_method_schema_not_cached(self, mock_load_cached_job_schemas):
+        mock_load_cached_job_schemas.return_value = {}
+        self.assertEqual(target_method_schema('spectrum'),
+                         method_to_json_schema(RecordsTargets.spectrum))
+
+    @patch('records_mover.records.job.cached_schemas.load_cached_job_schemas')
+    def test_source_method_schema_cached(self, mock_load_cached_job_schemas):
+        mock_load_cached_job_schemas.return_value = {'sources': {'table': {'type': 'object'}}}
+        self.assertEqual(source_method_schema('table'), {'type': 'object'})
@@ -0,0 +1,70 @@
+import io
+import unittest
+
+from mock import patch
+from records_mover.records.metrics import (
+    collect_metrics, current_metrics, stage, record_bytes_written, record_move_path,
+    record_streamed, rows_in_stream, LOAD, NEGOTIATION
+)
+from records_mover.records.records_format import DelimitedRecordsFormat
+from records_mover.utils.counting_fileobj import CountingFileobj
+
+
+class TestMetrics(unittest.TestCase):
+    def test_no_metrics_collected_outside_move(self):
+        self.assertIsNone(current_metrics())
+        with stage(LOAD):
+            pass
+        record_bytes_written(123)
+        self.assertIsNone(current_metrics())
+
+    def test_collect_metrics_nested(self):
+        with collect_metrics() as outer:
+            with collect_metrics() as inner:
+                self.assertIs(outer, inner)
+                record_bytes_written(10)
+            record_bytes_written(5)
+        self.assertEqual(outer.bytes_written, 15)
+        self.assertIsNone(current_metrics())
+
+    @patch('records_mover.records.metrics.time')
+    def test_stage_accumulates(self, mock_time):
+        mock_time.perf_counter.side_effect = [1.0, 2.0, 10.0, 10.5, 11.0]
+        with collect_metrics() as metrics:
+            with stage(LOAD):
+                pass
+            with stage(LOAD):
+                pass
+            record_move_path('from_fileobjs_source', negotiation_start=8.0)
+        self.assertEqual(metrics.stage_seconds, {LOAD: 1.5, NEGOTIATION: 3.0})
+        self.assertEqual(metrics.move_paths, ['from_fileobjs_source'])
+
+    def test_rows_in_stream_header_row(self):
+        records_format = DelimitedRecordsFormat(variant='csv', hints={'compression': None})
+        fileobj = CountingFileobj(io.BytesIO(b'a,b\n1,2\n3,4'))
+        fileobj.read()
+        self.assertEqual(rows_in_stream(fileobj, records_format), 2)
+
+    def test_rows_in_stream_multiple_files_no_header(self):
+        records_format = DelimitedRecordsFormat(variant='bluelabs',
+                                                hints={'compression': None})
+        fileobj = CountingFileobj(io.BytesIO(b'1,2\n3,4\n5,6\n'))
+        fileobj.read()
+        self.assertEqual(rows_in_stream(fileobj, records_format, num_files=2), 3)
+
+    def test_rows_in_stream_compressed(self):
+        records_format = DelimitedRecordsFormat(variant='bluelabs',
+                                                hints={'compression': 'GZIP'})
+        fileobj = CountingFileobj(io.BytesIO(b'1,2\n'))
+        fileobj.read()
+        self.assertIsNone(rows_in_stream(fileobj, records_format))
+
+    def test_record_streamed(self):
+        records_format = DelimitedRecordsFormat(variant='bluelabs',
+                                                hints={'compression': None})
+        with collect_metrics() as metrics:
+            fileobj = CountingFileobj(io.BytesIO(b'1,2\n3,4\n'))
+            fileobj.read()
+            record_streamed(fileobj, records_format)
+        self.assertEqual(metrics.bytes_read, 8)
+        self.assertEqual(metrics.rows, 2)
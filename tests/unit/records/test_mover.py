@@ -1,6 +1,7 @@
 import unittest
 from mock import Mock, MagicMock
 from records_mover.records.mover import move
+from records_mover.records.results import MoveResult
 from records_mover.records.sources.google_sheets import GoogleSheetsRecordsSource
 from records_mover.records.sources.dataframes import DataframesRecordsSource
 from records_mover.records.sources.fileobjs import FileobjsSource
@@ -21,6 +22,8 @@ class TestMover(unittest.TestCase):
         mock_target.validate = Mock(name='validate')
         mock_processing_instructions = Mock(name='processing_instructions')
         mock_target.can_move_directly_from_scheme.return_value = True
+        mock_target.move_from_records_directory.return_value =\
+            MoveResult(move_count=123, output_urls=None)
         out = move(mock_source, mock_target, mock_processing_instructions)
         mock_target.move_from_records_directory.\
             assert_called_with(directory=mock_source.records_directory.return_value,
@@ -28,7 +31,10 @@ class TestMover(unittest.TestCase):
                                processing_instructions=mock_processing_instructions)
         mock_scheme = mock_source.records_directory.return_value.loc.scheme
         mock_target.can_move_directly_from_scheme.assert_called_with(mock_scheme)
-        self.assertEqual(mock_target.move_from_records_directory.return_value, out)
+        self.assertEqual(out.move_count, 123)
+        self.assertEqual(out.metrics.move_paths, ['direct_from_records_directory'])
+        self.assertEqual(out.metrics.rows, 123)
+        self.assertIn('negotiation', out.metrics.stage_seconds)
 
     def test_move_from_deferred_fileobjs_source(self):
         mock_source = MagicMock(name='source', spec=sources.SupportsToFileobjsSource)
@@ -40,10 +46,15 @@ class TestMover(unittest.TestCase):
         mock_fileobjs_source = MagicMock(name='fileobjs_source', spec=FileobjsSource)
         mock_fileobjs_source.records_format = Mock(name='records_format')
         mock_source.to_fileobjs_source.return_value.__enter__.return_value = mock_fileobjs_source
+        mock_target.move_from_fileobjs_source.return_value =\
+            MoveResult(move_count=None, output_urls=None)
         out = move(mock_source, mock_target, mock_processing_instructions)
         mock_target.move_from_fileobjs_source.assert_called_with(mock_fileobjs_source,
                                                                  mock_processing_instructions)
-        self.assertEqual(mock_target.move_from_fileobjs_source.return_value, out)
+        self.assertEqual(mock_target.move_from_fileobjs_source.return_value.move_count,
+                         out.move_count)
+        self.assertEqual(out.metrics.move_paths, ['via_fileobjs_source', 'from_fileobjs_source'])
+        self.assertIsNone(out.metrics.rows)
 
     def test_move_from_records_directory_format_compatible(self):
         mock_source = MagicMock(name='source',
@@ -56,12 +67,34 @@ class TestMover(unittest.TestCase):
         mock_source.has_compatible_format.return_value = True
         mock_records_directory = mock_target.records_directory.return_value
         mock_processing_instructions = Mock(name='processing_instructions')
+        mock_source.move_to_records_directory.return_value =\
+            MoveResult(move_count=None, output_urls={'a': 'b'})
         out = move(mock_source, mock_target, mock_processing_instructions)
+        mock_target.processing_instructions_for_records_directory.\
+            assert_called_with(mock_processing_instructions)
         mock_source.move_to_records_directory.\
-            assert_called_with(processing_instructions=mock_processing_instructions,
+            assert_called_with(processing_instructions=mock_target.
+                               processing_instructions_for_records_directory.return_value,
                                records_directory=mock_records_directory,
                                records_format=mock_source.compatible_format.return_value)
-        self.assertEqual(mock_source.move_to_records_directory.return_value, out)
+        self.assertEqual(out.output_urls, {'a': 'b'})
+        self.assertEqual(out.metrics.move_paths, ['to_records_directory'])
+
+    def test_move_to_partitioned_records_directory_unsupported(self):
+        mock_source = MagicMock(name='source',
+                                spec=SupportsMoveToRecordsDirectory)
+        mock_source.validate = Mock(name='validate')
+        mock_source.can_move_to_partitions.return_value = False
+        mock_target = Mock(name='target', spec=targets.SupportsRecordsDirectory)
+        mock_target.validate = Mock(name='validate')
+        mock_target.records_format = Mock(name='records_format')
+        mock_source.has_compatible_format.return_value = True
+        mock_target.processing_instructions_for_records_directory.return_value.partition_by =\
+            ['a']
+        with self.assertRaises(NotImplementedError):
+            move(mock_source, mock_target, Mock(name='processing_instructions'))
+        mock_target.pre_load_hook.assert_not_called()
+        mock_source.move_to_records_directory.assert_not_called()
 
     def test_move_from_dataframe(self):
         mock_source = MagicMock(name='source',
@@ -72,6 +105,8 @@ class TestMover(unittest.TestCase):
         mock_target.validate = Mock(name='validate')
         mock_target.records_format = Mock(name='records_format')
         mock_processing_instructions = Mock(name='processing_instructions')
+        mock_target.move_from_dataframes_source.return_value =\
+            MoveResult(move_count=10, output_urls=None)
         out = move(mock_source, mock_target, mock_processing_instructions)
         mock_source.to_dataframes_source.\
             assert_called_with(mock_processing_instructions)
@@ -79,7 +114,8 @@ class TestMover(unittest.TestCase):
         mock_target.move_from_dataframes_source.\
             assert_called_with(dfs_source=mock_dfs_source,
                                processing_instructions=mock_processing_instructions)
-        self.assertEqual(mock_target.move_from_dataframes_source.return_value, out)
+        self.assertEqual(out.move_count, 10)
+        self.assertEqual(out.metrics.move_paths, ['from_dataframes_source'])
 
     def test_to_dataframe(self):
         mock_processing_instructions = Mock(name='processing_instructions')
@@ -99,11 +135,18 @@ class TestMover(unittest.TestCase):
         mock_dataframes_source.validate = Mock(name='validate')
         mock_google_sheets_source.validate = Mock(name='validate')
         mock_target.validate = Mock(name='validate')
+        mock_fileobjs_source.move_to_records_directory.return_value =\
+            MoveResult(move_count=None, output_urls=None)
         out = move(mock_google_sheets_source, mock_target, mock_processing_instructions)
+        mock_target.processing_instructions_for_records_directory.\
+            assert_called_with(mock_processing_instructions)
         mock_fileobjs_source.move_to_records_directory.\
-            assert_called_with(processing_instructions=mock_processing_instructions,
+            assert_called_with(processing_instructions=mock_target.
+                               processing_instructions_for_records_directory.return_value,
                                records_directory=mock_directory,
                                records_format=mock_fileobjs_source.compatible_format.return_value)
 
-        self.assertEqual(mock_fileobjs_source.move_to_records_directory.return_value,
-                         out)
+        self.assertIsNone(out.move_count)
+        self.assertEqual(out.metrics.move_paths, ['via_dataframes_source',
+                                                  'via_fileobjs_source',
+                                                  'to_records_directory'])
@@ -37,16 +37,13 @@ class TestPrep(unittest.TestCase):
         how_to_prep = ExistingTableHandling.TRUNCATE_AND_OVERWRITE
         self.mock_tbl.existing_table_handling = how_to_prep
 
-        self.prep.prep(mock_schema_sql, mock_driver)
+        out = self.prep.prep(mock_schema_sql, mock_driver)
 
-        mock_quote_schema_and_table.assert_called_with(None,
-                                                       self.mock_tbl.schema_name,
-                                                       self.mock_tbl.table_name,
-                                                       db_engine=mock_driver.db_engine)
-        str_arg = str(mock_driver.db_conn.execute.call_args.args[0])
-        self.assertEqual(
-            str_arg,
-            f"DELETE FROM {self.mock_tbl.schema_name}.{self.mock_tbl.table_name} WHERE true")
+        self.assertEqual(out, self.mock_tbl.table_name)
+
+        mock_driver.truncate_table.assert_called_with(self.mock_tbl.schema_name,
+                                                      self.mock_tbl.table_name)
+        mock_driver.db_conn.execute.assert_not_called()
 
     @patch('records_mover.records.prep.quote_schema_and_table')
     def test_prep_table_exists_delete_implicit(self, mock_quote_schema_and_table):
@@ -86,7 +83,7 @@ class TestPrep(unittest.TestCase):
         self.mock_tbl.existing_table_handling = how_to_prep
 
         self.prep.prep(mock_schema_sql, mock_driver)
-        mock_conn = mock_driver.db_engine.connect.return_value.__enter__.return_value
+        mock_conn = mock_driver.db_conn
 
         mock_quote_schema_and_table.assert_called_with(None,
                                                        self.mock_tbl.schema_name,
@@ -125,11 +122,13 @@ class TestPrep(unittest.TestCase):
         self.mock_tbl.existing_table_handling = how_to_prep
 
         self.prep.prep(mock_schema_sql, mock_driver)
-        mock_conn = mock_driver.db_engine.connect.return_value.__enter__.return_value
+        mock_conn = mock_driver.db_conn
         print(mock_conn.execute)
         str_args = [str(call_arg.args[0]) for call_arg in mock_conn.execute.call_args_list]
         mock_schema_sql_str_arg = str_args[0]
         self.assertEqual(mock_schema_sql_str_arg, mock_schema_sql)
+        mock_driver.invalidate_table.assert_called_with(self.mock_tbl.schema_name,
+                                                        self.mock_tbl.table_name)
         mock_driver.set_grant_permissions_for_groups.\
             assert_called_with(self.mock_tbl.schema_name,
                                self.mock_tbl.table_name,
@@ -159,7 +158,7 @@ class TestPrep(unittest.TestCase):
 
         self.prep.prep(mock_schema_sql, mock_driver,
                        existing_table_handling=ExistingTableHandling.DROP_AND_RECREATE)
-        mock_conn = mock_db_engine.connect.return_value.__enter__.return_value
+        mock_conn = mock_driver.db_conn
         mock_quote_schema_and_table.assert_called_with(None,
                                                        self.mock_tbl.schema_name,
                                                        self.mock_tbl.table_name,
@@ -181,3 +180,119 @@ class TestPrep(unittest.TestCase):
                                self.mock_tbl.add_user_perms_for,
                                None,
                                db_conn=mock_conn)
+
+    @patch('records_mover.records.prep.scratch_table_name')
+    @patch('records_mover.records.prep.quote_schema_and_table')
+    def test_prep_table_exists_stage_and_swap(self, mock_quote_schema_and_table,
+                                              mock_scratch_table_name):
+        mock_schema_sql = 'mock_schema_sql'
+        mock_driver = Mock(name='driver', spec=DBDriver)
+        mock_driver.db_conn = MagicMock(name='db')
+        mock_driver.db_engine = MagicMock(name='db_engine')
+        mock_scratch_table_name.return_value = 'mock_table_name_staging_abcd1234'
+
+        mock_driver.has_table.return_value = True
+        self.mock_tbl.existing_table_handling = ExistingTableHandling.STAGE_AND_SWAP
+
+        out = self.prep.prep(mock_schema_sql, mock_driver)
+
+        self.assertEqual(out, 'mock_table_name_staging_abcd1234')
+        mock_scratch_table_name.assert_called_with(self.mock_tbl.table_name, 'staging')
+        mock_driver.create_table_like.\
+            assert_called_with(self.mock_tbl.schema_name,
+                               'mock_table_name_staging_abcd1234',
+                               self.mock_tbl.table_name)
+        mock_driver.set_grant_permissions_for_groups.\
+            assert_called_with(self.mock_tbl.schema_name,
+                               'mock_table_name_staging_abcd1234',
+                               self.mock_tbl.add_group_perms_for,
+                               None,
+                               db_conn=mock_driver.db_conn)
+        mock_driver.set_grant_permissions_for_users.\
+            assert_called_with(self.mock_tbl.schema_name,
+                               'mock_table_name_staging_abcd1234',
+                               self.mock_tbl.add_user_perms_for,
+                               None,
+                               db_conn=mock_driver.db_conn)
+        mock_driver.truncate_table.assert_not_called()
+        mock_driver.db_conn.execute.assert_not_called()
+
+    @patch('records_mover.records.prep.quote_schema_and_table')
+    def test_prep_table_not_exists_stage_and_swap(self, mock_quote_schema_and_table):
+        mock_schema_sql = 'mock_schema_sql'
+        mock_driver = Mock(name='driver', spec=DBDriver)
+        mock_driver.db_conn = MagicMock(name='db')
+        mock_driver.db_engine = MagicMock(name='db_engine')
+
+        mock_driver.has_table.return_value = False
+        self.mock_tbl.existing_table_handling = ExistingTableHandling.STAGE_AND_SWAP
+
+        out = self.prep.prep(mock_schema_sql, mock_driver)
+
+        self.assertEqual(out, self.mock_tbl.table_name)
+        mock_driver.create_table_like.assert_not_called()
+        self.assertEqual(str(mock_driver.db_conn.execute.call_args.args[0]), mock_schema_sql)
+
+    def test_swap_in_staging_table(self):
+        mock_driver = Mock(name='driver', spec=DBDriver)
+
+        self.prep.swap_in_staging_table('mock_staging_table', mock_driver)
+
+        mock_driver.replace_table.assert_called_with(self.mock_tbl.schema_name,
+                                                     self.mock_tbl.table_name,
+                                                     'mock_staging_table')
+        mock_driver.invalidate_table.assert_called_with(self.mock_tbl.schema_name,
+                                                        self.mock_tbl.table_name)
+
+    def test_drop_staging_table(self):
+        mock_driver = Mock(name='driver', spec=DBDriver)
+        mock_driver.db_conn = MagicMock(name='db')
+
+        self.prep.drop_staging_table('mock_staging_table', mock_driver)
+
+        self.assertEqual(str(mock_driver.db_conn.execute.call_args.args[0]),
+                         f"\nDROP TABLE {self.mock_tbl.schema_name}.mock_staging_table")
+
+    @patch('records_mover.records.prep.quote_schema_and_table')
+    def test_prep_table_exists_upsert(self, mock_quote_schema_and_table):
+        mock_schema_sql = 'mock_schema_sql'
+        mock_driver = Mock(name='driver', spec=DBDriver)
+        mock_driver.db_conn = MagicMock(name='db')
+        mock_driver.db_engine = MagicMock(name='db_engine')
+
+        mock_driver.has_table.return_value = True
+        self.mock_tbl.existing_table_handling = ExistingTableHandling.UPSERT
+
+        out = self.prep.prep(mock_schema_sql, mock_driver)
+
+        self.assertTrue(out.startswith('mock_table_name_staging_'))
+        mock_driver.create_table_like.assert_called_with(self.mock_tbl.schema_name,
+                                                         out,
+                                                         self.mock_tbl.table_name)
+
+    def test_apply_staging_table_upsert(self):
+        mock_driver = Mock(name='driver', spec=DBDriver)
+        mock_driver.db_conn = MagicMock(name='db')
+        self.mock_tbl.existing_table_handling = ExistingTableHandling.UPSERT
+        self.mock_tbl.upsert_key = ['id']
+
+        self.prep.apply_staging_table('mock_staging_table', mock_driver)
+
+        mock_driver.merge_table.assert_called_with(self.mock_tbl.schema_name,
+                                                   self.mock_tbl.table_name,
+                                                   'mock_staging_table',
+                                                   ['id'])
+        self.assertEqual(str(mock_driver.db_conn.execute.call_args.args[0]),
+                         f"\nDROP TABLE {self.mock_tbl.schema_name}.mock_staging_table")
+        mock_driver.replace_table.assert_not_called()
+
+    def test_apply_staging_table_stage_and_swap(self):
+        mock_driver = Mock(name='driver', spec=DBDriver)
+        self.mock_tbl.existing_table_handling = ExistingTableHandling.STAGE_AND_SWAP
+
+        self.prep.apply_staging_table('mock_staging_table', mock_driver)
+
+        mock_driver.replace_table.assert_called_with(self.mock_tbl.schema_name,
+                                                     self.mock_tbl.table_name,
+                                                     'mock_staging_table')
+        mock_driver.merge_table.assert_not_called()
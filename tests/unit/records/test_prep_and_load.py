@@ -0,0 +1,80 @@
+import unittest
+from mock import Mock, MagicMock, call
+from records_mover.records.prep import TablePrep
+from records_mover.records.prep_and_load import prep_and_load
+from records_mover.db import DBDriver
+
+
+class LoadError(Exception):
+    pass
+
+
+class TestPrepAndLoad(unittest.TestCase):
+    def setUp(self):
+        self.mock_tbl = Mock(name='target_table_details')
+        self.mock_tbl.table_name = 'mytable'
+        self.mock_tbl.drop_and_recreate_on_load_error = False
+        self.mock_prep = Mock(name='prep', spec=TablePrep)
+        self.mock_driver = Mock(name='driver', spec=DBDriver)
+        self.mock_driver.db_conn = MagicMock(name='db_conn')
+        self.mock_load = Mock(name='load')
+
+    def prep_and_load(self):
+        return prep_and_load(self.mock_tbl, self.mock_prep, 'mock_schema_sql', self.mock_load,
+                             LoadError, driver=self.mock_driver)
+
+    def test_load_into_target_table(self):
+        self.mock_prep.prep.return_value = 'mytable'
+        out = self.prep_and_load()
+        self.mock_load.assert_called_with(self.mock_driver, 'mytable')
+        self.assertEqual(out.move_count, self.mock_load.return_value)
+        self.mock_prep.apply_staging_table.assert_not_called()
+
+    def test_load_into_staging_table_and_swap(self):
+        self.mock_prep.prep.return_value = 'mytable_staging'
+        out = self.prep_and_load()
+        self.mock_load.assert_called_with(self.mock_driver, 'mytable_staging')
+        self.mock_prep.apply_staging_table.assert_called_with('mytable_staging',
+                                                              self.mock_driver)
+        self.mock_prep.drop_staging_table.assert_not_called()
+        self.assertEqual(out.move_count, self.mock_load.return_value)
+
+    def test_staging_table_dropped_on_load_error(self):
+        self.mock_prep.prep.return_value = 'mytable_staging'
+        self.mock_load.side_effect = LoadError()
+        with self.assertRaises(LoadError):
+            self.prep_and_load()
+        self.mock_prep.drop_staging_table.assert_called_with('mytable_staging',
+                                                             self.mock_driver)
+        self.mock_prep.apply_staging_table.assert_not_called()
+
+    def test_staging_table_dropped_on_unexpected_error(self):
+        self.mock_prep.prep.return_value = 'mytable_staging'
+        self.mock_load.side_effect = KeyError()
+        self.mock_tbl.drop_and_recreate_on_load_error = True
+        with self.assertRaises(KeyError):
+            self.prep_and_load()
+        self.mock_prep.drop_staging_table.assert_called_with('mytable_staging',
+                                                             self.mock_driver)
+        self.assertEqual(self.mock_prep.prep.call_count, 1)
+
+    def test_staging_table_dropped_on_swap_error(self):
+        self.mock_prep.prep.return_value = 'mytable_staging'
+        self.mock_prep.apply_staging_table.side_effect = KeyError()
+        with self.assertRaises(KeyError):
+            self.prep_and_load()
+        self.mock_prep.drop_staging_table.assert_called_with('mytable_staging',
+                                                             self.mock_driver)
+
+    def test_load_error_recreates_target_table(self):
+        self.mock_prep.prep.return_value = 'mytable_staging'
+        self.mock_tbl.drop_and_recreate_on_load_error = True
+        self.mock_load.side_effect = [LoadError(), 123]
+        out = self.prep_and_load()
+        self.mock_prep.drop_staging_table.assert_called_with('mytable_staging',
+                                                             self.mock_driver)
+        self.assertEqual(self.mock_load.call_args_list,
+                         [call(self.mock_driver, 'mytable_staging'),
+                          call(self.mock_driver, 'mytable')])
+        self.mock_prep.apply_staging_table.assert_not_called()
+        self.assertEqual(out.move_count, 123)
@@ -18,6 +18,7 @@ class TestRecordsDirectory(unittest.TestCase):
             self.mock_schema_sql_file = mock_RecordsSchemaSqlFile.return_value
             self.mock_schema_json_file = mock_RecordsSchemaJsonFile.return_value
             self.mock_records_loc = Mock(name='records_loc')
+            self.mock_records_loc.url = 's3://bucket/path/'
             self.records_directory = RecordsDirectory(records_loc=self.mock_records_loc)
             mock_RecordsFormatFile.assert_called_with(self.mock_records_loc)
             mock_RecordsSchemaSqlFile.assert_called_with(self.mock_records_loc)
@@ -136,6 +137,33 @@ class TestRecordsDirectory(unittest.TestCase):
         self.mock_records_loc.copy_to.assert_called_with(mock_new_loc)
         self.assertEqual(out, mock_new_directory)
 
+    @patch('records_mover.records.records_directory.RecordsDirectory')
+    def test_copy_to_partitioned(self, mock_RecordsDirectory):
+        mock_new_loc = Mock(name='new_loc')
+        self.mock_records_loc.copy_to.return_value = mock_new_loc
+        mock_manifest_loc = self.mock_records_loc.file_in_this_directory.return_value
+        mock_manifest_loc.json_contents.return_value = {
+            'entries': [
+                {'url': 's3://bucket/path/event_date=2020-01-01/0000_part_00.parquet'},
+                {'url': 's3://bucket/path/event_date=2020-01-02/0000_part_00.parquet'},
+            ]
+        }
+
+        self.records_directory.copy_to(mock_new_loc)
+        mock_new_loc.file_in_this_directory.\
+            assert_has_calls([call('event_date=2020-01-01/0000_part_00.parquet'),
+                              call().size(),
+                              call('event_date=2020-01-02/0000_part_00.parquet'),
+                              call().size()])
+
+    def test_path_of_url(self):
+        self.assertEqual(self.records_directory.path_of_url('s3://bucket/path/a=1/file.csv'),
+                         'a=1/file.csv')
+
+    def test_path_of_url_outside_directory(self):
+        self.assertEqual(self.records_directory.path_of_url('s3://otherbucket/a=1/file.csv'),
+                         'file.csv')
+
     def test_save_fileobjs(self):
         mock_fileobj = Mock(name='fileobj')
         fileobjs_by_target_names = {
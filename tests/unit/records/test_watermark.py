@@ -0,0 +1,80 @@
+import datetime
+import json
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+
+from mock import Mock, patch
+from records_mover.records.watermark import (WatermarkStore, watermark_from_data,
+                                             watermark_sql, watermark_to_data)
+
+
+class TestWatermark(unittest.TestCase):
+    def test_to_and_from_data(self):
+        for value in [123,
+                      1.5,
+                      'abc',
+                      Decimal('12.34'),
+                      datetime.date(2020, 1, 2),
+                      datetime.datetime(2020, 1, 2, 3, 4, 5, 6)]:
+            data = watermark_to_data(value)
+            self.assertEqual(data, json.loads(json.dumps(data)))
+            self.assertEqual(value, watermark_from_data(data))
+
+    def test_to_data_unsupported(self):
+        with self.assertRaises(TypeError):
+            watermark_to_data(object())
+
+    def test_from_data_unsupported(self):
+        with self.assertRaises(ValueError):
+            watermark_from_data({'uuid': 'abc'})
+
+    def test_sql_numbers(self):
+        mock_db_engine = Mock(name='db_engine')
+        self.assertEqual('123', watermark_sql(123, mock_db_engine))
+        self.assertEqual('0.1', watermark_sql(0.1, mock_db_engine))
+        self.assertEqual('12.34', watermark_sql(Decimal('12.34'), mock_db_engine))
+
+    @patch('records_mover.db.quoting.quote_value')
+    def test_sql_quoted(self, mock_quote_value):
+        mock_db_engine = Mock(name='db_engine')
+        mock_quote_value.side_effect = lambda db, value, db_engine: f"'{value}'"
+        self.assertEqual("'2020-01-02 03:04:05'",
+                         watermark_sql(datetime.datetime(2020, 1, 2, 3, 4, 5), mock_db_engine))
+        self.assertEqual("'2020-01-02'",
+                         watermark_sql(datetime.date(2020, 1, 2), mock_db_engine))
+        self.assertEqual("'abc'", watermark_sql('abc', mock_db_engine))
+        mock_quote_value.assert_called_with(None, 'abc', db_engine=mock_db_engine)
+
+    def test_sql_bool(self):
+        with self.assertRaises(TypeError):
+            watermark_sql(True, Mock(name='db_engine'))
+
+
+class TestWatermarkStore(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, 'watermarks.json')
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_get_missing_file(self):
+        self.assertIsNone(WatermarkStore(self.path).get('a.b.c'))
+
+    def test_set_and_get(self):
+        store = WatermarkStore(self.path)
+        store.set('a.b.c', datetime.date(2020, 1, 2))
+        store.set('d.e.f', 5)
+        self.assertEqual(datetime.date(2020, 1, 2), WatermarkStore(self.path).get('a.b.c'))
+        self.assertEqual(5, WatermarkStore(self.path).get('d.e.f'))
+        self.assertEqual(['watermarks.json'], os.listdir(self.tempdir.name))
+
+    def test_set_unsupported_leaves_file_alone(self):
+        store = WatermarkStore(self.path)
+        store.set('a.b.c', 1)
+        with self.assertRaises(TypeError):
+            store.set('a.b.c', object())
+        self.assertEqual(1, store.get('a.b.c'))
+        self.assertEqual(['watermarks.json'], os.listdir(self.tempdir.name))
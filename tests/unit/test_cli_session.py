@@ -29,6 +29,8 @@ class TestCLISession(unittest.TestCase):
                           default_db_creds_name='foo',
                           default_aws_creds_name=None)
         mock_creds = mock_CredsViaLastPass.return_value
+        mock_creds.default_db_facts.return_value = {'type': 'vertica', 'host': 'myhost'}
         out = session.get_default_db_engine()
         self.assertEqual(out, mock_engine_from_db_facts.return_value)
-        mock_engine_from_db_facts.assert_called_with(mock_creds.default_db_facts.return_value)
+        mock_engine_from_db_facts.assert_called_with(mock_creds.default_db_facts.return_value,
+                                                     pool_pre_ping=True)
@@ -20,11 +20,13 @@ class TestSession(unittest.TestCase):
                            mock_google_cloud_storage_Client):
         mock_db_creds_name = Mock(name='db_creds_name')
         mock_creds = Mock(name='creds')
+        mock_creds.db_facts.return_value = {'type': 'postgres', 'host': 'myhost'}
         session = Session()
         out = session.get_db_engine(mock_db_creds_name,
                                     creds_provider=mock_creds)
         mock_creds.db_facts.assert_called_with(mock_db_creds_name)
-        mock_engine_from_db_facts.assert_called_with(mock_creds.db_facts.return_value)
+        mock_engine_from_db_facts.assert_called_with(mock_creds.db_facts.return_value,
+                                                     pool_pre_ping=True)
         self.assertEqual(mock_engine_from_db_facts.return_value, out)
 
     @patch('records_mover.db.connect.engine_from_db_facts')
@@ -37,12 +39,49 @@ class TestSession(unittest.TestCase):
                                               mock_google_cloud_storage_Client):
         mock_db_creds_name = Mock(name='db_creds_name')
         mock_creds = Mock(name='creds')
+        mock_creds.db_facts.return_value = {'type': 'postgres', 'host': 'myhost'}
         session = Session(creds=mock_creds)
         out = session.get_db_engine(mock_db_creds_name)
         mock_creds.db_facts.assert_called_with(mock_db_creds_name)
-        mock_engine_from_db_facts.assert_called_with(mock_creds.db_facts.return_value)
+        mock_engine_from_db_facts.assert_called_with(mock_creds.db_facts.return_value,
+                                                     pool_pre_ping=True)
         self.assertEqual(mock_engine_from_db_facts.return_value, out)
 
+    @patch('records_mover.db.connect.engine_from_db_facts')
+    def test_get_db_engine_cached(self,
+                                  mock_engine_from_db_facts,
+                                  mock_creds_via_env_os,
+                                  mock_os,
+                                  mock_get_config,
+                                  mock_google_auth_default,
+                                  mock_google_cloud_storage_Client):
+        mock_creds = Mock(name='creds')
+        mock_creds.db_facts.side_effect = [
+            {'type': 'psql (redshift)', 'host': 'myhost', 'username': 'me'},
+            {'type': 'redshift', 'host': 'myhost', 'user': 'me'},
+            {'type': 'redshift', 'host': 'otherhost', 'user': 'me'},
+        ]
+        session = Session(creds=mock_creds,
+                          db_pool_size=3,
+                          db_pool_pre_ping=False,
+                          db_pool_recycle=600)
+        mock_engine_a = Mock(name='engine_a')
+        mock_engine_b = Mock(name='engine_b')
+        mock_engine_from_db_facts.side_effect = [mock_engine_a, mock_engine_b]
+        self.assertEqual(mock_engine_a, session.get_db_engine('a'))
+        self.assertEqual(mock_engine_a, session.get_db_engine('a_alias'))
+        self.assertEqual(mock_engine_b, session.get_db_engine('b'))
+        self.assertEqual(2, mock_engine_from_db_facts.call_count)
+        mock_engine_from_db_facts.assert_called_with({'type': 'redshift',
+                                                      'host': 'otherhost',
+                                                      'user': 'me'},
+                                                     pool_pre_ping=False,
+                                                     pool_size=3,
+                                                     pool_recycle=600)
+        session.engine_cache.dispose()
+        mock_engine_a.dispose.assert_called_with()
+        mock_engine_b.dispose.assert_called_with()
+
     @patch('records_mover.session.UrlResolver')
     @patch('records_mover.db.factory.db_driver')
     def test_db_driver(self,
@@ -74,6 +113,23 @@ class TestSession(unittest.TestCase):
                                           s3_temp_base_loc=mock_s3_temp_base_loc,
                                           gcs_temp_base_loc=mock_gcs_temp_base_loc)
 
+    @patch('records_mover.session.UrlResolver')
+    @patch('records_mover.db.factory.db_driver')
+    def test_db_driver_redshift_data_api(self,
+                                         mock_db_driver,
+                                         mock_UrlResolver,
+                                         mock_creds_via_env_os,
+                                         mock_os,
+                                         mock_get_config,
+                                         mock_google_auth_default,
+                                         mock_google_cloud_storage_Client):
+        mock_creds = Mock(name='creds')
+        mock_db = Mock(name='db')
+        session = Session(creds=mock_creds, redshift_data_api=True)
+        session.db_driver(None, db_conn=mock_db)
+        self.assertEqual(mock_db_driver.call_args[1]['data_api_boto3_session'],
+                         mock_creds.default_boto3_session.return_value)
+
     @patch('records_mover.session.CredsViaEnv')
     def test_itest_type_uses_creds_via_env(self,
                                            mock_CredsViaEnv,
@@ -108,11 +164,12 @@ class TestSession(unittest.TestCase):
                                               mock_get_config,
                                               mock_google_auth_default,
                                               mock_google_cloud_storage_Client):
+        mock_db_facts_from_env.return_value = {'type': 'postgres', 'host': 'myhost'}
         session = Session()
         self.assertEqual(session.get_default_db_engine(), mock_engine_from_db_facts.return_value)
         mock_db_facts_from_env.assert_called_with()
         mock_db_facts = mock_db_facts_from_env.return_value
-        mock_engine_from_db_facts.assert_called_with(mock_db_facts)
+        mock_engine_from_db_facts.assert_called_with(mock_db_facts, pool_pre_ping=True)
 
     @patch('records_mover.creds.base_creds.db_facts_from_env')
     @patch('records_mover.db.connect.engine_from_db_facts')
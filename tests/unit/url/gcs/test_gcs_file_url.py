@@ -1,5 +1,7 @@
 from records_mover.url.gcs.gcs_file_url import GCSFileUrl
+from records_mover.utils.concat_files import ConcatFiles
 from mock import patch, Mock
+import io
 import unittest
 import google.api_core.exceptions
 
@@ -54,3 +56,121 @@ class TestGCSFileURL(unittest.TestCase):
         out = self.loc.rename_to(mock_new)
         self.mock_bucket_obj.rename_blob.assert_called_with(self.mock_blob_obj, mock_new.blob)
         self.assertEqual(out, mock_new)
+
+
+class FakeBlob:
+    def __init__(self, bucket, name, chunk_size=None):
+        self.bucket = bucket
+        self.name = name
+        self.chunk_size = chunk_size
+
+    def upload_from_string(self, data, content_type='text/plain'):
+        self.bucket.uploads.append((self.name, self.chunk_size))
+        self.bucket.contents[self.name] = data
+
+    def compose(self, sources):
+        assert len(sources) <= 32
+        self.bucket.composes.append(len(sources))
+        self.bucket.contents[self.name] =\
+            b''.join(self.bucket.contents[source.name] for source in sources)
+
+    def rewrite(self, source, token=None):
+        # Pretend it takes two calls
+        if token is None:
+            return 'more', 0, 0
+        self.bucket.contents[self.name] = self.bucket.contents[source.name]
+        return None, 0, 0
+
+
+class FakeBucket:
+    """Stand-in for a GCS bucket, keeping objects in memory"""
+    def __init__(self):
+        self.contents = {}
+        self.uploads = []
+        self.composes = []
+
+    def blob(self, name, chunk_size=None):
+        return FakeBlob(self, name, chunk_size)
+
+    def delete_blobs(self, names, on_error=None):
+        for name in names:
+            if name in self.contents:
+                del self.contents[name]
+            else:
+                on_error(name)
+
+
+class FakeGCSClient:
+    def __init__(self):
+        self.bucket_obj = FakeBucket()
+
+    def bucket(self, name):
+        return self.bucket_obj
+
+
+class TestGCSFileURLUploads(unittest.TestCase):
+    def setUp(self):
+        self.client = FakeGCSClient()
+        self.loc = GCSFileUrl(url='gs://bucket/dir/file.csv',
+                              gcs_client=self.client,
+                              gcp_credentials=Mock(name='gcp_credentials'))
+        self.loc.composite_part_size = 10
+
+    def test_upload_fileobj_small(self):
+        out = self.loc.upload_fileobj(io.BytesIO(b'123456789'))
+        self.assertEqual(out, 9)
+        self.assertEqual(self.client.bucket_obj.contents, {'dir/file.csv': b'123456789'})
+        self.assertEqual(self.client.bucket_obj.uploads,
+                         [('dir/file.csv', GCSFileUrl.upload_chunk_size)])
+        self.assertEqual(self.client.bucket_obj.composes, [])
+
+    def test_upload_fileobj_composite(self):
+        data = bytes(range(256)) * 2
+        out = self.loc.upload_fileobj(io.BytesIO(data))
+        self.assertEqual(out, len(data))
+        # Parts are cleaned up after being composed
+        self.assertEqual(self.client.bucket_obj.contents, {'dir/file.csv': data})
+        self.assertEqual(len(self.client.bucket_obj.uploads), 52)
+        # 52 parts take two compose calls to put together
+        self.assertEqual(self.client.bucket_obj.composes, [32, 21])
+
+    def test_upload_fileobj_short_reads(self):
+        # Each read returns at most what's left of the current file
+        self.loc.composite_part_size = 1000
+        out = self.loc.upload_fileobj(ConcatFiles([io.BytesIO(b'a' * 600),
+                                                   io.BytesIO(b'b' * 600)]))
+        self.assertEqual(out, 1200)
+        self.assertEqual(self.client.bucket_obj.contents,
+                         {'dir/file.csv': b'a' * 600 + b'b' * 600})
+        self.assertEqual(self.client.bucket_obj.composes, [2])
+
+    def test_upload_fileobj_small_short_reads(self):
+        out = self.loc.upload_fileobj(ConcatFiles([io.BytesIO(b'1234'), io.BytesIO(b'56')]))
+        self.assertEqual(out, 6)
+        self.assertEqual(self.client.bucket_obj.contents, {'dir/file.csv': b'123456'})
+        self.assertEqual(self.client.bucket_obj.composes, [])
+
+    def test_upload_fileobj_composite_failure_cleans_up(self):
+        class FailingFileobj(io.BytesIO):
+            def read(self, size=-1):
+                if self.tell() >= 20:
+                    raise IOError('whoops')
+                return super().read(size)
+
+        with self.assertRaises(IOError):
+            self.loc.upload_fileobj(FailingFileobj(b'x' * 100))
+        self.assertEqual(self.client.bucket_obj.contents, {})
+        self.assertEqual(self.client.bucket_obj.composes, [])
+
+    def test_store_string(self):
+        self.loc.store_string('hello')
+        self.assertEqual(self.client.bucket_obj.contents, {'dir/file.csv': b'hello'})
+
+    def test_copy_to_gcs(self):
+        self.client.bucket_obj.contents['dir/file.csv'] = b'abc'
+        other_loc = GCSFileUrl(url='gs://bucket/other/file.csv',
+                               gcs_client=self.client,
+                               gcp_credentials=Mock(name='gcp_credentials'))
+        out = self.loc.copy_to(other_loc)
+        self.assertEqual(out, other_loc)
+        self.assertEqual(self.client.bucket_obj.contents['other/file.csv'], b'abc')
@@ -3,6 +3,7 @@ from records_mover.url.s3.s3_file_url import S3FileUrl
 from records_mover.url.base import BaseFileUrl
 from mock import patch, Mock, MagicMock, mock_open
 import unittest
+import errno
 import os
 
 
@@ -16,21 +17,26 @@ class TestFilesystemFileUrl(unittest.TestCase):
         with self.assertRaises(ValueError):
             FilesystemFileUrl('file://bucket/bar')
 
+    @patch("records_mover.url.filesystem.os.makedirs")
     @patch("builtins.open", new_callable=mock_open)
     def test_store_string(self,
-                          mock_open):
+                          mock_open,
+                          mock_makedirs):
         mock_string = Mock(name='string')
         self.filesystem_file_url.store_string(mock_string)
         file_loc = Mock(name='file_loc')
         file_loc.local_file_path = '/my/file'
+        mock_makedirs.assert_called_with('/topdir/bottomdir', exist_ok=True)
         mock_open.assert_called_with('/topdir/bottomdir/file', 'wb')
         mock_open.return_value.write.assert_called_with(mock_string.encode.return_value)
 
+    @patch("records_mover.url.filesystem.os.makedirs")
     @patch("builtins.open", new_callable=mock_open)
     @patch("records_mover.url.base.blcopyfileobj")
     def test_upload_fileobj(self,
                             mock_copyfileobj,
-                            mock_open):
+                            mock_open,
+                            mock_makedirs):
         mock_fileobj = Mock(name='fileobj')
         self.filesystem_file_url.upload_fileobj(mock_fileobj)
         mock_copyfileobj.assert_called_with(mock_fileobj, mock_open.return_value)
@@ -85,11 +91,13 @@ class TestFilesystemFileUrl(unittest.TestCase):
     def test_is_directory(self):
         self.assertFalse(self.filesystem_file_url.is_directory())
 
+    @patch("records_mover.url.filesystem.os.makedirs")
     @patch("builtins.open", new_callable=mock_open)
     @patch("records_mover.url.base.blcopyfileobj")
     def test_concatenate_from(self,
                               mock_blcopyfileobj,
-                              mock_open):
+                              mock_open,
+                              mock_makedirs):
         mock_loc_1 = MagicMock(name='loc_1', spec=BaseFileUrl)
         mock_loc_2 = MagicMock(name='loc_2', spec=BaseFileUrl)
         mock_other_locs = [mock_loc_1, mock_loc_2]
@@ -113,6 +121,37 @@ class TestFilesystemFileUrl(unittest.TestCase):
                                           '/newtopdir/newbottomdir/newfile')
         self.assertEqual(out, mock_new_loc)
 
+    @patch("records_mover.url.filesystem.copy_file")
+    @patch("records_mover.url.filesystem.os.remove")
+    @patch("records_mover.url.filesystem.os.rename")
+    def test_rename_to_other_filesystem(self, mock_rename, mock_remove, mock_copy_file):
+        mock_new_loc = Mock(name='new_loc', spec=FilesystemFileUrl)
+        mock_new_loc.local_file_path = '/newtopdir/newbottomdir/newfile'
+        mock_rename.side_effect = OSError(errno.EXDEV, 'Invalid cross-device link')
+        out = self.filesystem_file_url.rename_to(mock_new_loc)
+        mock_copy_file.assert_called_with('/topdir/bottomdir/file',
+                                          '/newtopdir/newbottomdir/newfile')
+        mock_remove.assert_called_with('/topdir/bottomdir/file')
+        self.assertEqual(out, mock_new_loc)
+
+    @patch("records_mover.url.filesystem.copy_file")
+    def test_copy_to_filesystem(self, mock_copy_file):
+        mock_new_loc = Mock(name='new_loc', spec=FilesystemFileUrl)
+        mock_new_loc.local_file_path = '/newtopdir/newbottomdir/newfile'
+        out = self.filesystem_file_url.copy_to(mock_new_loc)
+        mock_copy_file.assert_called_with('/topdir/bottomdir/file',
+                                          '/newtopdir/newbottomdir/newfile')
+        self.assertEqual(out, mock_new_loc)
+
+    @patch("builtins.open", new_callable=mock_open)
+    def test_copy_to_other_url(self, mock_open):
+        mock_new_loc = Mock(name='new_loc', spec=S3FileUrl)
+        out = self.filesystem_file_url.copy_to(mock_new_loc)
+        mock_open.assert_called_with('/topdir/bottomdir/file', 'rb')
+        mock_fileobj = mock_open.return_value.__enter__.return_value
+        mock_new_loc.upload_fileobj.assert_called_with(mock_fileobj)
+        self.assertEqual(out, mock_new_loc)
+
     def test_rename_to_bad_target(self):
         mock_new_loc = Mock(name='new_loc', spec=S3FileUrl)
         with self.assertRaises(TypeError):
@@ -1,6 +1,10 @@
 from records_mover.url.s3.s3_directory_url import S3DirectoryUrl
 from records_mover.url.filesystem import FilesystemDirectoryUrl
-from mock import patch, Mock, call
+from mock import Mock, call
+from tempfile import TemporaryDirectory
+import datetime
+import hashlib
+import os
 import unittest
 
 
@@ -13,15 +17,6 @@ class TestS3DirectoryUrl(unittest.TestCase):
                                                S3Url=self.mock_S3Url,
                                                boto3_session=self.mock_boto3_session)
 
-    @patch('records_mover.url.s3.s3_directory_url.aws_cli')
-    def test_copy_to_dir(self,
-                         mock_aws_cli):
-        file_loc = Mock(name='file_loc', spec=FilesystemDirectoryUrl)
-        file_loc.local_file_path = '/my/dir/'
-        self.s3_directory_url.copy_to(file_loc)
-        mock_aws_cli.assert_called_with('s3', 'sync', 's3://bucket/topdir/bottomdir/',
-                                        '/my/dir/')
-
     def test_files_in_directory(self):
         mock_s3_client = self.mock_boto3_session.client.return_value
         mock_s3_client.list_objects.return_value = {
@@ -86,3 +81,104 @@ class TestS3DirectoryUrl(unittest.TestCase):
                                           call('s3://bucket/topdir/bottomdir/prefix2/',
                                                self.mock_boto3_session)])
         self.assertEqual(out, [mock_s3_url, mock_s3_url])
+
+
+class FakeS3Client:
+    """Stand-in for an S3 client, serving objects from memory in
+    pages of two"""
+    def __init__(self, objects):
+        self.objects = objects
+        self.downloads = []
+        self.last_modified = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+
+    def _etag(self, key):
+        if key.endswith('.multipart'):
+            return '"abc123-2"'
+        return '"' + hashlib.md5(self.objects[key]).hexdigest() + '"'
+
+    def list_objects_v2(self, Bucket, Prefix, ContinuationToken=None):
+        keys = sorted(key for key in self.objects if key.startswith(Prefix))
+        start = int(ContinuationToken or 0)
+        page = keys[start:start + 2]
+        resp = {
+            'Contents': [{'Key': key,
+                          'Size': len(self.objects[key]),
+                          'ETag': self._etag(key),
+                          'LastModified': self.last_modified}
+                         for key in page],
+            'IsTruncated': start + 2 < len(keys),
+        }
+        if resp['IsTruncated']:
+            resp['NextContinuationToken'] = str(start + 2)
+        return resp
+
+    def download_file(self, Bucket, Key, Filename, Config):
+        self.downloads.append(Key)
+        with open(Filename, 'wb') as f:
+            f.write(self.objects[Key])
+
+
+class TestS3DirectoryUrlSync(unittest.TestCase):
+    def setUp(self):
+        self.fake_s3_client = FakeS3Client({
+            'topdir/bottomdir/': b'',
+            'topdir/bottomdir/_manifest': b'{}',
+            'topdir/bottomdir/part-0.csv': b'a,b\n',
+            'topdir/bottomdir/part-1.csv': b'c,d\n',
+            'topdir/bottomdir/sub/big.multipart': b'0123456789',
+            'topdir/other/file.csv': b'not this one',
+        })
+        mock_boto3_session = Mock(name='boto3_session')
+        mock_boto3_session.client.return_value = self.fake_s3_client
+        self.s3_directory_url = S3DirectoryUrl('s3://bucket/topdir/bottomdir/',
+                                               S3Url=Mock(name='S3Url'),
+                                               boto3_session=mock_boto3_session)
+
+    def read_tree(self, path):
+        out = {}
+        for dirpath, dirnames, filenames in os.walk(path):
+            for filename in filenames:
+                full_path = os.path.join(dirpath, filename)
+                with open(full_path, 'rb') as f:
+                    out[os.path.relpath(full_path, path)] = f.read()
+        return out
+
+    def test_copy_to_dir(self):
+        with TemporaryDirectory() as tempdir:
+            file_loc = FilesystemDirectoryUrl(f'file://{tempdir}/')
+            out = self.s3_directory_url.copy_to(file_loc)
+            self.assertEqual(out, file_loc)
+            self.assertEqual(self.read_tree(tempdir), {
+                '_manifest': b'{}',
+                'part-0.csv': b'a,b\n',
+                'part-1.csv': b'c,d\n',
+                os.path.join('sub', 'big.multipart'): b'0123456789',
+            })
+            self.assertEqual(len(self.fake_s3_client.downloads), 4)
+
+    def test_copy_to_dir_skips_current_files(self):
+        with TemporaryDirectory() as tempdir:
+            file_loc = FilesystemDirectoryUrl(f'file://{tempdir}/')
+            self.s3_directory_url.copy_to(file_loc)
+            self.fake_s3_client.downloads = []
+            # Changed size
+            self.fake_s3_client.objects['topdir/bottomdir/part-0.csv'] = b'a,b,c\n'
+            # Same size, different contents
+            self.fake_s3_client.objects['topdir/bottomdir/part-1.csv'] = b'e,f\n'
+            # Multipart upload more recent than the local copy
+            self.fake_s3_client.objects['topdir/bottomdir/sub/big.multipart'] = b'9876543210'
+            self.fake_s3_client.last_modified = datetime.datetime.now(datetime.timezone.utc)
+
+            self.s3_directory_url.copy_to(file_loc)
+            self.assertEqual(sorted(self.fake_s3_client.downloads),
+                             ['topdir/bottomdir/part-0.csv',
+                              'topdir/bottomdir/part-1.csv',
+                              'topdir/bottomdir/sub/big.multipart'])
+            self.assertEqual(self.read_tree(tempdir)['part-1.csv'], b'e,f\n')
+
+    def test_copy_to_file_fails(self):
+        file_loc = Mock(name='file_loc', spec=FilesystemDirectoryUrl)
+        file_loc.is_directory.return_value = False
+        file_loc.url = 'file:///tmp/foo.csv'
+        with self.assertRaises(RuntimeError):
+            self.s3_directory_url.copy_to(file_loc)
@@ -1,5 +1,7 @@
 from records_mover.url.s3.s3_file_url import S3FileUrl, SMART_OPEN_USE_SESSION
+from botocore.exceptions import ClientError
 from mock import patch, Mock, MagicMock, ANY
+import io
 import unittest
 
 
@@ -12,6 +14,8 @@ class TestS3FileUrl(unittest.TestCase):
                                      boto3_session=self.mock_boto3_session)
         self.mock_s3_resource = self.mock_boto3_session.resource.return_value
         self.mock_s3_client = self.mock_boto3_session.client.return_value
+        # Small enough to be read over a single connection
+        self.mock_s3_client.head_object.return_value = {'ContentLength': 10}
         if SMART_OPEN_USE_SESSION:
             self.open_boto_args = {"session": self.mock_boto3_session}
         else:
@@ -89,6 +93,31 @@ class TestS3FileUrl(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.s3_file_url.open()
 
+    @patch('records_mover.url.s3.s3_file_url.s3_open')
+    def test_open_large_file_prefetches_ranges(self, mock_s3_open):
+        data = bytes(range(256)) * 4
+        self.mock_s3_client.head_object.return_value = {'ContentLength': len(data)}
+
+        def get_object(Bucket, Key, Range):
+            start, end = Range[len('bytes='):].split('-')
+            return {'Body': io.BytesIO(data[int(start):int(end) + 1])}
+
+        self.mock_s3_client.get_object.side_effect = get_object
+        self.s3_file_url.prefetch_part_size = 100
+        with self.s3_file_url.open() as f:
+            self.assertEqual(f.read(), data)
+        mock_s3_open.assert_not_called()
+        self.assertEqual(self.mock_s3_client.get_object.call_count, 11)
+        self.mock_s3_client.get_object.assert_any_call(Bucket='bucket',
+                                                       Key='topdir/bottomdir/file',
+                                                       Range='bytes=1000-1023')
+
+    def test_open_missing_file(self):
+        self.mock_s3_client.head_object.side_effect =\
+            ClientError({'Error': {'Code': '404', 'Message': 'Not Found'}}, 'HeadObject')
+        with self.assertRaises(FileNotFoundError):
+            self.s3_file_url.open()
+
     def test_download_fileobj(self):
         mock_fileobj = Mock(name='fileobj')
         self.s3_file_url.download_fileobj(mock_fileobj)
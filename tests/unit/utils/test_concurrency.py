@@ -0,0 +1,64 @@
+import threading
+import unittest
+
+from records_mover.records.metrics import collect_metrics, record_files_moved
+from records_mover.utils.concurrency import map_concurrently, imap_concurrently
+
+
+class TestMapConcurrently(unittest.TestCase):
+    def test_preserves_order(self):
+        self.assertEqual(map_concurrently(lambda x: x * 2, list(range(20)), max_workers=4),
+                         [x * 2 for x in range(20)])
+
+    def test_runs_in_calling_thread_with_one_worker(self):
+        threads = map_concurrently(lambda x: threading.current_thread(), [1, 2], max_workers=1)
+        self.assertEqual(threads, [threading.current_thread()] * 2)
+
+    def test_runs_in_parallel(self):
+        barrier = threading.Barrier(3, timeout=5)
+        self.assertEqual(map_concurrently(lambda x: barrier.wait() is not None, [1, 2, 3]),
+                         [True] * 3)
+
+    def test_raises_first_exception(self):
+        def fn(x):
+            if x > 0:
+                raise ValueError(x)
+            return x
+
+        with self.assertRaises(ValueError) as cm:
+            map_concurrently(fn, [0, 1, 2])
+        self.assertEqual(cm.exception.args, (1,))
+
+    def test_metrics_collected_from_workers(self):
+        with collect_metrics() as metrics:
+            map_concurrently(record_files_moved, [1, 2, 3])
+        self.assertEqual(metrics.files_moved, 6)
+
+
+class TestImapConcurrently(unittest.TestCase):
+    def test_preserves_order(self):
+        self.assertEqual(list(imap_concurrently(lambda x: x * 2, iter(range(20)),
+                                                max_workers=4)),
+                         [x * 2 for x in range(20)])
+
+    def test_bounds_items_in_flight(self):
+        pulled = []
+
+        def items():
+            for x in range(10):
+                pulled.append(x)
+                yield x
+
+        results = imap_concurrently(lambda x: x, items(), max_workers=2)
+        self.assertEqual(next(results), 0)
+        self.assertLessEqual(len(pulled), 3)
+        self.assertEqual(list(results), list(range(1, 10)))
+
+    def test_raises(self):
+        def fn(x):
+            if x == 1:
+                raise ValueError(x)
+            return x
+
+        with self.assertRaises(ValueError):
+            list(imap_concurrently(fn, [0, 1, 2]))
@@ -0,0 +1,48 @@
+import io
+import unittest
+
+from mock import Mock
+from records_mover.utils.counting_fileobj import CountingFileobj
+
+
+class TestCountingFileobj(unittest.TestCase):
+    def test_read(self):
+        fileobj = CountingFileobj(io.BytesIO(b'a\nb\nc'))
+        self.assertEqual(fileobj.read(2), b'a\n')
+        self.assertEqual(fileobj.read(), b'b\nc')
+        self.assertEqual(fileobj.bytes_count, 5)
+        self.assertEqual(fileobj.newline_count, 2)
+        self.assertFalse(fileobj.ends_with_newline)
+
+    def test_iterate(self):
+        fileobj = CountingFileobj(io.BytesIO(b'a\nb\n'))
+        self.assertEqual(list(fileobj), [b'a\n', b'b\n'])
+        self.assertEqual(fileobj.newline_count, 2)
+        self.assertTrue(fileobj.ends_with_newline)
+
+    def test_seek_to_start_resets(self):
+        fileobj = CountingFileobj(io.BytesIO(b'a\nb\n'))
+        fileobj.read()
+        fileobj.seek(0)
+        fileobj.read()
+        self.assertEqual(fileobj.bytes_count, 4)
+
+    def test_write_through_text_wrapper(self):
+        output = io.BytesIO()
+        fileobj = CountingFileobj(output)
+        text_fileobj = io.TextIOWrapper(fileobj, encoding='utf-8')
+        text_fileobj.write('a\nb\n')
+        text_fileobj.detach()
+        self.assertEqual(output.getvalue(), b'a\nb\n')
+        self.assertEqual(fileobj.bytes_count, 4)
+
+    def test_passes_through_other_attributes(self):
+        mock_fileobj = Mock(name='fileobj')
+        fileobj = CountingFileobj(mock_fileobj)
+        self.assertEqual(fileobj.mode, mock_fileobj.mode)
+
+    def test_doesnt_close_on_garbage_collection(self):
+        output = io.BytesIO()
+        fileobj = CountingFileobj(output)
+        del fileobj
+        self.assertFalse(output.closed)
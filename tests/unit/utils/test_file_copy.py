@@ -0,0 +1,109 @@
+import errno
+import gzip
+import io
+import os
+import tempfile
+import unittest
+from mock import patch
+from records_mover.utils import file_copy
+from records_mover.utils.file_copy import copy_file, copy_fileobj
+
+
+class TestFileCopy(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.data = bytes(range(256)) * 4000
+        self.src_path = os.path.join(self.tempdir.name, 'src')
+        self.dst_path = os.path.join(self.tempdir.name, 'dst')
+        with open(self.src_path, 'wb') as f:
+            f.write(self.data)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def read_dst(self):
+        with open(self.dst_path, 'rb') as f:
+            return f.read()
+
+    def test_copy_fileobj_local_files_from_current_positions(self):
+        with open(self.src_path, 'rb') as fsrc, open(self.dst_path, 'wb') as fdst:
+            fdst.write(b'header')
+            self.assertEqual(fsrc.read(10), self.data[:10])
+            with patch.object(file_copy, '_buffered_copyfileobj') as mock_buffered:
+                copied = copy_fileobj(fsrc, fdst)
+            mock_buffered.assert_not_called()
+            self.assertEqual(copied, len(self.data) - 10)
+            self.assertEqual(fsrc.read(), b'')
+            fdst.write(b'trailer')
+        self.assertEqual(self.read_dst(), b'header' + self.data[10:] + b'trailer')
+
+    def test_copy_fileobj_falls_back_after_partial_kernel_copy(self):
+        calls = []
+
+        def flaky_chunk(src_fd, dst_fd):
+            if calls:
+                raise OSError(errno.EXDEV, 'Invalid cross-device link')
+            calls.append(True)
+            return os.write(dst_fd, os.read(src_fd, 1000))
+
+        with patch.object(file_copy, '_kernel_copy_functions', return_value=[flaky_chunk]):
+            with open(self.src_path, 'rb') as fsrc, open(self.dst_path, 'wb') as fdst:
+                self.assertEqual(copy_fileobj(fsrc, fdst), len(self.data))
+        self.assertEqual(self.read_dst(), self.data)
+
+    def test_copy_fileobj_raises_real_errors(self):
+        def failing_chunk(src_fd, dst_fd):
+            raise OSError(errno.ENOSPC, 'No space left on device')
+
+        with patch.object(file_copy, '_kernel_copy_functions', return_value=[failing_chunk]):
+            with open(self.src_path, 'rb') as fsrc, open(self.dst_path, 'wb') as fdst:
+                with self.assertRaises(OSError):
+                    copy_fileobj(fsrc, fdst)
+
+    def test_copy_fileobj_sendfile(self):
+        with patch.object(file_copy, '_kernel_copy_functions',
+                          return_value=[file_copy._sendfile_chunk]):
+            with open(self.src_path, 'rb') as fsrc, open(self.dst_path, 'wb') as fdst:
+                fsrc.seek(100)
+                self.assertEqual(copy_fileobj(fsrc, fdst), len(self.data) - 100)
+        self.assertEqual(self.read_dst(), self.data[100:])
+
+    def test_copy_fileobj_does_not_bypass_decompression(self):
+        gz_path = os.path.join(self.tempdir.name, 'src.gz')
+        with gzip.open(gz_path, 'wb') as f:
+            f.write(self.data)
+        with gzip.open(gz_path, 'rb') as fsrc, open(self.dst_path, 'wb') as fdst:
+            self.assertEqual(copy_fileobj(fsrc, fdst), len(self.data))
+        self.assertEqual(self.read_dst(), self.data)
+
+    def test_copy_fileobj_buffer_grows(self):
+        fsrc = io.BytesIO(self.data)
+        read_sizes = []
+        original_read = fsrc.read
+
+        def read(size):
+            read_sizes.append(size)
+            return original_read(size)
+
+        fsrc.read = read
+        fdst = io.BytesIO()
+        self.assertEqual(copy_fileobj(fsrc, fdst), len(self.data))
+        self.assertEqual(fdst.getvalue(), self.data)
+        self.assertEqual(read_sizes[:3], [64 * 1024, 128 * 1024, 256 * 1024])
+
+    def test_copy_fileobj_fixed_length(self):
+        fsrc = io.BytesIO(self.data)
+        fdst = io.BytesIO()
+        with patch.object(fsrc, 'read', wraps=fsrc.read) as mock_read:
+            copy_fileobj(fsrc, fdst, 1000)
+        self.assertTrue(all(call[0] == (1000,) for call in mock_read.call_args_list))
+        self.assertEqual(fdst.getvalue(), self.data)
+
+    def test_copy_file(self):
+        self.assertEqual(copy_file(self.src_path, self.dst_path), len(self.data))
+        self.assertEqual(self.read_dst(), self.data)
+
+    @patch.object(file_copy, '_reflink', return_value=True)
+    def test_copy_file_reflink(self, mock_reflink):
+        self.assertEqual(copy_file(self.src_path, self.dst_path), len(self.data))
+        mock_reflink.assert_called_once()
@@ -0,0 +1,111 @@
+import io
+import threading
+import time
+import unittest
+
+from records_mover.utils.prefetching_reader import PrefetchingReader
+
+
+class SlowRemoteObject:
+    """Local stand-in for a remote object, where each ranged read
+    takes a while to come back"""
+    def __init__(self, data, latency=0.0):
+        self.data = data
+        self.latency = latency
+        self.requests = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def fetch_range(self, start, end):
+        with self._lock:
+            self.requests.append((start, end))
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self._in_flight -= 1
+        return self.data[start:end]
+
+
+class TestPrefetchingReader(unittest.TestCase):
+    def setUp(self):
+        self.data = bytes(range(256)) * 40
+
+    def open(self, remote, part_size=1000, depth=3):
+        return io.BufferedReader(PrefetchingReader(remote.fetch_range,
+                                                   size=len(remote.data),
+                                                   part_size=part_size,
+                                                   depth=depth))
+
+    def test_reads_sequentially(self):
+        remote = SlowRemoteObject(self.data)
+        with self.open(remote) as f:
+            chunks = []
+            while True:
+                chunk = f.read(333)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        self.assertEqual(b''.join(chunks), self.data)
+        self.assertEqual(remote.requests[0], (0, 1000))
+        self.assertEqual(remote.requests[-1], (10000, 10240))
+        self.assertEqual(len(remote.requests), 11)
+
+    def test_empty(self):
+        remote = SlowRemoteObject(b'')
+        with self.open(remote) as f:
+            self.assertEqual(f.read(), b'')
+        self.assertEqual(remote.requests, [])
+
+    def test_depth_bounds_requests_in_flight(self):
+        remote = SlowRemoteObject(self.data, latency=0.01)
+        with self.open(remote, depth=3) as f:
+            self.assertEqual(f.read(), self.data)
+        self.assertLessEqual(remote.max_in_flight, 3)
+        self.assertGreater(remote.max_in_flight, 1)
+
+    def test_seek(self):
+        remote = SlowRemoteObject(self.data)
+        with self.open(remote) as f:
+            f.read(10)
+            f.seek(5000)
+            self.assertEqual(f.tell(), 5000)
+            self.assertEqual(f.read(10), self.data[5000:5010])
+            f.seek(0)
+            self.assertEqual(f.read(), self.data)
+
+    def test_short_read_raises(self):
+        def fetch_range(start, end):
+            return self.data[start:end - 1]
+
+        f = io.BufferedReader(PrefetchingReader(fetch_range,
+                                                size=len(self.data),
+                                                part_size=1000,
+                                                depth=2))
+        with self.assertRaises(IOError):
+            f.read()
+        f.close()
+
+    def test_close_calls_on_close_once(self):
+        remote = SlowRemoteObject(self.data)
+        closes = []
+        reader = PrefetchingReader(remote.fetch_range,
+                                   size=len(self.data),
+                                   part_size=1000,
+                                   depth=2,
+                                   on_close=lambda: closes.append(True))
+        reader.close()
+        reader.close()
+        self.assertEqual(closes, [True])
+
+    def test_throughput_with_latency(self):
+        latency = 0.05
+        remote = SlowRemoteObject(self.data, latency=latency)
+        start = time.perf_counter()
+        with self.open(remote, part_size=1024, depth=5) as f:
+            self.assertEqual(f.read(), self.data)
+        elapsed = time.perf_counter() - start
+        # Ten parts fetched one at a time would take 10 * latency;
+        # five at a time should take about 2 * latency.
+        self.assertLess(elapsed, 10 * latency * 0.6)
@@ -0,0 +1,11 @@
+# https://boto3.amazonaws.com/v1/documentation/api/latest/reference/customizations/s3.html#boto3.s3.transfer.TransferConfig
+class TransferConfig:
+    def __init__(self,
+                 multipart_threshold: int = ...,
+                 max_concurrency: int = ...,
+                 multipart_chunksize: int = ...,
+                 num_download_attempts: int = ...,
+                 max_io_queue: int = ...,
+                 io_chunksize: int = ...,
+                 use_threads: bool = ...) -> None:
+        ...
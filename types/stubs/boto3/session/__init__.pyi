@@ -117,7 +117,7 @@ class S3ClientTypeStub:
 
     # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.get_object
     def get_object(self,
-                   Bucket: str, Key: str) -> GetObjectReponseType: ...
+                   Bucket: str, Key: str, Range: str = ...) -> GetObjectReponseType: ...
 
     # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.upload_fileobj
     def upload_fileobj(self,
@@ -129,6 +129,11 @@ class S3ClientTypeStub:
                          Bucket: str, Key: str, Fileobj: IO[bytes], ExtraArgs=None,
                          Callback=None, Config=None) -> None: ...
 
+    # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.download_file
+    def download_file(self,
+                      Bucket: str, Key: str, Filename: str, ExtraArgs=None,
+                      Callback=None, Config=None) -> None: ...
+
     def list_objects(self, Bucket: str, Prefix: str,
                      Delimiter: str = '/') -> ListObjectsResponseType:
         ...
@@ -174,6 +179,39 @@ class STSClientTypeStub:
         ...
 
 
+class RedshiftDataExecuteStatementOutput(TypedDict):
+    Id: str
+
+
+class RedshiftDataDescribeStatementOutput(TypedDict, total=False):
+    # https://docs.aws.amazon.com/redshift-data/latest/APIReference/API_DescribeStatement.html
+    Id: str
+    Status: str
+    Error: str
+    Duration: int
+    RedshiftQueryId: int
+    ResultRows: int
+
+
+class RedshiftDataClientTypeStub:
+    # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/redshift-data.html
+    def execute_statement(self, *,
+                          Sql: str,
+                          Database: str,
+                          ClusterIdentifier: str = ...,
+                          WorkgroupName: str = ...,
+                          DbUser: str = ...,
+                          SecretArn: str = ...,
+                          StatementName: str = ...) -> RedshiftDataExecuteStatementOutput:
+        ...
+
+    def describe_statement(self, *, Id: str) -> RedshiftDataDescribeStatementOutput:
+        ...
+
+    def cancel_statement(self, *, Id: str) -> Dict[str, Any]:
+        ...
+
+
 class Session:
     region_name: str
     resource: Any
@@ -192,3 +230,9 @@ class Session:
     @overload
     def client(self, resource_type: Literal["sts"]) -> STSClientTypeStub:  # noqa: F811
         ...
+
+    @overload
+    def client(self,  # noqa: F811
+               resource_type: Literal["redshift-data"],
+               region_name: Optional[str] = ...) -> RedshiftDataClientTypeStub:
+        ...
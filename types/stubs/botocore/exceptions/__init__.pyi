@@ -0,0 +1,8 @@
+from typing import Any, Dict
+
+
+class ClientError(Exception):
+    response: Dict[str, Any]
+
+    def __init__(self, error_response: Dict[str, Any], operation_name: str) -> None:
+        ...
@@ -1,2 +1,6 @@
 class NotFound(Exception):
     ...
+
+
+class BadRequest(Exception):
+    ...
@@ -8,6 +8,8 @@ _DEFAULT_NUM_RETRIES = 6
 
 
 class Client:
+    project: str
+
     def dataset(self, dataset_id: str, project: Optional[str]) -> DatasetReference:
         ...
 
@@ -55,6 +57,17 @@ class Client:
                       source_type: Optional[str] = None) -> google.cloud.bigquery.job.ExtractJob:
         ...
 
+    def query(self,
+              query: str,
+              job_config: Optional[google.cloud.bigquery.job.QueryJobConfig] = None,
+              job_id: Optional[str] = None,
+              job_id_prefix: Optional[str] = None,
+              location: Optional[str] = None,
+              project: Optional[str] = None,
+              retry: Optional[google.api_core.retry.Retry] = None,
+              timeout: Optional[float] = None) -> google.cloud.bigquery.job.QueryJob:
+        ...
+
     def get_table(self,
                   table: Union[google.cloud.bigquery.table.Table,
                                google.cloud.bigquery.table.TableReference,
@@ -62,3 +75,40 @@ class Client:
                   retry: Optional[google.api_core.retry.Retry] = None,
                   timeout: Optional[float] = None) -> google.cloud.bigquery.table.Table:
         ...
+
+    def create_table(self,
+                     table: Union[google.cloud.bigquery.table.Table,
+                                  google.cloud.bigquery.table.TableReference,
+                                  str],
+                     exists_ok: bool = False,
+                     retry: Optional[google.api_core.retry.Retry] = None,
+                     timeout: Optional[float] = None) -> google.cloud.bigquery.table.Table:
+        ...
+
+    def delete_table(self,
+                     table: Union[google.cloud.bigquery.table.Table,
+                                  google.cloud.bigquery.table.TableReference,
+                                  str],
+                     retry: Optional[google.api_core.retry.Retry] = None,
+                     timeout: Optional[float] = None,
+                     not_found_ok: bool = False) -> None:
+        ...
+
+    def copy_table(self,
+                   sources: Union[google.cloud.bigquery.table.Table,
+                                  google.cloud.bigquery.table.TableReference,
+                                  str,
+                                  Sequence[Union[google.cloud.bigquery.table.Table,
+                                                 google.cloud.bigquery.table.TableReference,
+                                                 str]]],
+                   destination: Union[google.cloud.bigquery.table.Table,
+                                      google.cloud.bigquery.table.TableReference,
+                                      str],
+                   job_id: Optional[str] = None,
+                   job_id_prefix: Optional[str] = None,
+                   location: Optional[str] = None,
+                   project: Optional[str] = None,
+                   job_config: Optional[google.cloud.bigquery.job.CopyJobConfig] = None,
+                   retry: Optional[google.api_core.retry.Retry] = None,
+                   timeout: Optional[float] = None) -> google.cloud.bigquery.job.CopyJob:
+        ...
@@ -55,6 +55,33 @@ class ExtractJob:
         ...
 
 
+class CopyJob:
+    def result(self,
+               retry: google.api_core.retry.Retry = DEFAULT_RETRY,
+               timeout: Optional[float] = None) -> _AsyncJob:
+        ...
+
+    errors: Optional[List[Mapping[Any, Any]]]
+
+
+class QueryJob:
+    def result(self,
+               retry: google.api_core.retry.Retry = DEFAULT_RETRY,
+               timeout: Optional[float] = None) -> _AsyncJob:
+        ...
+
+    destination: google.cloud.bigquery.table.TableReference
+
+
+class QueryJobConfig:
+    ...
+
+
+class CopyJobConfig:
+    create_disposition: str
+    write_disposition: str
+
+
 class LoadJobConfig:
     allow_jagged_rows: bool
     allow_quoted_newlines: bool
@@ -88,7 +115,8 @@ class LoadJobConfig:
 # https://googleapis.dev/python/bigquery/latest/generated/google.cloud.bigquery.job.ExtractJobConfig.html#google.cloud.bigquery.job.ExtractJobConfig.compression
 class ExtractJobConfig:
     compression: Literal['GZIP', 'DEFLATE', 'SNAPPY', 'NONE']
-    destination_format: Literal['CSV', 'NEWLINE_DELIMITED_JSON', 'AVRO']
+    destination_format: Literal['CSV', 'NEWLINE_DELIMITED_JSON', 'AVRO', 'PARQUET']
     use_avro_logical_types: bool
-    field_delimeter: str
+    field_delimiter: str
+    print_header: bool
     labels: Dict[str, str]
@@ -1,10 +1,18 @@
-from typing import Optional
+import datetime
+from typing import Optional, Sequence, Union, Mapping, Any
+import google.cloud.bigquery.schema
 
 
 class Table:
     location: Optional[str]
-
-    ...
+    schema: Sequence[Union[google.cloud.bigquery.schema.SchemaField, Mapping[str, Any]]]
+    expires: Optional[datetime.datetime]
+
+    def __init__(self,
+                 table_ref: Union['TableReference', str],
+                 schema: Optional[Sequence[Union[google.cloud.bigquery.schema.SchemaField,
+                                                 Mapping[str, Any]]]] = None) -> None:
+        ...
 
 
 class TimePartitioning:
@@ -1,9 +1,33 @@
+from typing import IO, Optional, Sequence, Tuple, Union
+
+
 class Blob:
     name: str
     size: int
+    chunk_size: Optional[int]
 
     def exists(self) -> bool:
         ...
 
     def delete(self) -> None:
         ...
+
+    def upload_from_file(self,
+                         file_obj: IO[bytes],
+                         rewind: bool = False,
+                         size: Optional[int] = None,
+                         content_type: Optional[str] = None) -> None:
+        ...
+
+    def upload_from_string(self,
+                           data: Union[bytes, str],
+                           content_type: str = 'text/plain') -> None:
+        ...
+
+    def compose(self, sources: Sequence['Blob']) -> None:
+        ...
+
+    def rewrite(self,
+                source: 'Blob',
+                token: Optional[str] = None) -> Tuple[Optional[str], int, int]:
+        ...
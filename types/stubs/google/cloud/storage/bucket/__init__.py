@@ -1,3 +1,4 @@
+from typing import Callable, Iterable, Optional, Union
 from google.cloud.storage.blob import Blob
 
 
@@ -5,5 +6,10 @@ class Bucket:
     def rename_blob(self, blob: Blob, new_name: str) -> Blob:  # type: ignore
         ...
 
-    def blob(self, blob_name: str) -> Blob:  # type: ignore
+    def blob(self, blob_name: str, chunk_size: Optional[int] = None) -> Blob:  # type: ignore
+        ...
+
+    def delete_blobs(self,
+                     blobs: Iterable[Union[str, Blob]],
+                     on_error: Optional[Callable[[Blob], None]] = None) -> None:
         ...